@@ -7,12 +7,20 @@ from graph_theory.objects.digraph import Digraph
 from graph_theory.objects.graph import Graph
 from graph_theory.objects.weighted_digraph import WeightedDigraph
 from graph_theory.objects.weighted_graph import WeightedGraph
+from graph_theory import generators
+from graph_theory import graphlike_clustering
 from graph_theory import graphlike_connectivity
+from graph_theory import graphlike_reachability
+from graph_theory import readwrite
 from graph_theory import stable_marriages
 
 __all__ = [
     "objects",
+    "generators",
+    "graphlike_clustering",
     "graphlike_connectivity",
+    "graphlike_reachability",
+    "readwrite",
     "stable_marriages",
     ]
 
@@ -0,0 +1,380 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+This module contains methods that generate random graphs and digraphs: the Erdos-Renyi models G(n, p) and G(n, m),
+Barabasi-Albert preferential attachment, Watts-Strogatz small worlds, the stochastic block model, and R-MAT.
+
+Every generator comes in two forms. The "_edges" form returns the edges as two parallel arrays of vertex ids
+(sources, targets), ready for bulk loading elsewhere; the plain form returns a FrozenGraph (or, with directed=True, a
+FrozenDigraph) on the vertices 0 to n-1 built straight from those arrays. Every generator takes a seed, and the same
+seed always gives the same edges.
+
+The G(n, p) and stochastic block models do not test each possible edge: they draw the gap to the next edge from the
+geometric distribution (Batagelj and Brandes), so their work is proportional to the number of edges made.
+"""
+import math
+import random
+from array import array
+from typing import Hashable, Iterator, List, Optional, Sequence, Tuple
+
+from graph_theory.exceptions import EdgeError
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.frozen_graph import FrozenGraph
+
+
+EdgeArrays = Tuple[array, array]
+
+
+def _freeze(n: int, edges: EdgeArrays, directed: bool) -> FrozenDigraph:
+    """
+    Builds the frozen graph (or digraph) on the vertices 0 to n-1 with the given edges.
+    """
+    sources, targets = edges
+    if directed:
+        return FrozenDigraph.from_edge_arrays(sources, targets, order=n)
+    return FrozenGraph.from_edge_arrays(sources, targets, order=n)
+
+
+def _skips(rng: random.Random, p: float, total: int) -> Iterator[int]:
+    """
+    Yields the positions, in [0, total), of the successes among total independent trials that each succeed with
+    probability p, by drawing the geometric gap between one success and the next.
+    """
+    if p <= 0 or total <= 0:
+        return
+    if p >= 1:
+        yield from range(total)
+        return
+    log_q = math.log(1.0 - p)
+    draw = rng.random
+    log = math.log
+    position = -1
+    while True:
+        position += 1 + int(log(1.0 - draw()) / log_q)
+        if position >= total:
+            return
+        yield position
+
+
+def _triangle(k: int) -> Tuple[int, int]:
+    """
+    Returns the k-th pair (v, w), w < v, in the order (1, 0), (2, 0), (2, 1), (3, 0), ...
+    """
+    v = int((1 + math.sqrt(1 + 8 * k)) / 2)
+    # Correct for the rounding of the square root on large k.
+    while v * (v - 1) // 2 > k:
+        v -= 1
+    while v * (v + 1) // 2 <= k:
+        v += 1
+    return v, k - v * (v - 1) // 2
+
+
+def _pairs(positions: Sequence[int], n: int, directed: bool, offset: int = 0) -> EdgeArrays:
+    """
+    Returns the edges at the given positions among all possible edges on the vertices offset to offset + n - 1:
+    the n(n-1) ordered pairs of distinct vertices if directed, and the n(n-1)/2 unordered pairs otherwise.
+    """
+    sources = array("q")
+    targets = array("q")
+    if directed:
+        others = n - 1
+        for k in positions:
+            i, j = divmod(k, others)
+            sources.append(offset + i)
+            targets.append(offset + j + (j >= i))
+    else:
+        for k in positions:
+            v, w = _triangle(k)
+            sources.append(offset + v)
+            targets.append(offset + w)
+    return sources, targets
+
+
+def _possible_edges(n: int, directed: bool) -> int:
+    """
+    Returns the number of possible edges on n vertices.
+    """
+    return n * (n - 1) if directed else n * (n - 1) // 2
+
+
+def gnp_edges(n: int, p: float, seed: Optional[Hashable] = None, directed: bool = False) -> EdgeArrays:
+    """
+    Returns the edges of an Erdos-Renyi random graph G(n, p), in which each possible edge is present independently
+    with probability p.
+
+    :param n: number of vertices
+    :param p: probability of each edge
+    :param seed: (optional) random seed
+    :param directed: (optional) whether to make a digraph
+    :type n: int
+    :type p: float
+    :type directed: bool
+    :returns: sources, targets
+    :rtype: tuple(array('q'), array('q'))
+    """
+    rng = random.Random(seed)
+    return _pairs(list(_skips(rng, p, _possible_edges(n, directed))), n, directed)
+
+
+def gnp(n: int, p: float, seed: Optional[Hashable] = None, directed: bool = False) -> FrozenDigraph:
+    """
+    Returns an Erdos-Renyi random graph G(n, p). See gnp_edges.
+
+    :rtype: FrozenGraph or FrozenDigraph
+    """
+    return _freeze(n, gnp_edges(n, p, seed, directed), directed)
+
+
+def gnm_edges(n: int, m: int, seed: Optional[Hashable] = None, directed: bool = False) -> EdgeArrays:
+    """
+    Returns the edges of an Erdos-Renyi random graph G(n, m), chosen uniformly among graphs with n vertices and m
+    edges.
+
+    :param n: number of vertices
+    :param m: number of edges
+    :param seed: (optional) random seed
+    :param directed: (optional) whether to make a digraph
+    :type n: int
+    :type m: int
+    :type directed: bool
+    :returns: sources, targets
+    :rtype: tuple(array('q'), array('q'))
+    """
+    total = _possible_edges(n, directed)
+    if not 0 <= m <= total:
+        raise EdgeError(
+            "EdgeCountError",
+            "A graph on {n} vertices has between 0 and {t} edges. Got {m}.".format(
+                n=n,
+                t=total,
+                m=m
+            )
+        )
+    rng = random.Random(seed)
+    return _pairs(rng.sample(range(total), m), n, directed)
+
+
+def gnm(n: int, m: int, seed: Optional[Hashable] = None, directed: bool = False) -> FrozenDigraph:
+    """
+    Returns an Erdos-Renyi random graph G(n, m). See gnm_edges.
+
+    :rtype: FrozenGraph or FrozenDigraph
+    """
+    return _freeze(n, gnm_edges(n, m, seed, directed), directed)
+
+
+def barabasi_albert_edges(n: int, m: int, seed: Optional[Hashable] = None) -> EdgeArrays:
+    """
+    Returns the edges of a Barabasi-Albert preferential attachment graph. Starting from m vertices with no edges,
+    each new vertex is joined to m distinct existing vertices, chosen with probability proportional to their degree.
+
+    :param n: number of vertices
+    :param m: number of edges from each new vertex
+    :param seed: (optional) random seed
+    :type n: int
+    :type m: int
+    :returns: sources, targets
+    :rtype: tuple(array('q'), array('q'))
+    """
+    if not 1 <= m < n:
+        raise EdgeError(
+            "EdgeCountError",
+            "Barabasi-Albert graphs need 1 <= m < n. Got m={m}, n={n}.".format(
+                m=m,
+                n=n
+            )
+        )
+    rng = random.Random(seed)
+    choice = rng.choice
+    sources = array("q")
+    targets = array("q")
+    # Each vertex appears in repeated once for every edge it has, so a uniform choice from it is by degree.
+    repeated = array("q")
+    chosen = list(range(m))
+    for source in range(m, n):
+        sources.extend([source] * m)
+        targets.extend(chosen)
+        repeated.extend(chosen)
+        repeated.extend([source] * m)
+        picks = set()
+        while len(picks) < m:
+            picks.add(choice(repeated))
+        chosen = list(picks)
+    return sources, targets
+
+
+def barabasi_albert(n: int, m: int, seed: Optional[Hashable] = None) -> FrozenGraph:
+    """
+    Returns a Barabasi-Albert preferential attachment graph. See barabasi_albert_edges.
+
+    :rtype: FrozenGraph
+    """
+    return _freeze(n, barabasi_albert_edges(n, m, seed), False)
+
+
+def watts_strogatz_edges(n: int, k: int, p: float, seed: Optional[Hashable] = None) -> EdgeArrays:
+    """
+    Returns the edges of a Watts-Strogatz small-world graph: a ring of n vertices, each joined to its k nearest
+    neighbours (k // 2 on either side), in which the far end of each edge is then moved, with probability p, to a
+    vertex chosen uniformly among those it would not repeat an edge with.
+
+    :param n: number of vertices
+    :param k: number of nearest neighbours joined
+    :param p: probability of moving each edge
+    :param seed: (optional) random seed
+    :type n: int
+    :type k: int
+    :type p: float
+    :returns: sources, targets
+    :rtype: tuple(array('q'), array('q'))
+    """
+    if not 0 <= k < n:
+        raise EdgeError(
+            "EdgeCountError",
+            "Watts-Strogatz graphs need 0 <= k < n. Got k={k}, n={n}.".format(
+                k=k,
+                n=n
+            )
+        )
+    rng = random.Random(seed)
+    draw = rng.random
+    pick = rng.randrange
+    neighbours = [set() for _ in range(n)]  # type: List[set]
+    lattice = [(u, (u + j) % n) for j in range(1, k // 2 + 1) for u in range(n)]
+    for u, v in lattice:
+        neighbours[u].add(v)
+        neighbours[v].add(u)
+    for u, v in lattice:
+        if draw() >= p or len(neighbours[u]) >= n - 1:
+            continue
+        w = pick(n)
+        while w == u or w in neighbours[u]:
+            w = pick(n)
+        neighbours[u].discard(v)
+        neighbours[v].discard(u)
+        neighbours[u].add(w)
+        neighbours[w].add(u)
+    sources = array("q")
+    targets = array("q")
+    for u, others in enumerate(neighbours):
+        for v in others:
+            if u < v:
+                sources.append(u)
+                targets.append(v)
+    return sources, targets
+
+
+def watts_strogatz(n: int, k: int, p: float, seed: Optional[Hashable] = None) -> FrozenGraph:
+    """
+    Returns a Watts-Strogatz small-world graph. See watts_strogatz_edges.
+
+    :rtype: FrozenGraph
+    """
+    return _freeze(n, watts_strogatz_edges(n, k, p, seed), False)
+
+
+def stochastic_block_model_edges(sizes: Sequence[int], probabilities: Sequence[Sequence[float]],
+                                 seed: Optional[Hashable] = None, directed: bool = False) -> EdgeArrays:
+    """
+    Returns the edges of a stochastic block model graph. The vertices are split into consecutive blocks of the given
+    sizes, and each possible edge from block a to block b is present independently with probability
+    probabilities[a][b]. For graphs, only probabilities[a][b] with a <= b are used.
+
+    :param sizes: number of vertices in each block
+    :param probabilities: edge probability between each pair of blocks
+    :param seed: (optional) random seed
+    :param directed: (optional) whether to make a digraph
+    :type sizes: list(int)
+    :type probabilities: list(list(float))
+    :type directed: bool
+    :returns: sources, targets
+    :rtype: tuple(array('q'), array('q'))
+    """
+    rng = random.Random(seed)
+    offsets = [0]
+    for size in sizes:
+        offsets.append(offsets[-1] + size)
+    sources = array("q")
+    targets = array("q")
+    for a, size_a in enumerate(sizes):
+        for b, size_b in enumerate(sizes):
+            if b < a and not directed:
+                continue
+            p = probabilities[a][b]
+            if a == b:
+                positions = list(_skips(rng, p, _possible_edges(size_a, directed)))
+                block_sources, block_targets = _pairs(positions, size_a, directed, offsets[a])
+            else:
+                block_sources = array("q")
+                block_targets = array("q")
+                for position in _skips(rng, p, size_a * size_b):
+                    i, j = divmod(position, size_b)
+                    block_sources.append(offsets[a] + i)
+                    block_targets.append(offsets[b] + j)
+            sources.extend(block_sources)
+            targets.extend(block_targets)
+    return sources, targets
+
+
+def stochastic_block_model(sizes: Sequence[int], probabilities: Sequence[Sequence[float]],
+                           seed: Optional[Hashable] = None, directed: bool = False) -> FrozenDigraph:
+    """
+    Returns a stochastic block model graph. See stochastic_block_model_edges.
+
+    :rtype: FrozenGraph or FrozenDigraph
+    """
+    edges = stochastic_block_model_edges(sizes, probabilities, seed, directed)
+    return _freeze(sum(sizes), edges, directed)
+
+
+def rmat_edges(scale: int, edge_factor: int = 16, a: float = 0.57, b: float = 0.19, c: float = 0.19,
+               seed: Optional[Hashable] = None) -> EdgeArrays:
+    """
+    Returns the edges of an R-MAT (recursive matrix) digraph on 2^scale vertices: the stochastic Kronecker digraph
+    whose 2 x 2 initiator is [[a, b], [c, 1 - a - b - c]]. Each of edge_factor * 2^scale edges picks one quadrant of
+    the adjacency matrix per level, with those probabilities. The defaults are the Graph500 parameters.
+
+    Loops drawn are dropped. Repeated edges are kept in the arrays, and kept once when building a graph from them.
+
+    :param scale: base 2 logarithm of the number of vertices
+    :param edge_factor: (optional) number of edges drawn per vertex
+    :param a: (optional) probability of the top left quadrant
+    :param b: (optional) probability of the top right quadrant
+    :param c: (optional) probability of the bottom left quadrant
+    :param seed: (optional) random seed
+    :type scale: int
+    :type edge_factor: int
+    :returns: sources, targets
+    :rtype: tuple(array('q'), array('q'))
+    """
+    rng = random.Random(seed)
+    draw = rng.random
+    m = edge_factor << scale
+    ab = a + b
+    abc = a + b + c
+    rows = [0] * m
+    columns = [0] * m
+    # Each level halves the remaining matrix for every edge at once.
+    for _ in range(scale):
+        draws = [draw() for _ in range(m)]
+        rows = [row << 1 | (r >= ab) for row, r in zip(rows, draws)]
+        columns = [column << 1 | (a <= r < ab or r >= abc) for column, r in zip(columns, draws)]
+    sources = array("q")
+    targets = array("q")
+    for row, column in zip(rows, columns):
+        if row != column:
+            sources.append(row)
+            targets.append(column)
+    return sources, targets
+
+
+def rmat(scale: int, edge_factor: int = 16, a: float = 0.57, b: float = 0.19, c: float = 0.19,
+         seed: Optional[Hashable] = None, directed: bool = True) -> FrozenDigraph:
+    """
+    Returns an R-MAT digraph (or, with directed=False, the graph underlying it). See rmat_edges.
+
+    :rtype: FrozenDigraph or FrozenGraph
+    """
+    return _freeze(1 << scale, rmat_edges(scale, edge_factor, a, b, c, seed), directed)
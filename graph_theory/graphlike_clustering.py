@@ -0,0 +1,164 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+This module contains methods that count triangles in graphs and derive clustering values from them: the number of
+triangles at each vertex, the local clustering coefficient of each vertex, and the transitivity of the graph.
+
+Triangles are counted by degree-ordered intersection. Each vertex is given a rank by its degree, and each edge is
+kept only in the adjacency of its lower-ranked endpoint (the "forward" adjacency). Every triangle is then found exactly
+once, as the intersection of the forward adjacencies of its two lower-ranked vertices, and no forward adjacency is
+longer than the square root of twice the number of edges. The work can be partitioned across processes.
+"""
+import multiprocessing
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def _forward_adjacency(graph) -> Tuple[List[Any], List[int], List[frozenset]]:
+    """
+    Builds the degree-ordered forward adjacency of a graph.
+
+    The vertices are relabelled with integers 0 to p-1 in order of nondecreasing degree, so that the forward
+    adjacency of a vertex holds exactly its neighbours of a greater integer label. Edges may be given once or in both
+    directions; loops are ignored.
+
+    :param graph: The graph to relabel
+    :type graph: graph.Graph
+    :returns: the vertices in rank order, their degrees, and their forward adjacencies
+    :rtype: tuple(list, list(int), list(frozenset(int)))
+    """
+    neighbours = {vertex: set() for vertex in graph.vertices}
+    for edge in graph.edges:
+        endpoints = tuple(edge)
+        if len(endpoints) != 2 or endpoints[0] == endpoints[1]:
+            continue
+        v1, v2 = endpoints
+        neighbours[v1].add(v2)
+        neighbours[v2].add(v1)
+    order = sorted(neighbours, key=lambda vertex: len(neighbours[vertex]))
+    rank = {vertex: i for i, vertex in enumerate(order)}
+    degrees = [len(neighbours[vertex]) for vertex in order]
+    forward = [
+        frozenset(rank[other] for other in neighbours[vertex] if rank[other] > i)
+        for i, vertex in enumerate(order)
+    ]
+    return order, degrees, forward
+
+
+# The forward adjacency held by each worker process, set once by _init_worker.
+_worker_forward = None
+
+
+def _init_worker(forward: List[frozenset]) -> None:
+    """
+    Initializes a worker process with the forward adjacency shared by all of its chunks.
+
+    :param forward: forward adjacency
+    :type forward: list(frozenset(int))
+    """
+    global _worker_forward
+    _worker_forward = forward
+
+
+def _count_chunk(ranks: Iterable[int], forward: Optional[List[frozenset]] = None) -> array:
+    """
+    Counts the triangles found from the given ranks, attributing each to all three of its vertices.
+
+    :param ranks: the vertices (by rank) whose forward edges are to be searched
+    :param forward: forward adjacency; defaults to the one given to this worker process
+    :returns: counts, indexed by rank
+    :rtype: array('q')
+    """
+    if forward is None:
+        forward = _worker_forward
+    counts = array('q', bytes(8 * len(forward)))
+    for v in ranks:
+        forward_v = forward[v]
+        for u in forward_v:
+            common = forward_v & forward[u]
+            if common:
+                found = len(common)
+                counts[v] += found
+                counts[u] += found
+                for w in common:
+                    counts[w] += 1
+    return counts
+
+
+def _triangle_counts(graph, processes: Optional[int] = None) -> Tuple[List[Any], List[int], array]:
+    """
+    Counts the triangles at each vertex of graph.
+
+    :param graph: The graph to count the triangles of
+    :param processes: number of worker processes to partition the work over; None or 1 counts in this process
+    :type processes: int
+    :returns: the vertices in rank order, their degrees, and their triangle counts
+    :rtype: tuple(list, list(int), array('q'))
+    """
+    order, degrees, forward = _forward_adjacency(graph)
+    if not processes or processes < 2 or len(order) < 2:
+        return order, degrees, _count_chunk(range(len(order)), forward)
+    # Striding the ranks keeps the high-degree end of the order spread evenly across the chunks.
+    chunks = [range(i, len(order), processes) for i in range(processes)]
+    counts = array('q', bytes(8 * len(order)))
+    with multiprocessing.Pool(processes, initializer=_init_worker, initargs=(forward,)) as pool:
+        for partial in pool.imap_unordered(_count_chunk, chunks):
+            for i, count in enumerate(partial):
+                counts[i] += count
+    return order, degrees, counts
+
+
+def triangles(graph, processes: Optional[int] = None) -> Dict[Any, int]:
+    """
+    Returns the number of triangles (cycles of length 3) that each vertex of graph belongs to.
+
+    :param graph: The graph to count the triangles of
+    :type graph: graph.Graph
+    :param processes: (optional) number of worker processes to partition the work over
+    :type processes: int
+    :returns: triangles, keyed by vertex
+    :rtype: dict
+    """
+    order, _, counts = _triangle_counts(graph, processes)
+    return dict(zip(order, counts))
+
+
+def local_clustering(graph, processes: Optional[int] = None) -> Dict[Any, float]:
+    """
+    Returns the local clustering coefficient of each vertex of graph: the number of edges between neighbours of the
+    vertex, divided by the number of pairs of neighbours. Vertices of degree less than 2 have coefficient 0.
+
+    :param graph: The graph to find the clustering coefficients of
+    :type graph: graph.Graph
+    :param processes: (optional) number of worker processes to partition the work over
+    :type processes: int
+    :returns: local_clustering, keyed by vertex
+    :rtype: dict
+    """
+    order, degrees, counts = _triangle_counts(graph, processes)
+    return {
+        vertex: 2 * count / (degree * (degree - 1)) if degree > 1 else 0.0
+        for vertex, degree, count in zip(order, degrees, counts)
+    }
+
+
+def transitivity(graph, processes: Optional[int] = None) -> float:
+    """
+    Returns the transitivity of graph: three times the number of triangles, divided by the number of paths of
+    length 2. A graph with no paths of length 2 has transitivity 0.
+
+    :param graph: The graph to find the transitivity of
+    :type graph: graph.Graph
+    :param processes: (optional) number of worker processes to partition the work over
+    :type processes: int
+    :returns: transitivity
+    :rtype: float
+    """
+    _, degrees, counts = _triangle_counts(graph, processes)
+    # Each triangle is counted once at each of its three vertices.
+    paths = sum(degree * (degree - 1) // 2 for degree in degrees)
+    if not paths:
+        return 0.0
+    return sum(counts) / paths
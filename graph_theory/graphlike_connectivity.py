@@ -35,19 +35,16 @@ def complete_graph(n):
 def is_complete_graph(graph):
     """
     Returns true if given graph is a complete graph, false else.
-    Checks adjacency matrix for nonzero entries, so, returns true if the edges 
-    exist even in directed and weighted graphs.
+    Checks the adjacency index for an edge between every pair of distinct vertices, so, returns true if the edges
+    exist even in directed and weighted graphs. With the "bitset" backend each vertex is checked with a single
+    comparison of its neighbourhood against the full vertex set.
 
     :param graph: Graph object to de determined if it is a complete graph.
     :type graph: graph.Graph
     :returns: is_complete_graph
     :rtype: bool
     """
-    adjacency = graph.get_adj()
-    for key in adjacency.keys():
-        if adjacency[key] == None:
-            return False
-    return True
+    return graph.adjacency.is_complete()
 
 
 def is_graphical_sequence(sequence):
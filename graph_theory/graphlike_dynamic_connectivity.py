@@ -0,0 +1,433 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+This module contains a fully dynamic connectivity structure for graphs: it answers whether two vertices are in the
+same component, and how many components there are, while edges are added and removed, without searching the graph.
+
+It is the structure of Holm, de Lichtenberg and Thorup. Every edge has a level, from 0 up to log2 of the order. The
+edges of level i or more that are tree edges form a spanning forest F_i, with F_0 a spanning forest of the whole graph,
+and each forest is held as Euler tours in balanced search trees (treaps), so that two vertices are connected in F_i
+exactly when their tours share a root. A query looks up two roots, in O(log n). Adding an edge links two trees of F_0,
+or records a non-tree edge. Removing a tree edge of level l cuts it from F_0 to F_l and then looks for a replacement
+from level l down, always searching the smaller of the two halves, and raising each edge that it passes over a level;
+since an edge is raised at most log2(n) times, a removal costs O(log^2 n) amortized.
+
+    connectivity = DynamicConnectivity(graph)
+    graph.connectivity = connectivity     # kept up to date by the graph's add_edges
+    connectivity.connected(u, v)
+"""
+import random
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+
+_priority = random.Random(0x5eed).random
+
+
+class _Node(object):
+    """
+    A node of the treap that holds an Euler tour: either the one node of a vertex, or one of the two arcs of a tree
+    edge. Each node counts, over its subtree, its nodes, its vertex nodes, its marked arcs (tree edges of exactly the
+    forest's level) and its marked vertices (vertices with non-tree edges of exactly the forest's level).
+    """
+    __slots__ = ("left", "right", "parent", "priority", "key", "is_vertex", "tree_mark", "nontree_mark", "count",
+                 "vertices", "tree_marks", "nontree_marks")
+
+    def __init__(self, key: Any, is_vertex: bool):
+        self.left = None
+        self.right = None
+        self.parent = None
+        self.priority = _priority()
+        self.key = key
+        self.is_vertex = is_vertex
+        self.tree_mark = 0
+        self.nontree_mark = 0
+        self.count = 1
+        self.vertices = int(is_vertex)
+        self.tree_marks = 0
+        self.nontree_marks = 0
+
+
+def _update(node: _Node) -> None:
+    """
+    Recomputes the counts of a node from its own flags and its children.
+    """
+    count = 1
+    vertices = int(node.is_vertex)
+    tree_marks = node.tree_mark
+    nontree_marks = node.nontree_mark
+    for child in (node.left, node.right):
+        if child is not None:
+            count += child.count
+            vertices += child.vertices
+            tree_marks += child.tree_marks
+            nontree_marks += child.nontree_marks
+    node.count = count
+    node.vertices = vertices
+    node.tree_marks = tree_marks
+    node.nontree_marks = nontree_marks
+
+
+def _merge(a: Optional[_Node], b: Optional[_Node]) -> Optional[_Node]:
+    """
+    Joins two tours, a before b, and returns the root of the result.
+    """
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.priority > b.priority:
+        a.right = _merge(a.right, b)
+        a.right.parent = a
+        _update(a)
+        return a
+    b.left = _merge(a, b.left)
+    b.left.parent = b
+    _update(b)
+    return b
+
+
+def _split(node: Optional[_Node], k: int) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """
+    Splits a tour into its first k nodes and the rest, and returns the roots of both.
+    """
+    if node is None:
+        return None, None
+    left_count = node.left.count if node.left is not None else 0
+    if k <= left_count:
+        left, node.left = _split(node.left, k)
+        if node.left is not None:
+            node.left.parent = node
+        _update(node)
+        node.parent = None
+        if left is not None:
+            left.parent = None
+        return left, node
+    node.right, right = _split(node.right, k - left_count - 1)
+    if node.right is not None:
+        node.right.parent = node
+    _update(node)
+    node.parent = None
+    if right is not None:
+        right.parent = None
+    return node, right
+
+
+def _root(node: _Node) -> _Node:
+    """
+    Returns the root of the treap holding node.
+    """
+    while node.parent is not None:
+        node = node.parent
+    return node
+
+
+def _index(node: _Node) -> int:
+    """
+    Returns the position of node in its tour.
+    """
+    i = node.left.count if node.left is not None else 0
+    while node.parent is not None:
+        if node is node.parent.right:
+            i += 1 + (node.parent.left.count if node.parent.left is not None else 0)
+        node = node.parent
+    return i
+
+
+def _find(root: _Node, total: str, own: str) -> Optional[_Node]:
+    """
+    Returns a node of the tour at root whose own flag is set, using the subtree counts named by total, or None.
+    """
+    if not getattr(root, total):
+        return None
+    node = root
+    while True:
+        if node.left is not None and getattr(node.left, total):
+            node = node.left
+        elif getattr(node, own):
+            return node
+        else:
+            node = node.right
+
+
+class _Forest(object):
+    """
+    The spanning forest F_i of one level, as Euler tours.
+    """
+    def __init__(self):
+        self.vertices = {}  # type: Dict[int, _Node]
+        self.arcs = {}  # type: Dict[Tuple[int, int], _Node]
+
+    def node(self, u: int) -> _Node:
+        """
+        Returns the node of vertex u, adding u as a tree of its own if it is new to the forest.
+        """
+        node = self.vertices.get(u)
+        if node is None:
+            node = self.vertices[u] = _Node(u, True)
+        return node
+
+    def root(self, u: int) -> _Node:
+        """
+        Returns the root of the tour of the tree holding u.
+        """
+        return _root(self.node(u))
+
+    def connected(self, u: int, v: int) -> bool:
+        """
+        Returns True if u and v are in the same tree of the forest.
+        """
+        return self.root(u) is self.root(v)
+
+    def _reroot(self, u: int) -> _Node:
+        """
+        Rotates the tour of the tree holding u to start at u, and returns its root.
+        """
+        node = self.node(u)
+        before, after = _split(_root(node), _index(node))
+        return _merge(after, before)
+
+    def link(self, u: int, v: int, mark: bool) -> None:
+        """
+        Joins the trees of u and v by the tree edge (u, v), marking it if it is of exactly this level.
+        """
+        tour_u = self._reroot(u)
+        tour_v = self._reroot(v)
+        forward = self.arcs[(u, v)] = _Node((u, v), False)
+        backward = self.arcs[(v, u)] = _Node((v, u), False)
+        if mark:
+            forward.tree_mark = forward.tree_marks = 1
+        _merge(_merge(_merge(tour_u, forward), tour_v), backward)
+
+    def cut(self, u: int, v: int) -> None:
+        """
+        Removes the tree edge (u, v), splitting its tree in two.
+        """
+        first = self.arcs.pop((u, v))
+        second = self.arcs.pop((v, u))
+        root = _root(first)
+        i = _index(first)
+        j = _index(second)
+        if i > j:
+            i, j = j, i
+        before, rest = _split(root, i)
+        middle, after = _split(rest, j - i + 1)
+        _, middle = _split(middle, 1)
+        _split(middle, middle.count - 1)
+        _merge(after, before)
+
+    def _set(self, node: _Node, flag: str, value: int) -> None:
+        """
+        Sets a flag of a node, and updates the counts above it.
+        """
+        setattr(node, flag, value)
+        while node is not None:
+            _update(node)
+            node = node.parent
+
+    def set_tree_mark(self, u: int, v: int, value: int) -> None:
+        """
+        Marks, or unmarks, the tree edge (u, v) as being of exactly this level.
+        """
+        for arc in ((u, v), (v, u)):
+            node = self.arcs[arc]
+            if node.tree_mark != value and (value == 0 or arc == (u, v)):
+                self._set(node, "tree_mark", value)
+
+    def set_nontree_mark(self, u: int, value: int) -> None:
+        """
+        Marks, or unmarks, u as having non-tree edges of exactly this level.
+        """
+        node = self.node(u)
+        if node.nontree_mark != value:
+            self._set(node, "nontree_mark", value)
+
+
+class DynamicConnectivity(object):
+    """
+    Connectivity of a graph under edge insertions and deletions.
+
+    :methods: insert, delete, connected, component_size, component_count
+    """
+    def __init__(self, graph=None):
+        """
+        :param graph: (optional) a graph whose edges to start with
+        :type graph: Graph
+        """
+        self._ids = {}  # type: Dict[Hashable, int]
+        self._forests = []  # type: List[_Forest]
+        self._nontree = []  # type: List[Dict[int, Set[int]]]
+        self._level = {}  # type: Dict[Tuple[int, int], int]
+        self._tree = set()  # type: Set[Tuple[int, int]]
+        if graph is not None:
+            for edge in graph.edges or ():
+                self.insert(*edge)
+
+    @property
+    def tree_edges(self) -> int:
+        """
+        The number of edges in the spanning forest.
+        :rtype: int
+        """
+        return len(self._tree)
+
+    def _id(self, vertex: Hashable) -> int:
+        """
+        Returns the id of a vertex, giving it one if it is new.
+        """
+        label = getattr(vertex, "name", vertex)
+        i = self._ids.get(label)
+        if i is None:
+            i = self._ids[label] = len(self._ids)
+        return i
+
+    def _forest(self, i: int) -> _Forest:
+        """
+        Returns the forest of level i, adding levels as needed.
+        """
+        while len(self._forests) <= i:
+            self._forests.append(_Forest())
+            self._nontree.append({})
+        return self._forests[i]
+
+    def _add_nontree(self, u: int, v: int, i: int) -> None:
+        """
+        Records (u, v) as a non-tree edge of level i.
+        """
+        forest = self._forest(i)
+        for a, b in ((u, v), (v, u)):
+            self._nontree[i].setdefault(a, set()).add(b)
+            forest.set_nontree_mark(a, 1)
+        self._level[_key(u, v)] = i
+
+    def _remove_nontree(self, u: int, v: int, i: int) -> None:
+        """
+        Forgets (u, v) as a non-tree edge of level i.
+        """
+        nontree = self._nontree[i]
+        for a, b in ((u, v), (v, u)):
+            neighbours = nontree[a]
+            neighbours.discard(b)
+            if not neighbours:
+                del nontree[a]
+                self._forests[i].set_nontree_mark(a, 0)
+
+    def insert(self, u: Hashable, v: Hashable) -> None:
+        """
+        Adds the edge (u, v). Loops, and edges already present, are ignored.
+
+        :param u: a vertex
+        :param v: a vertex
+        """
+        a, b = self._id(u), self._id(v)
+        key = _key(a, b)
+        if a == b or key in self._level:
+            return
+        forest = self._forest(0)
+        if forest.connected(a, b):
+            self._add_nontree(a, b, 0)
+        else:
+            forest.link(a, b, True)
+            self._tree.add(key)
+            self._level[key] = 0
+
+    def delete(self, u: Hashable, v: Hashable) -> None:
+        """
+        Removes the edge (u, v), if present, replacing it in the spanning forest if it was a tree edge.
+
+        :param u: a vertex
+        :param v: a vertex
+        """
+        a, b = self._ids.get(getattr(u, "name", u)), self._ids.get(getattr(v, "name", v))
+        if a is None or b is None:
+            return
+        key = _key(a, b)
+        level = self._level.pop(key, None)
+        if level is None:
+            return
+        if key not in self._tree:
+            self._remove_nontree(a, b, level)
+            return
+        self._tree.remove(key)
+        for i in range(level + 1):
+            self._forests[i].cut(a, b)
+        for i in range(level, -1, -1):
+            if self._replace(a, b, i):
+                return
+
+    def _replace(self, a: int, b: int, i: int) -> bool:
+        """
+        Looks for a non-tree edge of level i joining the trees of a and b in F_i, and makes it a tree edge. Edges of
+        level i in the smaller tree that are passed over are raised to level i + 1. Returns True if one was found.
+        """
+        forest = self._forests[i]
+        if forest.root(a).vertices > forest.root(b).vertices:
+            a, b = b, a
+        # Raise the tree edges of level i in the smaller tree, which keeps each F_i tree within n / 2^i vertices.
+        while True:
+            arc = _find(forest.root(a), "tree_marks", "tree_mark")
+            if arc is None:
+                break
+            x, y = arc.key
+            forest.set_tree_mark(x, y, 0)
+            self._forest(i + 1).link(x, y, True)
+            self._level[_key(x, y)] = i + 1
+        nontree = self._nontree[i]
+        while True:
+            node = _find(forest.root(a), "nontree_marks", "nontree_mark")
+            if node is None:
+                return False
+            x = node.key
+            for y in list(nontree[x]):
+                self._remove_nontree(x, y, i)
+                if forest.connected(y, b):
+                    key = _key(x, y)
+                    self._tree.add(key)
+                    self._level[key] = i
+                    for j in range(i + 1):
+                        self._forests[j].link(x, y, j == i)
+                    return True
+                self._add_nontree(x, y, i + 1)
+
+    def connected(self, u: Hashable, v: Hashable) -> bool:
+        """
+        Returns True if u and v are in the same component.
+
+        :param u: a vertex
+        :param v: a vertex
+        :rtype: bool
+        """
+        a, b = self._ids.get(getattr(u, "name", u)), self._ids.get(getattr(v, "name", v))
+        if a is None or b is None or not self._forests:
+            return getattr(u, "name", u) == getattr(v, "name", v)
+        return self._forests[0].connected(a, b)
+
+    def component_size(self, u: Hashable) -> int:
+        """
+        Returns the number of vertices in the component of u, counting only vertices that have had edges.
+
+        :param u: a vertex
+        :rtype: int
+        """
+        a = self._ids.get(getattr(u, "name", u))
+        if a is None or not self._forests:
+            return 1
+        return self._forests[0].root(a).vertices
+
+    def component_count(self, order: int) -> int:
+        """
+        Returns the number of components of a graph of order vertices.
+
+        :param order: the number of vertices of the graph
+        :type order: int
+        :rtype: int
+        """
+        return order - len(self._tree)
+
+
+def _key(u: int, v: int) -> Tuple[int, int]:
+    """
+    Returns the key of the edge between the vertices with ids u and v.
+    """
+    return (u, v) if u < v else (v, u)
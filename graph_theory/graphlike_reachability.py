@@ -0,0 +1,329 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+This module contains methods that answer whether one vertex of a digraph can reach another (whether there is a
+directed path from the first to the second).
+
+A ReachabilityIndex is built once from a digraph and then answers reachable(v1, v2) without searching the digraph.
+Vertices in the same strongly connected component reach exactly the same vertices, so the digraph is first condensed
+into its acyclic digraph of components, and the index is built over the components by one of two methods:
+    "closure" stores, for each component, the bitset of components it reaches (the transitive closure). A query is
+        a shift and a mask. This needs k^2 bits for k components, so suits digraphs of moderate size.
+    "interval" numbers the components in post-order of a spanning forest of the condensation, and labels each
+        component with the sorted, disjoint intervals of post-order numbers that it reaches (Agrawal, Borgida and
+        Jagadish's tree cover). A query is a binary search over the intervals of one component; on the sparse,
+        mostly tree-like digraphs typical of dependencies, there are very few intervals per component.
+"""
+import pickle
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, Hashable, List, Optional
+
+from graph_theory.exceptions import GraphTheoryException, VertexError
+
+
+def _label(vertex: Any) -> Hashable:
+    """
+    Returns the plain label of a vertex, so that an index holds no graphlike objects.
+    """
+    return getattr(vertex, "name", vertex)
+
+
+def strongly_connected_components(successors: List[List[int]]) -> List[int]:
+    """
+    Finds the strongly connected components of a digraph on the vertices 0 to p-1, by Tarjan's algorithm (without
+    recursion).
+
+    The components are numbered in the order Tarjan's algorithm completes them, which is a reverse topological order
+    of the condensation: if there is an edge from component c1 to a distinct component c2, then c2 < c1.
+
+    :param successors: the successors of each vertex
+    :type successors: list(list(int))
+    :returns: the component of each vertex
+    :rtype: list(int)
+    """
+    p = len(successors)
+    index = [-1] * p
+    low = [0] * p
+    component = [-1] * p
+    stack = []
+    on_stack = [False] * p
+    counter = 0
+    components = 0
+    for root in range(p):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(successors[root]))]
+        while work:
+            vertex, children = work[-1]
+            for child in children:
+                if index[child] == -1:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack[child] = True
+                    work.append((child, iter(successors[child])))
+                    break
+                elif on_stack[child] and index[child] < low[vertex]:
+                    low[vertex] = index[child]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[vertex] < low[parent]:
+                        low[parent] = low[vertex]
+                if low[vertex] == index[vertex]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component[member] = components
+                        if member == vertex:
+                            break
+                    components += 1
+    return component
+
+
+def _condensation(successors: List[List[int]], component: List[int]) -> List[List[int]]:
+    """
+    Returns the successors of each component in the condensation of a digraph, without repeats or loops.
+    """
+    k = max(component) + 1 if component else 0
+    condensed = [set() for _ in range(k)]
+    for vertex, children in enumerate(successors):
+        c = component[vertex]
+        for child in children:
+            d = component[child]
+            if d != c:
+                condensed[c].add(d)
+    return [sorted(children) for children in condensed]
+
+
+class ReachabilityIndex(object):
+    """
+    Answers whether one vertex of a digraph reaches another.
+
+    :attribute method: "closure" or "interval"
+    :methods: reachable, save
+    :class_methods: from_digraph, load
+    """
+    # Condensations with more components than this are indexed by intervals unless a method is given.
+    closure_limit = 1 << 14
+
+    def __init__(self, labels: List[Hashable], component: array, method: str, closure: Optional[List[int]] = None,
+                 post: Optional[array] = None, indptr: Optional[array] = None, lows: Optional[array] = None,
+                 highs: Optional[array] = None):
+        """
+        Constructor. Use ReachabilityIndex.from_digraph or ReachabilityIndex.load rather than calling this directly.
+
+        :param labels: the vertex labels
+        :param component: the component of each vertex, aligned with labels
+        :param method: "closure" or "interval"
+        :param closure: ("closure" only) the bitset of components that each component reaches
+        :param post: ("interval" only) the post-order number of each component
+        :param indptr: ("interval" only) the intervals of component c are lows[indptr[c]:indptr[c + 1]] and
+            highs[indptr[c]:indptr[c + 1]]
+        :param lows: ("interval" only) interval lower bounds
+        :param highs: ("interval" only) interval upper bounds
+        """
+        self.labels = labels
+        self.component = component
+        self.method = method
+        self._closure = closure
+        self._post = post
+        self._indptr = indptr
+        self._lows = lows
+        self._highs = highs
+        self._components = {label: c for label, c in zip(labels, component)}  # type: Dict[Hashable, int]
+
+    @classmethod
+    def from_digraph(cls, digraph, method: Optional[str] = None) -> "ReachabilityIndex":
+        """
+        Builds the reachability index of a digraph.
+
+        :param digraph: The digraph to index
+        :type digraph: digraph.Digraph
+        :param method: (optional) "closure" or "interval"; by default, "closure" unless the condensation has more
+            than ReachabilityIndex.closure_limit components
+        :type method: str
+        :returns: reachability_index
+        :rtype: ReachabilityIndex
+        """
+        vertices = list(digraph.vertices)
+        ids = {vertex: i for i, vertex in enumerate(vertices)}
+        successors = [[ids[other] for other in digraph.adjacent(vertex)] for vertex in vertices]
+        component = strongly_connected_components(successors)
+        condensed = _condensation(successors, component)
+        if method is None:
+            method = "closure" if len(condensed) <= cls.closure_limit else "interval"
+        labels = [_label(vertex) for vertex in vertices]
+        component = array("q", component)
+        if method == "closure":
+            return cls(labels, component, method, closure=cls._closure_of(condensed))
+        elif method == "interval":
+            post, indptr, lows, highs = cls._intervals_of(condensed)
+            return cls(labels, component, method, post=post, indptr=indptr, lows=lows, highs=highs)
+        raise GraphTheoryException(
+            "UnknownMethod",
+            "Method should be one of ['closure', 'interval']. Got '{m}' instead.".format(
+                m=method
+            )
+        )
+
+    @staticmethod
+    def _closure_of(condensed: List[List[int]]) -> List[int]:
+        """
+        Returns the transitive closure of a condensation whose successors all have smaller numbers, as one bitset per
+        component.
+        """
+        closure = []
+        for c, children in enumerate(condensed):
+            bits = 1 << c
+            for d in children:
+                bits |= closure[d]
+            closure.append(bits)
+        return closure
+
+    @staticmethod
+    def _intervals_of(condensed: List[List[int]]):
+        """
+        Returns the tree-cover interval labelling of a condensation whose successors all have smaller numbers.
+
+        :returns: post, indptr, lows, highs
+        """
+        k = len(condensed)
+        has_parent = [False] * k
+        for children in condensed:
+            for d in children:
+                has_parent[d] = True
+        # Number a spanning forest in post-order, rooted at the sources of the condensation.
+        post = array("q", [-1]) * k
+        first = array("q", [0]) * k
+        counter = 0
+        for root in range(k - 1, -1, -1):
+            if has_parent[root] or post[root] != -1:
+                continue
+            post[root] = -2
+            first[root] = counter
+            work = [(root, iter(condensed[root]))]
+            while work:
+                c, children = work[-1]
+                for d in children:
+                    if post[d] == -1:
+                        post[d] = -2
+                        first[d] = counter
+                        work.append((d, iter(condensed[d])))
+                        break
+                else:
+                    work.pop()
+                    post[c] = counter
+                    counter += 1
+        # Each component reaches its own subtree, and everything its successors reach.
+        labels = []
+        for c, children in enumerate(condensed):
+            intervals = [(first[c], post[c])]
+            for d in children:
+                intervals.extend(labels[d])
+            intervals.sort()
+            merged = [intervals[0]]
+            for low, high in intervals[1:]:
+                last_low, last_high = merged[-1]
+                if low <= last_high + 1:
+                    if high > last_high:
+                        merged[-1] = (last_low, high)
+                else:
+                    merged.append((low, high))
+            labels.append(merged)
+        indptr = array("q", [0])
+        lows = array("q")
+        highs = array("q")
+        for intervals in labels:
+            for low, high in intervals:
+                lows.append(low)
+                highs.append(high)
+            indptr.append(len(lows))
+        return post, indptr, lows, highs
+
+    def _component_of(self, vertex: Any) -> int:
+        try:
+            return self._components[_label(vertex)]
+        except KeyError:
+            raise VertexError(
+                "ValueNotFound",
+                "Vertex {v} not found in the vertices of this index.".format(
+                    v=vertex
+                )
+            )
+
+    def reachable(self, v1: Any, v2: Any) -> bool:
+        """
+        Returns True if there is a directed path from v1 to v2. Every vertex reaches itself.
+
+        :param v1:
+        :param v2:
+        :type v1: Vertex
+        :type v2: Vertex
+        :returns: reachable
+        :rtype: bool
+        """
+        c1 = self._component_of(v1)
+        c2 = self._component_of(v2)
+        if self.method == "closure":
+            return bool(self._closure[c1] >> c2 & 1)
+        number = self._post[c2]
+        start = self._indptr[c1]
+        i = bisect_right(self._lows, number, start, self._indptr[c1 + 1]) - 1
+        return i >= start and number <= self._highs[i]
+
+    def save(self, path: str) -> None:
+        """
+        Writes the index to path.
+
+        :param path: file path
+        :type path: str
+        """
+        state = {
+            "labels": self.labels,
+            "component": self.component,
+            "method": self.method,
+            "closure": self._closure,
+            "post": self._post,
+            "indptr": self._indptr,
+            "lows": self._lows,
+            "highs": self._highs,
+        }
+        with open(path, "wb") as index_file:
+            pickle.dump(state, index_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "ReachabilityIndex":
+        """
+        Reads an index written by ReachabilityIndex.save.
+
+        :param path: file path
+        :type path: str
+        :returns: reachability_index
+        :rtype: ReachabilityIndex
+        """
+        with open(path, "rb") as index_file:
+            state = pickle.load(index_file)
+        return cls(**state)
+
+
+def reachability_index(digraph, method: Optional[str] = None) -> ReachabilityIndex:
+    """
+    Builds the reachability index of a digraph. See ReachabilityIndex.from_digraph.
+
+    :param digraph: The digraph to index
+    :type digraph: digraph.Digraph
+    :param method: (optional) "closure" or "interval"
+    :type method: str
+    :returns: reachability_index
+    :rtype: ReachabilityIndex
+    """
+    return ReachabilityIndex.from_digraph(digraph, method)
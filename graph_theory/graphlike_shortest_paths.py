@@ -0,0 +1,442 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+This module contains methods that find the shortest paths from one vertex of a digraph to every other, and a cache of
+their results.
+
+Searches run over the frozen form of the digraph, which is itself kept until the digraph changes (see
+Graphlike.version), and return a ShortestPaths: the distance and the predecessor on a shortest path of each vertex, by
+vertex id, in two packed arrays. Two algorithms are provided:
+    "dijkstra" Dijkstra's algorithm with a binary heap, over the edge weights (1 for each edge of an unweighted
+        digraph). Weights must not be negative.
+    "bfs" breadth first search, counting edges and ignoring weights.
+
+When only edge weights change, a result can be repaired rather than found again: ShortestPaths.repair revisits only the
+vertices whose paths the changes can affect, in the manner of Ramalingam and Reps. WeightedDigraph.update_weights does
+this for every result in the digraph's cache.
+
+A ShortestPathCache holds the results of a digraph's searches, keyed by (source, frozen form, algorithm), up to a number
+of entries and a number of bytes, and drops the least recently used first. It is opt in:
+
+    digraph.shortest_path_cache = ShortestPathCache(max_entries=4096, max_bytes=64 << 20)
+    digraph.shortest_paths(origin).distance(destination)    # searches once per origin and frozen form
+"""
+import math
+from array import array
+from collections import OrderedDict, deque
+from bisect import bisect_right
+from heapq import heappop, heappush
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+
+from graph_theory.exceptions import EdgeError, GraphTheoryException
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+
+
+class ShortestPaths(object):
+    """
+    The shortest paths from one source vertex: the distance of each vertex (inf if it cannot be reached), and its
+    predecessor on a shortest path (-1 for the source and for vertices that cannot be reached), by vertex id.
+
+    :methods: distance, path, to_dict, repair
+    """
+    def __init__(self, graph, source: int, distances: array, predecessors: array, algorithm: str = "dijkstra"):
+        """
+        :param graph: the frozen digraph searched
+        :type graph: FrozenDigraph
+        :param source: the id of the source vertex
+        :param distances: the distance to each vertex, by id
+        :param predecessors: the id of the predecessor of each vertex, by id
+        :param algorithm: (optional) the algorithm that found the paths
+        :type distances: array('d')
+        :type predecessors: array('q')
+        """
+        self.graph = graph
+        self.source = source
+        self.distances = distances
+        self.predecessors = predecessors
+        self.algorithm = algorithm
+        # The shortest path tree as first child, next sibling and previous sibling links, built by the first repair.
+        self._first = None  # type: Optional[array]
+        self._next = None  # type: Optional[array]
+        self._previous = None  # type: Optional[array]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes held by the arrays of the result; the graph is shared, and not counted.
+        :rtype: int
+        """
+        return (
+            self.distances.itemsize * len(self.distances) + self.predecessors.itemsize * len(self.predecessors)
+        )
+
+    def distance(self, vertex: Hashable) -> float:
+        """
+        Returns the distance from the source to vertex, or inf if it cannot be reached.
+
+        :param vertex:
+        :type vertex: Vertex
+        :rtype: float
+        """
+        return self.distances[self.graph.vertex_id(vertex)]
+
+    def path(self, vertex: Hashable) -> List[Hashable]:
+        """
+        Returns a shortest path from the source to vertex, as the list of the vertices on it from the source to
+        vertex, or an empty list if vertex cannot be reached.
+
+        :param vertex:
+        :type vertex: Vertex
+        :rtype: list
+        """
+        i = self.graph.vertex_id(vertex)
+        if self.distances[i] == math.inf:
+            return []
+        labels = self.graph.labels
+        predecessors = self.predecessors
+        path = []
+        while i != -1:
+            path.append(labels[i])
+            i = predecessors[i]
+        path.reverse()
+        return path
+
+    def to_dict(self) -> Dict[Hashable, Dict[str, Any]]:
+        """
+        Returns the paths in the format of Digraph.dijkstra_distance:
+            {vertex: {'path': [source, ..., vertex], 'distance': distance}}
+
+        :rtype: dict(dict)
+        """
+        return {
+            label: {
+                'path': self.path(label),
+                'distance': self.distances[i]
+            }
+            for i, label in enumerate(self.graph.labels)
+        }
+
+    def _build_tree(self) -> None:
+        """
+        Builds the child links of the shortest path tree from the predecessors.
+        """
+        n = len(self.predecessors)
+        self._first = array("q", [-1]) * n
+        self._next = array("q", [-1]) * n
+        self._previous = array("q", [-1]) * n
+        for i, parent in enumerate(self.predecessors):
+            if parent != -1:
+                self._attach(i, parent)
+
+    def _attach(self, i: int, parent: int) -> None:
+        """
+        Makes parent the predecessor of i, in the tree as well as in the predecessors.
+        """
+        first = self._first[parent]
+        self._next[i] = first
+        self._previous[i] = -1
+        if first != -1:
+            self._previous[first] = i
+        self._first[parent] = i
+        self.predecessors[i] = parent
+
+    def _detach(self, i: int) -> None:
+        """
+        Removes i from the children of its predecessor.
+        """
+        parent = self.predecessors[i]
+        if parent == -1:
+            return
+        following, previous = self._next[i], self._previous[i]
+        if previous == -1:
+            self._first[parent] = following
+        else:
+            self._next[previous] = following
+        if following != -1:
+            self._previous[following] = previous
+        self.predecessors[i] = -1
+
+    def _subtree(self, i: int) -> List[int]:
+        """
+        Returns i and its descendants in the shortest path tree.
+        """
+        first = self._first
+        following = self._next
+        subtree = []
+        stack = [i]
+        while stack:
+            j = stack.pop()
+            subtree.append(j)
+            child = first[j]
+            while child != -1:
+                stack.append(child)
+                child = following[child]
+        return subtree
+
+    def repair(self, graph, changed: Iterable[int]) -> None:
+        """
+        Updates the paths, in place, for a new version of the digraph whose edges are those of the old one, but with
+        the weights of the changed edges replaced (see FrozenDigraph.reweighted), in the manner of Ramalingam and Reps.
+        Only the vertices whose distance or path can change are visited: the subtrees, in the shortest path tree,
+        below edges that got heavier, and the vertices that edges that got lighter bring closer.
+
+        :param graph: the new version of the digraph
+        :type graph: FrozenDigraph
+        :param changed: the ids of the edges whose weights changed
+        :type changed: iterable(int)
+        """
+        old_weights = self.graph.weights
+        self.graph = graph
+        if self.algorithm != "dijkstra" or old_weights is None:
+            return
+        if self._first is None:
+            self._build_tree()
+        weights = graph.weights
+        indptr = graph.indptr
+        indices = graph.indices
+        distances = self.distances
+        predecessors = self.predecessors
+        changed = [(bisect_right(indptr, k) - 1, indices[k], k) for k in changed]
+        for _, _, k in changed:
+            if weights[k] < 0:
+                raise EdgeError(
+                    "NegativeWeight",
+                    "Dijkstra's algorithm needs weights of at least 0. Got {w}.".format(
+                        w=weights[k]
+                    )
+                )
+        # Heavier tree edges: every vertex below one loses its distance, and is offered the best edge into it from
+        # the vertices that kept theirs.
+        affected = []
+        for u, v, k in changed:
+            if predecessors[v] == u and weights[k] > old_weights[k]:
+                affected.extend(self._subtree(v))
+        for i in affected:
+            distances[i] = math.inf
+        for i in affected:
+            self._detach(i)
+        heap = []
+        if affected:
+            reverse_indptr, reverse_indices, reverse_ids = graph._predecessors()
+            for i in affected:
+                for position in range(reverse_indptr[i], reverse_indptr[i + 1]):
+                    j = reverse_indices[position]
+                    distance = distances[j] + weights[reverse_ids[position]]
+                    if distance < math.inf:
+                        heappush(heap, (distance, i, j))
+        # Lighter edges: offer each a shorter path to its end.
+        for u, v, k in changed:
+            if distances[u] + weights[k] < distances[v]:
+                heappush(heap, (distances[u] + weights[k], v, u))
+        # Settle the offers in order of distance, as Dijkstra's algorithm does, passing improvements on.
+        while heap:
+            distance, i, parent = heappop(heap)
+            if distance >= distances[i]:
+                continue
+            distances[i] = distance
+            self._detach(i)
+            self._attach(i, parent)
+            for k in range(indptr[i], indptr[i + 1]):
+                j = indices[k]
+                if distance + weights[k] < distances[j]:
+                    heappush(heap, (distance + weights[k], j, i))
+
+
+def _dijkstra(graph, source: int) -> Tuple[array, array]:
+    """
+    Returns the distances and predecessors from the vertex with id source, by Dijkstra's algorithm.
+    """
+    indptr = graph.indptr
+    indices = graph.indices
+    weights = graph.weights
+    distances = array("d", [math.inf]) * graph.order
+    predecessors = array("q", [-1]) * graph.order
+    done = bytearray(graph.order)
+    distances[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        distance, i = heappop(heap)
+        if done[i]:
+            continue
+        done[i] = 1
+        for k in range(indptr[i], indptr[i + 1]):
+            weight = 1.0 if weights is None else weights[k]
+            if weight < 0:
+                raise EdgeError(
+                    "NegativeWeight",
+                    "Dijkstra's algorithm needs weights of at least 0. Got {w}.".format(
+                        w=weight
+                    )
+                )
+            j = indices[k]
+            if distance + weight < distances[j]:
+                distances[j] = distance + weight
+                predecessors[j] = i
+                heappush(heap, (distance + weight, j))
+    return distances, predecessors
+
+
+def _breadth_first(graph, source: int) -> Tuple[array, array]:
+    """
+    Returns the number of edges on a shortest path, and the predecessors, from the vertex with id source.
+    """
+    indptr = graph.indptr
+    indices = graph.indices
+    distances = array("d", [math.inf]) * graph.order
+    predecessors = array("q", [-1]) * graph.order
+    distances[source] = 0.0
+    queue = deque([source])
+    while queue:
+        i = queue.popleft()
+        distance = distances[i] + 1
+        for j in indices[indptr[i]:indptr[i + 1]]:
+            if distances[j] == math.inf:
+                distances[j] = distance
+                predecessors[j] = i
+                queue.append(j)
+    return distances, predecessors
+
+
+algorithms = {
+    "dijkstra": _dijkstra,
+    "bfs": _breadth_first,
+}  # type: Dict[str, Callable[[Any, int], Tuple[array, array]]]
+
+
+def shortest_paths(graph, vertex: Hashable, algorithm: str = "dijkstra") -> ShortestPaths:
+    """
+    Finds the shortest paths from vertex to every vertex of a digraph. Mutable digraphs are frozen first.
+
+    :param graph: The digraph to search
+    :type graph: Digraph or FrozenDigraph
+    :param vertex: the source vertex
+    :param algorithm: (optional) "dijkstra" (default) or "bfs"
+    :rtype: ShortestPaths
+    """
+    if algorithm not in algorithms:
+        raise GraphTheoryException(
+            "UnknownAlgorithm",
+            "Algorithm should be one of {a}. Got '{g}' instead.".format(
+                a=sorted(algorithms),
+                g=algorithm
+            )
+        )
+    if not isinstance(graph, FrozenDigraph):
+        graph = graph.freeze()
+    source = graph.vertex_id(vertex)
+    distances, predecessors = algorithms[algorithm](graph, source)
+    return ShortestPaths(graph, source, distances, predecessors, algorithm)
+
+
+class CacheStats(NamedTuple):
+    """
+    The counters of a ShortestPathCache.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+
+
+class ShortestPathCache(object):
+    """
+    The shortest path results of a digraph, keyed by (source, frozen form, algorithm), holding at most max_entries
+    results and max_bytes bytes of arrays, and dropping the least recently used first. The frozen form identifies both
+    the digraph and its version, so results are held for one frozen form at a time: they are dropped as soon as
+    another is asked for, whether of a newer version or of another digraph sharing the cache.
+
+    :methods: get, repair, clear, stats
+    """
+    def __init__(self, max_entries: int = 1024, max_bytes: Optional[int] = None):
+        """
+        :param max_entries: (optional) the most results to hold
+        :param max_bytes: (optional) the most bytes of result arrays to hold; unbounded by default
+        :type max_entries: int
+        :type max_bytes: int
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._graph = None  # type: Optional[FrozenDigraph]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, source: Hashable, graph: FrozenDigraph, algorithm: str,
+            compute: Callable[[], ShortestPaths]) -> ShortestPaths:
+        """
+        Returns the cached result for (source, graph, algorithm), or computes, caches and returns it.
+
+        :param source: the label of the source vertex
+        :param graph: the frozen form of the digraph that compute searches
+        :type graph: FrozenDigraph
+        :param algorithm: the name of the algorithm
+        :param compute: a function of no arguments that finds the result
+        :rtype: ShortestPaths
+        """
+        if graph is not self._graph:
+            self.evictions += len(self._entries)
+            self.clear()
+            self._graph = graph
+        key = (source, algorithm)
+        result = self._entries.get(key)
+        if result is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return result
+        self.misses += 1
+        result = compute()
+        if self.max_bytes is not None and result.nbytes > self.max_bytes:
+            return result
+        self._entries[key] = result
+        self.nbytes += result.nbytes
+        while len(self._entries) > self.max_entries or self.max_bytes is not None and self.nbytes > self.max_bytes:
+            _, dropped = self._entries.popitem(last=False)
+            self.nbytes -= dropped.nbytes
+            self.evictions += 1
+        return result
+
+    def repair(self, previous, graph, changed: Iterable[int]) -> None:
+        """
+        Carries the results found on the previous frozen form of the digraph over to a new one that differs only in
+        the weights of the changed edges, repairing each in place (see ShortestPaths.repair) rather than dropping it.
+        Any other results are dropped.
+
+        :param previous: the frozen digraph before the change
+        :type previous: FrozenDigraph
+        :param graph: the frozen digraph after the change
+        :type graph: FrozenDigraph
+        :param changed: the ids of the edges whose weights changed
+        """
+        changed = list(changed)
+        entries = OrderedDict()
+        for key, result in self._entries.items():
+            if result.graph is previous:
+                result.repair(graph, changed)
+                entries[key] = result
+            else:
+                self.nbytes -= result.nbytes
+                self.evictions += 1
+        self._entries = entries
+        self._graph = graph
+
+    def clear(self) -> None:
+        """
+        Drops every result. The counters are kept.
+        """
+        self._entries.clear()
+        self.nbytes = 0
+
+    def stats(self) -> CacheStats:
+        """
+        Returns the hit, miss and eviction counters, and the number of entries and bytes held.
+        :rtype: CacheStats
+        """
+        return CacheStats(self.hits, self.misses, self.evictions, len(self._entries), self.nbytes)
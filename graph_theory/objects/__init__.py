@@ -1,8 +1,15 @@
 __all__ = [
+    "adjacency",
+    "attributes",
     "digraph",
+    "frozen_digraph",
+    "frozen_graph",
     "graph",
     "graphlike",
+    "snapshot",
+    "sqlite_digraph",
     "weighted_digraph",
     "weighted_graph",
     "tree",
+    "views",
     ]
\ No newline at end of file
@@ -0,0 +1,578 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+Adjacency indexes for graphlike objects. Where the vertices, edges and adjacency_matrix properties describe a
+graphlike object mathematically, an adjacency index answers the questions asked of it most often (is there an edge
+from v1 to v2, what is adjacent to v, how many neighbours do v1 and v2 share) without searching those collections.
+
+Two interchangeable backends are provided:
+    SetAdjacency keeps the successors and predecessors of each vertex in a hash set. This is the default, and suits
+        sparse graphs.
+    BitsetAdjacency numbers the vertices 0 to p-1 and keeps the successors and predecessors of each vertex as a packed
+        bitset (a Python int). Membership is a shift and a mask, and neighbourhood intersections, unions and common
+        neighbour counts are word-parallel. This suits dense graphs, where a set per vertex costs far more memory and
+        time than p bits.
+
+Removing a vertex costs time in its degree. The bitset backend leaves the number of a removed vertex unused (a
+tombstone) rather than renumbering the others, and compacts the numbering once the tombstones outnumber the vertices.
+
+An index may also be shared (see share()), for snapshots of a graphlike object: the set backend then copies a row of
+successors or predecessors only when it is first changed, and the bitset backend, whose rows are ints, copies its
+lists of rows alone.
+"""
+from abc import ABCMeta, abstractmethod
+from array import array
+from typing import Any, Dict, Hashable, List, Sequence, Set, Tuple
+
+from graph_theory.exceptions import EdgeError, VertexError
+
+
+def _popcount(bits: int) -> int:
+    """
+    Returns the number of set bits in a nonnegative int.
+    :param bits:
+    :type bits: int
+    :rtype: int
+    """
+    return bin(bits).count("1")
+
+
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+
+
+class BaseAdjacency(object):
+    """
+    Abstract adjacency index over hashable vertex labels. Each edge is directed; undirected graphs add both
+    directions.
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def __init__(self, vertices=()):
+        """
+        Constructor
+        :param vertices: the initial vertices
+        """
+        self.add_vertices(*vertices)
+
+    @abstractmethod
+    def __contains__(self, vertex: Hashable) -> bool:
+        return False
+
+    @abstractmethod
+    def __len__(self) -> int:
+        return 0
+
+    @abstractmethod
+    def add_vertices(self, *vertices: Hashable) -> None:
+        """
+        Adds vertices with no edges. Vertices already present are left untouched.
+        """
+        return None
+
+    @abstractmethod
+    def add_edge(self, v1: Hashable, v2: Hashable) -> None:
+        """
+        Adds the edge from v1 to v2. Both must already be vertices.
+        """
+        return None
+
+    @abstractmethod
+    def remove_vertices(self, *vertices: Hashable) -> None:
+        """
+        Removes vertices, and every edge to or from them. Vertices not present are ignored.
+        """
+        return None
+
+    @abstractmethod
+    def remove_edge(self, v1: Hashable, v2: Hashable) -> None:
+        """
+        Removes the edge from v1 to v2, if there is one. Both must be vertices.
+        """
+        return None
+
+    @abstractmethod
+    def is_edge(self, v1: Hashable, v2: Hashable) -> bool:
+        """
+        Returns True if there is an edge from v1 to v2.
+        """
+        return False
+
+    @abstractmethod
+    def successors(self, vertex: Hashable) -> Set[Hashable]:
+        """
+        Returns the set of vertices that vertex has an edge to.
+        """
+        return set()
+
+    @abstractmethod
+    def predecessors(self, vertex: Hashable) -> Set[Hashable]:
+        """
+        Returns the set of vertices that have an edge to vertex.
+        """
+        return set()
+
+    def out_degree(self, vertex: Hashable) -> int:
+        """
+        Returns the number of edges from vertex.
+        """
+        return len(self.successors(vertex))
+
+    def in_degree(self, vertex: Hashable) -> int:
+        """
+        Returns the number of edges to vertex.
+        """
+        return len(self.predecessors(vertex))
+
+    def common_successors(self, v1: Hashable, v2: Hashable) -> int:
+        """
+        Returns the number of vertices that both v1 and v2 have an edge to.
+        """
+        return len(self.intersection(v1, v2))
+
+    @abstractmethod
+    def intersection(self, *vertices: Hashable) -> Set[Hashable]:
+        """
+        Returns the set of vertices that every one of vertices has an edge to.
+        """
+        return set()
+
+    @abstractmethod
+    def union(self, *vertices: Hashable) -> Set[Hashable]:
+        """
+        Returns the set of vertices that any one of vertices has an edge to.
+        """
+        return set()
+
+    @abstractmethod
+    def difference(self, vertex: Hashable, *vertices: Hashable) -> Set[Hashable]:
+        """
+        Returns the set of vertices that vertex has an edge to, and that none of vertices have an edge to.
+        """
+        return set()
+
+    @abstractmethod
+    def is_complete(self) -> bool:
+        """
+        Returns True if there is an edge from each vertex to every other vertex.
+        """
+        return False
+
+    @abstractmethod
+    def copy(self) -> "BaseAdjacency":
+        """
+        Returns an independent copy of the index.
+        """
+        return self
+
+    def share(self) -> "BaseAdjacency":
+        """
+        Returns a copy of the index to be changed in its place, while the index itself is kept unchanged: the copy
+        may share storage with the index, and copies what it shares only as it changes it.
+        """
+        return self.copy()
+
+    def is_edge_many(self, sources: Sequence[Hashable], targets: Sequence[Hashable]) -> array:
+        """
+        Returns, for each i, whether there is an edge from sources[i] to targets[i].
+
+        :param sources:
+        :param targets:
+        :returns: is_edge, as 1 or 0 for each pair
+        :rtype: array('b')
+        """
+        self._check_lengths(sources, targets)
+        return array("b", [self.is_edge(v1, v2) for v1, v2 in zip(sources, targets)])
+
+    def neighbors_many(self, vertices: Sequence[Hashable]) -> Tuple[array, List[Hashable]]:
+        """
+        Returns the successors of each of vertices, in compressed sparse row form: the successors of vertices[i] are
+        neighbours[indptr[i]:indptr[i + 1]].
+
+        :param vertices:
+        :returns: indptr, neighbours
+        :rtype: tuple(array('q'), list)
+        """
+        indptr = array("q", [0])
+        neighbours = []
+        for vertex in vertices:
+            neighbours.extend(self.successors(vertex))
+            indptr.append(len(neighbours))
+        return indptr, neighbours
+
+    @staticmethod
+    def _check_lengths(sources: Sequence[Hashable], targets: Sequence[Hashable]) -> None:
+        """
+        Raises EdgeError unless there are as many sources as targets.
+        """
+        if len(sources) != len(targets):
+            raise EdgeError(
+                "LengthMismatch",
+                "Expected as many sources as targets. Got {s} and {t}.".format(
+                    s=len(sources),
+                    t=len(targets)
+                )
+            )
+
+    @staticmethod
+    def _missing(vertex: Hashable) -> VertexError:
+        """
+        Returns the error raised when a vertex is not indexed.
+        """
+        return VertexError(
+            "ValueNotFound",
+            "Vertex {v} not found in the vertices of this graph.".format(
+                v=vertex
+            )
+        )
+
+
+class SetAdjacency(BaseAdjacency):
+    """
+    Adjacency index holding the successors and predecessors of each vertex in a set.
+    """
+    # The vertices whose rows of successors and predecessors this index may change in place, or None for all of them.
+    _owned_successors = None
+    _owned_predecessors = None
+    def __init__(self, vertices=()):
+        """
+        Constructor
+        :param vertices: the initial vertices
+        """
+        self._successors = {}  # type: Dict[Hashable, Set[Hashable]]
+        self._predecessors = {}  # type: Dict[Hashable, Set[Hashable]]
+        super(SetAdjacency, self).__init__(vertices)
+
+    def __contains__(self, vertex: Hashable) -> bool:
+        return vertex in self._successors
+
+    def __len__(self) -> int:
+        return len(self._successors)
+
+    @staticmethod
+    def _writable(rows: Dict[Hashable, Set[Hashable]], owned: Set[Hashable], vertex: Hashable) -> Set[Hashable]:
+        """
+        Returns the row of vertex in rows to be changed, copying it first if it is shared (see share()).
+        """
+        row = rows[vertex]
+        if owned is not None and vertex not in owned:
+            row = rows[vertex] = set(row)
+            owned.add(vertex)
+        return row
+
+    def add_vertices(self, *vertices: Hashable) -> None:
+        for vertex in vertices:
+            if vertex not in self._successors:
+                self._successors[vertex] = set()
+                self._predecessors[vertex] = set()
+                if self._owned_successors is not None:
+                    self._owned_successors.add(vertex)
+                    self._owned_predecessors.add(vertex)
+
+    def add_edge(self, v1: Hashable, v2: Hashable) -> None:
+        try:
+            successors = self._writable(self._successors, self._owned_successors, v1)
+            predecessors = self._writable(self._predecessors, self._owned_predecessors, v2)
+        except KeyError as error:
+            raise self._missing(error.args[0])
+        successors.add(v2)
+        predecessors.add(v1)
+
+    def remove_vertices(self, *vertices: Hashable) -> None:
+        for vertex in vertices:
+            successors = self._successors.pop(vertex, None)
+            if successors is None:
+                continue
+            predecessors = self._predecessors.pop(vertex)
+            for other in successors:
+                self._writable(self._predecessors, self._owned_predecessors, other).discard(vertex)
+            for other in predecessors:
+                self._writable(self._successors, self._owned_successors, other).discard(vertex)
+
+    def remove_edge(self, v1: Hashable, v2: Hashable) -> None:
+        try:
+            successors = self._writable(self._successors, self._owned_successors, v1)
+            predecessors = self._writable(self._predecessors, self._owned_predecessors, v2)
+        except KeyError as error:
+            raise self._missing(error.args[0])
+        successors.discard(v2)
+        predecessors.discard(v1)
+
+    def is_edge(self, v1: Hashable, v2: Hashable) -> bool:
+        try:
+            return v2 in self._successors[v1]
+        except KeyError:
+            raise self._missing(v1)
+
+    def successors(self, vertex: Hashable) -> Set[Hashable]:
+        try:
+            return set(self._successors[vertex])
+        except KeyError:
+            raise self._missing(vertex)
+
+    def predecessors(self, vertex: Hashable) -> Set[Hashable]:
+        try:
+            return set(self._predecessors[vertex])
+        except KeyError:
+            raise self._missing(vertex)
+
+    def out_degree(self, vertex: Hashable) -> int:
+        try:
+            return len(self._successors[vertex])
+        except KeyError:
+            raise self._missing(vertex)
+
+    def in_degree(self, vertex: Hashable) -> int:
+        try:
+            return len(self._predecessors[vertex])
+        except KeyError:
+            raise self._missing(vertex)
+
+    def _rows(self, vertices) -> List[Set[Hashable]]:
+        try:
+            return [self._successors[vertex] for vertex in vertices]
+        except KeyError as error:
+            raise self._missing(error.args[0])
+
+    def intersection(self, *vertices: Hashable) -> Set[Hashable]:
+        if not vertices:
+            return set()
+        rows = sorted(self._rows(vertices), key=len)
+        return rows[0].intersection(*rows[1:])
+
+    def union(self, *vertices: Hashable) -> Set[Hashable]:
+        return set().union(*self._rows(vertices))
+
+    def difference(self, vertex: Hashable, *vertices: Hashable) -> Set[Hashable]:
+        rows = self._rows((vertex,) + vertices)
+        return rows[0].difference(*rows[1:])
+
+    def is_complete(self) -> bool:
+        others = len(self._successors) - 1
+        return all(
+            len(successors) == others and vertex not in successors
+            for vertex, successors in self._successors.items()
+        )
+
+    def copy(self) -> "SetAdjacency":
+        clone = SetAdjacency.__new__(SetAdjacency)
+        clone._successors = {vertex: set(row) for vertex, row in self._successors.items()}
+        clone._predecessors = {vertex: set(row) for vertex, row in self._predecessors.items()}
+        return clone
+
+    def share(self) -> "SetAdjacency":
+        # The rows are shared, and copied by the copy as it changes them; the index itself stays as it is.
+        clone = SetAdjacency.__new__(SetAdjacency)
+        clone._successors = dict(self._successors)
+        clone._predecessors = dict(self._predecessors)
+        clone._owned_successors = set()
+        clone._owned_predecessors = set()
+        return clone
+
+    def is_edge_many(self, sources: Sequence[Hashable], targets: Sequence[Hashable]) -> array:
+        self._check_lengths(sources, targets)
+        successors = self._successors
+        try:
+            return array("b", [v2 in successors[v1] for v1, v2 in zip(sources, targets)])
+        except KeyError as error:
+            raise self._missing(error.args[0])
+
+    def neighbors_many(self, vertices: Sequence[Hashable]) -> Tuple[array, List[Hashable]]:
+        rows = self._rows(vertices)
+        indptr = array("q", [0])
+        neighbours = []
+        for row in rows:
+            neighbours.extend(row)
+            indptr.append(len(neighbours))
+        return indptr, neighbours
+
+
+class BitsetAdjacency(BaseAdjacency):
+    """
+    Adjacency index holding the successors and predecessors of each vertex as a bitset, bit i standing for the
+    vertex numbered i.
+    """
+    def __init__(self, vertices=()):
+        """
+        Constructor
+        :param vertices: the initial vertices
+        """
+        self._ids = {}  # type: Dict[Hashable, int]
+        self._labels = []  # type: List[Hashable]
+        self._out = []  # type: List[int]
+        self._in = []  # type: List[int]
+        # The numbers of removed vertices, whose bits are clear in every row, until the next compaction.
+        self._dead = 0
+        super(BitsetAdjacency, self).__init__(vertices)
+
+    def __contains__(self, vertex: Hashable) -> bool:
+        return vertex in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _id(self, vertex: Hashable) -> int:
+        try:
+            return self._ids[vertex]
+        except KeyError:
+            raise self._missing(vertex)
+
+    def _decode(self, bits: int) -> Set[Hashable]:
+        """
+        Returns the set of vertices whose bits are set in bits.
+        """
+        labels = self._labels
+        vertices = set()
+        while bits:
+            low = bits & -bits
+            vertices.add(labels[low.bit_length() - 1])
+            bits ^= low
+        return vertices
+
+    def add_vertices(self, *vertices: Hashable) -> None:
+        for vertex in vertices:
+            if vertex not in self._ids:
+                self._ids[vertex] = len(self._labels)
+                self._labels.append(vertex)
+                self._out.append(0)
+                self._in.append(0)
+
+    def add_edge(self, v1: Hashable, v2: Hashable) -> None:
+        i, j = self._id(v1), self._id(v2)
+        self._out[i] |= 1 << j
+        self._in[j] |= 1 << i
+
+    def remove_vertices(self, *vertices: Hashable) -> None:
+        out = self._out
+        into = self._in
+        for vertex in vertices:
+            i = self._ids.pop(vertex, None)
+            if i is None:
+                continue
+            mask = ~(1 << i)
+            for rows, bits in ((into, out[i]), (out, into[i])):
+                while bits:
+                    low = bits & -bits
+                    rows[low.bit_length() - 1] &= mask
+                    bits ^= low
+            out[i] = into[i] = 0
+            self._labels[i] = None
+            self._dead += 1
+        if self._dead > len(self._ids):
+            self.compact()
+
+    def remove_edge(self, v1: Hashable, v2: Hashable) -> None:
+        i, j = self._id(v1), self._id(v2)
+        self._out[i] &= ~(1 << j)
+        self._in[j] &= ~(1 << i)
+
+    def compact(self) -> None:
+        """
+        Numbers the vertices 0 to p-1 again, in their present order, reclaiming the numbers of removed vertices.
+        """
+        if not self._dead:
+            return
+        live = sorted(self._ids.values())
+        renumber = {i: new for new, i in enumerate(live)}
+
+        def moved(bits: int) -> int:
+            result = 0
+            while bits:
+                low = bits & -bits
+                result |= 1 << renumber[low.bit_length() - 1]
+                bits ^= low
+            return result
+
+        self._labels = [self._labels[i] for i in live]
+        self._out = [moved(self._out[i]) for i in live]
+        self._in = [moved(self._in[i]) for i in live]
+        self._ids = {label: i for i, label in enumerate(self._labels)}
+        self._dead = 0
+
+    def is_edge(self, v1: Hashable, v2: Hashable) -> bool:
+        j = self._ids.get(v2)
+        return j is not None and bool(self._out[self._id(v1)] >> j & 1)
+
+    def successors(self, vertex: Hashable) -> Set[Hashable]:
+        return self._decode(self._out[self._id(vertex)])
+
+    def predecessors(self, vertex: Hashable) -> Set[Hashable]:
+        return self._decode(self._in[self._id(vertex)])
+
+    def out_degree(self, vertex: Hashable) -> int:
+        return _popcount(self._out[self._id(vertex)])
+
+    def in_degree(self, vertex: Hashable) -> int:
+        return _popcount(self._in[self._id(vertex)])
+
+    def common_successors(self, v1: Hashable, v2: Hashable) -> int:
+        return _popcount(self._out[self._id(v1)] & self._out[self._id(v2)])
+
+    def intersection(self, *vertices: Hashable) -> Set[Hashable]:
+        if not vertices:
+            return set()
+        bits = self._out[self._id(vertices[0])]
+        for vertex in vertices[1:]:
+            bits &= self._out[self._id(vertex)]
+        return self._decode(bits)
+
+    def union(self, *vertices: Hashable) -> Set[Hashable]:
+        bits = 0
+        for vertex in vertices:
+            bits |= self._out[self._id(vertex)]
+        return self._decode(bits)
+
+    def difference(self, vertex: Hashable, *vertices: Hashable) -> Set[Hashable]:
+        bits = self._out[self._id(vertex)]
+        for other in vertices:
+            bits &= ~self._out[self._id(other)]
+        return self._decode(bits)
+
+    def is_complete(self) -> bool:
+        # A query never compacts, so that readers of a shared index do not renumber it: the numbers of removed
+        # vertices are left out of the mask instead.
+        live = self._ids.values()
+        full = sum(1 << i for i in live)
+        out = self._out
+        return all(out[i] == full ^ (1 << i) for i in live)
+
+    def copy(self) -> "BitsetAdjacency":
+        clone = BitsetAdjacency.__new__(BitsetAdjacency)
+        clone._ids = dict(self._ids)
+        clone._labels = list(self._labels)
+        clone._out = list(self._out)
+        clone._in = list(self._in)
+        clone._dead = self._dead
+        return clone
+
+    def is_edge_many(self, sources: Sequence[Hashable], targets: Sequence[Hashable]) -> array:
+        self._check_lengths(sources, targets)
+        ids = self._ids
+        out = self._out
+        try:
+            rows = [out[ids[v1]] for v1 in sources]
+        except KeyError as error:
+            raise self._missing(error.args[0])
+        return array("b", [j is not None and row >> j & 1 for row, j in zip(rows, map(ids.get, targets))])
+
+    def neighbors_many(self, vertices: Sequence[Hashable]) -> Tuple[array, List[Hashable]]:
+        labels = self._labels
+        indptr = array("q", [0])
+        neighbours = []
+        for vertex in vertices:
+            bits = self._out[self._id(vertex)]
+            while bits:
+                low = bits & -bits
+                neighbours.append(labels[low.bit_length() - 1])
+                bits ^= low
+            indptr.append(len(neighbours))
+        return indptr, neighbours
+
+
+backends = {
+    "set": SetAdjacency,
+    "bitset": BitsetAdjacency,
+}
@@ -0,0 +1,310 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+Columnar attributes for the vertices and edges of frozen graphs. A Vertex carries only a name, and a weighted edge a
+single weight; any number of further typed attributes (timestamps, capacities, categories) are kept here, one packed
+column per attribute, indexed by vertex id or edge id, rather than on each object.
+
+Numeric columns are arrays of one of the array module's typecodes ("q" for integers and timestamps, "d" for reals, "b"
+for flags, and so on). Category columns store a small integer code per row and the list of distinct categories once.
+
+Comparing a column with a value gives a Mask, one byte per row; masks combine with &, | and ~, working on all of
+their bytes at once, and Mask.ids() lists the matching rows:
+
+    weight = graph.edge_attributes["weight"]
+    recent = graph.edge_attributes["timestamp"] >= cutoff
+    edges = graph.edges_where((weight > 0.5) & recent)
+"""
+import operator
+from array import array
+from itertools import compress, repeat
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Union
+
+from graph_theory.exceptions import GraphTheoryException, MatrixError
+
+
+class Mask(object):
+    """
+    A selection of rows: one byte per row, 1 where the row is selected and 0 where it is not.
+    """
+    def __init__(self, flags: bytes):
+        """
+        :param flags: one byte, 0 or 1, per row
+        :type flags: bytes
+        """
+        self.flags = bytes(flags)
+
+    def __len__(self) -> int:
+        return len(self.flags)
+
+    def _combine(self, other: "Mask", combine: Callable[[int, int], int]) -> "Mask":
+        if len(other) != len(self):
+            raise MatrixError(
+                "ShapeError",
+                "Masks of {a} and {b} rows cannot be combined.".format(
+                    a=len(self),
+                    b=len(other)
+                )
+            )
+        bits = combine(int.from_bytes(self.flags, "little"), int.from_bytes(other.flags, "little"))
+        return Mask(bits.to_bytes(len(self), "little"))
+
+    def __and__(self, other: "Mask") -> "Mask":
+        return self._combine(other, operator.and_)
+
+    def __or__(self, other: "Mask") -> "Mask":
+        return self._combine(other, operator.or_)
+
+    def __invert__(self) -> "Mask":
+        return self._combine(self, lambda bits, _: bits ^ int.from_bytes(b"\x01" * len(self), "little"))
+
+    def count(self) -> int:
+        """
+        Returns the number of selected rows.
+        """
+        return self.flags.count(1)
+
+    def ids(self) -> array:
+        """
+        Returns the selected rows, in order.
+
+        :rtype: array('q')
+        """
+        return array("q", compress(range(len(self.flags)), self.flags))
+
+
+class BaseColumn(object):
+    """
+    A column of values, one per row. Comparisons with a value give a Mask.
+    """
+    kind = None  # type: str
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(self, i: int) -> Any:
+        raise NotImplementedError
+
+    def _compare(self, comparison: Callable[[Any, Any], bool], value: Any) -> Mask:
+        raise NotImplementedError
+
+    def __eq__(self, value: Any) -> Mask:
+        return self._compare(operator.eq, value)
+
+    def __ne__(self, value: Any) -> Mask:
+        return self._compare(operator.ne, value)
+
+    def __lt__(self, value: Any) -> Mask:
+        return self._compare(operator.lt, value)
+
+    def __le__(self, value: Any) -> Mask:
+        return self._compare(operator.le, value)
+
+    def __gt__(self, value: Any) -> Mask:
+        return self._compare(operator.gt, value)
+
+    def __ge__(self, value: Any) -> Mask:
+        return self._compare(operator.ge, value)
+
+    __hash__ = None
+
+    def isin(self, values: Iterable[Any]) -> Mask:
+        """
+        Returns the mask of rows whose value is one of values.
+        """
+        values = set(values)
+        return Mask(bytes(map(values.__contains__, self)))
+
+
+class Column(BaseColumn):
+    """
+    A numeric column, packed as an array of one typecode. A column over a read-only buffer (such as a mapped file) is
+    copied into an array the first time it is written to.
+    """
+    kind = "numeric"
+
+    def __init__(self, typecode: str, values: Union[Sequence[Any], memoryview, None] = None, length: int = 0,
+                 default: Any = 0):
+        """
+        :param typecode: the array typecode of the values
+        :param values: (optional) the values, used in place if they are an array or memoryview of the typecode
+        :param length: (optional) the number of rows, when values are not given
+        :param default: (optional) the value of each row, when values are not given
+        :type typecode: str
+        """
+        self.typecode = typecode
+        if values is None:
+            values = array(typecode, [default]) * length
+        elif not (isinstance(values, array) and values.typecode == typecode
+                  or isinstance(values, memoryview) and values.format == typecode):
+            values = array(typecode, values)
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, i: int) -> Any:
+        return self.values[i]
+
+    def __setitem__(self, i: int, value: Any) -> None:
+        if isinstance(self.values, memoryview) and self.values.readonly:
+            self.values = array(self.typecode, self.values)
+        self.values[i] = value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.values)
+
+    def _compare(self, comparison: Callable[[Any, Any], bool], value: Any) -> Mask:
+        return Mask(bytes(map(comparison, self.values, repeat(value))))
+
+
+class CategoryColumn(BaseColumn):
+    """
+    A column of categories, stored as a code per row into the list of distinct categories.
+    """
+    kind = "category"
+
+    def __init__(self, values: Optional[Iterable[Hashable]] = None, length: int = 0, default: Hashable = None,
+                 codes: Union[Sequence[int], memoryview, None] = None,
+                 categories: Optional[List[Hashable]] = None):
+        """
+        :param values: (optional) the category of each row
+        :param length: (optional) the number of rows, when values are not given
+        :param default: (optional) the category of each row, when values are not given
+        :param codes: (optional) the code of each row, given with categories in place of values
+        :param categories: (optional) the categories, by code
+        """
+        self.categories = list(categories or [])
+        self._positions = {category: code for code, category in enumerate(self.categories)}
+        if codes is not None:
+            self.codes = codes
+        else:
+            if values is None:
+                values = repeat(default, length)
+            self.codes = array("q", map(self._code, values))
+
+    def _code(self, category: Hashable) -> int:
+        """
+        Returns the code of a category, adding it if it is new.
+        """
+        code = self._positions.get(category)
+        if code is None:
+            code = self._positions[category] = len(self.categories)
+            self.categories.append(category)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, i: int) -> Hashable:
+        return self.categories[self.codes[i]]
+
+    def __setitem__(self, i: int, category: Hashable) -> None:
+        if isinstance(self.codes, memoryview) and self.codes.readonly:
+            self.codes = array("q", self.codes)
+        self.codes[i] = self._code(category)
+
+    def _compare(self, comparison: Callable[[Any, Any], bool], value: Any) -> Mask:
+        if comparison in (operator.eq, operator.ne):
+            code = self._positions.get(value, -1)
+            return Mask(bytes(map(comparison, self.codes, repeat(code))))
+        # Order comparisons go by category, not code: compare each category once and look the results up by code.
+        results = bytes(comparison(category, value) for category in self.categories)
+        return Mask(bytes(map(results.__getitem__, self.codes)))
+
+    def isin(self, values: Iterable[Hashable]) -> Mask:
+        codes = {self._positions[value] for value in values if value in self._positions}
+        return Mask(bytes(map(codes.__contains__, self.codes)))
+
+
+class AttributeStore(object):
+    """
+    The attribute columns of one kind of row (vertices, or edges) of a graph, by name. Columns may be given as
+    loaders, which are called to build the column the first time it is asked for.
+    """
+    def __init__(self, rows: int, loaders: Optional[Dict[str, Callable[[], BaseColumn]]] = None):
+        """
+        :param rows: the number of rows: vertices, or edges
+        :param loaders: (optional) functions that build columns, by name
+        :type rows: int
+        """
+        self.rows = rows
+        self._columns = {}  # type: Dict[str, BaseColumn]
+        self._loaders = dict(loaders or {})
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns or name in self._loaders
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._columns) + [name for name in self._loaders if name not in self._columns])
+
+    def __len__(self) -> int:
+        return len(set(self._columns).union(self._loaders))
+
+    def __getitem__(self, name: str) -> BaseColumn:
+        column = self._columns.get(name)
+        if column is None:
+            try:
+                loader = self._loaders.pop(name)
+            except KeyError:
+                raise GraphTheoryException(
+                    "AttributeNotFound",
+                    "There is no attribute named {n!r}.".format(n=name)
+                )
+            column = self._columns[name] = loader()
+        return column
+
+    def __setitem__(self, name: str, column: BaseColumn) -> None:
+        if len(column) != self.rows:
+            raise MatrixError(
+                "ShapeError",
+                "Expected a column of {r} rows. Got {g}.".format(
+                    r=self.rows,
+                    g=len(column)
+                )
+            )
+        self._loaders.pop(name, None)
+        self._columns[name] = column
+
+    def __delitem__(self, name: str) -> None:
+        self[name]
+        del self._columns[name]
+
+    def add_loader(self, name: str, loader: Callable[[], BaseColumn]) -> None:
+        """
+        Adds a column that is built by calling loader the first time it is asked for.
+
+        :param name: the attribute name
+        :param loader: a function of no arguments returning the column
+        """
+        self._columns.pop(name, None)
+        self._loaders[name] = loader
+
+    def add(self, name: str, kind: str, values: Optional[Iterable[Any]] = None, default: Any = None) -> BaseColumn:
+        """
+        Adds a column and returns it.
+
+        :param name: the attribute name
+        :param kind: an array typecode for a numeric column, or "category"
+        :param values: (optional) the value of each row
+        :param default: (optional) the value of each row, when values are not given; 0 for numeric columns
+        :rtype: BaseColumn
+        """
+        if kind == "category":
+            column = CategoryColumn(values, self.rows, default)
+        else:
+            column = Column(kind, None if values is None else list(values), self.rows,
+                            0 if default is None else default)
+        self[name] = column
+        return column
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """
+        Returns the attributes of a row, by name.
+        """
+        return {name: self[name][i] for name in self}
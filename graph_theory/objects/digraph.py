@@ -3,12 +3,17 @@ Created on Apr 13, 2016
 
 @author: unoriginalbanter
 """
-from typing import Union, Tuple, Set, AnyStr, SupportsComplex, Dict, Any, Iterable, Optional, overload
+from typing import Union, Tuple, Set, AnyStr, SupportsComplex, Dict, Any, Iterable, Iterator, List, Optional, \
+    Sequence, overload
 
-import math
+import pickle
+from array import array
+from contextlib import contextmanager
+from types import MappingProxyType
 
-from graph_theory.objects.graphlike import Graphlike, Vertex, BaseEdge, Matrix
-from graph_theory.exceptions import VertexError, EdgeError, MatrixError
+from graph_theory.objects.adjacency import BaseAdjacency, backends
+from graph_theory.objects.graphlike import Graphlike, Vertex, VertexTable, BaseEdge, Matrix, derived
+from graph_theory.exceptions import GraphTheoryException, VertexError, EdgeError, MatrixError
 
 
 class DirectedEdge(BaseEdge, tuple):
@@ -32,23 +37,130 @@ class DirectedEdge(BaseEdge, tuple):
             )
         super(DirectedEdge, self).__init__(vertex_pair, *args, **kwargs)
 
+    # BaseEdge derives from Iterable, whose placeholder __iter__ would otherwise come before tuple's in the MRO.
+    __iter__ = tuple.__iter__
+
+
+def _pickled_array(values: array, protocol: int) \
+        -> Union[array, pickle.PickleBuffer]:
+    """
+    Returns an array as it should be pickled: as a buffer, which may be passed out of band, under protocol 5 and
+    above, and as the array otherwise.
+    """
+    return pickle.PickleBuffer(values) if protocol >= 5 else values
+
+
+def _unpickled_array(buffer: Any, typecode: str) \
+        -> memoryview:
+    """
+    Returns an array pickled by _pickled_array as a memoryview of typecode items, without copying it.
+    """
+    return memoryview(buffer).cast("B").cast(typecode)
+
+
+def _pickled_values(values: List[Any], protocol: int) \
+        -> Tuple[Optional[str], Any]:
+    """
+    Returns values as they should be pickled, with their typecode: as an array (see _pickled_array) when they are all
+    ints or all floats, and as a list, with a typecode of None, otherwise, so that every value keeps its type.
+    """
+    typecode = {frozenset({int}): "q", frozenset({float}): "d"}.get(frozenset(type(value) for value in values))
+    if typecode is not None:
+        try:
+            return typecode, _pickled_array(array(typecode, values), protocol)
+        except OverflowError:
+            # Ints too large for an array are pickled as they are
+            pass
+    return None, values
+
+
+def _unpickled_values(typecode: Optional[str], values: Any) \
+        -> Sequence[Any]:
+    """
+    Returns values pickled by _pickled_values.
+    """
+    return values if typecode is None else _unpickled_array(values, typecode)
+
+
+def _rebuild_digraph(cls: type, state: Tuple) \
+        -> "Digraph":
+    """
+    Rebuilds a digraph (or a subclass of Digraph) from the state given by Digraph.__reduce_ex__.
+    """
+    backend, labels, sources, targets, weights, matrix = state
+    sources = _unpickled_array(sources, "q")
+    targets = _unpickled_array(targets, "q")
+    edge_form = cls.edge_form
+    if weights is None:
+        edges = {edge_form(labels[i], labels[j]) for i, j in zip(sources, targets)}
+    else:
+        edges = {
+            edge_form(labels[i], labels[j], weight)
+            for i, j, weight in zip(sources, targets, _unpickled_values(*weights))
+        }
+    digraph = cls.__new__(cls)
+    digraph._backend = backend
+    digraph._adjacency = None
+    digraph._log = None
+    digraph._vertices = None
+    digraph._edges = None
+    digraph._adjacency_matrix = None
+    digraph.vertices = set(labels)
+    digraph.edges = edges
+    if matrix is not None:
+        matrix_sources, matrix_targets, typecode, values = matrix
+        values = _unpickled_values(typecode, values)
+        adj = {}
+        stored = {edge: edge for edge in edges}
+        for i, j, value in zip(_unpickled_array(matrix_sources, "q"), _unpickled_array(matrix_targets, "q"), values):
+            key = DirectedEdge((labels[i], labels[j]))
+            adj[stored.get(key, key)] = value
+        digraph.adjacency_matrix = adj
+    return digraph
+
 
 class Digraph(Graphlike):
     """
     :class_methods: is_legal_digraph
-    :properties: vertices, edges, adjacency_matrix
-    :methods: is_edge, has_an_edge_with
+    :properties: vertices, edges, adjacency_matrix, adjacency, backend, log, shortest_path_cache
+    :methods: is_edge, has_an_edge_with, edge, batch, snapshot, subgraph, edge_subgraph, reverse, filter,
+        shortest_paths, dijkstra_distance
     """
-    def __init__(self, vertices: Set[Vertex], edges: Set[DirectedEdge], adjacency_matrix=None):
+    _shortest_path_cache = None
+    # The mutations buffered by batch(), and whether they are being applied with their legality checks deferred.
+    _batch = None
+    _deferred = False
+    # The edges of the digraph keyed by their (v1, v2) pairs, and the version of the digraph they were interned at.
+    _interned = None
+    # The table interning the vertices of the digraph, shared with its copies.
+    _vertex_table = None
+    # Whether the collections and adjacency index are shared with a snapshot, and must be copied before a change.
+    _shared = False
+
+    def __init__(self, vertices: Set[Vertex], edges: Set[DirectedEdge], adjacency_matrix=None, backend="set"):
         """
         :param vertices: the nodes of a digraph
         :param edges: the edges between vertices, a list of ordered pairs (list) of vertices
         :param adjacency_matrix: (optional) the adjacency matrix; a dict whose keys are 2-tuples of vertices and
             whose values are floats
+        :param backend: (optional) the adjacency index to answer edge and neighbourhood queries with; "set" (the
+            default) for sparse digraphs, or "bitset" for dense digraphs
         :type vertices: set
         :type edges: set
         :type adjacency_matrix: dict
+        :type backend: str
         """
+        if backend not in backends:
+            raise GraphTheoryException(
+                "UnknownBackend",
+                "Backend should be one of {b}. Got '{g}' instead.".format(
+                    b=sorted(backends),
+                    g=backend
+                )
+            )
+        self._backend = backend
+        self._adjacency = None
+        self._log = None
         super(Digraph, self).__init__(vertices, edges, adjacency_matrix)
         self._vertices = None
         self._edges = None
@@ -75,10 +187,9 @@ class Digraph(Graphlike):
         :param vertices:
         :type vertices: set
         """
-        self._vertices = set(
-            Vertex(v)
-            for v in vertices
-        )
+        self._vertices = set(self._intern(vertices))
+        self._adjacency = None
+        self.touch()
 
     @property
     def edges(self) \
@@ -99,6 +210,8 @@ class Digraph(Graphlike):
         :type edges: set(tuple)
         """
         self._edges = edges
+        self._adjacency = None
+        self.touch()
 
     @property
     def adjacency_matrix(self) \
@@ -108,7 +221,7 @@ class Digraph(Graphlike):
         :return: adjacency_matrix
         :rtype: list(list)
         """
-        return self.adjacency_matrix
+        return self._adjacency_matrix
 
     @adjacency_matrix.setter
     def adjacency_matrix(self, matrix: Matrix) \
@@ -119,6 +232,330 @@ class Digraph(Graphlike):
         :type matrix: list(list)
         """
         self._adjacency_matrix = matrix
+        self.touch()
+
+    @property
+    def backend(self) \
+            -> str:
+        """
+        Backend getter
+        :return: the name of the adjacency index backend
+        :rtype: str
+        """
+        return self._backend
+
+    @property
+    def adjacency(self) \
+            -> BaseAdjacency:
+        """
+        Adjacency index getter. The index is built from vertices and edges the first time it is needed after either
+        is set, and kept up to date by add_vertices, add_edges, remove_vertices and remove_edges.
+        :return: adjacency
+        :rtype: BaseAdjacency
+        """
+        if self._adjacency is None:
+            adjacency = backends[self._backend](self._vertices or ())
+            self._index_edges(adjacency, self._edges or ())
+            self._adjacency = adjacency
+        return self._adjacency
+
+    @property
+    def log(self):
+        """
+        Mutation log getter
+        :return: the log that the add and remove methods record to before changing the digraph, or None
+        :rtype: MutationLog
+        """
+        return self._log
+
+    @log.setter
+    def log(self, log) \
+            -> None:
+        """
+        Mutation log setter
+        :param log: a log to record mutations to, or None to stop recording
+        :type log: MutationLog
+        """
+        self._log = log
+
+    def _intern(self, vertices: Iterable[Vertex]) \
+            -> List[Vertex]:
+        """
+        Returns the vertices of the digraph's VertexTable with the names of vertices, so that the digraph holds a
+        single Vertex for each name, and its vertices compare with each other by id.
+        :param vertices: vertices, or their names
+        :return: vertices
+        :rtype: list(Vertex)
+        """
+        table = self._vertex_table
+        if table is None:
+            table = self._vertex_table = VertexTable()
+        intern = table.intern
+        return [intern(vertex) for vertex in vertices]
+
+    def _release(self, vertices: Iterable[Vertex]) \
+            -> None:
+        """
+        Releases the names of removed vertices from the digraph's VertexTable, so that the table does not outgrow the
+        digraph. Vertices that are in the digraph again are kept.
+        :param vertices: vertices, or their names
+        """
+        if self._vertex_table is not None:
+            self._vertex_table.release(*(vertex for vertex in vertices if vertex not in self._vertices))
+
+    def _edge_arrays(self) \
+            -> Tuple[List[Any], array, array, Optional[List[Any]]]:
+        """
+        Returns the digraph in packed form: the vertex labels, and the ids of the first and second vertex of each
+        edge, with the weight of each edge, as it is held, if the edges are weighted.
+        :return: labels, sources, targets, weights
+        :rtype: tuple(list, array('q'), array('q'), list)
+        """
+        labels = [getattr(vertex, "name", vertex) for vertex in self.vertices or ()]
+        ids = {label: i for i, label in enumerate(labels)}
+        sources = array("q")
+        targets = array("q")
+        weights = None
+        edges = self.edges or ()
+        weighted = sum(hasattr(edge, "weight") for edge in edges)
+        if weighted and weighted < len(edges):
+            raise EdgeError(
+                "TypeError",
+                "Either every edge or no edge must carry a weight. Got {w} weighted edges of {q}.".format(
+                    w=weighted,
+                    q=len(edges)
+                )
+            )
+        if weighted:
+            weights = [edge.weight for edge in edges]
+        try:
+            for v1, v2 in edges:
+                sources.append(ids[v1])
+                targets.append(ids[v2])
+        except KeyError as error:
+            raise VertexError(
+                "ValueNotFound",
+                "Vertex {v} not found in the vertices of this graph.".format(
+                    v=error.args[0]
+                )
+            )
+        return labels, sources, targets, weights
+
+    def __reduce_ex__(self, protocol: int) \
+            -> Tuple[Any, Tuple]:
+        """
+        Pickles the digraph in packed form, as its vertex labels and arrays of edge ids and weights, rather than as an
+        object per edge. Under protocol 5 and above, the arrays are given as buffers, which may be passed out of band.
+        The weights, and the values of the adjacency matrix, which is kept entry for entry, zero entries included, are
+        given as an array when they are all ints or all floats, and as a list otherwise, so that every value keeps its
+        type. The adjacency index is rebuilt when next needed, and the log is not kept.
+        """
+        labels, sources, targets, weights = self._edge_arrays()
+        matrix = None
+        if self._adjacency_matrix is not None:
+            ids = {label: i for i, label in enumerate(labels)}
+            matrix_sources = array("q")
+            matrix_targets = array("q")
+            values = []
+            for (v1, v2), value in self._adjacency_matrix.items():
+                matrix_sources.append(ids[v1])
+                matrix_targets.append(ids[v2])
+                values.append(value)
+            matrix = (
+                _pickled_array(matrix_sources, protocol),
+                _pickled_array(matrix_targets, protocol)
+            ) + _pickled_values(values, protocol)
+        state = (
+            self._backend,
+            labels,
+            _pickled_array(sources, protocol),
+            _pickled_array(targets, protocol),
+            None if weights is None else _pickled_values(weights, protocol),
+            matrix
+        )
+        return _rebuild_digraph, (type(self), state)
+
+    def copy(self) \
+            -> "Digraph":
+        """
+        Returns a copy of the digraph, copying its collections and adjacency index rather than walking its objects.
+        Vertices and edges are values, and are shared with the copy. The copy has no log.
+        :return: digraph
+        :rtype: Digraph
+        """
+        clone = type(self).__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone._vertices = None if self._vertices is None else set(self._vertices)
+        clone._edges = None if self._edges is None else set(self._edges)
+        clone._adjacency_matrix = None if self._adjacency_matrix is None else dict(self._adjacency_matrix)
+        clone._adjacency = None if self._adjacency is None else self._adjacency.copy()
+        clone._log = None
+        clone._derived = None
+        clone._interned = None
+        clone._shared = False
+        clone._shortest_path_cache = None
+        return clone
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: Dict[int, Any]) \
+            -> "Digraph":
+        return self.copy()
+
+    @contextmanager
+    def batch(self) \
+            -> Iterator["Digraph"]:
+        """
+        Buffers the add and remove methods called within the block, and applies them together when it ends: the
+        legality of the digraph is checked once, for the result, rather than once per call, and if any of them fails,
+        or the result is not legal, the digraph is left as it was before the block. If the block raises, nothing is
+        applied. Queries made within the block see the digraph as it was before it. Nested blocks join the outermost.
+
+            with digraph.batch():
+                digraph.add_vertices(...)
+                digraph.add_edges(...)
+                digraph.remove_edges(...)
+        """
+        if self._batch is not None:
+            yield self
+            return
+        self._batch = []
+        try:
+            yield self
+        except BaseException:
+            self._batch = None
+            raise
+        operations, self._batch = self._batch, None
+        if operations:
+            self._apply_batch(operations)
+
+    def _buffer(self, operation: str, items: Tuple) \
+            -> bool:
+        """
+        Buffers a mutation if within a batch() block, and returns whether it did. If not, readies the digraph to be
+        changed (see _unshare).
+        :param operation: the name of the method called
+        :param items: its arguments
+        """
+        if self._batch is None:
+            self._unshare()
+            return False
+        self._batch.append((operation, items))
+        return True
+
+    def snapshot(self) \
+            -> "Digraph":
+        """
+        Returns an immutable view of the digraph as it is now, in constant time. The snapshot shares the collections,
+        adjacency matrix and adjacency index of the digraph, and answers the same queries; any attempt to change it
+        raises GraphTheoryException. The digraph copies what it shares the next time it is changed (the adjacency
+        index row by row, as its rows are changed), so readers of a snapshot see one consistent version while a single
+        writer goes on changing the digraph. Changes made to the collections in place, rather than through the add
+        and remove methods, are seen by snapshots too.
+
+        The snapshot has no log, connectivity structure or shortest path cache. Use to_digraph() for a mutable copy.
+        :return: snapshot
+        :rtype: Digraph
+        """
+        from graph_theory.objects.snapshot import snapshot_class
+        cls = snapshot_class(type(self))
+        snapshot = cls.__new__(cls)
+        snapshot.__dict__.update(self.__dict__)
+        snapshot._log = None
+        snapshot._batch = None
+        snapshot._derived = None if self._derived is None else dict(self._derived)
+        snapshot._shortest_path_cache = None
+        self._shared = True
+        return snapshot
+
+    def _unshare(self) \
+            -> None:
+        """
+        Copies the collections, adjacency matrix and adjacency index if they are shared with a snapshot, before the
+        digraph is changed.
+        """
+        if not self._shared:
+            return
+        self._vertices = None if self._vertices is None else set(self._vertices)
+        self._edges = None if self._edges is None else set(self._edges)
+        self._adjacency_matrix = None if self._adjacency_matrix is None else dict(self._adjacency_matrix)
+        self._adjacency = None if self._adjacency is None else self._adjacency.share()
+        # The snapshots keep the interned edges; they are interned again when next needed.
+        self._interned = None
+        self._shared = False
+
+    def _apply_batch(self, operations: List[Tuple[str, Tuple]]) \
+            -> None:
+        """
+        Applies the mutations buffered by batch() to copies of the collections and adjacency index, checks the
+        result once, and keeps it, or puts the originals back.
+        :param operations: (method name, arguments) pairs, in the order they were called
+        """
+        state = self._checkpoint()
+        log = self._log
+        self._log = None
+        self._deferred = True
+        try:
+            for operation, items in operations:
+                getattr(self, operation)(*items)
+            self._validate()
+        except BaseException:
+            self._restore(state)
+            raise
+        finally:
+            self._deferred = False
+            self._log = log
+        self._release([vertex for operation, items in operations if operation == "remove_vertices" for vertex in items])
+        if log is not None:
+            for operation, items in operations:
+                getattr(log, operation)(items)
+
+    def _checkpoint(self) \
+            -> Dict[str, Any]:
+        """
+        Sets aside the collections, adjacency matrix and adjacency index, putting copies in their place.
+        :return: the originals
+        """
+        state = {
+            "_vertices": self._vertices,
+            "_edges": self._edges,
+            "_adjacency_matrix": self._adjacency_matrix,
+            "_adjacency": self._adjacency,
+            "_shared": self._shared,
+        }
+        self._vertices = set(self._vertices or ())
+        self._edges = set(self._edges or ())
+        self._adjacency_matrix = None if self._adjacency_matrix is None else dict(self._adjacency_matrix)
+        self._adjacency = None if self._adjacency is None else self._adjacency.copy()
+        self._shared = False
+        return state
+
+    def _restore(self, state: Dict[str, Any]) \
+            -> None:
+        """
+        Puts back the originals set aside by _checkpoint.
+        :param state:
+        """
+        self.__dict__.update(state)
+        self.touch()
+
+    def _validate(self) \
+            -> None:
+        """
+        Checks that the digraph is legal, after a batch of mutations.
+        """
+        self.is_legal_digraph(self._vertices, self._edges, self._adjacency_matrix)
+
+    @classmethod
+    def _index_edges(cls, adjacency: BaseAdjacency, edges: Iterable[DirectedEdge]) \
+            -> None:
+        """
+        Adds edges to an adjacency index.
+        :param adjacency:
+        :param edges:
+        """
+        for v1, v2 in edges:
+            adjacency.add_edge(v1, v2)
 
     @classmethod
     def is_legal(cls, vertices: Set[Vertex], edges: Set[DirectedEdge], matrix: Matrix) \
@@ -147,15 +584,14 @@ class Digraph(Graphlike):
         :param matrix: adjacency matrix to check
         :return:
         """
-        if any(not edge.isinstance(DirectedEdge) for edge in edges):
+        if any(not isinstance(edge, DirectedEdge) for edge in edges):
             raise EdgeError(
                 "EdgeTypeError",
                 "Found an edge not of type DirectedEdge"
             )
-        if any(matrix[Digraph.edge_form(vert, other)] != 0
-                for vert in vertices
-                for other in vertices.difference(vert)
-            ):
+        if any(v1 == v2 for v1, v2 in edges) or (
+            matrix is not None and any(matrix.get((vert, vert), 0) != 0 for vert in vertices)
+        ):
             raise EdgeError(
                 "AutoAdjacent",
                 "Vertices cannot share and edge with themselves in a strict Digraph."
@@ -168,33 +604,20 @@ class Digraph(Graphlike):
 
         :param edge: The edge to check
         """
-        if edge in self.edges:
-            # We found the edge (v1, v2)
-            return True
-        else:
-            # First validate that the vertices are indeed present in the vertices argument.
-            v1, v2 = edge.vertices
-            if v1 not in self.vertices:
-                raise VertexError(
-                    "ValueNotFound",
-                    "Vertex {v} not found in the vertices of this graph: {vertices}".format(
-                        v=v1,
-                        vertices=self.vertices
-                    )
+        v1, v2 = edge
+        adjacency = self.adjacency
+        if v2 not in adjacency:
+            raise VertexError(
+                "ValueNotFound",
+                "Vertex {v} not found in the vertices of this graph: {vertices}".format(
+                    v=v2,
+                    vertices=self.vertices
                 )
-            if v2 not in self.vertices:
-                raise VertexError(
-                    "ValueNotFound",
-                    "Vertex {v} not found in the vertices of this graph: {vertices}".format(
-                        v=v2,
-                        vertices=self.vertices
-                    )
-                )
-            # We did not find the edge, and they are indeed vertices
-            return False
-    
+            )
+        return adjacency.is_edge(v1, v2)
+
     def has_an_edge_with(self, v1: Vertex, *vertices: Vertex) \
-            -> Union[False, DirectedEdge]:
+            -> Union[bool, DirectedEdge]:
         """
         Returns False if there is no edge from v1 to any of the edges in
         vertices, and returns the first edge encountered in any other case.
@@ -202,15 +625,104 @@ class Digraph(Graphlike):
         :param v1: The vertex to find edges to/from
         :param vertices: Collection of vertices to check if v1 has an edge to.
         """
+        adjacency = self.adjacency
         for vertex in vertices:
-            if self.is_edge(v1, vertex):
-                return self.edge_form(v1, vertex)
+            if adjacency.is_edge(v1, vertex):
+                return self.edge(v1, vertex)
         return False
-    
+
+    def edge(self, v1: Vertex, v2: Vertex) \
+            -> DirectedEdge:
+        """
+        Returns the edge from v1 to v2 held by the digraph, rather than a new edge of the same form. If there is no
+        such edge, raises EdgeError.
+
+        :param v1:
+        :param v2:
+        :return: edge
+        :rtype: DirectedEdge
+        """
+        try:
+            return self._edge_table()[v1, v2]
+        except KeyError:
+            raise EdgeError(
+                "ValueNotFound",
+                "Edge {e} is not in the digraph.".format(
+                    e=(v1, v2)
+                )
+            )
+
+    def _edge_table(self) \
+            -> Dict[Tuple[Vertex, Vertex], DirectedEdge]:
+        """
+        Returns the edges of the digraph, interned by their raw (v1, v2) pairs: edges hash and compare as the tuples
+        of their vertices, so a pair finds the edge object the digraph holds without a new one being made. The table
+        is built once, and kept up to date by the add and remove methods; any other change has it built again.
+        :return: edges
+        :rtype: dict({tuple: DirectedEdge})
+        """
+        table = self._current_edge_table()
+        if table is None:
+            table = {edge: edge for edge in self._edges or ()}
+            self._interned = (self._version, table)
+        return table
+
+    def _current_edge_table(self) \
+            -> Optional[Dict[Tuple[Vertex, Vertex], DirectedEdge]]:
+        """
+        Returns the table of interned edges if it is up to date with the digraph, or None.
+        """
+        interned = self._interned
+        if interned is None or interned[0] != self._version:
+            return None
+        return interned[1]
+
+    def _update_edge_table(self, table: Optional[Dict[Tuple[Vertex, Vertex], DirectedEdge]],
+                           added: Iterable[DirectedEdge] = (), removed: Iterable[Tuple[Vertex, Vertex]] = ()) \
+            -> None:
+        """
+        Brings the table of interned edges, taken by _current_edge_table before a change, up to date with it.
+        :param table: the table, or None if it was not up to date
+        :param added: the edges added to the digraph; those it held already are kept
+        :param removed: the pairs of vertices whose edges were removed
+        """
+        if table is None:
+            return
+        for pair in removed:
+            table.pop(pair, None)
+        for edge in added:
+            table.setdefault(edge, edge)
+        self._interned = (self._version, table)
+
+    def is_edge_many(self, sources: Sequence[Vertex], targets: Sequence[Vertex]) \
+            -> array:
+        """
+        Returns, for each i, whether (sources[i], targets[i]) is an edge. Every source MUST be contained in
+        self.vertices. If not, raises VertexError.
+
+        :param sources: The first vertex of each pair to check
+        :param targets: The second vertex of each pair to check
+        :return: is_edge, as 1 or 0 for each pair
+        :rtype: array('b')
+        """
+        return self.adjacency.is_edge_many(sources, targets)
+
+    def neighbors_many(self, vertices: Sequence[Vertex]) \
+            -> Tuple[array, List[Vertex]]:
+        """
+        Returns the vertices adjacent to each of vertices, in compressed sparse row form: the vertices adjacent to
+        vertices[i] are neighbours[indptr[i]:indptr[i + 1]].
+
+        :param vertices: The vertices to find the adjacent vertices of
+        :return: indptr, neighbours
+        :rtype: tuple(array('q'), list(Vertex))
+        """
+        return self.adjacency.neighbors_many(vertices)
+
     @classmethod
     def edge_form(cls, v1: Vertex, v2: Vertex, *args, **kwargs):
         """Returns the edge-form of v1,v2, irregardless if v1,v2 is an edge.
-        
+
         This is used for data-typing since the different graphlike objects use
         different data types for edges based on their mathematic properties.
         :param v1:
@@ -218,8 +730,8 @@ class Digraph(Graphlike):
         :type v1: Vertex
         :type v2: Vertex
         """
-        return DirectedEdge(tuple([v1, v2]), *args, **kwargs)
-    
+        return DirectedEdge((v1, v2), *args, **kwargs)
+
     def add_vertices(self, *new_vertices):
         """
         Adds vertices to self.vertices and adds the vertex row and column to the adjacency matrix. If any new
@@ -229,18 +741,36 @@ class Digraph(Graphlike):
         :param new_vertices: Vertex object to add.
         :type new_vertices: *Vertex
         """
-        vertices = self.vertices.union(new_vertices)
+        if self._buffer("add_vertices", new_vertices):
+            return
+        new_vertices = self._intern(new_vertices)
+        if self._log is not None:
+            self._log.add_vertices(new_vertices)
+        if self._deferred:
+            vertices = self._vertices
+            vertices.update(new_vertices)
+        else:
+            vertices = self.vertices.union(new_vertices)
         # Add the vertex to the vertex collection
         adj = self.adjacency_matrix
         # Add the vertex row and column to the adjacency matrix
-        for vert in vertices:
-            for vertex in new_vertices:
-                # Assign the value to zero (Assumes no new edges)
-                adj[Digraph.edge_form(vert, vertex)] = 0
-                adj[Digraph.edge_form(vertex, vert)] = 0
-        self.vertices = vertices
-        self.adjacency_matrix = adj
-        
+        if adj is not None:
+            for vert in vertices:
+                for vertex in new_vertices:
+                    # Assign the value to zero (Assumes no new edges); an edge is made only for a missing entry. It is
+                    # a plain DirectedEdge whatever the edge form of the digraph, since an absent edge has no weight.
+                    if (vert, vertex) not in adj:
+                        adj[DirectedEdge((vert, vertex))] = 0
+                    if (vertex, vert) not in adj:
+                        adj[DirectedEdge((vertex, vert))] = 0
+        table = self._current_edge_table()
+        adjacency = self._adjacency
+        self._vertices = vertices
+        if adjacency is not None:
+            adjacency.add_vertices(*new_vertices)
+        self.touch()
+        self._update_edge_table(table)
+
     def add_edges(self, *es):
         """
         Adds multiple edges to self.edges and self.adj. Do not call this before the endpoints of the edge are known by
@@ -248,57 +778,173 @@ class Digraph(Graphlike):
         :param es:
         :type es: *DirectedEdge
         """
-        edges = self.edges()
-        adj = self.adjacency_matrix()
-        for edge in es:
-            adj[edge] = 1
-        edges = edges.union(es)
-        self.is_legal_digraph(self.vertices, edges, adj)
-        self.edges = edges
-        self.adjacency_matrix = adj
-        
+        if self._buffer("add_edges", es):
+            return
+        # Every endpoint is checked before anything is changed, so that a refused call leaves no trace.
+        self._missing_vertices([vertex for edge in es for vertex in edge])
+        adj = self.adjacency_matrix
+        if self._deferred:
+            edges = self._edges
+            edges.update(es)
+        else:
+            edges = self.edges.union(es)
+            self.is_legal_digraph(self.vertices, edges, adj)
+        if self._log is not None:
+            self._log.add_edges(es)
+        table = self._current_edge_table()
+        adjacency = self.adjacency
+        self._index_edges(adjacency, es)
+        if adj is not None:
+            for edge in es:
+                adj[edge] = 1
+        self._edges = edges
+        self.touch()
+        self._update_edge_table(table, added=es)
+
+    def _missing_vertices(self, vertices):
+        """
+        Raises VertexError if any of vertices is not in the digraph.
+        :param vertices:
+        :type vertices: list(Vertex)
+        """
+        adjacency = self.adjacency
+        for vertex in vertices:
+            if vertex not in adjacency:
+                raise VertexError(
+                    "ValueNotFound",
+                    "Vertex {v} not found in the vertices of this graph.".format(
+                        v=vertex
+                    )
+                )
+
+    def _missing_edges(self, edges):
+        """
+        Raises EdgeError if any of edges is not in the digraph.
+        :param edges:
+        :type edges: tuple(DirectedEdge)
+        """
+        adjacency = self.adjacency
+        for edge in edges:
+            v1, v2 = edge
+            self._missing_vertices((v1, v2))
+            if not adjacency.is_edge(v1, v2):
+                raise EdgeError(
+                    "ValueNotFound",
+                    "Edge {e} is not in the digraph.".format(
+                        e=edge
+                    )
+                )
+
+    def remove_vertices(self, *old_vertices):
+        """
+        Removes vertices from self.vertices, along with every edge to or from them and their rows and columns of the
+        adjacency matrix. The edges are found from the adjacency index, so this takes time in the degrees of the
+        vertices removed (and in the order of the digraph, if it keeps an adjacency matrix).
+
+        :param old_vertices: Vertex objects, or labels, to remove
+        :type old_vertices: *Vertex
+        """
+        if self._buffer("remove_vertices", old_vertices):
+            return
+        self._missing_vertices(old_vertices)
+        old_vertices = self._intern(old_vertices)
+        if self._log is not None:
+            self._log.remove_vertices(old_vertices)
+        adjacency = self.adjacency
+        incident = set()
+        for vertex in old_vertices:
+            incident.update((vertex, other) for other in adjacency.successors(vertex))
+            incident.update((other, vertex) for other in adjacency.predecessors(vertex))
+        self._edges.difference_update(incident)
+        adj = self.adjacency_matrix
+        if adj is not None:
+            for vertex in old_vertices:
+                for other in self._vertices:
+                    adj.pop((vertex, other), None)
+                    adj.pop((other, vertex), None)
+        self._vertices.difference_update(old_vertices)
+        adjacency.remove_vertices(*old_vertices)
+        table = self._current_edge_table()
+        self.touch()
+        self._update_edge_table(table, removed=incident)
+        # Within a batch, names are released once the batch has been kept (see _apply_batch).
+        if not self._deferred:
+            self._release(old_vertices)
+
+    def remove_edges(self, *es):
+        """
+        Removes multiple edges from self.edges, the adjacency index and self.adj, whose entries for them are set to 0.
+        Each edge must be in the digraph; only its endpoints are looked at.
+        :param es:
+        :type es: *DirectedEdge
+        """
+        if self._buffer("remove_edges", es):
+            return
+        self._missing_edges(es)
+        if self._log is not None:
+            self._log.remove_edges(es)
+        adjacency = self.adjacency
+        for v1, v2 in es:
+            adjacency.remove_edge(v1, v2)
+        self._edges.difference_update(es)
+        adj = self.adjacency_matrix
+        if adj is not None:
+            for edge in es:
+                if edge in adj:
+                    adj[edge] = 0
+        table = self._current_edge_table()
+        self.touch()
+        self._update_edge_table(table, removed=es)
+
     def in_degree(self, vertex):
         """
         Returns the indegree of the given vertex.
         :param vertex:
         :type vertex: Vertex
         """
-        degree = 0
-        # This is faster for large matrices with many edges, relatively slow but otherwise, computers are fast so NBD
-        for other_vert in self.vertices.difference(vertex):
-            if self.edge_form(other_vert, vertex) in self.edges:
-                degree += 1
-        return degree
-    
+        return self.adjacency.in_degree(vertex)
+
     def out_degree(self, vertex):
         """
         Returns the outdegree of a given vertex.
         :param vertex:
         :type vertex: Vertex
         """
-        degree = 0
-        # This is faster for large matrices with many edges, relatively slow otherwise
-        # but otherwise, computers are fast so NBD
-        for other_vert in self.vertices:
-            if self.edge_form(vertex, other_vert) in self.edges:
-                degree += 1
-        return degree
-    
+        return self.adjacency.out_degree(vertex)
+
+    @derived
+    def in_degrees(self):
+        """
+        Returns the indegree of every vertex, computed once per version of the digraph.
+        :return: in_degrees
+        :rtype: mappingproxy({Vertex: int})
+        """
+        adjacency = self.adjacency
+        return MappingProxyType({vertex: adjacency.in_degree(vertex) for vertex in self.vertices})
+
+    @derived
+    def out_degrees(self):
+        """
+        Returns the outdegree of every vertex, computed once per version of the digraph.
+        :return: out_degrees
+        :rtype: mappingproxy({Vertex: int})
+        """
+        adjacency = self.adjacency
+        return MappingProxyType({vertex: adjacency.out_degree(vertex) for vertex in self.vertices})
+
+    @derived
     def sum_of_degrees(self):
         """Returns the sum of degrees of the graph. Recall that:
             (SUM(in_degree(v)) FORALL v IN vertices) is equal to
             (SUM(out_degree(v)) FORALL v IN vertices)
-            
+
         Since they are equal, it does not matter which degree we are summing,
         but for sake of documentation, it is the in_degree
         :return sum_of_degrees:
         :rtype: int
         """
-        sum_of_degrees = 0
-        for vertex in self.vertices:
-            sum_of_degrees += self.in_degree(vertex)
-        return sum_of_degrees
-    
+        return sum(self.in_degrees().values())
+
     def adjacent(self, vertex):
         """
         Returns a set of vertices that are adjacent to v.
@@ -308,12 +954,63 @@ class Digraph(Graphlike):
         :return: adjacents
         :rtype: set(Vertex)
         """
-        adjacents = set()
-        for other in self.vertices():
-            if self.is_edge(vertex, other):
-                adjacents.union(other)
-        return adjacents
-    
+        return self.adjacency.successors(vertex)
+
+    @derived
+    def freeze(self):
+        """
+        Returns an immutable copy of the digraph in compressed sparse row form. The copy is made once per version of
+        the digraph, and shared by every caller until the digraph changes.
+
+        :return: frozen_digraph
+        :rtype: FrozenDigraph
+        """
+        from graph_theory.objects.frozen_digraph import FrozenDigraph
+        return FrozenDigraph.from_digraph(self)
+
+    def subgraph(self, vertices):
+        """
+        Returns a read-only view of the subgraph induced by some of the vertices: those vertices, and every edge
+        between them. Views are taken over the frozen form of the digraph (see freeze), so they share its storage,
+        and show the digraph as it was when they were made.
+
+        :param vertices: the vertices to keep
+        :type vertices: iterable(Vertex)
+        :rtype: DigraphView
+        """
+        frozen = self.freeze()
+        return frozen.subgraph([frozen.vertex_id(vertex) for vertex in vertices])
+
+    def edge_subgraph(self, mask):
+        """
+        Returns a read-only view of the digraph keeping only the edges selected by a mask over the edge ids of its
+        frozen form, such as digraph.edge_subgraph(digraph.freeze().edge_attributes["weight"] > 0.5).
+
+        :param mask: one flag per edge id
+        :type mask: Mask
+        :rtype: DigraphView
+        """
+        return self.freeze().edge_subgraph(mask)
+
+    def reverse(self):
+        """
+        Returns a read-only view of the digraph with every edge turned around.
+
+        :rtype: DigraphView
+        """
+        return self.freeze().reverse()
+
+    def filter(self, vertex_pred=None, edge_pred=None):
+        """
+        Returns a read-only view of the digraph keeping only the vertices and edges that pass the given tests (see
+        DigraphView.filter).
+
+        :param vertex_pred: (optional) a test of a vertex label
+        :param edge_pred: (optional) a test of an edge, in edge form
+        :rtype: DigraphView
+        """
+        return self.freeze().filter(vertex_pred, edge_pred)
+
     def other_vertices(self, *vertices):
         """
         Returns the collection of other vertices, distinct from the args vertices.
@@ -325,14 +1022,55 @@ class Digraph(Graphlike):
             possible = possible.differnce(element)
         return possible
     
+    @property
+    def shortest_path_cache(self):
+        """
+        Shortest path cache getter: the cache that shortest_paths keeps its results in, or None (the default) for no
+        cache.
+        :return: shortest_path_cache
+        :rtype: ShortestPathCache
+        """
+        return self._shortest_path_cache
+
+    @shortest_path_cache.setter
+    def shortest_path_cache(self, cache) \
+            -> None:
+        """
+        Shortest path cache setter
+        :param cache: a ShortestPathCache, or None to stop caching
+        """
+        self._shortest_path_cache = cache
+
+    def shortest_paths(self, vertex, algorithm="dijkstra"):
+        """
+        Returns the shortest paths from vertex to every vertex (see graph_theory.graphlike_shortest_paths), from the
+        shortest path cache if one is set.
+
+        :param vertex: A vertex
+        :param algorithm: (optional) "dijkstra" (default), over the edge weights, or "bfs", counting edges
+        :type vertex: Vertex
+        :type algorithm: str
+        :return: shortest_paths
+        :rtype: ShortestPaths
+        """
+        from graph_theory.graphlike_shortest_paths import shortest_paths
+        cache = self._shortest_path_cache
+        if cache is None:
+            return shortest_paths(self, vertex, algorithm)
+        frozen = self.freeze()
+        return cache.get(
+            getattr(vertex, "name", vertex), frozen, algorithm, lambda: shortest_paths(frozen, vertex, algorithm)
+        )
+
     def dijkstra_distance(self, vertex):
         """Performs Dijkstra's Distance Algorithm. Returns the distance from
-        vertex to each of the other vertices.
+        vertex to each of the other vertices, and a shortest path to each
+        (empty, with distance inf, for vertices that cannot be reached).
         
         Output format: 
             output = {
                 vertex: {
-                    'path':[v1,v2,...], 
+                    'path':[vertex, v1, v2, ...],
                     distance:dist(input, vertex)
                 }
             }
@@ -343,39 +1081,4 @@ class Digraph(Graphlike):
         :rtype: dict(dict)
         """
         assert vertex in self.vertices, "Given vertex is not a member of the digraph."
-        adj = self.adjacency_matrix
-        labels = {
-            vert: math.inf
-            for vert in self.vertices
-        }
-        path = {
-            vert: []
-            for vert in self.vertices
-        }
-        collection = self.vertices.remove(vertex)
-        labels[vertex] = 0
-        while collection:
-            # While there are values to check for
-            for vert in collection:
-                # Select a lowest-labeled vertex
-                if (labels[vert] <= labels[other] for other in collection):
-                    vertex = vert
-                    break
-            # Stop counting vertex
-            collection.difference(vertex)
-            edges = [
-                edge
-                for edge in self.edges
-                if edge[0] == vertex
-            ]
-            for edge in edges:
-                w = edge[1]
-                if (w in collection) and (labels[w] > labels[vertex] + adj[edge]):
-                    labels[w] = labels[vertex] + adj[edge]
-                    path[w].append(vertex)
-        distances = {}
-        for vertex in self.vertices:
-            distances[vertex] = {
-                'path': path[vertex],
-                'distance': labels[vertex]
-            }
+        return self.shortest_paths(vertex).to_dict()
@@ -0,0 +1,777 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+A frozen digraph is an immutable digraph held in compressed sparse row (CSR) form. Its vertices are numbered 0 to
+p-1, and the successors of vertex i are indices[indptr[i]:indptr[i + 1]], sorted, with the weight of each edge (if
+the digraph is weighted) at the same position of weights. Position k of indices is the id of the edge it describes.
+
+Where a Digraph is built up one vertex and edge at a time, a frozen digraph is built in bulk, either from another
+digraph (Digraph.freeze) or from arrays of edge endpoints (FrozenDigraph.from_edge_arrays), and its arrays can be
+handed to other code without walking any edge objects. It answers the same queries as a Digraph.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from graph_theory.exceptions import EdgeError, GraphTheoryException, MatrixError, VertexError
+from graph_theory.objects.attributes import AttributeStore, CategoryColumn, Column, Mask
+from graph_theory.objects.digraph import Digraph, DirectedEdge, _pickled_array, _unpickled_array
+from graph_theory.objects.graphlike import Graphlike, Vertex
+
+
+def _label(vertex: Any) -> Hashable:
+    """
+    Returns the plain label of a vertex.
+    """
+    return getattr(vertex, "name", vertex)
+
+
+def _pickled_columns(store: AttributeStore, protocol: int, skip: Optional[str] = None) -> List[Tuple]:
+    """
+    Returns the columns of an attribute store as they should be pickled: (name, typecode, values, categories) for
+    each, where the typecode of a category column is None, its values are its codes, and categories is None for a
+    numeric column.
+    """
+    columns = []
+    for name in store:
+        if name == skip:
+            continue
+        column = store[name]
+        if isinstance(column, CategoryColumn):
+            typecode, values, categories = None, column.codes, list(column.categories)
+        else:
+            typecode, values, categories = column.typecode, column.values, None
+        if protocol < 5 or not isinstance(values, (array, memoryview)):
+            values = array(typecode or "q", values)
+        columns.append((name, typecode, _pickled_array(values, protocol), categories))
+    return columns
+
+
+def _unpickled_columns(rows: int, columns: List[Tuple]) -> AttributeStore:
+    """
+    Returns the attribute store of columns pickled by _pickled_columns, using the pickled buffers in place.
+    """
+    store = AttributeStore(rows)
+    for name, typecode, values, categories in columns:
+        if typecode is None:
+            store[name] = CategoryColumn(codes=_unpickled_array(values, "q"), categories=categories)
+        else:
+            store[name] = Column(typecode, _unpickled_array(values, typecode))
+    return store
+
+
+def _rebuild_frozen(cls: type, labels: List[Hashable], indptr: Any, indices: Any, weights: Any,
+                    vertex_columns: Optional[List[Tuple]] = None,
+                    edge_columns: Optional[List[Tuple]] = None) -> "FrozenDigraph":
+    """
+    Rebuilds a frozen digraph (or graph) from the state given by FrozenDigraph.__reduce_ex__, using the pickled
+    buffers in place.
+    """
+    indices = _unpickled_array(indices, "q")
+    return cls(
+        labels,
+        _unpickled_array(indptr, "q"),
+        indices,
+        None if weights is None else _unpickled_array(weights, "d"),
+        _unpickled_columns(len(labels), vertex_columns or []),
+        _unpickled_columns(len(indices), edge_columns or [])
+    )
+
+
+class FrozenDigraph(Graphlike):
+    """
+    :class_methods: from_edge_arrays, from_digraph
+    :properties: vertices, edges, adjacency_matrix, labels, indptr, indices, weights, order, size,
+        vertex_attributes, edge_attributes
+    :methods: is_edge, has_an_edge_with, adjacent, in_degree, out_degree, vertex_id, successor_ids, vertices_where,
+        edges_where, subgraph, edge_subgraph, reverse, filter, to_digraph
+    """
+    # Whether each edge is stored in both directions, as in a frozen graph.
+    _symmetric = False
+
+    def __init__(self, labels: Sequence[Hashable], indptr: Sequence[int], indices: Sequence[int],
+                 weights: Optional[Sequence[float]] = None, vertex_attributes: Optional[AttributeStore] = None,
+                 edge_attributes: Optional[AttributeStore] = None):
+        """
+        Constructor. Use FrozenDigraph.from_edge_arrays or Digraph.freeze rather than calling this directly, unless
+        the arrays are already in sorted CSR form.
+
+        :param labels: the label of each vertex, by id
+        :param indptr: p + 1 row offsets into indices
+        :param indices: the successors of each vertex, by id, sorted within each row
+        :param weights: (optional) the weight of each edge, aligned with indices
+        :param vertex_attributes: (optional) attribute columns by vertex id
+        :param edge_attributes: (optional) attribute columns by edge id; the weights are the "weight" column
+        :type labels: list
+        :type indptr: array('q')
+        :type indices: array('q')
+        :type weights: array('d')
+        """
+        if len(indptr) != len(labels) + 1:
+            raise MatrixError(
+                "ShapeError",
+                "Expected {e} row offsets for {p} vertices. Got {g}.".format(
+                    e=len(labels) + 1,
+                    p=len(labels),
+                    g=len(indptr)
+                )
+            )
+        if weights is not None and len(weights) != len(indices):
+            raise MatrixError(
+                "ShapeError",
+                "Expected a weight for each of {q} edges. Got {g}.".format(
+                    q=len(indices),
+                    g=len(weights)
+                )
+            )
+        self._labels = labels
+        self._indptr = indptr
+        self._indices = indices
+        self._weights = weights
+        self._ids = None
+        self._vertices = None
+        self._edges = None
+        self._reverse = None
+        if vertex_attributes is None:
+            vertex_attributes = AttributeStore(len(labels))
+        if edge_attributes is None:
+            edge_attributes = AttributeStore(len(indices))
+        self._vertex_attributes = vertex_attributes
+        self._edge_attributes = edge_attributes
+        if weights is not None and "weight" not in self._edge_attributes:
+            self._edge_attributes.add_loader("weight", lambda: Column("d", weights))
+
+    @classmethod
+    def from_edge_arrays(cls, sources: Iterable[int], targets: Iterable[int],
+                         weights: Optional[Iterable[float]] = None, labels: Optional[Sequence[Hashable]] = None,
+                         order: Optional[int] = None) -> "FrozenDigraph":
+        """
+        Builds a frozen digraph from parallel arrays of edge endpoints, given as vertex ids. Repeated edges are kept
+        once (with the last weight given for them); loops are not allowed.
+
+        :param sources: the id of the first vertex of each edge
+        :param targets: the id of the second vertex of each edge
+        :param weights: (optional) the weight of each edge
+        :param labels: (optional) the label of each vertex, by id; defaults to the ids themselves
+        :param order: (optional) the number of vertices; defaults to len(labels), or one more than the largest id
+        :returns: frozen_digraph
+        :rtype: FrozenDigraph
+        """
+        sources = array("q", sources)
+        targets = array("q", targets)
+        if len(sources) != len(targets):
+            raise EdgeError(
+                "LengthMismatch",
+                "Expected as many sources as targets. Got {s} and {t}.".format(
+                    s=len(sources),
+                    t=len(targets)
+                )
+            )
+        if order is None:
+            if labels is not None:
+                order = len(labels)
+            else:
+                order = max(max(sources, default=-1), max(targets, default=-1)) + 1
+        if labels is None:
+            labels = range(order)
+        indptr, indices, weights = cls._compress(sources, targets, weights, order)
+        return cls(list(labels), indptr, indices, weights)
+
+    @staticmethod
+    def _compress(sources: array, targets: array, weights: Optional[Iterable[float]], order: int) \
+            -> Tuple[array, array, Optional[array]]:
+        """
+        Sorts and deduplicates edges into CSR arrays, by counting sort on the sources and then sorting each row. Only
+        the arrays themselves are held, never a Python object per edge.
+
+        :returns: indptr, indices, weights
+        """
+        for ids in (sources, targets):
+            if ids and (min(ids) < 0 or max(ids) >= order):
+                raise VertexError(
+                    "ValueNotFound",
+                    "Vertex ids should lie in [0, {p}).".format(
+                        p=order
+                    )
+                )
+        q = len(sources)
+        if weights is not None:
+            weights = array("d", weights)
+            if len(weights) != q:
+                raise EdgeError(
+                    "LengthMismatch",
+                    "Expected a weight for each of {q} edges. Got {g}.".format(
+                        q=q,
+                        g=len(weights)
+                    )
+                )
+        indptr = array("q", bytes(8 * (order + 1)))
+        for source in sources:
+            indptr[source + 1] += 1
+        for i in range(order):
+            indptr[i + 1] += indptr[i]
+        cursor = indptr[:-1]
+        indices = array("q", bytes(8 * q))
+        edge_weights = array("d", bytes(8 * q)) if weights is not None else None
+        for k, (source, target) in enumerate(zip(sources, targets)):
+            position = cursor[source]
+            indices[position] = target
+            if weights is not None:
+                edge_weights[position] = weights[k]
+            cursor[source] = position + 1
+        # Sort each row, keeping repeated edges once (with the last weight given), and pack the rows together.
+        kept = 0
+        for i in range(order):
+            start, stop = indptr[i], indptr[i + 1]
+            indptr[i] = kept
+            if edge_weights is not None:
+                unique = dict(zip(indices[start:stop], edge_weights[start:stop]))
+                row = sorted(unique)
+                edge_weights[kept:kept + len(row)] = array("d", [unique[j] for j in row])
+            else:
+                unique = set(indices[start:stop])
+                row = sorted(unique)
+            if i in unique:
+                raise EdgeError(
+                    "AutoAdjacent",
+                    "Vertices cannot share and edge with themselves in a strict Digraph."
+                )
+            indices[kept:kept + len(row)] = array("q", row)
+            kept += len(row)
+        indptr[order] = kept
+        del indices[kept:]
+        if edge_weights is not None:
+            del edge_weights[kept:]
+        return indptr, indices, edge_weights
+
+    @classmethod
+    def from_digraph(cls, digraph) -> "FrozenDigraph":
+        """
+        Builds the frozen digraph of a digraph. A frozen digraph of this class is returned as it is; any other frozen
+        digraph is built again from its arrays (so that a frozen digraph given to FrozenGraph is symmetrised).
+
+        :param digraph: The digraph to freeze
+        :type digraph: Digraph
+        :returns: frozen_digraph
+        :rtype: FrozenDigraph
+        """
+        if isinstance(digraph, cls):
+            return digraph
+        if isinstance(digraph, FrozenDigraph):
+            sources = array("q", [i for i, k, j in digraph._edge_triples()])
+            weights = None if digraph._weights is None else array("d", digraph._weights)
+            return cls.from_edge_arrays(sources, array("q", digraph._indices), weights, list(digraph._labels))
+        labels, sources, targets, weights = digraph._edge_arrays()
+        return cls.from_edge_arrays(sources, targets, weights, labels)
+
+    @property
+    def vertices(self) \
+            -> FrozenSet[Hashable]:
+        """
+        Vertices getter
+        :return: vertices
+        :rtype: frozenset
+        """
+        if self._vertices is None:
+            self._vertices = frozenset(self._labels)
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices: Iterable[Vertex]) \
+            -> None:
+        raise self._frozen()
+
+    @property
+    def edges(self) \
+            -> FrozenSet[DirectedEdge]:
+        """
+        Edges getter. The edge objects are made the first time they are asked for.
+        :return: edges
+        :rtype: frozenset(DirectedEdge)
+        """
+        if self._edges is None:
+            labels = self._labels
+            self._edges = frozenset(
+                self.edge_form(labels[i], labels[j], *([self._weights[k]] if self._weights is not None else []))
+                for i, k, j in self._edge_triples()
+            )
+        return self._edges
+
+    @edges.setter
+    def edges(self, edges: Iterable[DirectedEdge]) \
+            -> None:
+        raise self._frozen()
+
+    @property
+    def adjacency_matrix(self) \
+            -> None:
+        """
+        Adjacency matrix getter. Frozen digraphs keep no adjacency matrix; see indptr, indices and weights.
+        :return: None
+        """
+        return None
+
+    @adjacency_matrix.setter
+    def adjacency_matrix(self, matrix) \
+            -> None:
+        raise self._frozen()
+
+    @property
+    def labels(self) -> Sequence[Hashable]:
+        """
+        The label of each vertex, by id.
+        """
+        return self._labels
+
+    @property
+    def indptr(self) -> Sequence[int]:
+        """
+        The row offsets: the successors of vertex i are indices[indptr[i]:indptr[i + 1]].
+        """
+        return self._indptr
+
+    @property
+    def indices(self) -> Sequence[int]:
+        """
+        The successors of each vertex, by id, sorted within each row.
+        """
+        return self._indices
+
+    @property
+    def weights(self) -> Optional[Sequence[float]]:
+        """
+        The weight of each edge, aligned with indices, or None if the digraph is unweighted.
+        """
+        return self._weights
+
+    @property
+    def vertex_attributes(self) -> AttributeStore:
+        """
+        The attribute columns of the vertices, by vertex id.
+        """
+        return self._vertex_attributes
+
+    @property
+    def edge_attributes(self) -> AttributeStore:
+        """
+        The attribute columns of the edges, by edge id (the position of the edge in indices). The edges of a frozen
+        graph are stored once in each direction, and so have a row for each.
+        """
+        return self._edge_attributes
+
+    @property
+    def order(self) -> int:
+        """
+        The number of vertices.
+        """
+        return len(self._labels)
+
+    @property
+    def size(self) -> int:
+        """
+        The number of edges.
+        """
+        return len(self._indices)
+
+    def _edge_triples(self) -> Iterable[Tuple[int, int, int]]:
+        """
+        Yields (source id, edge id, target id) for each edge stored.
+        """
+        indptr = self._indptr
+        indices = self._indices
+        for i in range(len(self._labels)):
+            for k in range(indptr[i], indptr[i + 1]):
+                yield i, k, indices[k]
+
+    @staticmethod
+    def _frozen() -> GraphTheoryException:
+        """
+        Returns the error raised by any attempt to modify a frozen digraph.
+        """
+        return GraphTheoryException(
+            "FrozenGraph",
+            "Frozen graphs cannot be modified. Use to_digraph() for a mutable copy."
+        )
+
+    def vertex_id(self, vertex: Hashable) -> int:
+        """
+        Returns the id of vertex.
+
+        :param vertex:
+        :type vertex: Vertex
+        :rtype: int
+        """
+        if self._ids is None:
+            self._ids = {label: i for i, label in enumerate(self._labels)}  # type: Dict[Hashable, int]
+        try:
+            return self._ids[_label(vertex)]
+        except KeyError:
+            raise VertexError(
+                "ValueNotFound",
+                "Vertex {v} not found in the vertices of this graph.".format(
+                    v=vertex
+                )
+            )
+
+    def successor_ids(self, i: int) -> Sequence[int]:
+        """
+        Returns the ids of the successors of the vertex with id i.
+
+        :param i: vertex id
+        :type i: int
+        :rtype: array('q')
+        """
+        return self._indices[self._indptr[i]:self._indptr[i + 1]]
+
+    def edge_id(self, i: int, j: int) -> int:
+        """
+        Returns the id of the edge between the vertices with ids i and j, or -1 if there is none.
+
+        :param i: vertex id
+        :param j: vertex id
+        :rtype: int
+        """
+        start, stop = self._indptr[i], self._indptr[i + 1]
+        k = bisect_left(self._indices, j, start, stop)
+        return k if k < stop and self._indices[k] == j else -1
+
+    def _predecessors(self) -> Tuple[array, array, array]:
+        """
+        Returns the transpose of the digraph as CSR arrays, with the id of the edge each of its entries describes,
+        building it the first time it is needed.
+
+        :returns: indptr, indices, edge_ids
+        """
+        if self._reverse is None:
+            p = len(self._labels)
+            indptr = array("q", bytes(8 * (p + 1)))
+            for j in self._indices:
+                indptr[j + 1] += 1
+            for i in range(p):
+                indptr[i + 1] += indptr[i]
+            cursor = array("q", indptr)
+            indices = array("q", bytes(8 * len(self._indices)))
+            edge_ids = array("q", bytes(8 * len(self._indices)))
+            for i, k, j in self._edge_triples():
+                indices[cursor[j]] = i
+                edge_ids[cursor[j]] = k
+                cursor[j] += 1
+            self._reverse = (indptr, indices, edge_ids)
+        return self._reverse
+
+    def is_edge(self, edge: Sequence[Hashable], *args: Any, **kwargs: Any) -> bool:
+        """
+        Returns true if v1,v2 is an edge. v1 and v2 MUST be contained in self.vertices. If not, raises VertexError.
+
+        :param edge: The edge to check
+        """
+        v1, v2 = edge
+        return self.edge_id(self.vertex_id(v1), self.vertex_id(v2)) != -1
+
+    def is_edge_many(self, sources: Sequence[Hashable], targets: Sequence[Hashable]) -> array:
+        """
+        Returns, for each i, whether (sources[i], targets[i]) is an edge.
+
+        :param sources: The first vertex of each pair to check
+        :param targets: The second vertex of each pair to check
+        :return: is_edge, as 1 or 0 for each pair
+        :rtype: array('b')
+        """
+        if len(sources) != len(targets):
+            raise EdgeError(
+                "LengthMismatch",
+                "Expected as many sources as targets. Got {s} and {t}.".format(
+                    s=len(sources),
+                    t=len(targets)
+                )
+            )
+        vertex_id = self.vertex_id
+        edge_id = self.edge_id
+        return array("b", [
+            edge_id(vertex_id(v1), vertex_id(v2)) != -1
+            for v1, v2 in zip(sources, targets)
+        ])
+
+    def neighbors_many(self, vertices: Sequence[Hashable]) -> Tuple[array, List[Hashable]]:
+        """
+        Returns the vertices adjacent to each of vertices, in compressed sparse row form: the vertices adjacent to
+        vertices[i] are neighbours[indptr[i]:indptr[i + 1]].
+
+        :param vertices: The vertices to find the adjacent vertices of
+        :return: indptr, neighbours
+        :rtype: tuple(array('q'), list)
+        """
+        labels = self._labels
+        indptr = array("q", [0])
+        neighbours = []
+        for vertex in vertices:
+            neighbours.extend(labels[j] for j in self.successor_ids(self.vertex_id(vertex)))
+            indptr.append(len(neighbours))
+        return indptr, neighbours
+
+    def _check_mask(self, mask: Mask, rows: int) -> None:
+        """
+        Raises MatrixError if mask does not have the given number of rows.
+        """
+        if len(mask) != rows:
+            raise MatrixError(
+                "ShapeError",
+                "Expected a mask of {r} rows. Got {g}.".format(
+                    r=rows,
+                    g=len(mask)
+                )
+            )
+
+    def vertices_where(self, mask: Mask) -> Set[Hashable]:
+        """
+        Returns the vertices selected by a mask over the vertex attributes, such as
+        digraph.vertices_where(digraph.vertex_attributes["kind"] == "server").
+
+        :param mask: one flag per vertex id
+        :type mask: Mask
+        :rtype: set
+        """
+        self._check_mask(mask, len(self._labels))
+        labels = self._labels
+        return {labels[i] for i in mask.ids()}
+
+    def edges_where(self, mask: Mask) -> Set[DirectedEdge]:
+        """
+        Returns the edges selected by a mask over the edge attributes, such as
+        digraph.edges_where(digraph.edge_attributes["weight"] > 0.5). The edges of a frozen graph are returned once
+        each, and selected by their row from the lower id end.
+
+        :param mask: one flag per edge id
+        :type mask: Mask
+        :rtype: set(DirectedEdge)
+        """
+        self._check_mask(mask, len(self._indices))
+        labels = self._labels
+        indptr = self._indptr
+        indices = self._indices
+        weights = self._weights
+        edges = set()
+        for k in mask.ids():
+            i = bisect_right(indptr, k) - 1
+            j = indices[k]
+            if self._symmetric and j < i:
+                continue
+            if weights is None:
+                edges.add(self.edge_form(labels[i], labels[j]))
+            else:
+                edges.add(self.edge_form(labels[i], labels[j], weights[k]))
+        return edges
+
+    def has_an_edge_with(self, v1: Hashable, *vertices: Hashable) -> Union[bool, DirectedEdge]:
+        """
+        Returns False if there is no edge from v1 to any of the edges in
+        vertices, and returns the first edge encountered in any other case.
+
+        :param v1: The vertex to find edges to/from
+        :param vertices: Collection of vertices to check if v1 has an edge to.
+        """
+        i = self.vertex_id(v1)
+        for vertex in vertices:
+            k = self.edge_id(i, self.vertex_id(vertex))
+            if k != -1:
+                if self._weights is not None:
+                    return self.edge_form(v1, vertex, self._weights[k])
+                return self.edge_form(v1, vertex)
+        return False
+
+    def adjacent(self, vertex: Hashable) -> Set[Hashable]:
+        """
+        Returns a set of vertices that are adjacent to v.
+
+        :param vertex:
+        :type vertex: Vertex
+        :return: adjacents
+        :rtype: set
+        """
+        labels = self._labels
+        return {labels[j] for j in self.successor_ids(self.vertex_id(vertex))}
+
+    def in_degree(self, vertex: Hashable) -> int:
+        """
+        Returns the indegree of the given vertex.
+        :param vertex:
+        :type vertex: Vertex
+        """
+        i = self.vertex_id(vertex)
+        indptr = self._predecessors()[0]
+        return indptr[i + 1] - indptr[i]
+
+    def out_degree(self, vertex: Hashable) -> int:
+        """
+        Returns the outdegree of a given vertex.
+        :param vertex:
+        :type vertex: Vertex
+        """
+        i = self.vertex_id(vertex)
+        return self._indptr[i + 1] - self._indptr[i]
+
+    def sum_of_degrees(self) -> int:
+        """
+        Returns the sum of degrees of the digraph, which is the number of edges.
+        :rtype: int
+        """
+        return len(self._indices)
+
+    def other_vertices(self, *vertices: Hashable) -> Set[Hashable]:
+        """
+        Returns the collection of other vertices, distinct from the args vertices.
+        :arg vertices:
+        :type vertices: Vertex
+        """
+        return set(self.vertices).difference(_label(vertex) for vertex in vertices)
+
+    def edge_form(self, v1: Hashable, v2: Hashable, *args: Any, **kwargs: Any) -> DirectedEdge:
+        """
+        Returns the edge-form of v1,v2, irregardless if v1,v2 is an edge: a WeightedDirectedEdge if the digraph is
+        weighted, and a DirectedEdge otherwise.
+        :param v1:
+        :param v2:
+        """
+        return self._mutable_class().edge_form(v1, v2, *args, **kwargs)
+
+    def _mutable_class(self) -> type:
+        """
+        Returns the class of mutable digraph that this frozen digraph corresponds to.
+        """
+        if self._weights is not None:
+            from graph_theory.objects.weighted_digraph import WeightedDigraph
+            return WeightedDigraph
+        return Digraph
+
+    def add_vertices(self, *vertices: Vertex) -> None:
+        raise self._frozen()
+
+    def add_edges(self, *edges: DirectedEdge) -> None:
+        raise self._frozen()
+
+    def remove_vertices(self, *vertices: Vertex) -> None:
+        raise self._frozen()
+
+    def remove_edges(self, *edges: DirectedEdge) -> None:
+        raise self._frozen()
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Any, Tuple]:
+        """
+        Pickles the digraph as its labels, CSR arrays and attribute columns. Under protocol 5 and above, the arrays are
+        given as buffers, which may be passed out of band, and are used in place when unpickled.
+        """
+        if protocol >= 5:
+            arrays = [self._indptr, self._indices, self._weights]
+        else:
+            arrays = [array("q", self._indptr), array("q", self._indices)]
+            arrays.append(None if self._weights is None else array("d", self._weights))
+        indptr, indices, weights = [None if values is None else _pickled_array(values, protocol) for values in arrays]
+        return _rebuild_frozen, (
+            type(self),
+            list(self._labels),
+            indptr,
+            indices,
+            weights,
+            _pickled_columns(self._vertex_attributes, protocol),
+            # The weight column is the weights, pickled above
+            _pickled_columns(self._edge_attributes, protocol, None if self._weights is None else "weight")
+        )
+
+    def copy(self) -> "FrozenDigraph":
+        """
+        Returns the digraph itself: a frozen digraph cannot change, so it is its own copy.
+        """
+        return self
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenDigraph":
+        return self
+
+    def reweighted(self, weights: Dict[int, float]) -> "FrozenDigraph":
+        """
+        Returns the frozen digraph with some of its edge weights changed. The new digraph shares the vertices, edges,
+        indexes and vertex attributes of this one, and only the weight array is copied. Both directions of an edge of
+        a frozen graph should be given.
+
+        :param weights: the new weight of each changed edge, by edge id
+        :type weights: dict(int, float)
+        :rtype: FrozenDigraph
+        """
+        if self._weights is None:
+            raise GraphTheoryException(
+                "Unweighted",
+                "Only weighted digraphs can be reweighted."
+            )
+        new_weights = array("d", self._weights)
+        for k, weight in weights.items():
+            new_weights[k] = weight
+        edge_attributes = AttributeStore(len(self._indices))
+        for name in self._edge_attributes:
+            if name != "weight":
+                edge_attributes.add_loader(name, lambda name=name: self._edge_attributes[name])
+        reweighted = type(self)(self._labels, self._indptr, self._indices, new_weights, self._vertex_attributes,
+                                edge_attributes)
+        reweighted._ids = self._ids
+        reweighted._reverse = self._reverse
+        return reweighted
+
+    def _view(self):
+        """
+        Returns the view of the whole digraph (see graph_theory.objects.views).
+        """
+        from graph_theory.objects.views import DigraphView
+        return DigraphView(self)
+
+    def subgraph(self, vertex_ids: Iterable[int]):
+        """
+        Returns a read-only view of the subgraph induced by some of the vertices: those vertices, and every edge
+        between them. The view shares the storage of the digraph.
+
+        :param vertex_ids: the ids of the vertices to keep
+        :type vertex_ids: iterable(int)
+        :rtype: DigraphView
+        """
+        return self._view().subgraph(vertex_ids)
+
+    def edge_subgraph(self, mask: Mask):
+        """
+        Returns a read-only view of the digraph keeping only the edges selected by a mask over the edge ids, such as
+        digraph.edge_subgraph(digraph.edge_attributes["weight"] > 0.5). The view shares the storage of the digraph.
+
+        :param mask: one flag per edge id
+        :type mask: Mask
+        :rtype: DigraphView
+        """
+        return self._view().edge_subgraph(mask)
+
+    def reverse(self):
+        """
+        Returns a read-only view of the digraph with every edge turned around, over the transpose of the digraph.
+
+        :rtype: DigraphView
+        """
+        return self._view().reverse()
+
+    def filter(self, vertex_pred=None, edge_pred=None):
+        """
+        Returns a read-only view of the digraph keeping only the vertices and edges that pass the given tests (see
+        DigraphView.filter). The view shares the storage of the digraph.
+
+        :param vertex_pred: (optional) a test of a vertex label
+        :param edge_pred: (optional) a test of an edge, in edge form
+        :rtype: DigraphView
+        """
+        return self._view().filter(vertex_pred, edge_pred)
+
+    def to_digraph(self, backend: str = "set"):
+        """
+        Returns a mutable copy of the digraph: a WeightedDigraph if the digraph is weighted, and a Digraph otherwise.
+
+        :param backend: (optional) the adjacency index backend of the copy
+        :type backend: str
+        :rtype: Digraph
+        """
+        return self._mutable_class()(set(self._labels), set(self.edges), backend=backend)
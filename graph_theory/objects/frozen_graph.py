@@ -0,0 +1,114 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+A frozen graph is an immutable graph held in compressed sparse row form. It is stored exactly as the frozen digraph
+with an edge in each direction for every edge of the graph, so indices (and weights) hold each edge twice.
+"""
+from array import array
+from typing import FrozenSet, Hashable, Iterable, Optional, Sequence
+
+from graph_theory.objects.digraph import DirectedEdge
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.graph import Graph
+
+
+class FrozenGraph(FrozenDigraph):
+    """
+    :class_methods: from_edge_arrays, from_digraph
+    :methods: degree, to_graph
+    """
+    _symmetric = True
+
+    @classmethod
+    def from_edge_arrays(cls, sources: Iterable[int], targets: Iterable[int],
+                         weights: Optional[Iterable[float]] = None, labels: Optional[Sequence[Hashable]] = None,
+                         order: Optional[int] = None) -> "FrozenGraph":
+        """
+        Builds a frozen graph from parallel arrays of edge endpoints, given as vertex ids. Each edge need only be
+        given in one direction; repeated edges are kept once, and loops are not allowed.
+
+        :param sources: the id of one end of each edge
+        :param targets: the id of the other end of each edge
+        :param weights: (optional) the weight of each edge
+        :param labels: (optional) the label of each vertex, by id; defaults to the ids themselves
+        :param order: (optional) the number of vertices; defaults to len(labels), or one more than the largest id
+        :returns: frozen_graph
+        :rtype: FrozenGraph
+        """
+        sources = array("q", sources)
+        targets = array("q", targets)
+        both_sources = sources + targets
+        both_targets = targets + sources
+        if weights is not None:
+            weights = array("d", weights)
+            weights = weights + weights
+        return super(FrozenGraph, cls).from_edge_arrays(both_sources, both_targets, weights, labels, order)
+
+    @property
+    def edges(self) \
+            -> FrozenSet[DirectedEdge]:
+        """
+        Edges getter. Each edge is given once, from its lower id end to its higher.
+        :return: edges
+        :rtype: frozenset(DirectedEdge)
+        """
+        if self._edges is None:
+            labels = self._labels
+            weights = self._weights
+            self._edges = frozenset(
+                self.edge_form(labels[i], labels[j], *([weights[k]] if weights is not None else []))
+                for i, k, j in self._edge_triples()
+                if i < j
+            )
+        return self._edges
+
+    @edges.setter
+    def edges(self, edges):
+        raise self._frozen()
+
+    @property
+    def size(self) -> int:
+        """
+        The number of edges.
+        """
+        return len(self._indices) // 2
+
+    def in_degree(self, vertex: Hashable) -> int:
+        """
+        Returns the degree of the given vertex.
+        """
+        return self.out_degree(vertex)
+
+    def degree(self, vertex: Hashable) -> int:
+        """
+        Returns the degree of the given vertex.
+        """
+        return self.out_degree(vertex)
+
+    def sum_of_degrees(self) -> int:
+        """
+        Returns the sum of degrees of the graph, which is twice the number of edges.
+        :rtype: int
+        """
+        return len(self._indices)
+
+    def _mutable_class(self) -> type:
+        """
+        Returns the class of mutable graph that this frozen graph corresponds to.
+        """
+        if self._weights is not None:
+            from graph_theory.objects.weighted_graph import WeightedGraph
+            return WeightedGraph
+        return Graph
+
+    def to_graph(self, backend: str = "set") -> Graph:
+        """
+        Returns a mutable copy of the graph.
+
+        :param backend: (optional) the adjacency index backend of the copy
+        :type backend: str
+        :rtype: Graph
+        """
+        return self.to_digraph(backend)
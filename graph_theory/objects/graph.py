@@ -19,7 +19,20 @@ edges each be sets instead of lists.
 """
 import math
 
+from graph_theory.exceptions import EdgeError, GraphTheoryException
+from graph_theory.graphlike_dynamic_connectivity import DynamicConnectivity
 from graph_theory.objects import digraph
+from graph_theory.objects.adjacency import backends
+from graph_theory.objects.graphlike import derived
+
+
+def _rebuild_graph(cls, state, tracked):
+    """Rebuilds a graph from the state given by Graph.__reduce_ex__, and its
+    connectivity structure if it kept one."""
+    graph = digraph._rebuild_digraph(cls, state)
+    if tracked:
+        graph.track_connectivity()
+    return graph
 
 
 class Graph(digraph.Digraph):
@@ -30,8 +43,12 @@ class Graph(digraph.Digraph):
             vertices)
         Adjacency matrix: a two-degree list whose keys are list-pairs of vertices and whose values are 1, or None if no
             edge is present; employs the dictionary representation of a matrix
+        connectivity: (optional) a dynamic connectivity structure, kept up to date by add_edges, remove_vertices and
+            remove_edges
     """
-    def __init__(self, vertices=None, edges=None, adjacency_matrix=None):
+    _connectivity = None
+
+    def __init__(self, vertices=None, edges=None, adjacency_matrix=None, backend="set"):
         """
         Constructor
         :param vertices: Collection of vertices
@@ -40,7 +57,21 @@ class Graph(digraph.Digraph):
         :type edges: set(set)
         :param adjacency_matrix: Adjacency matrix
         :type adjacency_matrix: list(list)
+        :param backend: (optional) the adjacency index to answer edge and neighbourhood queries with; "set" (the
+            default) for sparse graphs, or "bitset" for dense graphs
+        :type backend: str
         """
+        if backend not in backends:
+            raise GraphTheoryException(
+                "UnknownBackend",
+                "Backend should be one of {b}. Got '{g}' instead.".format(
+                    b=sorted(backends),
+                    g=backend
+                )
+            )
+        self._backend = backend
+        self._adjacency = None
+        self._log = None
         self._vertices = None
         self._edges = None
         self._adjacency_matrix = None
@@ -64,7 +95,9 @@ class Graph(digraph.Digraph):
         :param vertices:
         :type vertices: set
         """
-        self._vertices = vertices
+        self._vertices = set(self._intern(vertices or ()))
+        self._adjacency = None
+        self.touch()
 
     @property
     def edges(self):
@@ -83,6 +116,10 @@ class Graph(digraph.Digraph):
         :type edges: set(tuple)
         """
         self._edges = edges
+        self._adjacency = None
+        self.touch()
+        if self._connectivity is not None:
+            self.connectivity = DynamicConnectivity(self)
 
     @property
     def adjacency_matrix(self):
@@ -91,7 +128,7 @@ class Graph(digraph.Digraph):
         :return: adjacency_matrix
         :rtype: list(list)
         """
-        return self.adjacency_matrix
+        return self._adjacency_matrix
 
     @adjacency_matrix.setter
     def adjacency_matrix(self, matrix):
@@ -101,7 +138,94 @@ class Graph(digraph.Digraph):
         :type matrix: list(list)
         """
         self._adjacency_matrix = matrix
+        self.touch()
+
+    @property
+    def connectivity(self):
+        """
+        Connectivity getter: the dynamic connectivity structure kept up to
+        date with the edges of the graph, or None (the default) for none.
+        :return: connectivity
+        :rtype: DynamicConnectivity
+        """
+        return self._connectivity
+
+    @connectivity.setter
+    def connectivity(self, connectivity):
+        """
+        Connectivity setter
+        :param connectivity: a DynamicConnectivity holding the edges of the
+            graph, or None to stop keeping one
+        :type connectivity: DynamicConnectivity
+        """
+        self._connectivity = connectivity
+
+    def track_connectivity(self):
+        """Builds a dynamic connectivity structure from the edges of the
+        graph and keeps it up to date from then on, so that is_connected()
+        and same_component() need no search. Returns the structure."""
+        self.connectivity = DynamicConnectivity(self)
+        return self.connectivity
+
+    def copy(self):
+        """Returns a copy of the graph (see Digraph.copy). The copy keeps its
+        own connectivity structure, if the graph keeps one."""
+        clone = super(Graph, self).copy()
+        if self._connectivity is not None:
+            clone.track_connectivity()
+        return clone
+
+    __copy__ = copy
+
+    def __reduce_ex__(self, protocol):
+        """Pickles the graph as Digraph.__reduce_ex__ does, and whether it
+        keeps a connectivity structure, which is built again when the graph is
+        unpickled."""
+        rebuild, arguments = super(Graph, self).__reduce_ex__(protocol)
+        return _rebuild_graph, arguments + (self._connectivity is not None,)
+
+    def snapshot(self):
+        """Returns an immutable view of the graph as it is now, in constant
+        time (see Digraph.snapshot). The snapshot answers is_connected() and
+        same_component() from components(), not from the connectivity
+        structure, which is changed along with the graph."""
+        snapshot = super(Graph, self).snapshot()
+        snapshot._connectivity = None
+        return snapshot
     
+    def _restore(self, state):
+        """Puts back the graph as it was before a failed batch (see
+        Digraph.batch), building its connectivity structure again."""
+        super(Graph, self)._restore(state)
+        if self._connectivity is not None:
+            self.connectivity = DynamicConnectivity(self)
+
+    def _validate(self):
+        """Checks that the graph is legal, after a batch of mutations: that
+        no edge joins a vertex to itself."""
+        self._refuse_loops(self._edges)
+
+    @staticmethod
+    def _refuse_loops(edges):
+        """Raises EdgeError if any of the edges joins a vertex to itself."""
+        if any(v1 == v2 for v1, v2 in edges):
+            raise EdgeError(
+                "AutoAdjacent",
+                "Vertices cannot share and edge with themselves in a Graph."
+            )
+
+    @classmethod
+    def _index_edges(cls, adjacency, edges):
+        """
+        Adds edges to an adjacency index, in both directions.
+        :param adjacency:
+        :param edges:
+        """
+        for edge in edges:
+            v1, v2 = edge
+            adjacency.add_edge(v1, v2)
+            adjacency.add_edge(v2, v1)
+
     def is_legal_graph(self, vertices, edges, adj):
         # Check edges
         assert(vert!=vert2 for edge in edges for vert, vert2 in edge), \
@@ -116,18 +240,30 @@ class Graph(digraph.Digraph):
         """
         Returns true if v1,v2 is an edge
         """
-        assert v1 in self.vertices, "v1 is not an edge."
-        assert v2 in self.vertices, "v2 is not an edge."
-        if v1 == v2:
-            #Weighted graphs dont have self-adjacent vertices
-            return False
-        if self.edge_form(v1,v2) in self.edges():
-            #Yes
-            return True
-        else:
-            #Else statement for readability, fuck speed its 2016
-            return False
+        assert v1 in self.adjacency, "v1 is not an edge."
+        assert v2 in self.adjacency, "v2 is not an edge."
+        return self.adjacency.is_edge(v1, v2)
         
+    def edge(self, v1, v2):
+        """Returns the edge between v1 and v2 held by the graph, in the
+        order asked for: an edge held the other way round is turned once,
+        and the turned edge is interned along with it (see
+        Digraph._edge_table)."""
+        table = self._edge_table()
+        try:
+            return table[v1, v2]
+        except KeyError:
+            if (v2, v1) not in table:
+                return super(Graph, self).edge(v1, v2)
+            edge = table[v1, v2] = self._turned(table[v2, v1])
+            return edge
+
+    def _turned(self, edge):
+        """Returns an edge the other way round, in the edge form of the
+        graph."""
+        v1, v2 = edge
+        return self.edge_form(v2, v1)
+
     def is_an_edge(self, v1, *vertices):
         """Returns False if there is no edge from v1 to any of the edges in
         vertices, and returns the first edge encountered in any other case."""
@@ -136,16 +272,46 @@ class Graph(digraph.Digraph):
                 return self.edge_form(v1, vertex)
         return False
     
+    @derived
+    def components(self):
+        """Returns the connected components of the graph, as a tuple of
+        frozensets of vertices, found by breadth first search once per
+        version of the graph."""
+        adjacency = self.adjacency
+        unseen = set(self.vertices)
+        components = []
+        while unseen:
+            start = unseen.pop()
+            component = {start}
+            frontier = [start]
+            while frontier:
+                reached = set()
+                for vertex in frontier:
+                    reached.update(adjacency.successors(vertex))
+                reached.difference_update(component)
+                component.update(reached)
+                frontier = list(reached)
+            unseen.difference_update(component)
+            components.append(frozenset(component))
+        return tuple(components)
+
     def is_connected(self):
-        """Returns True if graph is a connected graph, False else."""
-        vertex = self.get_vertices().pop()
-        distances = self.breadth_first(vertex)
-        for v in distances.keys():
-            if distances[v] == math.inf:
-                #if there is a single unreachable vertex, then not connected
-                return False
-        #Every vertex is reachable, so, connected
-        return True
+        """Returns True if graph is a connected graph, False else. Answered
+        from the connectivity structure if the graph keeps one, and from
+        components() otherwise."""
+        if self._connectivity is not None:
+            return self._connectivity.component_count(len(self.vertices)) <= 1
+        return len(self.components()) <= 1
+
+    def same_component(self, v1, v2):
+        """Returns True if there is a path between v1 and v2. Answered from
+        the connectivity structure if the graph keeps one, and from
+        components() otherwise."""
+        assert v1 in self.vertices, "v1 is not in the graph."
+        assert v2 in self.vertices, "v2 is not in the graph."
+        if self._connectivity is not None:
+            return self._connectivity.connected(v1, v2)
+        return any(v1 in component and v2 in component for component in self.components())
     
     def add_vertex(self, vertex):
         """
@@ -183,38 +349,106 @@ class Graph(digraph.Digraph):
         self.is_legal_graph(self.get_vertices(), edges, adj)
         
     def add_edges(self, *edges):
-        """Adds multiple edges with add_edge"""
-        adj = self.adj
-        for e in edges:
-            assert (vertex in self.vertices for vertex in e), \
-                "Edge has vertices that are not in the graph."
-            self.add_edge(e)
-            adj[e]=1
-        self.set_adj(adj)
+        """Adds multiple edges to self.edges and self.adj. Do not call this
+        before the endpoints of the edges are known by the graph in
+        self.vertices."""
+        if self._buffer("add_edges", edges):
+            return
+        # Every endpoint is checked before anything is changed (see
+        # Digraph.add_edges); within a batch, loops are refused when it ends.
+        self._missing_vertices([vertex for edge in edges for vertex in edge])
+        if not self._deferred:
+            self._refuse_loops(edges)
+        adjacency = self.adjacency
+        if self._log is not None:
+            self._log.add_edges(edges)
+        self._index_edges(adjacency, edges)
+        adj = self.adjacency_matrix
+        if adj is not None:
+            for edge in edges:
+                # Keep the entries held already, rather than making edges for them
+                turned = (edge[1], edge[0])
+                adj[edge] = 1
+                adj[turned if turned in adj else self._turned(edge)] = 1
+        table = self._current_edge_table()
+        if self._deferred:
+            self._edges.update(edges)
+        else:
+            self._edges = set(self.edges or ()).union(edges)
+        self.touch()
+        self._update_edge_table(table, added=edges)
+        if self._connectivity is not None:
+            for v1, v2 in edges:
+                self._connectivity.insert(v1, v2)
         
+    def remove_vertices(self, *vertices):
+        """Removes vertices, along with every edge to or from them (see
+        Digraph.remove_vertices), and those edges from the connectivity
+        structure, if the graph keeps one."""
+        if self._buffer("remove_vertices", vertices):
+            return
+        adjacency = self.adjacency
+        self._missing_vertices(vertices)
+        incident = [(vertex, other) for vertex in vertices for other in adjacency.successors(vertex)]
+        super(Graph, self).remove_vertices(*vertices)
+        if self._connectivity is not None:
+            for v1, v2 in incident:
+                self._connectivity.delete(v1, v2)
+
+    def remove_edges(self, *edges):
+        """Removes multiple edges from self.edges, the adjacency index and
+        self.adj, in both directions, and from the connectivity structure,
+        if the graph keeps one. Each edge must be in the graph, given either
+        way round."""
+        if self._buffer("remove_edges", edges):
+            return
+        self._missing_edges(edges)
+        if self._log is not None:
+            self._log.remove_edges(edges)
+        adjacency = self.adjacency
+        adj = self.adjacency_matrix
+        for v1, v2 in edges:
+            adjacency.remove_edge(v1, v2)
+            adjacency.remove_edge(v2, v1)
+            self._edges.discard((v1, v2))
+            self._edges.discard((v2, v1))
+            if adj is not None:
+                for key in ((v1, v2), (v2, v1)):
+                    if key in adj:
+                        adj[key] = 0
+        table = self._current_edge_table()
+        self.touch()
+        self._update_edge_table(table, removed=[pair for v1, v2 in edges for pair in ((v1, v2), (v2, v1))])
+        if self._connectivity is not None:
+            for v1, v2 in edges:
+                self._connectivity.delete(v1, v2)
+
     def degree(self, vertex):
         """Returns the degree of the given vertex"""
-        assert vertex in self.get_vertices(), "Vertex is not in the graph."
-        degree = 0
-        for other in self.get_vertices():
-            if (vertex!=other) and (self.is_edge(vertex,other)):
-                degree = degree + 1
-        return degree
+        assert vertex in self.adjacency, "Vertex is not in the graph."
+        return self.adjacency.out_degree(vertex)
     
+    @derived
+    def degrees(self):
+        """Returns the degree of every vertex, computed once per version of
+        the graph."""
+        return self.out_degrees()
+
+    @derived
     def sum_of_degrees(self):
         """Returns the sum of degrees of the graph."""
-        degree = 0
-        for vertex in self.get_vertices():
-            degree = degree + self.degree(vertex)
-        return degree
+        return sum(self.degrees().values())
     
     def adjacent(self, vertex):
         """Returns a set of vertices that are adjacent to v."""
-        adjacents = {}
-        for other in self.get_vertices():
-            if self.is_edge(vertex,other):
-                adjacents.append(other)
-        return adjacents
+        return self.adjacency.successors(vertex)
+        
+    @derived
+    def freeze(self):
+        """Returns an immutable copy of the graph in compressed sparse row
+        form, made once per version of the graph."""
+        from graph_theory.objects.frozen_graph import FrozenGraph
+        return FrozenGraph.from_digraph(self)
         
     def other_vertices(self, *vertices):
         """Returns the collection of other vertices, distinct from vertex."""
@@ -15,10 +15,18 @@ This abstract class is designed to provide an abstract base class (ABC)
 for the entirety of the graphlike objects included in this package:
 graph, digraph, multigraph, psuedograph, psuedo
 
+Every graphlike object carries a version, bumped each time it is changed through its setters, add_vertices,
+add_edges, remove_vertices or remove_edges, and a cache of the results derived from it (degrees, components, frozen
+forms), kept until its version changes. Methods whose results are cached are marked with @derived. Changes made to
+the collections or the adjacency matrix in place, rather than through these methods, are not seen, and should be
+followed by touch().
+
 @author: unoriginalbanter
 """
+import functools
 import numbers
-from typing import Union, Sequence, Set, AnyStr, SupportsComplex, Dict, Any, Iterable, Optional, overload
+from typing import Union, Sequence, Set, AnyStr, SupportsComplex, Dict, Any, Iterable, Optional, overload, Callable, \
+    Hashable
 
 
 from abc import ABCMeta, abstractmethod, abstractproperty
@@ -26,11 +34,17 @@ from abc import ABCMeta, abstractmethod, abstractproperty
 from graph_theory.exceptions import VertexError, EdgeError, MatrixError
 
 
-class Vertex(AnyStr):
+class Vertex(object):
     """
     This defines a vertex object. Generally speaking, this object shouldn't be anything cast in an extraordinary
     type or fashion, as these serve simply as labels for an abstract object.
+
+    A vertex hashes and compares equal to its name, so that vertices may be looked up by their plain labels, and
+    plain labels and vertices may be mixed freely. Its hash is computed once, when it is made. A vertex interned by a
+    VertexTable also carries a dense id, and compares with the other vertices of its table by id alone.
     """
+    __slots__ = ("name", "_hash", "_table", "_id")
+
     def __init__(self, name: AnyStr, *args: Any, **kwargs: Any):
         """
         For the time being, a vertex is given almost exclusively by its name. Name should only have a type of str, int,
@@ -43,16 +57,12 @@ class Vertex(AnyStr):
         :param name: The identifier of the vertex.
         :type name: str or int or bytes
         """
-        if type(name) == str:
-            super(Vertex).__init__(name, *args, **kwargs)
-        elif type(name) == bytes:
-            super(Vertex).__init__(name, *args, **kwargs)
-        elif type(name) == int:
-            super(Vertex).__init__(name, *args, **kwargs)
-        else:
+        if isinstance(name, Vertex):
+            name = name.name
+        if type(name) not in (str, bytes, int):
             try:
                 # Hashtag benefit of the doubt
-                super(Vertex).__init__(name, *args, **kwargs)
+                str(name, *args, **kwargs)
             except TypeError:
                 raise VertexError(
                     "TypeError",
@@ -64,6 +74,114 @@ class Vertex(AnyStr):
                     "Unknown error during casting of vertex value."
                 )
         self.name = name
+        self._hash = hash(name)
+        self._table = None
+        self._id = None
+
+    @property
+    def id(self) -> Optional[int]:
+        """
+        Id getter: the number given to the vertex by the VertexTable that interned it, or None.
+        :return: id
+        :rtype: int
+        """
+        return self._id
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, Vertex):
+            if self._table is not None and self._table is other._table:
+                return self._id == other._id
+            other = other.name
+        return self.name == other
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple:
+        # A vertex is pickled and copied by its name alone, and leaves its table behind.
+        return Vertex, (self.name,)
+
+    def __repr__(self) -> str:
+        return "Vertex({n!r})".format(n=self.name)
+
+
+class VertexTable(object):
+    """
+    Interns vertices: keeps one Vertex per name, numbered densely from 0 in the order the names are first seen, so
+    that the vertices of one table compare by their ids. A released name leaves a tombstone in place of its id, and
+    its vertex leaves the table, comparing by name from then on; the ids are made dense again once the tombstones
+    outnumber the names.
+    """
+    __slots__ = ("_by_name", "_by_id", "_dead")
+
+    def __init__(self):
+        self._by_name = {}
+        self._by_id = []
+        # The number of tombstones in _by_id, until the next compaction.
+        self._dead = 0
+
+    def intern(self, label: Union[Vertex, Hashable]) -> Vertex:
+        """
+        Returns the vertex of the table with the name of label, adding one if there is none.
+
+        :param label: a vertex, or the name of one
+        :returns: vertex
+        :rtype: Vertex
+        """
+        if isinstance(label, Vertex):
+            if label._table is self:
+                return label
+            label = label.name
+        vertex = self._by_name.get(label)
+        if vertex is None:
+            vertex = Vertex(label)
+            vertex._table = self
+            vertex._id = len(self._by_id)
+            self._by_name[label] = vertex
+            self._by_id.append(vertex)
+        return vertex
+
+    def release(self, *labels: Union[Vertex, Hashable]) -> None:
+        """
+        Drops the vertices with the names of labels from the table. Names not in the table are ignored.
+
+        :param labels: vertices, or their names
+        """
+        for label in labels:
+            vertex = self._by_name.pop(getattr(label, "name", label), None)
+            if vertex is None:
+                continue
+            self._by_id[vertex._id] = None
+            vertex._table = None
+            vertex._id = None
+            self._dead += 1
+        if self._dead > len(self._by_name):
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Numbers the vertices 0 to n-1 again, in their present order, reclaiming the ids of released names.
+        """
+        if not self._dead:
+            return
+        self._by_id = [vertex for vertex in self._by_id if vertex is not None]
+        for i, vertex in enumerate(self._by_id):
+            vertex._id = i
+        self._dead = 0
+
+    def __getitem__(self, i: int) -> Optional[Vertex]:
+        """
+        Returns the vertex with id i, or None if its name was released.
+        """
+        return self._by_id[i]
+
+    def __contains__(self, label: Hashable) -> bool:
+        return label in self._by_name
+
+    def __len__(self) -> int:
+        return len(self._by_name)
 
 
 class BaseEdge(Iterable[Vertex]):
@@ -80,7 +198,7 @@ class BaseEdge(Iterable[Vertex]):
         :param args:  Other values
         :param kwargs: Other keyword values
         """
-        super(BaseEdge, self).__init__(vertex_pair)
+        super(BaseEdge, self).__init__()
         self.vertices = vertex_pair
 
 
@@ -104,7 +222,7 @@ class BaseWeightedEdge(BaseEdge):
                     t=type(weight)
                 )
             )
-        super(BaseWeightedEdge).__init__(vertex_pair, *args, **kwargs)
+        super(BaseWeightedEdge, self).__init__(vertex_pair, *args, **kwargs)
         self.weight = weight
 
     def __repr__(self) -> str:
@@ -114,18 +232,47 @@ class BaseWeightedEdge(BaseEdge):
         :return: repr
         :rtype: str
         """
-        return "{v}, {w}".format(v=self.vertex_pair, w=self.weight)
+        return "{v}, {w}".format(v=self.vertices, w=self.weight)
 
 
 Matrix = Dict[BaseEdge, numbers.Real]
 
 
+def derived(method: Callable) -> Callable:
+    """
+    Marks a method of a graphlike object as derived from the object's state: its result is computed the first time it
+    is asked for with some arguments, and kept until the object's version changes. Results are shared between
+    callers, so they should not be changed.
+
+    :param method: a method whose arguments are hashable
+    :returns: the caching method
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def cached(self, *args: Hashable) -> Any:
+        cache = self._derived
+        if cache is None:
+            cache = self._derived = {}
+        key = (name, args)
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = method(self, *args)
+            return result
+    return cached
+
+
 class Graphlike(object):
     """
     abstract class, cannot instantiate it as a standalone instance
     """
     __metaclass__ = ABCMeta
-    
+
+    # The number of changes made so far, and the results derived since the last one.
+    _version = 0
+    _derived = None
+
     @abstractmethod
     def __init__(self, vertices: Set[Vertex], edges: Set[BaseEdge], adjacency_matrix: Matrix):
         """
@@ -138,6 +285,25 @@ class Graphlike(object):
         self.edges = edges
         self.adjacency_matrix = adjacency_matrix
 
+    @property
+    def version(self) \
+            -> int:
+        """
+        Version getter: the number of changes made to the object, so that results computed from it can be checked for
+        staleness.
+        :return: version
+        :rtype: int
+        """
+        return self._version
+
+    def touch(self) \
+            -> None:
+        """
+        Records a change to the object: bumps its version, and drops the results derived from it.
+        """
+        self._version += 1
+        self._derived = None
+
     @classmethod
     @abstractmethod
     def is_legal(cls, vertices: Set[Vertex], edges: Set[BaseEdge], adjacency_matrix: Matrix) \
@@ -284,6 +450,26 @@ class Graphlike(object):
         """
         return None
 
+    @abstractmethod
+    def remove_vertices(self, *vertices: Vertex) \
+            -> None:
+        """
+        Removes vertices from the graphlike object's vertices and adjacency_matrix properties, along with every edge
+        to or from them.
+
+        :param vertices: collection of vertices to remove from Graphlike.vertices
+        :type vertices: Vertex
+        """
+        return None
+
+    @abstractmethod
+    def remove_edges(self, *edges: BaseEdge) \
+            -> None:
+        """
+        Removes edges from the graphlike object's edges and adjacency_matrix properties.
+        """
+        return None
+
     @abstractmethod
     def is_edge(self, potential_edge: BaseEdge, *args: Any, **kwargs: Any) \
             -> bool:
@@ -492,11 +678,11 @@ class WeightedGraphlike(Graphlike):
 
     @classmethod
     @abstractmethod
-    def edge_form(cls, *params: Union[Iterable[Vertex], SupportsComplex], *args: Any, **kwargs: Any) -> BaseWeightedEdge:
+    def edge_form(cls, *params: Union[Iterable[Vertex], SupportsComplex], **kwargs: Any) -> BaseWeightedEdge:
         """
         Returns the edge-format of v1, v2
         :param vertex1:
         :param vertex2:
         :param args:
         """
-        return BaseWeightedEdge(*params, *args, **kwargs)
+        return BaseWeightedEdge(*params, **kwargs)
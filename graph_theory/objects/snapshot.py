@@ -0,0 +1,136 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+Snapshots of mutable digraphs. Digraph.snapshot() returns, in constant time, an immutable view of a digraph as it is
+at that moment: an instance of the snapshot class of the digraph's class, sharing the digraph's collections and
+adjacency index. The snapshot answers every query its class does, and refuses every change; the digraph copies what it
+shares the next time it is changed (see Digraph._unshare), so a snapshot stays consistent while a single writer goes
+on changing the digraph, and any number of readers may query it meanwhile.
+"""
+from typing import Any, Dict, Tuple
+
+from graph_theory.exceptions import GraphTheoryException
+
+
+# The snapshot class of each digraph class, made the first time it is needed.
+_classes = {}  # type: Dict[type, type]
+
+
+def snapshot_class(cls: type) -> type:
+    """
+    Returns the class of the snapshots of instances of cls: a subclass of both Snapshot and cls.
+
+    :param cls: a subclass of Digraph
+    :returns: snapshot_class
+    :rtype: type
+    """
+    try:
+        return _classes[cls]
+    except KeyError:
+        snapshot = _classes[cls] = type(
+            cls.__name__ + "Snapshot",
+            (Snapshot, cls),
+            {"__module__": __name__, "_mutable_class": cls}
+        )
+        return snapshot
+
+
+class Snapshot(object):
+    """
+    Mixed in before a mutable digraph class, makes the class of its snapshots: the queries of the class are kept, and
+    its setters, add and remove methods, batch() and update_weights() raise GraphTheoryException.
+    """
+    # The class of digraph the snapshot was taken of.
+    _mutable_class = None
+
+    @staticmethod
+    def _frozen() -> GraphTheoryException:
+        """
+        Returns the error raised by any attempt to modify a snapshot.
+        """
+        return GraphTheoryException(
+            "FrozenGraph",
+            "Snapshots cannot be modified. Use to_digraph() for a mutable copy."
+        )
+
+    @property
+    def vertices(self):
+        """
+        Vertices getter
+        :return: vertices
+        :rtype: set(Vertex)
+        """
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices) -> None:
+        raise self._frozen()
+
+    @property
+    def edges(self):
+        """
+        Edges getter
+        :return: edges
+        :rtype: set(DirectedEdge)
+        """
+        return self._edges
+
+    @edges.setter
+    def edges(self, edges) -> None:
+        raise self._frozen()
+
+    @property
+    def adjacency_matrix(self):
+        """
+        Adjacency matrix getter
+        :return: adjacency_matrix
+        :rtype: dict
+        """
+        return self._adjacency_matrix
+
+    @adjacency_matrix.setter
+    def adjacency_matrix(self, matrix) -> None:
+        raise self._frozen()
+
+    def _unshare(self) -> None:
+        # Every change to a digraph begins here (see Digraph._buffer).
+        raise self._frozen()
+
+    def batch(self):
+        raise self._frozen()
+
+    def snapshot(self) -> "Snapshot":
+        """
+        Returns the snapshot itself: a snapshot cannot change, so it is its own snapshot.
+        """
+        return self
+
+    def copy(self) -> "Snapshot":
+        """
+        Returns the snapshot itself: a snapshot cannot change, so it is its own copy.
+        """
+        return self
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Snapshot":
+        return self
+
+    def to_digraph(self):
+        """
+        Returns a mutable copy of the snapshot, of the class of digraph it was taken of.
+        :return: digraph
+        :rtype: Digraph
+        """
+        clone = super(Snapshot, self).copy()
+        clone.__class__ = self._mutable_class
+        return clone
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Any, Tuple]:
+        """
+        Pickles the snapshot as the class of digraph it was taken of, so that it is unpickled as a mutable copy.
+        """
+        rebuild, arguments = super(Snapshot, self).__reduce_ex__(protocol)
+        return rebuild, (self._mutable_class,) + tuple(arguments[1:])
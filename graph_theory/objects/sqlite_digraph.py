@@ -0,0 +1,571 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+A digraph stored out of core, in a SQLite database, for digraphs larger than memory.
+
+Vertices are numbered in a vertices table, and edges are kept in an edges table whose primary key is (source, target)
+and which has no rowid, so the edges are clustered by source vertex: the successors of a vertex are one range of one
+B-tree, read in a few pages. An index on (target, source) answers in-degree queries.
+
+Two bounded least-recently-used caches keep the hot part of the digraph in memory: one maps vertex labels to ids, and
+one holds the successor list (the adjacency page) of recently used vertices. neighbors_many, and prefetch, read the
+pages of a whole batch of vertices, such as a BFS frontier, in one query per few hundred vertices. Writes are committed
+per call, or once per transaction() block, and bulk_load inserts edges in batches within a single transaction.
+"""
+import sqlite3
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, FrozenSet, Hashable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from graph_theory.exceptions import EdgeError, GraphTheoryException, VertexError
+from graph_theory.objects.digraph import DirectedEdge
+from graph_theory.objects.graphlike import Graphlike, Vertex, derived
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vertices (id INTEGER PRIMARY KEY, label UNIQUE NOT NULL);
+CREATE TABLE IF NOT EXISTS edges (
+    source INTEGER NOT NULL, target INTEGER NOT NULL, weight REAL, PRIMARY KEY (source, target)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS edges_by_target ON edges (target, source);
+"""
+
+# The most parameters put in one query.
+_BATCH = 500
+
+
+class _LRU(OrderedDict):
+    """
+    A dict holding at most capacity items, dropping the least recently used.
+    """
+    def __init__(self, capacity: int):
+        super(_LRU, self).__init__()
+        self.capacity = capacity
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        self.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self[key] = value
+        self.move_to_end(key)
+        if len(self) > self.capacity:
+            self.popitem(last=False)
+
+
+def _label(vertex: Any) -> Union[str, int, bytes]:
+    """
+    Returns the plain label of a vertex, which must be a str, int or bytes to be stored.
+    """
+    label = vertex.name if isinstance(vertex, Vertex) else vertex
+    if type(label) not in (str, int, bytes):
+        raise VertexError(
+            "TypeError",
+            "Vertices stored in SQLite must be labelled by str, int or bytes. Got '{t}' instead.".format(
+                t=type(label)
+            )
+        )
+    return label
+
+
+def _batches(values: Sequence[Any]) -> Iterator[Sequence[Any]]:
+    """
+    Yields slices of values of at most _BATCH items.
+    """
+    for start in range(0, len(values), _BATCH):
+        yield values[start:start + _BATCH]
+
+
+class SqliteDigraph(Graphlike):
+    """
+    :properties: vertices, edges, adjacency_matrix, order, size
+    :methods: is_edge, has_an_edge_with, adjacent, in_degree, out_degree, neighbors_many, prefetch, add_vertices,
+        add_edges, remove_vertices, remove_edges, bulk_load, transaction, freeze, close
+    """
+    def __init__(self, path: str = ":memory:", weighted: bool = False, cache_size: int = 4096):
+        """
+        Constructor. Opens, or creates, the digraph stored at path.
+
+        :param path: (optional) database file path; by default, a database in memory
+        :param weighted: (optional) whether edges carry weights
+        :param cache_size: (optional) the number of adjacency pages, and of vertex ids, to keep in memory
+        :type path: str
+        :type weighted: bool
+        :type cache_size: int
+        """
+        self.path = path
+        self.weighted = weighted
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._ids = _LRU(cache_size)
+        self._pages = _LRU(cache_size)
+        self._depth = 0
+
+    @property
+    def vertices(self) \
+            -> Set[Hashable]:
+        """
+        Vertices getter. Reads every vertex label.
+        :return: vertices
+        :rtype: set
+        """
+        return {label for label, in self._connection.execute("SELECT label FROM vertices")}
+
+    @vertices.setter
+    def vertices(self, vertices):
+        raise GraphTheoryException(
+            "StoredGraph",
+            "The vertices of a stored digraph cannot be replaced. Use add_vertices()."
+        )
+
+    @property
+    def edges(self) \
+            -> Set[DirectedEdge]:
+        """
+        Edges getter. Reads every edge.
+        :return: edges
+        :rtype: set(DirectedEdge)
+        """
+        rows = self._connection.execute(
+            "SELECT s.label, t.label, e.weight FROM edges e "
+            "JOIN vertices s ON s.id = e.source JOIN vertices t ON t.id = e.target"
+        )
+        return {self.edge_form(v1, v2, *([weight] if self.weighted else [])) for v1, v2, weight in rows}
+
+    @edges.setter
+    def edges(self, edges):
+        raise GraphTheoryException(
+            "StoredGraph",
+            "The edges of a stored digraph cannot be replaced. Use add_edges()."
+        )
+
+    @property
+    def adjacency_matrix(self) \
+            -> None:
+        """
+        Stored digraphs keep no adjacency matrix.
+        :return: None
+        """
+        return None
+
+    @adjacency_matrix.setter
+    def adjacency_matrix(self, matrix):
+        raise GraphTheoryException(
+            "StoredGraph",
+            "Stored digraphs keep no adjacency matrix."
+        )
+
+    @property
+    def order(self) -> int:
+        """
+        The number of vertices.
+        """
+        return self._connection.execute("SELECT COUNT(*) FROM vertices").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """
+        The number of edges.
+        """
+        return self._connection.execute("SELECT COUNT(*) FROM edges").fetchone()[0]
+
+    @classmethod
+    def is_legal(cls, vertices, edges, adjacency_matrix) \
+            -> None:
+        """
+        Stored digraphs are checked as they are written.
+        """
+        return None
+
+    @classmethod
+    def edge_form(cls, v1: Hashable, v2: Hashable, *args: Any, **kwargs: Any) -> DirectedEdge:
+        """
+        Returns the edge-form of v1,v2: a WeightedDirectedEdge if a weight is given, and a DirectedEdge otherwise.
+        """
+        if args or kwargs:
+            from graph_theory.objects.weighted_digraph import WeightedDirectedEdge
+            return WeightedDirectedEdge(tuple([v1, v2]), *args, **kwargs)
+        return DirectedEdge(tuple([v1, v2]))
+
+    def _missing(self, vertex: Hashable) -> VertexError:
+        """
+        Returns the error raised for a vertex that is not in the digraph.
+        """
+        return VertexError(
+            "ValueNotFound",
+            "Vertex {v} not found in the vertices of this graph.".format(
+                v=vertex
+            )
+        )
+
+    def vertex_id(self, vertex: Hashable) -> int:
+        """
+        Returns the id of vertex.
+
+        :param vertex:
+        :type vertex: Vertex
+        :rtype: int
+        """
+        label = _label(vertex)
+        i = self._ids.get(label)
+        if i is None:
+            row = self._connection.execute("SELECT id FROM vertices WHERE label = ?", (label,)).fetchone()
+            if row is None:
+                raise self._missing(vertex)
+            i = row[0]
+            self._ids.put(label, i)
+        return i
+
+    def _vertex_ids(self, vertices: Sequence[Hashable]) -> List[int]:
+        """
+        Returns the ids of vertices, reading those not cached in batches.
+        """
+        labels = [_label(vertex) for vertex in vertices]
+        missing = list({label for label in labels if label not in self._ids})
+        for batch in _batches(missing):
+            rows = self._connection.execute(
+                "SELECT label, id FROM vertices WHERE label IN ({q})".format(q=", ".join("?" * len(batch))),
+                batch
+            )
+            for label, i in rows:
+                self._ids.put(label, i)
+        ids = []
+        for label in labels:
+            i = self._ids.get(label)
+            if i is None:
+                i = self.vertex_id(label)
+            ids.append(i)
+        return ids
+
+    def _read_pages(self, ids: Iterable[int]) -> dict:
+        """
+        Reads the adjacency pages of vertex ids, in batches, caches them, and returns them by id.
+        """
+        pages = {i: [] for i in ids}
+        for batch in _batches(list(pages)):
+            rows = self._connection.execute(
+                "SELECT e.source, t.label FROM edges e JOIN vertices t ON t.id = e.target "
+                "WHERE e.source IN ({q})".format(q=", ".join("?" * len(batch))),
+                batch
+            )
+            for i, label in rows:
+                pages[i].append(label)
+        pages = {i: frozenset(page) for i, page in pages.items()}
+        for i, page in pages.items():
+            self._pages.put(i, page)
+        return pages
+
+    def _page(self, vertex: Hashable) -> FrozenSet[Hashable]:
+        """
+        Returns the labels of the successors of vertex, from the cache if they are there.
+        """
+        i = self.vertex_id(vertex)
+        page = self._pages.get(i)
+        if page is None:
+            page = self._read_pages([i])[i]
+        return page
+
+    def prefetch(self, vertices: Sequence[Hashable]) -> None:
+        """
+        Reads the adjacency pages of vertices that are not cached, in as few queries as possible.
+
+        :param vertices: the vertices about to be visited, such as a BFS frontier
+        """
+        ids = self._vertex_ids(vertices)
+        self._read_pages([i for i in set(ids) if i not in self._pages])
+
+    def neighbors_many(self, vertices: Sequence[Hashable]) -> Tuple[array, List[Hashable]]:
+        """
+        Returns the vertices adjacent to each of vertices, in compressed sparse row form: the vertices adjacent to
+        vertices[i] are neighbours[indptr[i]:indptr[i + 1]]. Pages not cached are read in batches.
+
+        :param vertices: The vertices to find the adjacent vertices of
+        :return: indptr, neighbours
+        :rtype: tuple(array('q'), list)
+        """
+        ids = self._vertex_ids(vertices)
+        pages = {}
+        missing = []
+        for i in set(ids):
+            page = self._pages.get(i)
+            if page is None:
+                missing.append(i)
+            else:
+                pages[i] = page
+        pages.update(self._read_pages(missing))
+        indptr = array("q", [0])
+        neighbours = []
+        for i in ids:
+            neighbours.extend(pages[i])
+            indptr.append(len(neighbours))
+        return indptr, neighbours
+
+    def is_edge(self, edge: Sequence[Hashable], *args: Any, **kwargs: Any) -> bool:
+        """
+        Returns true if v1,v2 is an edge. v1 and v2 MUST be contained in self.vertices. If not, raises VertexError.
+
+        :param edge: The edge to check
+        """
+        v1, v2 = edge
+        i = self.vertex_id(v1)
+        j = self.vertex_id(v2)
+        page = self._pages.get(i)
+        if page is not None:
+            return _label(v2) in page
+        row = self._connection.execute("SELECT 1 FROM edges WHERE source = ? AND target = ?", (i, j)).fetchone()
+        return row is not None
+
+    def has_an_edge_with(self, v1: Hashable, *vertices: Hashable) -> Union[bool, DirectedEdge]:
+        """
+        Returns False if there is no edge from v1 to any of the vertices, and returns the first edge encountered in any
+        other case.
+
+        :param v1: The vertex to find edges from
+        :param vertices: Collection of vertices to check if v1 has an edge to.
+        """
+        i = self.vertex_id(v1)
+        for vertex in vertices:
+            row = self._connection.execute(
+                "SELECT weight FROM edges WHERE source = ? AND target = ?", (i, self.vertex_id(vertex))
+            ).fetchone()
+            if row is not None:
+                return self.edge_form(v1, vertex, *([row[0]] if self.weighted else []))
+        return False
+
+    def adjacent(self, vertex: Hashable) -> Set[Hashable]:
+        """
+        Returns a set of vertices that are adjacent to v.
+
+        :param vertex:
+        :type vertex: Vertex
+        :return: adjacents
+        :rtype: set
+        """
+        return set(self._page(vertex))
+
+    def out_degree(self, vertex: Hashable) -> int:
+        """
+        Returns the outdegree of a given vertex.
+        """
+        i = self.vertex_id(vertex)
+        page = self._pages.get(i)
+        if page is not None:
+            return len(page)
+        return self._connection.execute("SELECT COUNT(*) FROM edges WHERE source = ?", (i,)).fetchone()[0]
+
+    def in_degree(self, vertex: Hashable) -> int:
+        """
+        Returns the indegree of the given vertex.
+        """
+        i = self.vertex_id(vertex)
+        return self._connection.execute("SELECT COUNT(*) FROM edges WHERE target = ?", (i,)).fetchone()[0]
+
+    def sum_of_degrees(self) -> int:
+        """
+        Returns the sum of degrees of the graph, which is the number of edges.
+        :rtype: int
+        """
+        return self.size
+
+    def other_vertices(self, *vertices: Hashable) -> Set[Hashable]:
+        """
+        Returns the collection of other vertices, distinct from the args vertices.
+        """
+        return self.vertices.difference(_label(vertex) for vertex in vertices)
+
+    @contextmanager
+    def transaction(self) -> Iterator["SqliteDigraph"]:
+        """
+        Groups writes into one transaction, committed when the block ends, or rolled back if it raises. Blocks may be
+        nested: a nested block is a savepoint, rolled back on its own if it raises, and committed only with the
+        outermost block.
+
+            with digraph.transaction():
+                digraph.add_vertices(...)
+                digraph.add_edges(...)
+        """
+        savepoint = "block_{d}".format(d=self._depth)
+        if self._depth:
+            self._connection.execute("SAVEPOINT " + savepoint)
+        elif not self._connection.in_transaction:
+            # Begun at once, so that a savepoint opened before the first write does not begin (and end) it.
+            self._connection.execute("BEGIN")
+        self._depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._depth -= 1
+            if self._depth:
+                self._connection.execute("ROLLBACK TO " + savepoint)
+                self._connection.execute("RELEASE " + savepoint)
+            else:
+                self._connection.rollback()
+            self._ids.clear()
+            self._pages.clear()
+            self.touch()
+            raise
+        self._depth -= 1
+        if self._depth:
+            self._connection.execute("RELEASE " + savepoint)
+        self._commit()
+
+    def _commit(self) -> None:
+        """
+        Commits, unless within a transaction block.
+        """
+        if not self._depth:
+            self._connection.commit()
+
+    def add_vertices(self, *vertices: Hashable) -> None:
+        """
+        Adds vertices. Vertices already present are left untouched.
+
+        :param vertices: Vertex objects, or labels, to add
+        """
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO vertices (label) VALUES (?)", [(_label(vertex),) for vertex in vertices]
+        )
+        self.touch()
+        self._commit()
+
+    def _edge_rows(self, edges: Iterable[Any]) -> Iterator[Tuple[int, int, Optional[float]]]:
+        """
+        Yields (source id, target id, weight) for edges.
+        """
+        for edge in edges:
+            v1, v2 = edge
+            if _label(v1) == _label(v2):
+                raise EdgeError(
+                    "AutoAdjacent",
+                    "Vertices cannot share and edge with themselves in a strict Digraph."
+                )
+            weight = getattr(edge, "weight", None)
+            if self.weighted and weight is None:
+                raise EdgeError(
+                    "TypeError",
+                    "All edges in a weighted digraph must be weighted. Got {e}.".format(
+                        e=edge
+                    )
+                )
+            yield self.vertex_id(v1), self.vertex_id(v2), weight
+
+    def add_edges(self, *edges: Any) -> None:
+        """
+        Adds edges. Do not call this before the endpoints of the edges are known by the digraph. An edge already
+        present has its weight replaced.
+
+        :param edges: DirectedEdge objects, or WeightedDirectedEdge objects if the digraph is weighted
+        """
+        rows = list(self._edge_rows(edges))
+        self._connection.executemany("INSERT OR REPLACE INTO edges (source, target, weight) VALUES (?, ?, ?)", rows)
+        for i, _, _ in rows:
+            self._pages.pop(i, None)
+        self.touch()
+        self._commit()
+
+    def remove_vertices(self, *vertices: Hashable) -> None:
+        """
+        Removes vertices, and every edge to or from them.
+
+        :param vertices: Vertex objects, or labels, to remove
+        """
+        ids = self._vertex_ids(vertices)
+        for batch in _batches(ids):
+            marks = ", ".join("?" * len(batch))
+            # The pages of the predecessors of the vertices list them, and are dropped with their own.
+            for (i,) in self._connection.execute(
+                "SELECT DISTINCT source FROM edges WHERE target IN ({q})".format(q=marks), batch
+            ):
+                self._pages.pop(i, None)
+            self._connection.execute(
+                "DELETE FROM edges WHERE source IN ({q}) OR target IN ({q})".format(q=marks), batch + batch
+            )
+            self._connection.execute("DELETE FROM vertices WHERE id IN ({q})".format(q=marks), batch)
+        for vertex, i in zip(vertices, ids):
+            self._ids.pop(_label(vertex), None)
+            self._pages.pop(i, None)
+        self.touch()
+        self._commit()
+
+    def remove_edges(self, *edges: Any) -> None:
+        """
+        Removes edges. Edges not in the digraph are ignored, but their endpoints must be.
+
+        :param edges: DirectedEdge objects, or (v1, v2) pairs
+        """
+        rows = [(self.vertex_id(v1), self.vertex_id(v2)) for v1, v2 in edges]
+        self._connection.executemany("DELETE FROM edges WHERE source = ? AND target = ?", rows)
+        for i, _ in rows:
+            self._pages.pop(i, None)
+        self.touch()
+        self._commit()
+
+    def bulk_load(self, edges: Iterable[Sequence[Any]], batch_size: int = 65536) -> None:
+        """
+        Adds many edges, given as (v1, v2) or (v1, v2, weight) sequences of labels, adding their vertices as needed.
+        Edges are inserted in batches, all in one transaction.
+
+        :param edges: the edges to add
+        :param batch_size: (optional) number of edges inserted at a time
+        """
+        with self.transaction():
+            batch = []
+            for edge in edges:
+                batch.append(edge)
+                if len(batch) >= batch_size:
+                    self._load_batch(batch)
+                    batch = []
+            if batch:
+                self._load_batch(batch)
+        self._pages.clear()
+
+    def _load_batch(self, batch: List[Sequence[Any]]) -> None:
+        """
+        Inserts one batch of bulk_load.
+        """
+        self.add_vertices(*{label for edge in batch for label in edge[:2]})
+        self.add_edges(*(
+            self.edge_form(edge[0], edge[1], *edge[2:3]) if self.weighted else self.edge_form(edge[0], edge[1])
+            for edge in batch
+        ))
+
+    @derived
+    def freeze(self):
+        """
+        Returns an immutable in-memory copy of the digraph in compressed sparse row form, made once per version of
+        the digraph.
+
+        :return: frozen_digraph
+        :rtype: FrozenDigraph
+        """
+        from graph_theory.objects.frozen_digraph import FrozenDigraph
+        positions = {}
+        labels = []
+        for i, label in self._connection.execute("SELECT id, label FROM vertices ORDER BY id"):
+            positions[i] = len(labels)
+            labels.append(label)
+        sources = array("q")
+        targets = array("q")
+        weights = array("d") if self.weighted else None
+        for i, j, weight in self._connection.execute("SELECT source, target, weight FROM edges"):
+            sources.append(positions[i])
+            targets.append(positions[j])
+            if self.weighted:
+                weights.append(weight)
+        return FrozenDigraph.from_edge_arrays(sources, targets, weights, labels)
+
+    def close(self) -> None:
+        """
+        Closes the database.
+        """
+        self._connection.close()
@@ -4,6 +4,7 @@ Created on Sep 18, 2016
 @author: MyMac
 '''
 
+from graph_theory.exceptions import EdgeError
 from . import graph
 
 class Tree(graph.Graph):
@@ -15,158 +16,81 @@ class Tree(graph.Graph):
     from Graph.
     '''
 
-    def __init__(self, verts=[], edges=[], ad_m={}):
+    def __init__(self, vertices=None, edges=None, adjacency_matrix=None, backend="set"):
         '''
-        Constructor
+        Constructor: a Graph (see Graph.__init__) whose vertices and edges
+        must make a tree.
         '''
-        self.vertices=self.set_vertices(verts)
-        self.edges=self.set_edges(edges)
-        self.adj=ad_m
-        
-            
-    def get_vertices(self):
-        return self.vertices
-    
-    def set_vertices(self, vertices):
-        self.vertices=set(vertices)
-        
-    property(get_vertices, set_vertices)
-    
-    def get_edges(self):
-        return self.edges
-    
-    def set_edges(self, edges):
-        self.edges=set(edges)
-        
-    property(get_edges, set_edges)
-    
-    def set_adj(self, adj):
-        self.adj = adj
-        
-    def get_adj(self):
-        return self.adj
-    
-    def is_edge(self, v1, v2):
-        """Returns true if v1,v2 is an edge"""
-        assert v1 in self.vertices, "v1 is not an edge."
-        assert v2 in self.vertices, "v2 is not an edge."
-        if v1 == v2:
-            #Weighted graphs dont have self-adjacent vertices
-            return False
-        if self.edge_form(v1,v2) in self.edges():
-            #Yes
-            return True
-        else:
-            #Else statement for readability, fuck speed its 2016
-            return False
-        
-    def is_an_edge(self, v1, *vertices):
-        """Returns False if there is no edge from v1 to any of the edges in
-        vertices, and returns the first edge encountered in any other case."""
-        for vertex in vertices:
-            if self.is_edge(v1, vertex):
-                return self.edge_form(v1, vertex)
-        return False
-    
+        super(Tree, self).__init__(vertices or set(), edges or set(), adjacency_matrix, backend)
+        self.is_legal_tree(self._vertices, self._edges, self._adjacency_matrix)
+
     def is_legal_tree(self, vertices, edges, adj):
-        """Checks for Graph legality."""
-        #Uses inherited method is_legal_graph from Graph
-        self.is_legal_graph(vertices,edges,adj)
-        assert self.is_connected(), "Trees must be connected graphs."
-        assert len(vertices) == len(vertices) - 1, \
-            "In a tree, we must have q=p-1\np = len(vertices)\nq=lend(edges)"
-        
-    
-    def add_vertex(self, vertex):
-        '''
-        Adds a singular vertex to self.vertices and adds the vertex
-        row and column to the adjacency matrix. 
-        
-        DOES NOT SET EDGES
-        '''
-        vertices = self.get_vertices()
-        vertices.append(vertex)
-        adj = self.get_adj()
-        for vert in vertices:
-            adj[[vert, vertex]]=None
-            adj[[vertex, vert]]=None
-        vertices.append(vertex)
-        self.set_vertices(vertices)
-        self.set_adj(adj)
-        
-    
-    def add_edge(self, edge):
-        '''
-        Adds a singular edge to self.edges and self.adj
-        Do not call this before the endpoints of the edge are known by
-        the graph in self.vertices.
-        '''
-        edges = self.get_edges()
-        adj = self.get_adj()
-        edges.append(edge)
-        adj[edge[0], edge[1]] = 1
-        adj[edge[1], edge[0]] = 1
-        self.is_legal_graph(self.get_vertices(), edges, adj)
-        self.set_edges(edges)
-        self.set_adj(adj)
-        self.is_legal_graph(self.get_vertices(), edges, adj)
-        
+        """Checks for Tree legality: a tree is a graph with one fewer edge
+        than it has vertices, and no cycles (and so is connected). A loop
+        is a cycle too."""
+        if vertices and len(edges) != len(vertices) - 1:
+            raise EdgeError(
+                "NotATree",
+                "In a tree, we must have q = p - 1. Got p = {p}, q = {q}.".format(
+                    p=len(vertices),
+                    q=len(edges)
+                )
+            )
+        # Union-find over the edges: an edge within one part closes a cycle.
+        parent = {}
+        def find(vertex):
+            while parent.get(vertex, vertex) != vertex:
+                vertex = parent[vertex]
+            return vertex
+        for v1, v2 in edges:
+            root1, root2 = find(v1), find(v2)
+            if root1 == root2:
+                raise EdgeError(
+                    "NotATree",
+                    "Trees cannot have cycles. Edge {e} closes one.".format(
+                        e=(v1, v2)
+                    )
+                )
+            parent[root1] = root2
+
+    def _validate(self):
+        """Checks that the tree is legal, after a batch of mutations (see
+        Digraph.batch)."""
+        super(Tree, self)._validate()
+        self.is_legal_tree(self._vertices, self._edges, self._adjacency_matrix)
+
+    def _as_batch(self, operation, items):
+        """Returns whether a mutation was called outside a batch, and if it
+        was, applies it as a batch of its own (see Digraph.batch), so that
+        the result is checked to be a tree, and refused whole if not. Most
+        changes to a tree only make sense together, such as a vertex and the
+        edge that joins it: make those in one batch."""
+        if self._batch is not None or self._deferred:
+            return False
+        with self.batch():
+            getattr(super(Tree, self), operation)(*items)
+        return True
+
+    def add_vertices(self, *vertices):
+        """Adds vertices (see Digraph.add_vertices). Outside a batch, only
+        the first vertex of an empty tree can be added on its own."""
+        if not self._as_batch("add_vertices", vertices):
+            super(Tree, self).add_vertices(*vertices)
+
     def add_edges(self, *edges):
-        '''Adds multiple edges with add_edge'''
-        adj = self.adj
-        for e in edges:
-            assert (vertex in self.vertices for vertex in e), \
-                "Edge has vertices that are not in the graph."
-            self.add_edge(e)
-            adj[e]=1
-        self.set_adj(adj)
-        
-    def degree(self, vertex):
-        """Returns the degree of the given vertex"""
-        assert vertex in self.get_vertices(), "Vertex is not in the graph."
-        degree = 0
-        for other in self.get_vertices():
-            if (vertex!=other) and (self.is_edge(vertex,other)):
-                degree = degree + 1
-        return degree
-    
-    def sum_of_degrees(self):
-        """Returns the sum of degrees of the graph."""
-        degree = 0
-        for vertex in self.get_vertices():
-            degree = degree + self.degree(vertex)
-        return degree
-    
-    def adjacent(self, vertex):
-        """Returns a set of vertices that are adjacent to v."""
-        adjacents = {}
-        for other in self.get_vertices():
-            if self.is_edge(vertex,other):
-                adjacents.append(other)
-        return adjacents
-        
-    def other_vertices(self, *vertices):
-        """Returns the collection of other vertices, distinct from vertex."""
-        possible = self.get_vertices()
-        for element in vertices:
-            possible.remove(element)
-        return possible
-    
-    def breadth_first(self, vertex):
-        """returns a dictionary whose keys are the vertices, and whose values
-        are the distances from vertex to each of these."""
-        distances = {vert:0 for vert in self.get_vertices()}
-        i = 0
-        adjacents = [vertex]
-        counted = []
-        distances = {}
-        while adjacents:
-            for vertex in adjacents:
-                distances[vertex] = i
-                counted.append(vertex) 
-            adjacents = [
-                other 
-                for other in self.other_vertices(*counted)
-                if self.is_an_edge(other, adjacents)
-             ]
-        return distances
\ No newline at end of file
+        """Adds edges (see Graph.add_edges), in a batch with the vertices
+        they join."""
+        if not self._as_batch("add_edges", edges):
+            super(Tree, self).add_edges(*edges)
+
+    def remove_vertices(self, *vertices):
+        """Removes vertices with their edges (see Graph.remove_vertices).
+        Outside a batch, only leaves can be removed."""
+        if not self._as_batch("remove_vertices", vertices):
+            super(Tree, self).remove_vertices(*vertices)
+
+    def remove_edges(self, *edges):
+        """Removes edges (see Graph.remove_edges), in a batch with the edges
+        or removals that keep the tree whole."""
+        if not self._as_batch("remove_edges", edges):
+            super(Tree, self).remove_edges(*edges)
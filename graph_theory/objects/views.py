@@ -0,0 +1,484 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+A view is a read-only graph over the storage of a frozen digraph (or graph): the subgraph on some of its vertices, the
+subgraph on some of its edges, its reverse, or any combination of these. A view holds no edges of its own, only its
+parent, a flag per vertex and a flag per edge of the parent, and whether it is reversed, so making one costs at most a
+byte per vertex and per edge, and views of views share the same parent.
+
+The vertices of a view keep the ids and labels they have in the parent, as its edges keep their edge ids. The reverse
+of a digraph follows the transpose of its parent (see FrozenDigraph._predecessors), which is built once and shared by
+every reversed view, so walking the predecessors of a vertex costs no more than walking its successors.
+
+Views answer the same queries as a frozen digraph (vertices, edges, adjacent, is_edge, the degrees), and so can be
+handed to any algorithm of this package; those that work on the CSR arrays call freeze(), which copies the view into
+a compact frozen digraph, once.
+
+    view = digraph.freeze().subgraph(ids).reverse()
+    view.filter(edge_pred=lambda edge: edge.weight < 10)
+"""
+from array import array
+from typing import Any, Callable, FrozenSet, Hashable, Iterable, Iterator, Optional, Set, Tuple, Union
+
+from graph_theory.exceptions import MatrixError, VertexError
+from graph_theory.objects.attributes import Mask
+from graph_theory.objects.digraph import DirectedEdge
+from graph_theory.objects.frozen_digraph import FrozenDigraph, _label
+from graph_theory.objects.graphlike import Graphlike, derived
+
+
+def _both(flags: Optional[bytes], other: bytes) -> bytes:
+    """
+    Returns the flags set in both of two sets of flags, where None stands for all of them.
+    """
+    if flags is None:
+        return other
+    return (Mask(flags) & Mask(other)).flags
+
+
+class DigraphView(Graphlike):
+    """
+    :properties: parent, vertices, edges, adjacency_matrix, labels, order, size, is_reversed
+    :methods: is_edge, has_an_edge_with, adjacent, in_degree, out_degree, vertex_id, successor_ids, subgraph,
+        edge_subgraph, reverse, filter, freeze, to_digraph
+    """
+    def __init__(self, parent: FrozenDigraph, vertex_mask: Optional[bytes] = None,
+                 edge_mask: Optional[bytes] = None, reverse: bool = False):
+        """
+        Constructor. Use the subgraph, edge_subgraph, reverse and filter methods of a graph rather than calling this
+        directly.
+
+        :param parent: the frozen digraph viewed
+        :param vertex_mask: (optional) one byte per vertex id of the parent, 1 for the vertices in the view; all of
+            them by default
+        :param edge_mask: (optional) one byte per edge id of the parent, 1 for the edges in the view; all of them by
+            default. Both directions of an edge of a frozen graph should have the same flag.
+        :param reverse: (optional) whether the edges of the view go the other way to those of the parent
+        :type parent: FrozenDigraph
+        :type vertex_mask: bytes
+        :type edge_mask: bytes
+        :type reverse: bool
+        """
+        for flags, rows in ((vertex_mask, len(parent.labels)), (edge_mask, len(parent.indices))):
+            if flags is not None and len(flags) != rows:
+                raise MatrixError(
+                    "ShapeError",
+                    "Expected a mask of {r} rows. Got {g}.".format(
+                        r=rows,
+                        g=len(flags)
+                    )
+                )
+        self._parent = parent
+        self._vertex_mask = vertex_mask
+        self._edge_mask = edge_mask
+        # The reverse of a graph is the graph itself.
+        self._reversed = reverse and not parent._symmetric
+        self._vertices = None
+        self._edges = None
+
+    @property
+    def parent(self) -> FrozenDigraph:
+        """
+        The frozen digraph whose storage the view shares.
+        """
+        return self._parent
+
+    @property
+    def is_reversed(self) -> bool:
+        """
+        Whether the edges of the view go the other way to those of its parent.
+        """
+        return self._reversed
+
+    @property
+    def vertices(self) \
+            -> FrozenSet[Hashable]:
+        """
+        Vertices getter
+        :return: vertices
+        :rtype: frozenset
+        """
+        if self._vertices is None:
+            labels = self._parent.labels
+            self._vertices = frozenset(labels[i] for i in self._vertex_ids())
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices: Iterable[Hashable]) \
+            -> None:
+        raise self._frozen()
+
+    @property
+    def edges(self) \
+            -> FrozenSet[DirectedEdge]:
+        """
+        Edges getter. The edges of a view of a graph are given once each, from their lower id end to their higher.
+        :return: edges
+        :rtype: frozenset(DirectedEdge)
+        """
+        if self._edges is None:
+            labels = self._parent.labels
+            weights = self._parent.weights
+            symmetric = self._parent._symmetric
+            edge_form = self.edge_form
+            self._edges = frozenset(
+                edge_form(labels[i], labels[j], *([weights[k]] if weights is not None else []))
+                for i in self._vertex_ids()
+                for j, k in self._arcs(i)
+                if not symmetric or i < j
+            )
+        return self._edges
+
+    @edges.setter
+    def edges(self, edges: Iterable[DirectedEdge]) \
+            -> None:
+        raise self._frozen()
+
+    @property
+    def adjacency_matrix(self) \
+            -> None:
+        """
+        Adjacency matrix getter. Views keep no adjacency matrix.
+        :return: None
+        """
+        return None
+
+    @adjacency_matrix.setter
+    def adjacency_matrix(self, matrix) \
+            -> None:
+        raise self._frozen()
+
+    @property
+    def labels(self):
+        """
+        The label of each vertex of the parent, by id.
+        """
+        return self._parent.labels
+
+    @property
+    def order(self) -> int:
+        """
+        The number of vertices.
+        """
+        if self._vertex_mask is None:
+            return len(self._parent.labels)
+        return self._vertex_mask.count(1)
+
+    @property
+    def size(self) -> int:
+        """
+        The number of edges.
+        """
+        arcs = sum(1 for i in self._vertex_ids() for _ in self._arcs(i))
+        return arcs // 2 if self._parent._symmetric else arcs
+
+    @staticmethod
+    def _frozen():
+        """
+        Returns the error raised by any attempt to modify a view.
+        """
+        return FrozenDigraph._frozen()
+
+    def _vertex_ids(self) -> Iterable[int]:
+        """
+        Returns the ids of the vertices in the view, in order.
+        """
+        if self._vertex_mask is None:
+            return range(len(self._parent.labels))
+        return Mask(self._vertex_mask).ids()
+
+    def _arcs(self, i: int, backwards: bool = False) -> Iterator[Tuple[int, int]]:
+        """
+        Yields (vertex id, edge id) for each edge of the view out of (or, backwards, into) the vertex with id i.
+        """
+        parent = self._parent
+        if self._reversed == backwards or parent._symmetric:
+            indptr, indices, edge_ids = parent.indptr, parent.indices, None
+        else:
+            indptr, indices, edge_ids = parent._predecessors()
+        vertex_mask = self._vertex_mask
+        edge_mask = self._edge_mask
+        for position in range(indptr[i], indptr[i + 1]):
+            j = indices[position]
+            k = position if edge_ids is None else edge_ids[position]
+            if (vertex_mask is None or vertex_mask[j]) and (edge_mask is None or edge_mask[k]):
+                yield j, k
+
+    def _edge_id(self, i: int, j: int) -> int:
+        """
+        Returns the id (in the parent) of the edge of the view between the vertices with ids i and j, or -1 if there
+        is none.
+        """
+        k = self._parent.edge_id(j, i) if self._reversed else self._parent.edge_id(i, j)
+        if k != -1 and self._edge_mask is not None and not self._edge_mask[k]:
+            return -1
+        return k
+
+    def vertex_id(self, vertex: Hashable) -> int:
+        """
+        Returns the id of vertex, which is its id in the parent.
+
+        :param vertex:
+        :type vertex: Vertex
+        :rtype: int
+        """
+        i = self._parent.vertex_id(vertex)
+        if self._vertex_mask is not None and not self._vertex_mask[i]:
+            raise VertexError(
+                "ValueNotFound",
+                "Vertex {v} not found in the vertices of this graph.".format(
+                    v=vertex
+                )
+            )
+        return i
+
+    def successor_ids(self, i: int) -> array:
+        """
+        Returns the ids of the successors of the vertex with id i.
+
+        :param i: vertex id
+        :type i: int
+        :rtype: array('q')
+        """
+        return array("q", [j for j, _ in self._arcs(i)])
+
+    def is_edge(self, edge: Iterable[Hashable], *args: Any, **kwargs: Any) -> bool:
+        """
+        Returns true if v1,v2 is an edge. v1 and v2 MUST be contained in self.vertices. If not, raises VertexError.
+
+        :param edge: The edge to check
+        """
+        v1, v2 = edge
+        return self._edge_id(self.vertex_id(v1), self.vertex_id(v2)) != -1
+
+    def has_an_edge_with(self, v1: Hashable, *vertices: Hashable) -> Union[bool, DirectedEdge]:
+        """
+        Returns False if there is no edge from v1 to any of the edges in
+        vertices, and returns the first edge encountered in any other case.
+
+        :param v1: The vertex to find edges to/from
+        :param vertices: Collection of vertices to check if v1 has an edge to.
+        """
+        i = self.vertex_id(v1)
+        weights = self._parent.weights
+        for vertex in vertices:
+            k = self._edge_id(i, self.vertex_id(vertex))
+            if k != -1:
+                if weights is not None:
+                    return self.edge_form(v1, vertex, weights[k])
+                return self.edge_form(v1, vertex)
+        return False
+
+    def adjacent(self, vertex: Hashable) -> Set[Hashable]:
+        """
+        Returns a set of vertices that are adjacent to v.
+
+        :param vertex:
+        :type vertex: Vertex
+        :return: adjacents
+        :rtype: set
+        """
+        labels = self._parent.labels
+        return {labels[j] for j, _ in self._arcs(self.vertex_id(vertex))}
+
+    def in_degree(self, vertex: Hashable) -> int:
+        """
+        Returns the indegree of the given vertex.
+        :param vertex:
+        :type vertex: Vertex
+        """
+        return sum(1 for _ in self._arcs(self.vertex_id(vertex), backwards=True))
+
+    def out_degree(self, vertex: Hashable) -> int:
+        """
+        Returns the outdegree of a given vertex.
+        :param vertex:
+        :type vertex: Vertex
+        """
+        return sum(1 for _ in self._arcs(self.vertex_id(vertex)))
+
+    def degree(self, vertex: Hashable) -> int:
+        """
+        Returns the degree of the given vertex of a view of a graph.
+        """
+        return self.out_degree(vertex)
+
+    def sum_of_degrees(self) -> int:
+        """
+        Returns the sum of degrees of the view: its number of edges, twice over for a view of a graph.
+        :rtype: int
+        """
+        return sum(1 for i in self._vertex_ids() for _ in self._arcs(i))
+
+    def other_vertices(self, *vertices: Hashable) -> Set[Hashable]:
+        """
+        Returns the collection of other vertices, distinct from the args vertices.
+        :arg vertices:
+        :type vertices: Vertex
+        """
+        return set(self.vertices).difference(_label(vertex) for vertex in vertices)
+
+    def edge_form(self, v1: Hashable, v2: Hashable, *args: Any, **kwargs: Any) -> DirectedEdge:
+        """
+        Returns the edge-form of v1,v2, irregardless if v1,v2 is an edge, as the parent gives it.
+        :param v1:
+        :param v2:
+        """
+        return self._parent.edge_form(v1, v2, *args, **kwargs)
+
+    def add_vertices(self, *vertices: Hashable) -> None:
+        raise self._frozen()
+
+    def add_edges(self, *edges: DirectedEdge) -> None:
+        raise self._frozen()
+
+    def remove_vertices(self, *vertices: Hashable) -> None:
+        raise self._frozen()
+
+    def remove_edges(self, *edges: DirectedEdge) -> None:
+        raise self._frozen()
+
+    def subgraph(self, vertex_ids: Iterable[int]) -> "DigraphView":
+        """
+        Returns the view of the subgraph induced by some of the vertices of this one: those vertices, and every edge
+        between them.
+
+        :param vertex_ids: the ids of the vertices to keep
+        :type vertex_ids: iterable(int)
+        :rtype: DigraphView
+        """
+        p = len(self._parent.labels)
+        flags = bytearray(p)
+        for i in vertex_ids:
+            if not 0 <= i < p:
+                raise VertexError(
+                    "ValueNotFound",
+                    "Vertex ids should lie in [0, {p}).".format(
+                        p=p
+                    )
+                )
+            flags[i] = 1
+        return DigraphView(self._parent, _both(self._vertex_mask, bytes(flags)), self._edge_mask, self._reversed)
+
+    def edge_subgraph(self, mask: Mask) -> "DigraphView":
+        """
+        Returns the view keeping only the edges of this one selected by a mask over the edge ids of the parent, such
+        as graph.edge_subgraph(graph.edge_attributes["weight"] > 0.5), and all of its vertices. An edge of a graph is
+        selected by its row from the lower id end, as in FrozenDigraph.edges_where.
+
+        :param mask: one flag per edge id
+        :type mask: Mask
+        :rtype: DigraphView
+        """
+        parent = self._parent
+        flags = mask.flags
+        if len(flags) != len(parent.indices):
+            raise MatrixError(
+                "ShapeError",
+                "Expected a mask of {r} rows. Got {g}.".format(
+                    r=len(parent.indices),
+                    g=len(flags)
+                )
+            )
+        if parent._symmetric:
+            # Give both directions of each edge the flag of its lower id end.
+            flags = bytearray(flags)
+            indptr = parent.indptr
+            indices = parent.indices
+            for i in range(len(parent.labels)):
+                for k in range(indptr[i], indptr[i + 1]):
+                    j = indices[k]
+                    if j < i:
+                        flags[k] = flags[parent.edge_id(j, i)]
+            flags = bytes(flags)
+        return DigraphView(parent, self._vertex_mask, _both(self._edge_mask, flags), self._reversed)
+
+    def reverse(self) -> "DigraphView":
+        """
+        Returns the view of this one with every edge turned around. The reverse of a view of a graph is the same view.
+
+        :rtype: DigraphView
+        """
+        return DigraphView(self._parent, self._vertex_mask, self._edge_mask, not self._reversed)
+
+    def filter(self, vertex_pred: Optional[Callable[[Hashable], bool]] = None,
+               edge_pred: Optional[Callable[[DirectedEdge], bool]] = None) -> "DigraphView":
+        """
+        Returns the view keeping only the vertices and edges of this one that pass the given tests. The vertices are
+        tested first, and only the edges between vertices that pass are tested. The predicates are called once per
+        vertex and edge, when the view is made.
+
+        :param vertex_pred: (optional) a test of a vertex label
+        :param edge_pred: (optional) a test of an edge, in the edge form of the view (with its weight if the graph is
+            weighted)
+        :rtype: DigraphView
+        """
+        parent = self._parent
+        labels = parent.labels
+        view = self
+        if vertex_pred is not None:
+            view = view.subgraph([i for i in self._vertex_ids() if vertex_pred(labels[i])])
+        if edge_pred is None:
+            return view
+        weights = parent.weights
+        flags = bytearray(len(parent.indices))
+        for i in view._vertex_ids():
+            for j, k in view._arcs(i):
+                if parent._symmetric and j < i:
+                    continue
+                edge = view.edge_form(labels[i], labels[j], *([weights[k]] if weights is not None else []))
+                if edge_pred(edge):
+                    flags[k] = 1
+                    if parent._symmetric:
+                        flags[parent.edge_id(j, i)] = 1
+        return DigraphView(parent, view._vertex_mask, _both(view._edge_mask, bytes(flags)), view._reversed)
+
+    @derived
+    def freeze(self) -> FrozenDigraph:
+        """
+        Returns the view copied into a frozen digraph (or graph) of its own, with its vertices numbered again from 0,
+        in the order of their ids in the parent. The copy is made once, and shared by every caller.
+
+        :rtype: FrozenDigraph
+        """
+        parent = self._parent
+        symmetric = parent._symmetric
+        weights = parent.weights
+        labels = parent.labels
+        ids = array("q", [-1]) * len(labels)
+        kept = []
+        for i in self._vertex_ids():
+            ids[i] = len(kept)
+            kept.append(labels[i])
+        sources = array("q")
+        targets = array("q")
+        new_weights = None if weights is None else array("d")
+        for i in self._vertex_ids():
+            for j, k in self._arcs(i):
+                if symmetric and j < i:
+                    continue
+                sources.append(ids[i])
+                targets.append(ids[j])
+                if new_weights is not None:
+                    new_weights.append(weights[k])
+        return type(parent).from_edge_arrays(sources, targets, new_weights, kept)
+
+    def to_digraph(self, backend: str = "set"):
+        """
+        Returns a mutable copy of the view: of the class that its parent's to_digraph() gives.
+
+        :param backend: (optional) the adjacency index backend of the copy
+        :type backend: str
+        :rtype: Digraph
+        """
+        return self._parent._mutable_class()(set(self.vertices), set(self.edges), backend=backend)
+
+    def copy(self) -> "DigraphView":
+        """
+        Returns the view itself: a view cannot change, so it is its own copy.
+        """
+        return self
+
+    __copy__ = copy
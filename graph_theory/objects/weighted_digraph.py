@@ -9,7 +9,6 @@ There is still no (v1, v1) edge for any vertex v1.
 Also, edges are in the form of a dictionary, with the key being the classic
 [v1, v2]. 
 """
-import math
 
 
 from graph_theory.exceptions import *
@@ -27,6 +26,12 @@ class WeightedDirectedEdge(BaseWeightedEdge, digraph.DirectedEdge):
        :attribute: vertex_pair
        :attribute: weight
     """
+    def __new__(cls, vertex_pair, weight, *args, **kwargs):
+        """
+        The tuple itself holds only the vertex pair; the weight is an attribute.
+        """
+        return super(WeightedDirectedEdge, cls).__new__(cls, vertex_pair)
+
     def __init__(self, vertex_pair, weight, *args, **kwargs):
         """
         :param vertex_pair:
@@ -36,7 +41,7 @@ class WeightedDirectedEdge(BaseWeightedEdge, digraph.DirectedEdge):
         :param args:
         :param kwargs:
         """
-        super(WeightedDirectedEdge).__init__(vertex_pair, weight, *args, **kwargs)
+        super(WeightedDirectedEdge, self).__init__(vertex_pair, weight, *args, **kwargs)
 
 
 class WeightedDigraph(digraph.Digraph):
@@ -48,17 +53,20 @@ class WeightedDigraph(digraph.Digraph):
         adj (Adjacency matrix), a dict whose keys are list-pairs of vertices and whose values are 0 or 1; employs the
             dictionary representation of a matrix
     """
-    def __init__(self, vertices=None, edges=None, adjacency_matrix=None):
+    def __init__(self, vertices=None, edges=None, adjacency_matrix=None, backend="set"):
         """
         Constructor
 
         :param vertices: Set of vertices
         :param edges: Set of tuple entries (vertex1, vertex2, weight)
         :param adjacency_matrix:
+        :param backend: (optional) the adjacency index to answer edge and neighbourhood queries with; "set" (the
+            default) for sparse digraphs, or "bitset" for dense digraphs
         :type vertices: set(Vertex)
         :type edges: set(Weighted
+        :type backend: str
         """
-        super(WeightedDigraph).__init__(vertices, edges, adjacency_matrix)
+        super(WeightedDigraph, self).__init__(vertices or set(), edges or set(), adjacency_matrix, backend)
         self._vertices = None
         self._edges = None
         self._adjacency_matrix = None
@@ -82,7 +90,9 @@ class WeightedDigraph(digraph.Digraph):
         :param vertices:
         :type vertices: set(Vertex)
         """
-        self._vertices = vertices
+        self._vertices = set(self._intern(vertices or ()))
+        self._adjacency = None
+        self.touch()
 
     @property
     def edges(self):
@@ -101,6 +111,8 @@ class WeightedDigraph(digraph.Digraph):
         :type edges: set(WeightedDirectedEdge)
         """
         self._edges = edges
+        self._adjacency = None
+        self.touch()
 
     @property
     def adjacency_matrix(self):
@@ -109,7 +121,7 @@ class WeightedDigraph(digraph.Digraph):
         :return: adjacency_matrix
         :rtype: dict({WeightedDirectedEdge: numbers.Real})
         """
-        return self.adjacency_matrix
+        return self._adjacency_matrix
 
     @adjacency_matrix.setter
     def adjacency_matrix(self, matrix):
@@ -119,6 +131,7 @@ class WeightedDigraph(digraph.Digraph):
         :type matrix: dict({WeightedDirectedEdge: numbers.Real})
         """
         self._adjacency_matrix = matrix
+        self.touch()
     
     def is_legal(self, vertices, edges, adjacency_matrix):
         """
@@ -146,19 +159,28 @@ class WeightedDigraph(digraph.Digraph):
         :type matrix: dict({WeightedDirectedEdge: numbers.Real})
         :return:
         """
-        if all(edge.isinstance(WeightedDirectedEdge) for edge in edges):
-            pass
-        else:
+        if any(not isinstance(edge, WeightedDirectedEdge) for edge in edges):
             raise EdgeError(
                 "TypeError",
-                "All edges in a weighted digraph must be both weighted and directional. Edges: {e}"
+                "All edges in a weighted digraph must be both weighted and directional. Edges: {e}".format(
+                    e=edges
+                )
             )
-        if any(matrix[key] != key.weight for key in matrix):
+        # The entries of absent edges are 0, under plain DirectedEdge keys (see Digraph.add_vertices)
+        if matrix is not None and any(matrix[key] != getattr(key, "weight", 0) for key in matrix):
             raise MatrixError(
                 "TypeError",
                 "All edge values must correspond to their weights."
             )
 
+    def _validate(self):
+        """
+        Checks that the digraph is legal, after a batch of mutations (see Digraph.batch): that its edges are weighted,
+        and agree with the adjacency matrix.
+        """
+        super(WeightedDigraph, self)._validate()
+        WeightedDigraph.is_legal_weighted_digraph(self._vertices, self._edges, self._adjacency_matrix)
+
     @classmethod
     def edge_form(cls, vertex1, vertex2, *args, **kwargs):
         """
@@ -191,34 +213,11 @@ class WeightedDigraph(digraph.Digraph):
         :arg weight: (Optional) Returns True if there is an edge from v1 to v2 AND that edge has weight given.
         """
         if args:
-            # Checking everything
-            weight = args[0]
-            if self.edge_form(v1, v2, weight) in self.edges:
-                return True
-            else:
-                return False
+            # Checking everything, against the edge the digraph holds
+            edge = self._edge_table().get((v1, v2))
+            return edge is not None and edge.weight == args[0]
         else:
-            # Iterate through each edge to see if they share the same vertex_pair.
-            # Fake weight it dont matter
-            weight = [1]
-            if any(edge.vertex_pair == self.edge_form(v1, v2, weight).vertex_pair for edge in self.edges):
-                return True
-            else:
-                return False
-    
-    def has_an_edge_with(self, v1, *vertices):
-        """
-        Returns False if there is no edge from v1 to any of the edges in vertices, and returns the first edge
-        encountered in any other case.
-        :param v1:
-        :type v1: Vertex
-        :argument vertices:
-        :type vertices: *Vertex
-        """
-        for vertex in vertices:
-            if self.is_edge(v1, vertex):
-                return self.edge_form(v1, vertex)
-        return False
+            return self.adjacency.is_edge(v1, v2)
     
     def add_vertex(self, vertex):
         """
@@ -235,120 +234,92 @@ class WeightedDigraph(digraph.Digraph):
         self.set_vertices(vertices)
         self.set_adj(adj)
         
-    def add_edges(self, **edges_weights):
+    def add_edges(self, *edges):
         """
-        Adds a singular edge to self.edges and self.adjacency_matrix
-        Do not call this before the endpoints of the edge are known by
-        the graph in self.vertices.
+        Adds multiple weighted edges to self.edges and self.adjacency_matrix. Do not call this before the endpoints of
+        the edges are known by the graph in self.vertices.
+        :param edges:
+        :type edges: *WeightedDirectedEdge
+        """
+        if self._buffer("add_edges", edges):
+            return
+        if not self._deferred:
+            WeightedDigraph.is_legal_weighted_digraph(self.vertices, edges, None)
+        super(WeightedDigraph, self).add_edges(*edges)
+        adj = self.adjacency_matrix
+        if adj is not None:
+            for edge in edges:
+                # Replace the key too, so that an absent edge's entry takes the edge and its weight.
+                adj.pop(edge, None)
+                adj[edge] = edge.weight
+
+    def remove_edges(self, *edges):
         """
-        ew = edges_weights
-        edges = self.get_edges()
-        adj = self.get_adj()
-        vs = ew.keys()
-        for v in vs:
-            adj[v] = edges[v]
-        self.is_legal_graph(self.get_vertices(), edges, adj)
-        self.set_edges(edges)
-        self.set_adj(adj)
-        
-    def in_degree(self, vertex):
-        """Returns the indegree of the given vertext."""
-        assert vertex in self.get_vertices(), "Vertex must be in the graph."
-        degree = 0
-        #This is faster for large matrices with many edges, relatively slow otherwise
-        #but otherwise, computers are fast so NBD
-        for other_vert in self.get_vertices():
-            if [other_vert, vertex] in self.get_edges():
-                degree = degree + 1
-        return degree
-    
-    def out_degree(self, vertex):
-        """Returns the outdegree of a given vertex"""
-        degree = 0
-        #This is faster for large matrices with many edges, relatively slow otherwise
-        #but otherwise, computers are fast so NBD
-        for other_vert in self.get_vertices():
-            if [vertex, other_vert] in self.get_edges():
-                degree = degree + 1
-        return degree
-    
-    def sum_of_degrees(self):
-        """Returns the sum of degrees of the graph. Recall that:
-            (SUM(in_degree(v)) FORALL v IN vertices) is equal to
-            (SUM(out_degree(v)) FORALL v IN vertices)
-            
-        Since they are equal, it does not matter which degree we are summing,
-        but for sake of documentation, it is the in_degree
-        """
-        sum = 0
-        for vertex in self.get_vertices():
-            sum = sum + self.in_degree(vertex)
-        return vertex
-    
-    def adjacent(self, vertex):
-        """Returns a set of vertices that are adjacent to v."""
-        adjacents = {}
-        for other in self.get_vertices():
-            if self.is_edge(vertex,other):
-                adjacents.append(other)
-        return adjacents
-    
-    def other_vertices(self, *vertices):
-        """Returns the collection of other vertices, distinct from vertex."""
-        possible = self.get_vertices()
-        for element in vertices:
-            possible.remove(element)
-        return possible
-        
-    def dijkstra_distance(self, vertex):
-        """Performs Dijkstra's Distance Algorithm. Returns the distance from
-        vertex to each of the other vertices.
-        
-        Output format: 
-            output = {
-                vertex: {
-                    'path':[v1,v2,...], 
-                    distance:dist(input, vertex)
-                }
-            }
-        """
-        assert vertex in self.vertices, "Given vertex is not a member of the digraph."
-        adj = self.get_adj()
-        #Track the distance here
-        labels = {
-            vert:math.inf 
-            for vert in self.get_vertices()
-        }
-        #Track a shortest path (NOTE: shortest path may not be unique)
-        path = {
-            vert:[]
-            for vert in self.get_vertices()
-        }
-        #Track the collection of vertices that hasn't been counted yet
-        collection = self.get_vertices().remove(vertex)
-        labels[vertex] = 0
-        while collection:
-            #While there are values to check for
-            for vert in collection:
-                #Select a lowest-labeled vertex
-                if (labels[vert] <= labels[other] for other in collection):
-                    vertex = vert
-                    break
-            #Stop counting vertex
-            collection.remove(vertex)
-            edges = [
-                edge
-                for edge in self.edges
-                if edge[0] == vertex
-            ]
+        Removes multiple weighted edges from self.edges and the adjacency index, and their entries from
+        self.adjacency_matrix. Each edge must be in the digraph; its weight is not looked at.
+        :param edges:
+        :type edges: *WeightedDirectedEdge
+        """
+        if self._buffer("remove_edges", edges):
+            return
+        super(WeightedDigraph, self).remove_edges(*edges)
+        adj = self.adjacency_matrix
+        if adj is not None:
             for edge in edges:
-                w = edge[1]
-                if (w in collection) and (labels[w] > labels[vertex] + adj[edge]):
-                    labels[w] = labels[vertex] + adj[edge]
-                    path[w].append(vertex)
-        return {
-            vertex: {
-                'path':path[vertex],
-                'distance':labels[vertex]
-            }
-        }
\ No newline at end of file
+                adj.pop(edge, None)
+
+    def update_weights(self, *edges):
+        """
+        Changes the weights of edges already in the digraph: each given edge replaces the edge between the same
+        vertices. The frozen form of the digraph is carried over with only its weights changed, and the results in its
+        shortest path cache are repaired rather than dropped (see graph_theory.graphlike_shortest_paths). Within a
+        batch() block, the change is buffered like the add and remove methods, and the frozen form is built again.
+        :param edges:
+        :type edges: *WeightedDirectedEdge
+        """
+        if self._buffer("update_weights", edges):
+            return
+        if not self._deferred:
+            WeightedDigraph.is_legal_weighted_digraph(self.vertices, edges, None)
+        adjacency = self.adjacency
+        for edge in edges:
+            if not adjacency.is_edge(*edge):
+                raise EdgeError(
+                    "ValueNotFound",
+                    "Edge {e} is not in the digraph.".format(
+                        e=edge
+                    )
+                )
+        if self._log is not None:
+            self._log.update_weights(edges)
+        entries = [entry for edge in edges for entry in self._reweighted_entries(edge)]
+        table = self._current_edge_table()
+        self._edges.difference_update(entries)
+        self._edges.update(edges)
+        adj = self.adjacency_matrix
+        if adj is not None:
+            for entry in entries:
+                # Replace the key too, so that it carries the new weight.
+                adj.pop(entry, None)
+                adj[entry] = entry.weight
+        frozen = None if self._deferred else (self._derived or {}).get(("freeze", ()))
+        self.touch()
+        self._update_edge_table(table, added=edges, removed=entries)
+        if frozen is not None:
+            changed = {}
+            for entry in entries:
+                changed[frozen.edge_id(frozen.vertex_id(entry[0]), frozen.vertex_id(entry[1]))] = entry.weight
+            reweighted = frozen.reweighted(changed)
+            # The reweighted form is the frozen form of the new version, as freeze() would build it.
+            self._derived = {("freeze", ()): reweighted}
+            if self._shortest_path_cache is not None:
+                self._shortest_path_cache.repair(frozen, reweighted, changed)
+
+    def _reweighted_entries(self, edge):
+        """
+        Returns the entries whose weights update_weights changes for an edge: the edge itself.
+        :param edge:
+        :type edge: WeightedDirectedEdge
+        :rtype: tuple(WeightedDirectedEdge)
+        """
+        return edge,
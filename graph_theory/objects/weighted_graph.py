@@ -3,9 +3,10 @@ Created on Apr 13, 2016
 
 @author: unoriginalbanter
 
-Defines WeightedGraph class objects. 
+Defines WeightedGraph class objects.
 Note: edges is a bit redundant. Equivalently, adj.keys()
 """
+from graph_theory.exceptions import EdgeError
 from graph_theory.objects import weighted_digraph, graph
 
 
@@ -13,181 +14,75 @@ class WeightedGraph(weighted_digraph.WeightedDigraph, graph.Graph):
     """
     Main properties:
         - vertices <set> The nodes of a graph
-        - edges <dict> The edges between vertices, a dict of unordered
-                        pairs, tracks weights as the value.
-        - adj (Adjacency matrix), a dict whose keys are list-pairs of vertices
-                and whose values are float-type weights, or None if no edge is
-                present;
+        - edges <set> The edges between vertices, weighted edges each held
+                        one way round, and answered for either way round.
+        - adj (Adjacency matrix), a dict whose keys are weighted edges, both
+                ways round, and whose values are their weights;
                 employs the dictionary representation of a matrix
     """
-    def __init__(self, vertices, edges, adjacency_matrix):
+    def __init__(self, vertices=None, edges=None, adjacency_matrix=None, backend="set"):
         """
         Constructor
 
-        :param vertices:
-        :param edges:
-        :param adjacency_matrix:
-
-        """
-        self._vertices = self.set_vertices(vertices)
-        self._edges = self.set_edges(edges)
-        self._adjacency_matrix = adjacency_matrix
-
-    @property
-    def vertices(self):
-        """
-        Vertices getter
-        :return: vertices
-        :rtype: set
-        """
-        return self._vertices
-
-    @vertices.setter
-    def vertices(self, vertices):
-        """
-        Vertices setter
-        :param vertices:
-        :type vertices: set
-        """
-        self._vertices = vertices
-
-    @property
-    def edges(self):
-        """
-        Edges getter
-        :return: edges
-        :rtype: set(tuple)
-        """
-        return self._edges
-
-    @edges.setter
-    def edges(self, edges):
-        """
-        Edges setter
-        :param edges:
-        :type edges: set(tuple)
-        """
-        self._edges = edges
-
-    @property
-    def adjacency_matrix(self):
-        """
-        Adjacency matrix getter
-        :return: adjacency_matrix
-        :rtype: list(list)
-        """
-        return self.adjacency_matrix
-
-    @adjacency_matrix.setter
-    def adjacency_matrix(self, matrix):
-        """
-        Adjacency matrix setter
-        :param matrix:
-        :type matrix: list(list)
-        """
-        self._adjacency_matrix = matrix
-
-    def degree(self, vertex):
-        """Returns the degree of the given vertex"""
-        assert vertex in self.get_vertices(), "Vertex is not in the graph."
-        degree = 0
-        for other in self.get_vertices():
-            if self.is_edge(vertex, other):
-                degree = degree + 1
-        return degree
-
-    def sum_of_degrees(self):
-        """Returns the sum of degrees of the graph."""
-        degree = 0
-        for vertex in self.get_vertices():
-            degree += self.degree(vertex)
-        return degree
-
-    def adjacent(self, vertex):
-        """Returns a set of vertices that are adjacent to v."""
-        adjacents = {}
-        for other in self.get_vertices():
-            if self.is_edge(vertex, other):
-                adjacents.append(other)
-        return adjacents
-
-    def other_vertices(self, *vertices):
-        """Returns the collection of other vertices, distinct from vertex."""
-        possible = self.get_vertices()
-        for element in vertices:
-            possible.remove(element)
-        return possible
-
-    def edge_form(self, v1, v2, value=1.0):
-        """Returns the edge-form of v1,v2, irregardless if v1,v2 is an edge.
-        
-        Since weighted graphs require a weight, edge_form takes a value; if no
-        value is present, value defaults to 1.
-        
-        This is used for data-typing since the different graphlike objects use
-        different data types for edges based on their mathematic properties.
-        """
-        return {{v1, v2}: value}
-    
-    def is_legal_graph(self, vertices, edges, adj):
-        assert(list(edge.keys())[0]!=list(edge.keys())[1] for edge in edges), \
-            "Edges cannot have both endpoints be the same vertex"
-        assert(adj[set([vert,vert])]==0 for vert in vertices), \
-            "Edges cannot have both endpoints be the same vertex"
-        assert(adj[entry] in [0,1] for entry in adj.keys()), \
-            "Vertices can only have at most 1 edge between them"
-            
-    def is_edge(self, v1, v2):
-        """Returns true if v1,v2 is an edge"""
-        assert v1 in self.vertices, "v1 is not an edge."
-        assert v2 in self.vertices, "v2 is not an edge."
-        if self.edge_form(v1, v2) in self.edges:
-            return True
-        return False
-    
-    def is_an_edge(self, v1, *vertices):
-        """Returns False if there is no edge from v1 to any of the edges in
-        vertices, and returns the first edge encountered in any other case."""
-        for vertex in vertices:
-            if self.is_edge(v1, vertex):
-                return self.edge_form(v1, vertex)
-        return False
-    
-    def add_vertex(self, vertex):
-        """
-        Adds a singular vertex to self.vertices and adds the vertex
-        row and column to the adjacency matrix
-        """
-        vertices = self.get_vertices()
-        vertices.append(vertex)
-        adj = self.get_adj()
-        for vert in vertices:
-            adj[[vert, vertex]]=None
-            adj[[vertex, vert]]=None
-        vertices.append(vertex)
-        self.set_vertices(vertices)
-        self.set_adj(adj)
-        
-    
-    def add_edge(self, edge, weight):
-        """
-        Parameter:
-         - edge is a <set(v1, v2)>
-         - weight is your real number weight
-        Adds a singular edge to self.edges and self.adj
-        Do not call this before the endpoints of the edge are known by
-        the graph in self.vertices.
-        """
-        edges = self.get_edges()
-        adj = self.get_adj()
-        #Add the edge to self.edges
-        edges[edge] = weight
-        v1 = edge.pop()
-        v2 = edge.pop()
-        adj[v1,v2] = weight
-        adj[v2,v1] = weight
-        self.set_edges(edges)
-        self.set_adj(adj)
-        
-
-    
+        :param vertices: Set of vertices
+        :param edges: Set of weighted edges, each given one way round
+        :param adjacency_matrix: (optional) the adjacency matrix
+        :param backend: (optional) the adjacency index to answer edge and
+            neighbourhood queries with; "set" (the default) or "bitset"
+        :type vertices: set(Vertex)
+        :type edges: set(WeightedDirectedEdge)
+        :type backend: str
+        """
+        super(WeightedGraph, self).__init__(vertices, edges, adjacency_matrix, backend)
+
+    # Setting the edges rebuilds the connectivity structure, as for a Graph.
+    edges = graph.Graph.edges
+
+    def _turned(self, edge):
+        """Returns an edge the other way round, with the same weight."""
+        v1, v2 = edge
+        return self.edge_form(v2, v1, edge.weight)
+
+    def _reweighted_entries(self, edge):
+        """Returns the entries whose weights update_weights changes for an
+        edge: the edge both ways round, since the graph may hold it either
+        way round, and keeps both of its arcs in the adjacency matrix and
+        the frozen form."""
+        return edge, self._turned(edge)
+
+    def is_edge(self, v1, v2, *args, **kwargs):
+        """Returns true if v1,v2 is an edge, either way round. Can also
+        return true only if the edge has the weight given as the optional
+        argument (see WeightedDigraph.is_edge)."""
+        if args:
+            try:
+                return self.edge(v1, v2).weight == args[0]
+            except EdgeError:
+                return False
+        return self.adjacency.is_edge(v1, v2)
+
+    def add_edges(self, *edges):
+        """Adds multiple weighted edges to self.edges, the adjacency index
+        and self.adj, in both directions (see WeightedDigraph.add_edges)."""
+        if self._buffer("add_edges", edges):
+            return
+        super(WeightedGraph, self).add_edges(*edges)
+        adj = self.adjacency_matrix
+        if adj is not None:
+            for edge in edges:
+                turned = self._turned(edge)
+                adj.pop(turned, None)
+                adj[turned] = edge.weight
+
+    def remove_edges(self, *edges):
+        """Removes multiple weighted edges, given either way round, from
+        self.edges, the adjacency index and self.adj, in both directions.
+        Their weights are not looked at."""
+        if self._buffer("remove_edges", edges):
+            return
+        super(WeightedGraph, self).remove_edges(*edges)
+        adj = self.adjacency_matrix
+        if adj is not None:
+            for v1, v2 in edges:
+                adj.pop((v1, v2), None)
+                adj.pop((v2, v1), None)
@@ -0,0 +1,8 @@
+__all__ = [
+    "arrow",
+    "binary",
+    "edgelist",
+    "exporters",
+    "mutation_log",
+    "shared",
+    ]
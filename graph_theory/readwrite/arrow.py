@@ -0,0 +1,206 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+Import and export of edge tables in Apache Arrow form, and so in Parquet files. An edge table has a column of source
+vertices, a column of target vertices, and optionally a column of weights; any further columns of an exported graph
+are its edge attributes.
+
+from_arrow() dictionary-encodes the source and target columns together, so that the labels of the graph are the
+distinct values of either column, in order of first appearance, and the ids of the endpoints come straight out of the
+encoding as one packed array; the only Python object built per vertex is its label, and none is built per edge.
+to_arrow() does the reverse, writing the endpoints as dictionary columns over the labels of the frozen graph.
+
+    table = pyarrow.parquet.read_table("edges.parquet", columns=["src", "dst", "weight"])
+    graph = from_arrow(table, weight="weight")
+
+pyarrow is an optional dependency: it is imported only when one of these functions is called.
+"""
+from array import array
+from typing import Any, Optional
+
+from graph_theory.exceptions import EdgeError, GraphTheoryException
+from graph_theory.objects.attributes import CategoryColumn
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.frozen_graph import FrozenGraph
+
+
+def _pyarrow():
+    """
+    Returns the pyarrow module, or raises a GraphTheoryException if it is not installed.
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise GraphTheoryException(
+            "MissingDependency",
+            "Arrow and Parquet support requires pyarrow. Install it with 'pip install pyarrow'."
+        )
+    return pyarrow
+
+
+def _packed(column, typecode: str) -> array:
+    """
+    Copies an Arrow array of fixed width numbers, without nulls, into an array of typecode, in one block.
+    """
+    values = array(typecode)
+    if len(column):
+        data = memoryview(column.buffers()[1])
+        start = column.offset * values.itemsize
+        values.frombytes(data[start:start + len(column) * values.itemsize])
+    return values
+
+
+def _column(table, name: str):
+    """
+    Returns a column of a table as a single Arrow array, checking that it has no nulls.
+    """
+    pyarrow = _pyarrow()
+    try:
+        column = table.column(name)
+    except KeyError:
+        raise GraphTheoryException(
+            "AttributeNotFound",
+            "The table has no column named {n!r}.".format(n=name)
+        )
+    if column.null_count:
+        raise EdgeError(
+            "ValueError",
+            "Column {n!r} has {c} nulls.".format(
+                n=name,
+                c=column.null_count
+            )
+        )
+    if pyarrow.types.is_dictionary(column.type):
+        column = column.cast(column.type.value_type)
+    if isinstance(column, pyarrow.ChunkedArray):
+        column = column.combine_chunks()
+    return column
+
+
+def _arrow_array(values: array, data_type):
+    """
+    Returns an Arrow array over the buffer of a packed array, without copying it.
+    """
+    pyarrow = _pyarrow()
+    return pyarrow.Array.from_buffers(data_type, len(values), [None, pyarrow.py_buffer(values)])
+
+
+def _arrow_type(typecode: str, itemsize: int):
+    """
+    Returns the Arrow type of the items of an array of typecode.
+    """
+    pyarrow = _pyarrow()
+    if typecode in "fd":
+        return pyarrow.float32() if itemsize == 4 else pyarrow.float64()
+    bits = 8 * itemsize
+    return getattr(pyarrow, ("int{b}" if typecode.islower() else "uint{b}").format(b=bits))()
+
+
+def from_arrow(table, src: str = "src", dst: str = "dst", weight: Optional[str] = None,
+               directed: bool = True) -> FrozenDigraph:
+    """
+    Builds a frozen graph from an Arrow table of edges.
+
+    :param table: the edge table
+    :type table: pyarrow.Table
+    :param src: (optional) the name of the column of source vertices
+    :param dst: (optional) the name of the column of target vertices
+    :param weight: (optional) the name of the column of edge weights, for a weighted graph
+    :param directed: (optional) False for a FrozenGraph, True (default) for a FrozenDigraph
+    :returns: the graph, labelled by the values of the src and dst columns
+    :rtype: FrozenDigraph
+    """
+    pyarrow = _pyarrow()
+    sources = _column(table, src)
+    targets = _column(table, dst)
+    if targets.type != sources.type:
+        targets = targets.cast(sources.type)
+    encoded = pyarrow.concat_arrays([sources, targets]).dictionary_encode()
+    ids = _packed(encoded.indices.cast(pyarrow.int64()), "q")
+    q = len(sources)
+    weights = None
+    if weight is not None:
+        weights = _packed(_column(table, weight).cast(pyarrow.float64()), "d")
+    cls = FrozenDigraph if directed else FrozenGraph
+    return cls.from_edge_arrays(ids[:q], ids[q:], weights, encoded.dictionary.to_pylist())
+
+
+def to_arrow(graph, src: str = "src", dst: str = "dst", weight: str = "weight"):
+    """
+    Returns the edge table of a graph: its endpoints as dictionary columns over its labels, its weights if it is
+    weighted, and a column for each of its edge attributes. The edges of a graph are given once each, from the lower
+    id end. Mutable graphs are frozen first.
+
+    :param graph: The graph to export
+    :type graph: Digraph or FrozenDigraph
+    :param src: (optional) the name of the column of source vertices
+    :param dst: (optional) the name of the column of target vertices
+    :param weight: (optional) the name of the column of edge weights
+    :rtype: pyarrow.Table
+    """
+    pyarrow = _pyarrow()
+    from pyarrow import compute
+    if not isinstance(graph, FrozenDigraph):
+        graph = graph.freeze()
+    indptr = graph.indptr
+    sources = array("q")
+    for i in range(graph.order):
+        sources.extend(array("q", [i]) * (indptr[i + 1] - indptr[i]))
+    sources = _arrow_array(sources, pyarrow.int64())
+    targets = _arrow_array(array("q", graph.indices), pyarrow.int64())
+    # The edges of a graph are kept from their lower id end (a loop, stored once, is kept too); those of a digraph are
+    # all kept, in place.
+    kept = None
+    if isinstance(graph, FrozenGraph):
+        kept = compute.less_equal(sources, targets)
+    labels = pyarrow.array(list(graph.labels))
+    columns = {}
+    for name, ids in ((src, sources), (dst, targets)):
+        columns[name] = pyarrow.DictionaryArray.from_arrays(ids if kept is None else ids.filter(kept), labels)
+    attributes = graph.edge_attributes
+    for name in attributes:
+        column = attributes[name]
+        if isinstance(column, CategoryColumn):
+            codes = _arrow_array(array("q", column.codes), pyarrow.int64())
+            values = pyarrow.DictionaryArray.from_arrays(codes, pyarrow.array(column.categories))
+        else:
+            packed = column.values
+            values = _arrow_array(packed, _arrow_type(column.typecode, memoryview(packed).itemsize))
+        columns[weight if name == "weight" else name] = values if kept is None else values.filter(kept)
+    return pyarrow.table(columns)
+
+
+def read_parquet(path: str, src: str = "src", dst: str = "dst", weight: Optional[str] = None,
+                 directed: bool = True, **kwargs: Any) -> FrozenDigraph:
+    """
+    Reads a frozen graph from the edge table in a Parquet file, reading only the columns it needs. Further keyword
+    arguments are passed to pyarrow.parquet.read_table.
+
+    :param path: file path
+    :param src: (optional) the name of the column of source vertices
+    :param dst: (optional) the name of the column of target vertices
+    :param weight: (optional) the name of the column of edge weights, for a weighted graph
+    :param directed: (optional) False for a FrozenGraph, True (default) for a FrozenDigraph
+    :rtype: FrozenDigraph
+    """
+    _pyarrow()
+    from pyarrow import parquet
+    columns = [src, dst] if weight is None else [src, dst, weight]
+    return from_arrow(parquet.read_table(path, columns=columns, **kwargs), src, dst, weight, directed)
+
+
+def write_parquet(graph, path: str, src: str = "src", dst: str = "dst", weight: str = "weight",
+                  **kwargs: Any) -> None:
+    """
+    Writes the edge table of a graph (see to_arrow) to a Parquet file. Further keyword arguments are passed to
+    pyarrow.parquet.write_table.
+
+    :param graph: The graph to write
+    :type graph: Digraph or FrozenDigraph
+    :param path: file path
+    """
+    _pyarrow()
+    from pyarrow import parquet
+    parquet.write_table(to_arrow(graph, src, dst, weight), path, **kwargs)
@@ -0,0 +1,351 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+A binary file format for frozen graphs and digraphs, laid out so that it can be memory-mapped and used in place.
+
+A file is a fixed header followed by sections, each starting on an 8-byte boundary:
+    indptr      p + 1 int64 row offsets
+    indices     q int64 successor ids
+    weights     q float64 edge weights (weighted graphs only)
+    labels      the vertex label table, in one of the forms:
+                    "range"  no table; the label of each vertex is its id
+                    "int"    p int64 labels
+                    "str"    p + 1 int64 offsets into a UTF-8 blob
+                    "bytes"  p + 1 int64 offsets into a blob
+                    "pickle" a pickled list of labels, for any other labels
+    attributes  (only if the graph has attribute columns) a marker, the length of the column directory, the pickled
+                directory, and then each column: the values of a numeric column in its own type, or the int64 codes of
+                a category column, whose categories are kept in the directory
+
+Readers of graphs without attributes stop at the end of the labels, so the attribute section may follow any file. The
+weights of a weighted graph are its "weight" edge attribute, and are not stored twice.
+
+load() maps the file and reads only the header: the arrays of the frozen graph it returns are views of the mapping,
+and labels are decoded, and attribute columns built, as they are asked for, so pages are read in only when used, and
+every process that loads the same file shares one copy of it in the page cache. All numbers are stored in the byte
+order of the machine that saved the file. The same image can also be written into, and used in place from, any buffer
+(write_into and from_buffer). Empty and truncated files are refused with a FormatError before anything is read.
+"""
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from typing import Hashable, Iterator, List, Sequence, Tuple
+
+from graph_theory.exceptions import GraphTheoryException
+from graph_theory.objects.attributes import AttributeStore, CategoryColumn, Column
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.frozen_graph import FrozenGraph
+
+
+MAGIC = b"GTCSR\x00\x00\x01"
+VERSION = 1
+
+# magic, version, byte order, flags, label kind, order p, size q, then the offset of each section and the labels end.
+_HEADER = struct.Struct("=8sIHHIxxxxQQQQQQQ")
+
+_WEIGHTED = 1
+_UNDIRECTED = 2
+
+_LABEL_KINDS = ["range", "int", "str", "bytes", "pickle"]
+
+_BYTE_ORDERS = {"little": 1, "big": 2}
+
+_ATTRIBUTES_MAGIC = b"GTATTRS\x00"
+
+# marker, length of the directory
+_ATTRIBUTES_HEADER = struct.Struct("=8sQ")
+
+
+def _align(position: int) -> int:
+    """
+    Returns position rounded up to a multiple of 8.
+    """
+    return (position + 7) & ~7
+
+
+def _label_table(labels: Sequence[Hashable]):
+    """
+    Returns the kind of the label table for labels, and its sections as a list of buffers.
+    """
+    if all(type(label) is int for label in labels):
+        if all(label == i for i, label in enumerate(labels)):
+            return "range", []
+        try:
+            return "int", [array("q", labels)]
+        except OverflowError:
+            pass
+    for kind, kind_type in (("str", str), ("bytes", bytes)):
+        if labels and all(type(label) is kind_type for label in labels):
+            blobs = [label.encode("utf-8") for label in labels] if kind == "str" else list(labels)
+            offsets = array("q", [0])
+            total = 0
+            for blob in blobs:
+                total += len(blob)
+                offsets.append(total)
+            return kind, [offsets, b"".join(blobs)]
+    return "pickle", [pickle.dumps(list(labels), protocol=pickle.HIGHEST_PROTOCOL)]
+
+
+class _Labels(Sequence[Hashable]):
+    """
+    The vertex labels of a mapped file, decoded one at a time as they are asked for.
+    """
+    def __init__(self, kind: str, view: memoryview, order: int):
+        """
+        :param kind: the label table kind
+        :param view: the label table section
+        :param order: the number of vertices
+        """
+        self._kind = kind
+        self._order = order
+        if kind == "range":
+            self._values = range(order)
+        elif kind == "int":
+            self._values = view.cast("q")
+        elif kind == "pickle":
+            self._values = pickle.loads(view)
+        else:
+            self._values = None
+            offsets_length = 8 * (order + 1)
+            self._offsets = view[:offsets_length].cast("q")
+            self._blob = view[offsets_length:]
+
+    def __len__(self) -> int:
+        return self._order
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._order))]
+        if self._values is not None:
+            return self._values[i]
+        if i < 0:
+            i += self._order
+        raw = self._blob[self._offsets[i]:self._offsets[i + 1]]
+        return str(raw, "utf-8") if self._kind == "str" else bytes(raw)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for i in range(self._order):
+            yield self[i]
+
+
+def _layout(graph) -> Tuple[bytes, List[Tuple[int, memoryview]], int]:
+    """
+    Lays out the image of a frozen graph: returns its header, the byte offset and bytes of each section, and the size
+    of the whole image.
+    """
+    flags = 0
+    if graph.weights is not None:
+        flags |= _WEIGHTED
+    if isinstance(graph, FrozenGraph):
+        flags |= _UNDIRECTED
+    kind, label_sections = _label_table(graph.labels)
+    sections = [("indptr", array("q", graph.indptr)), ("indices", array("q", graph.indices))]
+    if graph.weights is not None:
+        sections.append(("weights", array("d", graph.weights)))
+    sections.extend(("labels", section) for section in label_sections)
+    offsets = {}
+    placed = []
+    position = _HEADER.size
+    for name, section in sections:
+        position = _align(position)
+        offsets.setdefault(name, position)
+        section = memoryview(section).cast("B")
+        placed.append((position, section))
+        position += section.nbytes
+    header = _HEADER.pack(
+        MAGIC, VERSION, _BYTE_ORDERS[sys.byteorder], flags, _LABEL_KINDS.index(kind),
+        graph.order, len(graph.indices),
+        offsets["indptr"], offsets["indices"], offsets.get("weights", 0), offsets.get("labels", position), position
+    )
+    position = _layout_attributes(graph, placed, position)
+    return header, placed, position
+
+
+def _layout_attributes(graph, placed: List[Tuple[int, memoryview]], position: int) -> int:
+    """
+    Places the attribute section of a frozen graph, if it has attribute columns, after position, and returns the end
+    of the image.
+    """
+    directory = {"vertex": [], "edge": []}
+    columns = []
+    offset = 0
+    for row_kind, store in (("vertex", graph.vertex_attributes), ("edge", graph.edge_attributes)):
+        for name in store:
+            if row_kind == "edge" and name == "weight" and graph.weights is not None:
+                continue
+            column = store[name]
+            if isinstance(column, CategoryColumn):
+                data = memoryview(array("q", column.codes)).cast("B")
+                directory[row_kind].append((name, "category", "q", offset, data.nbytes, column.categories))
+            else:
+                data = memoryview(column.values).cast("B")
+                directory[row_kind].append((name, "numeric", column.typecode, offset, data.nbytes, None))
+            columns.append((offset, data))
+            offset = _align(offset + data.nbytes)
+    if not columns:
+        return position
+    directory = pickle.dumps(directory, protocol=pickle.HIGHEST_PROTOCOL)
+    position = _align(position)
+    placed.append((position, memoryview(_ATTRIBUTES_HEADER.pack(_ATTRIBUTES_MAGIC, len(directory)) + directory)))
+    data_start = _align(position + _ATTRIBUTES_HEADER.size + len(directory))
+    for offset, data in columns:
+        placed.append((data_start + offset, data))
+    return data_start + columns[-1][0] + columns[-1][1].nbytes
+
+
+def _attribute_stores(view: memoryview, position: int, order: int, size: int, source: str) \
+        -> Tuple[AttributeStore, AttributeStore]:
+    """
+    Returns the vertex and edge attribute stores of the image in view whose labels end at position, with a loader for
+    each column, or (None, None) if the image has no attribute section. Raises GraphTheoryException if the section is
+    cut short.
+    """
+    position = _align(position)
+    end = position + _ATTRIBUTES_HEADER.size
+    if len(view) < end:
+        return None, None
+    marker, length = _ATTRIBUTES_HEADER.unpack(view[position:end])
+    if marker != _ATTRIBUTES_MAGIC:
+        return None, None
+    truncated = GraphTheoryException("FormatError", "{p} is truncated in its attribute section.".format(p=source))
+    if len(view) < end + length:
+        raise truncated
+    directory = pickle.loads(view[end:end + length])
+    data_start = _align(end + length)
+    entries = directory["vertex"] + directory["edge"]
+    if entries and data_start + max(entry[3] + entry[4] for entry in entries) > len(view):
+        raise truncated
+
+    def loader(entry):
+        name, kind, typecode, offset, nbytes, categories = entry
+        data = view[data_start + offset:data_start + offset + nbytes].cast(typecode)
+        if kind == "category":
+            return lambda: CategoryColumn(codes=data, categories=categories)
+        return lambda: Column(typecode, data)
+
+    stores = []
+    for row_kind, rows in (("vertex", order), ("edge", size)):
+        stores.append(AttributeStore(rows, {entry[0]: loader(entry) for entry in directory[row_kind]}))
+    return stores[0], stores[1]
+
+
+def image_size(graph) -> int:
+    """
+    Returns the number of bytes that write_into needs to hold a graph.
+
+    :param graph: The frozen graph
+    :type graph: FrozenDigraph
+    :rtype: int
+    """
+    return _layout(graph)[2]
+
+
+def write_into(graph, buffer) -> int:
+    """
+    Writes the image of a frozen graph, as save would write it to a file, into a writable buffer of at least
+    image_size(graph) bytes, and returns the size of the image.
+
+    :param graph: The frozen graph
+    :type graph: FrozenDigraph
+    :param buffer: writable buffer
+    :rtype: int
+    """
+    header, sections, size = _layout(graph)
+    view = memoryview(buffer).cast("B")
+    view[:len(header)] = header
+    for offset, section in sections:
+        view[offset:offset + section.nbytes] = section
+    return size
+
+
+def save(graph, path: str) -> None:
+    """
+    Writes a graph or digraph to path. Mutable graphs are frozen first. The file is written beside path and then
+    moved over it, so processes that have the old file mapped keep a consistent view of it.
+
+    :param graph: The graph to write
+    :type graph: Digraph or FrozenDigraph
+    :param path: file path
+    :type path: str
+    """
+    if not isinstance(graph, FrozenDigraph):
+        graph = graph.freeze()
+    header, sections, _ = _layout(graph)
+    partial_path = "{p}.partial".format(p=path)
+    with open(partial_path, "wb") as graph_file:
+        graph_file.write(header)
+        for offset, section in sections:
+            graph_file.write(b"\x00" * (offset - graph_file.tell()))
+            graph_file.write(section)
+    os.replace(partial_path, path)
+
+
+def from_buffer(buffer, source: str = "buffer") -> FrozenDigraph:
+    """
+    Returns the frozen graph (or digraph) whose image a buffer holds, as written by save or write_into. The arrays of
+    the graph are views of the buffer, and labels are decoded as they are asked for.
+
+    :param buffer: the image
+    :param source: (optional) what the buffer is, for error messages
+    :type source: str
+    :returns: the graph, as a FrozenGraph if it was saved from a graph, and a FrozenDigraph otherwise
+    :rtype: FrozenDigraph
+    """
+    view = memoryview(buffer).cast("B")
+    if len(view) < _HEADER.size:
+        raise GraphTheoryException("FormatError", "{p} is too short to be a graph file.".format(p=source))
+    (magic, version, byte_order, flags, kind, order, size,
+     indptr_offset, indices_offset, weights_offset, labels_offset, labels_end) = _HEADER.unpack(
+        view[:_HEADER.size]
+    )
+    if magic != MAGIC or version != VERSION:
+        raise GraphTheoryException(
+            "FormatError",
+            "{p} is not a version {v} graph file.".format(p=source, v=VERSION)
+        )
+    if byte_order != _BYTE_ORDERS[sys.byteorder]:
+        raise GraphTheoryException(
+            "FormatError",
+            "{p} was saved on a machine of the other byte order.".format(p=source)
+        )
+    ends = [indptr_offset + 8 * (order + 1), indices_offset + 8 * size, labels_end]
+    if flags & _WEIGHTED:
+        ends.append(weights_offset + 8 * size)
+    if max(ends) > len(view):
+        raise GraphTheoryException(
+            "FormatError",
+            "{p} is truncated: its sections end at byte {e}, but it has {n} bytes.".format(
+                p=source,
+                e=max(ends),
+                n=len(view)
+            )
+        )
+    indptr = view[indptr_offset:indptr_offset + 8 * (order + 1)].cast("q")
+    indices = view[indices_offset:indices_offset + 8 * size].cast("q")
+    weights = view[weights_offset:weights_offset + 8 * size].cast("d") if flags & _WEIGHTED else None
+    labels = _Labels(_LABEL_KINDS[kind], view[labels_offset:labels_end], order)
+    vertex_attributes, edge_attributes = _attribute_stores(view, labels_end, order, size, source)
+    cls = FrozenGraph if flags & _UNDIRECTED else FrozenDigraph
+    return cls(labels, indptr, indices, weights, vertex_attributes, edge_attributes)
+
+
+def load(path: str) -> FrozenDigraph:
+    """
+    Maps a file written by save, and returns the frozen graph (or digraph) it holds, without reading its arrays.
+
+    :param path: file path
+    :type path: str
+    :returns: the graph, as a FrozenGraph if it was saved from a graph, and a FrozenDigraph otherwise
+    :rtype: FrozenDigraph
+    """
+    with open(path, "rb") as graph_file:
+        # An empty file cannot be mapped, and a short one has no header to read.
+        if os.fstat(graph_file.fileno()).st_size < _HEADER.size:
+            raise GraphTheoryException("FormatError", "{p} is too short to be a graph file.".format(p=path))
+        mapping = mmap.mmap(graph_file.fileno(), 0, access=mmap.ACCESS_READ)
+    return from_buffer(mapping, path)
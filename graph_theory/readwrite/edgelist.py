@@ -0,0 +1,444 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+Reading edge lists: text files with one edge per line, "source target" or "source target weight", separated by
+whitespace or, for CSV files, commas. Files may be plain, gzip or bz2 compressed; compression is detected from the
+first bytes of the file. Blank lines and lines starting with the comment marker are skipped.
+
+Files are read in chunks of chunk_size lines, so no more than one chunk of text is held at a time. iter_edgelist
+yields each chunk as parsed (sources, targets, weights) batches, without building a graph; read_edgelist interns the
+vertex labels into ids as it goes, keeps only packed id and weight arrays, and builds a frozen graph from them in
+bulk at the end.
+
+read_edgelist_parallel splits an uncompressed file at newline-aligned byte offsets into one shard per worker
+process. Each worker parses its shard with its own label table, and the shards are then merged: each shard's labels
+are interned into one id space in shard order, its ids are mapped through the result, and a single frozen graph is
+built from the joined arrays.
+
+write_edgelist writes a graph as an edge list, straight from the arrays of its frozen form, a chunk of lines at a
+time. write_lines, which it is built on, is shared with the other text writers.
+"""
+import bz2
+import gzip
+import io
+import multiprocessing
+import os
+from array import array
+from itertools import islice
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from graph_theory.exceptions import EdgeError, VertexError
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.frozen_graph import FrozenGraph
+
+
+Batch = Tuple[List[Hashable], List[Hashable], Optional[array]]
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def open_text(path_or_file: Union[str, Any], encoding: str = "utf-8") -> io.TextIOBase:
+    """
+    Opens a path, or wraps a binary file object, as text, decompressing gzip and bz2 data. Text file objects are
+    returned as they are.
+
+    :param path_or_file: file path, or file object
+    :param encoding: (optional) text encoding
+    :rtype: io.TextIOBase
+    """
+    if isinstance(path_or_file, io.TextIOBase):
+        return path_or_file
+    if hasattr(path_or_file, "read"):
+        raw = path_or_file if hasattr(path_or_file, "peek") else io.BufferedReader(path_or_file)
+    else:
+        raw = open(path_or_file, "rb")
+    magic = raw.peek(3)[:3]
+    if magic[:2] == b"\x1f\x8b":
+        raw = gzip.GzipFile(fileobj=raw)
+    elif magic == b"BZh":
+        raw = bz2.BZ2File(raw)
+    return io.TextIOWrapper(raw, encoding=encoding)
+
+
+def _is_csv(path_or_file: Union[str, Any]) -> bool:
+    """
+    Returns whether path_or_file names a CSV file, compressed or not.
+    """
+    name = path_or_file if isinstance(path_or_file, str) else getattr(path_or_file, "name", None)
+    if not isinstance(name, str):
+        return False
+    for suffix in (".gz", ".bz2"):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    return name.lower().endswith(".csv")
+
+
+def _chunks(lines: Iterator[str], chunk_size: int) -> Iterator[List[str]]:
+    """
+    Yields lists of at most chunk_size lines.
+    """
+    lines = iter(lines)
+    chunk = list(islice(lines, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(lines, chunk_size))
+
+
+def _parse_error(n: int, problem: str, line: str) -> EdgeError:
+    """
+    Returns the error for line n of an edge list, which cannot be parsed. The line number, the problem and the line
+    are kept as error.parse, so that the error can be made again with the line numbered in a whole file (see
+    read_edgelist_parallel).
+    """
+    error = EdgeError("ParseError", "Line {n} {p}: {line!r}".format(n=n, p=problem, line=line))
+    error.parse = (n, problem, line)
+    return error
+
+
+def _parse_lines(lines: List[str], weighted: bool, delimiter: Optional[str], comments: str,
+                 nodetype: Optional[Callable[[str], Hashable]], first_line: int = 1) -> Batch:
+    """
+    Parses lines of an edge list into a batch of sources, targets and weights. first_line is the line number of the
+    first of lines in the file, for error messages.
+    """
+    sources = []
+    targets = []
+    weights = array("d") if weighted else None
+    for n, line in enumerate(lines, first_line):
+        fields = line.split(delimiter)
+        if not fields or not fields[0].strip() or fields[0].lstrip().startswith(comments):
+            continue
+        if len(fields) < (3 if weighted else 2):
+            raise _parse_error(n, "has too few fields", line)
+        sources.append(fields[0].strip())
+        targets.append(fields[1].strip())
+        if weighted:
+            try:
+                weights.append(float(fields[2]))
+            except ValueError:
+                raise _parse_error(n, "has a weight that is not a number", line)
+    if nodetype is not None:
+        sources = [nodetype(label) for label in sources]
+        targets = [nodetype(label) for label in targets]
+    return sources, targets, weights
+
+
+def create_text(path_or_file: Union[str, Any], encoding: str = "utf-8") -> io.TextIOBase:
+    """
+    Opens a path for writing text, compressing with gzip or bz2 if the path ends in ".gz" or ".bz2", or wraps a binary
+    file object. Text file objects are returned as they are.
+
+    :param path_or_file: file path, or file object
+    :param encoding: (optional) text encoding
+    :rtype: io.TextIOBase
+    """
+    if isinstance(path_or_file, io.TextIOBase):
+        return path_or_file
+    if hasattr(path_or_file, "write"):
+        raw = path_or_file
+    elif str(path_or_file).endswith(".gz"):
+        raw = gzip.open(path_or_file, "wb", compresslevel=6)
+    elif str(path_or_file).endswith(".bz2"):
+        raw = bz2.open(path_or_file, "wb")
+    else:
+        raw = open(path_or_file, "wb")
+    return io.TextIOWrapper(raw, encoding=encoding)
+
+
+def write_lines(path_or_file: Union[str, Any], lines: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                encoding: str = "utf-8") -> None:
+    """
+    Writes lines (each ending in a newline) to a path or file object, joining chunk_size lines at a time into one
+    write. A path is closed when done; a file object is left open.
+
+    :param path_or_file: file path, or file object
+    :param lines: the lines to write
+    :param chunk_size: (optional) number of lines written at a time
+    :param encoding: (optional) text encoding
+    """
+    text = create_text(path_or_file, encoding)
+    try:
+        for chunk in _chunks(lines, chunk_size):
+            text.write("".join(chunk))
+    finally:
+        if text is path_or_file:
+            text.flush()
+        elif hasattr(path_or_file, "write"):
+            text.detach()
+        else:
+            text.close()
+
+
+def iter_edgelist(path_or_file: Union[str, Any], weighted: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  delimiter: Optional[str] = None, comments: str = "#",
+                  nodetype: Optional[Callable[[str], Hashable]] = None, encoding: str = "utf-8") -> Iterator[Batch]:
+    """
+    Yields the edges of an edge list in batches of at most chunk_size edges.
+
+    :param path_or_file: file path, or file object
+    :param weighted: (optional) whether each line carries a weight in its third field
+    :param chunk_size: (optional) number of lines read at a time
+    :param delimiter: (optional) field separator; by default, "," for .csv files and any whitespace otherwise
+    :param comments: (optional) marker of lines to skip
+    :param nodetype: (optional) conversion applied to each vertex label, such as int; by default labels are str
+    :param encoding: (optional) text encoding
+    :returns: batches of sources, targets, and (if weighted) weights
+    :rtype: iterator(tuple(list, list, array('d')))
+    """
+    if delimiter is None and _is_csv(path_or_file):
+        delimiter = ","
+    text = open_text(path_or_file, encoding)
+    try:
+        first_line = 1
+        for lines in _chunks(text, chunk_size):
+            yield _parse_lines(lines, weighted, delimiter, comments, nodetype, first_line)
+            first_line += len(lines)
+    finally:
+        if text is path_or_file:
+            pass
+        elif hasattr(path_or_file, "read"):
+            _release(text, path_or_file)
+        else:
+            text.close()
+
+
+def _release(text: io.TextIOWrapper, path_or_file: Any) -> None:
+    """
+    Takes apart the layers open_text put around a file object, closing them but leaving the file object open.
+    """
+    layer = text.detach()
+    if isinstance(layer, gzip.GzipFile):
+        inner = layer.fileobj
+        layer.close()
+    elif isinstance(layer, bz2.BZ2File):
+        inner = layer._fp
+        layer.close()
+    else:
+        inner = layer
+    if inner is not path_or_file:
+        # The buffered reader open_text made; closing it would close the file object.
+        inner.detach()
+
+
+def _intern_batches(batches: Iterator[Batch], weighted: bool) -> Tuple[Dict[Hashable, int], array, array, array]:
+    """
+    Interns the labels of batches of edges into ids in order of first appearance, and returns the label table with
+    the packed sources, targets and weights.
+    """
+    ids = {}
+    intern = ids.setdefault
+    sources = array("q")
+    targets = array("q")
+    weights = array("d") if weighted else None
+    for batch_sources, batch_targets, batch_weights in batches:
+        for source, target in zip(batch_sources, batch_targets):
+            sources.append(intern(source, len(ids)))
+            targets.append(intern(target, len(ids)))
+        if weighted:
+            weights.extend(batch_weights)
+    return ids, sources, targets, weights
+
+
+def read_edgelist(path_or_file: Union[str, Any], directed: bool = True, weighted: bool = False,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE, delimiter: Optional[str] = None, comments: str = "#",
+                  nodetype: Optional[Callable[[str], Hashable]] = None, encoding: str = "utf-8") -> FrozenDigraph:
+    """
+    Reads an edge list into a frozen digraph (or, with directed=False, a frozen graph). The vertices are the labels
+    that appear in the file, numbered in order of first appearance.
+
+    :param path_or_file: file path, or file object
+    :param directed: (optional) whether to build a digraph
+    :param weighted: (optional) whether each line carries a weight in its third field
+    :param chunk_size: (optional) number of lines read at a time
+    :param delimiter: (optional) field separator; by default, "," for .csv files and any whitespace otherwise
+    :param comments: (optional) marker of lines to skip
+    :param nodetype: (optional) conversion applied to each vertex label, such as int; by default labels are str
+    :param encoding: (optional) text encoding
+    :rtype: FrozenDigraph or FrozenGraph
+    """
+    ids, sources, targets, weights = _intern_batches(
+        iter_edgelist(path_or_file, weighted, chunk_size, delimiter, comments, nodetype, encoding), weighted
+    )
+    cls = FrozenDigraph if directed else FrozenGraph
+    return cls.from_edge_arrays(sources, targets, weights, list(ids))
+
+
+def shard_offsets(path: str, shards: int) -> List[int]:
+    """
+    Returns the byte offsets that split a file into at most the given number of shards of about equal size, each
+    starting at the beginning of a line. The first offset is 0 and the last is the size of the file.
+
+    :param path: file path
+    :param shards: number of shards
+    :rtype: list(int)
+    """
+    size = os.path.getsize(path)
+    offsets = [0]
+    with open(path, "rb") as edge_file:
+        for k in range(1, shards):
+            edge_file.seek(max(k * size // shards, offsets[-1]))
+            edge_file.readline()
+            if edge_file.tell() >= size:
+                break
+            if edge_file.tell() > offsets[-1]:
+                offsets.append(edge_file.tell())
+    offsets.append(size)
+    return offsets
+
+
+def _shard_lines(path: str, start: int, end: int, encoding: str) -> Iterator[str]:
+    """
+    Yields the lines of a file that start at or after byte start and before byte end.
+    """
+    with open(path, "rb") as edge_file:
+        edge_file.seek(start)
+        position = start
+        for line in edge_file:
+            if position >= end:
+                return
+            position += len(line)
+            yield line.decode(encoding)
+
+
+def _parse_shard(arguments) -> Tuple[int, Optional[Tuple[int, str, str]], List[Hashable], array, array, array]:
+    """
+    Worker: parses one shard of a file with its own label table, numbering its lines from 1, and returns the number of
+    lines in it and the labels in id order with the packed sources, targets and weights. A line that cannot be parsed
+    is returned rather than raised, as its number in the shard, the problem and the line, so that the caller can
+    number it in the file.
+    """
+    path, start, end, weighted, chunk_size, delimiter, comments, nodetype, encoding = arguments
+    count = 0
+
+    def batches():
+        nonlocal count
+        for lines in _chunks(_shard_lines(path, start, end, encoding), chunk_size):
+            yield _parse_lines(lines, weighted, delimiter, comments, nodetype, count + 1)
+            count += len(lines)
+    try:
+        ids, sources, targets, weights = _intern_batches(batches(), weighted)
+    except EdgeError as error:
+        if not hasattr(error, "parse"):
+            raise
+        return count, error.parse, [], array("q"), array("q"), None
+    return count, None, list(ids), sources, targets, weights
+
+
+def read_edgelist_parallel(path: str, directed: bool = True, weighted: bool = False,
+                           processes: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                           delimiter: Optional[str] = None, comments: str = "#",
+                           nodetype: Optional[Callable[[str], Hashable]] = None,
+                           encoding: str = "utf-8") -> FrozenDigraph:
+    """
+    Reads an edge list as read_edgelist does, parsing shards of the file in worker processes. Compressed files cannot
+    be split, and are read by read_edgelist in this process. The vertices are numbered in order of first appearance
+    in the file, as they are by read_edgelist.
+
+    :param path: file path
+    :param directed: (optional) whether to build a digraph
+    :param weighted: (optional) whether each line carries a weight in its third field
+    :param processes: (optional) number of worker processes; defaults to the number of CPUs, and 1 parses in this
+        process
+    :param chunk_size: (optional) number of lines each worker parses at a time
+    :param delimiter: (optional) field separator; by default, "," for .csv files and any whitespace otherwise
+    :param comments: (optional) marker of lines to skip
+    :param nodetype: (optional) conversion applied to each vertex label, such as int; it must be picklable
+    :param encoding: (optional) text encoding
+    :rtype: FrozenDigraph or FrozenGraph
+    """
+    with open(path, "rb") as edge_file:
+        magic = edge_file.read(3)
+    if magic[:2] == b"\x1f\x8b" or magic == b"BZh":
+        return read_edgelist(path, directed, weighted, chunk_size, delimiter, comments, nodetype, encoding)
+    if delimiter is None and _is_csv(path):
+        delimiter = ","
+    processes = processes or os.cpu_count() or 1
+    offsets = shard_offsets(path, processes)
+    tasks = [
+        (path, start, end, weighted, chunk_size, delimiter, comments, nodetype, encoding)
+        for start, end in zip(offsets, offsets[1:])
+    ]
+    if processes < 2 or len(tasks) < 2:
+        shards = [_parse_shard(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(min(processes, len(tasks))) as pool:
+            shards = pool.map(_parse_shard, tasks, chunksize=1)
+    ids = {}
+    intern = ids.setdefault
+    sources = array("q")
+    targets = array("q")
+    weights = array("d") if weighted else None
+    # Each shard numbers its lines from 1; the lines of the shards before it give the line in the file it starts after
+    lines_before = 0
+    for count, failure, shard_labels, shard_sources, shard_targets, shard_weights in shards:
+        if failure is not None:
+            n, problem, line = failure
+            raise _parse_error(lines_before + n, problem, line)
+        lines_before += count
+        mapping = array("q", [intern(label, len(ids)) for label in shard_labels])
+        sources.extend(array("q", map(mapping.__getitem__, shard_sources)))
+        targets.extend(array("q", map(mapping.__getitem__, shard_targets)))
+        if weighted:
+            weights.extend(shard_weights)
+    cls = FrozenDigraph if directed else FrozenGraph
+    return cls.from_edge_arrays(sources, targets, weights, list(ids))
+
+
+def _names(labels: Iterable[Hashable], delimiter: str) -> List[str]:
+    """
+    Returns the labels as they are written in an edge list, checking that each can be read back.
+    """
+    names = [str(label) for label in labels]
+    for name in names:
+        if not name or "\n" in name or (delimiter in name if delimiter != " " else any(c.isspace() for c in name)):
+            raise VertexError(
+                "FormatError",
+                "Vertex label {n!r} cannot be written to an edge list with delimiter {d!r}.".format(
+                    n=name,
+                    d=delimiter
+                )
+            )
+    return names
+
+
+def write_edgelist(graph, path_or_file: Union[str, Any], delimiter: str = " ", weights: bool = True,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = "utf-8") -> None:
+    """
+    Writes a graph or digraph as an edge list, one "source target" or "source target weight" line per edge. The
+    edges of a graph are written once each. Paths ending in ".gz" or ".bz2" are compressed. Mutable graphs are frozen
+    first.
+
+    :param graph: The graph to write
+    :type graph: Digraph or FrozenDigraph
+    :param path_or_file: file path, or file object
+    :param delimiter: (optional) field separator
+    :param weights: (optional) whether to write the weights of a weighted graph
+    :param chunk_size: (optional) number of lines written at a time
+    :param encoding: (optional) text encoding
+    """
+    if not isinstance(graph, FrozenDigraph):
+        graph = graph.freeze()
+    write_lines(path_or_file, _edgelist_lines(graph, delimiter, weights), chunk_size, encoding)
+
+
+def _edgelist_lines(graph: FrozenDigraph, delimiter: str, weights: bool) -> Iterator[str]:
+    """
+    Yields the lines of the edge list of a frozen graph or digraph.
+    """
+    names = _names(graph.labels, delimiter)
+    indptr = graph.indptr
+    indices = graph.indices
+    edge_weights = graph.weights if weights else None
+    undirected = isinstance(graph, FrozenGraph)
+    for i in range(len(names)):
+        prefix = names[i] + delimiter
+        for k in range(indptr[i], indptr[i + 1]):
+            j = indices[k]
+            if undirected and j < i:
+                continue
+            if edge_weights is None:
+                yield prefix + names[j] + "\n"
+            else:
+                yield prefix + names[j] + delimiter + repr(edge_weights[k]) + "\n"
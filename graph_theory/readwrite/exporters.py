@@ -0,0 +1,177 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+Writers for the file formats of external solvers and tools:
+    DIMACS  the shortest path format of the 9th DIMACS challenge: "p sp n m", then "a u v length" per arc
+    METIS   the graph format of METIS and related partitioners: "n m [fmt]", then the neighbours of each vertex
+    GraphML the XML format read by most graph tools
+
+Each writer works straight from the arrays of the graph's frozen form, and writes a chunk of lines at a time, so that
+no more than one chunk of text is built at once. Mutable graphs are frozen first, into a copy that they do not keep.
+DIMACS and METIS number the vertices from 1 in the order of the frozen graph's labels; GraphML keeps the labels.
+"""
+from typing import Any, Iterator, Union
+from xml.sax.saxutils import escape, quoteattr
+
+from graph_theory.exceptions import EdgeError, GraphTheoryException
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.frozen_graph import FrozenGraph
+from graph_theory.readwrite.edgelist import DEFAULT_CHUNK_SIZE, write_lines
+
+
+def _frozen(graph) -> FrozenDigraph:
+    """
+    Returns the frozen form of a graph: the frozen form it has made already, if any, or otherwise a frozen copy made
+    for the export alone, which the graph does not keep (see graphlike.derived).
+    """
+    if isinstance(graph, FrozenDigraph):
+        return graph
+    frozen = (getattr(graph, "_derived", None) or {}).get(("freeze", ()))
+    if frozen is not None:
+        return frozen
+    freeze = type(graph).freeze
+    return getattr(freeze, "__wrapped__", freeze)(graph)
+
+
+def _integer(weight: float, minimum: int, file_format: str) -> int:
+    """
+    Returns a weight as an int, checking that it is a whole number of at least minimum.
+    """
+    if weight != weight or weight % 1 or weight < minimum:
+        raise EdgeError(
+            "TypeError",
+            "{f} edge weights must be whole numbers of at least {m}. Got {w}.".format(
+                f=file_format,
+                m=minimum,
+                w=weight
+            )
+        )
+    return int(weight)
+
+
+def write_dimacs(graph, path_or_file: Union[str, Any], comment: str = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 encoding: str = "utf-8") -> None:
+    """
+    Writes a digraph in DIMACS shortest path format. Arcs of unweighted digraphs have length 1, and each edge of a
+    graph is written as an arc in each direction. Lengths must be whole numbers.
+
+    :param graph: The digraph to write
+    :type graph: WeightedDigraph or FrozenDigraph
+    :param path_or_file: file path, or file object
+    :param comment: (optional) a comment to write at the top of the file
+    :param chunk_size: (optional) number of lines written at a time
+    :param encoding: (optional) text encoding
+    """
+    write_lines(path_or_file, _dimacs_lines(_frozen(graph), comment), chunk_size, encoding)
+
+
+def _dimacs_lines(graph: FrozenDigraph, comment: str) -> Iterator[str]:
+    """
+    Yields the lines of the DIMACS file of a frozen digraph.
+    """
+    if comment is not None:
+        for line in comment.splitlines():
+            yield "c {l}\n".format(l=line)
+    indptr = graph.indptr
+    indices = graph.indices
+    weights = graph.weights
+    yield "p sp {n} {m}\n".format(n=graph.order, m=len(indices))
+    for i in range(graph.order):
+        prefix = "a {u} ".format(u=i + 1)
+        for k in range(indptr[i], indptr[i + 1]):
+            length = 1 if weights is None else _integer(weights[k], 0, "DIMACS")
+            yield "{p}{v} {w}\n".format(p=prefix, v=indices[k] + 1, w=length)
+
+
+def write_metis(graph, path_or_file: Union[str, Any], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                encoding: str = "utf-8") -> None:
+    """
+    Writes a graph in METIS format, with edge weights if it is weighted. Weights must be whole numbers of at least 1.
+
+    :param graph: The graph to write
+    :type graph: Graph or FrozenGraph
+    :param path_or_file: file path, or file object
+    :param chunk_size: (optional) number of lines written at a time
+    :param encoding: (optional) text encoding
+    """
+    graph = _frozen(graph)
+    if not isinstance(graph, FrozenGraph):
+        raise GraphTheoryException(
+            "Undirected",
+            "METIS files hold undirected graphs. Got a {t}.".format(
+                t=type(graph).__name__
+            )
+        )
+    write_lines(path_or_file, _metis_lines(graph), chunk_size, encoding)
+
+
+def _metis_lines(graph: FrozenGraph) -> Iterator[str]:
+    """
+    Yields the lines of the METIS file of a frozen graph.
+    """
+    indptr = graph.indptr
+    indices = graph.indices
+    weights = graph.weights
+    if weights is None:
+        yield "{n} {m}\n".format(n=graph.order, m=graph.size)
+    else:
+        yield "{n} {m} 001\n".format(n=graph.order, m=graph.size)
+    for i in range(graph.order):
+        start, stop = indptr[i], indptr[i + 1]
+        if weights is None:
+            yield " ".join([str(j + 1) for j in indices[start:stop]]) + "\n"
+        else:
+            yield " ".join([
+                "{v} {w}".format(v=indices[k] + 1, w=_integer(weights[k], 1, "METIS"))
+                for k in range(start, stop)
+            ]) + "\n"
+
+
+def write_graphml(graph, path_or_file: Union[str, Any], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  encoding: str = "utf-8") -> None:
+    """
+    Writes a graph or digraph in GraphML. Vertices are given the ids n0, n1, ..., with their labels as "label" data,
+    and weights are written as "weight" data. The edges of a graph are written once each.
+
+    :param graph: The graph to write
+    :type graph: Digraph or FrozenDigraph
+    :param path_or_file: file path, or file object
+    :param chunk_size: (optional) number of lines written at a time
+    :param encoding: (optional) text encoding
+    """
+    write_lines(path_or_file, _graphml_lines(_frozen(graph), encoding), chunk_size, encoding)
+
+
+def _graphml_lines(graph: FrozenDigraph, encoding: str) -> Iterator[str]:
+    """
+    Yields the lines of the GraphML file of a frozen graph or digraph.
+    """
+    undirected = isinstance(graph, FrozenGraph)
+    indptr = graph.indptr
+    indices = graph.indices
+    weights = graph.weights
+    yield "<?xml version=\"1.0\" encoding={e}?>\n".format(e=quoteattr(encoding.upper()))
+    yield "<graphml xmlns=\"http://graphml.graphdrawing.org/xmlns\">\n"
+    yield "  <key id=\"label\" for=\"node\" attr.name=\"label\" attr.type=\"string\"/>\n"
+    if weights is not None:
+        yield "  <key id=\"weight\" for=\"edge\" attr.name=\"weight\" attr.type=\"double\"/>\n"
+    yield "  <graph id=\"G\" edgedefault={d}>\n".format(d=quoteattr("undirected" if undirected else "directed"))
+    for i, label in enumerate(graph.labels):
+        yield "    <node id=\"n{i}\"><data key=\"label\">{l}</data></node>\n".format(i=i, l=escape(str(label)))
+    for i in range(graph.order):
+        for k in range(indptr[i], indptr[i + 1]):
+            j = indices[k]
+            if undirected and j < i:
+                continue
+            if weights is None:
+                yield "    <edge source=\"n{i}\" target=\"n{j}\"/>\n".format(i=i, j=j)
+            else:
+                yield "    <edge source=\"n{i}\" target=\"n{j}\"><data key=\"weight\">{w!r}</data></edge>\n".format(
+                    i=i,
+                    j=j,
+                    w=weights[k]
+                )
+    yield "  </graph>\n"
+    yield "</graphml>\n"
@@ -0,0 +1,300 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+Durable mutable graphs: an append-only write-ahead log of mutations, folded from time to time into a snapshot.
+
+A graph's directory holds numbered generations. The snapshot of generation g, "snapshot-g.bin", is a binary graph file
+(see graph_theory.readwrite.binary) of the graph as it was when generation g began, and the log "log-g.bin" holds the
+mutations made since. Generation 0 has no snapshot: it begins from an empty graph.
+
+Each log record is a small header (operation, payload length, CRC-32 of the payload) followed by the pickled list of
+vertex labels or edges the operation applies to. Records are written before the graph is changed, so recovery, which
+loads the newest complete snapshot and replays the logs after it, gets back every mutation that was made. A record
+cut short by a crash fails its length or checksum test; recovery stops there and truncates the log to the last whole
+record.
+
+Compaction freezes the graph and starts the next generation's log at once, in the calling thread, and then writes the
+new snapshot and deletes the older generation in a background thread. Until the snapshot is complete, recovery still
+uses the older snapshot and replays both logs.
+"""
+import os
+import pickle
+import re
+import struct
+import threading
+import zlib
+from typing import Any, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from graph_theory.exceptions import GraphTheoryException
+from graph_theory.objects.digraph import Digraph
+from graph_theory.objects.graphlike import Vertex
+from graph_theory.readwrite import binary
+
+
+ADD_VERTICES = 1
+ADD_EDGES = 2
+REMOVE_VERTICES = 3
+REMOVE_EDGES = 4
+UPDATE_WEIGHTS = 5
+
+# operation, payload length, CRC-32 of the payload
+_RECORD = struct.Struct("=BII")
+
+_FILE_NAME = re.compile(r"^(snapshot|log)-(\d+)\.bin$")
+
+
+def _name(vertex: Hashable) -> Hashable:
+    """
+    Returns the plain label of a vertex.
+    """
+    return vertex.name if isinstance(vertex, Vertex) else vertex
+
+
+def _edge_record(edge) -> Tuple[Hashable, ...]:
+    """
+    Returns an edge as a tuple of its end labels, followed by its weight if it has one.
+    """
+    v1, v2 = edge
+    weight = getattr(edge, "weight", None)
+    if weight is None:
+        return _name(v1), _name(v2)
+    return _name(v1), _name(v2), weight
+
+
+def snapshot_path(directory: str, generation: int) -> str:
+    """
+    Returns the path of the snapshot of a generation.
+    """
+    return os.path.join(directory, "snapshot-{g}.bin".format(g=generation))
+
+
+def log_path(directory: str, generation: int) -> str:
+    """
+    Returns the path of the log of a generation.
+    """
+    return os.path.join(directory, "log-{g}.bin".format(g=generation))
+
+
+def read_records(path: str) -> Iterator[Tuple[int, List[Any], int]]:
+    """
+    Yields the whole records of a log, as (operation, items, end offset of the record), stopping at the first record
+    that is cut short or fails its checksum.
+
+    :param path: log file path
+    :rtype: iterator(tuple(int, list, int))
+    """
+    with open(path, "rb") as log_file:
+        position = 0
+        while True:
+            header = log_file.read(_RECORD.size)
+            if len(header) < _RECORD.size:
+                return
+            operation, length, checksum = _RECORD.unpack(header)
+            payload = log_file.read(length)
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                return
+            position += _RECORD.size + length
+            yield operation, pickle.loads(payload), position
+
+
+def replay(graph: Digraph, path: str) -> int:
+    """
+    Applies the whole records of a log to a graph, and returns the end offset of the last of them.
+
+    :param graph: The graph to apply the log to
+    :type graph: Digraph
+    :param path: log file path
+    :rtype: int
+    """
+    end = 0
+    for operation, items, end in read_records(path):
+        if operation == ADD_VERTICES:
+            graph.add_vertices(*items)
+        elif operation == ADD_EDGES:
+            graph.add_edges(*(graph.edge_form(*item) for item in items))
+        elif operation == REMOVE_VERTICES:
+            graph.remove_vertices(*items)
+        elif operation == REMOVE_EDGES:
+            graph.remove_edges(*(graph.edge_form(*item) for item in items))
+        elif operation == UPDATE_WEIGHTS:
+            graph.update_weights(*(graph.edge_form(*item) for item in items))
+        else:
+            raise GraphTheoryException(
+                "FormatError",
+                "Unknown operation {o} in log {p}.".format(
+                    o=operation,
+                    p=path
+                )
+            )
+    return end
+
+
+class MutationLog(object):
+    """
+    The open log of the current generation of a graph directory. Attached to a graph as graph.log, it records each
+    mutation of the graph before the graph is changed.
+
+    :methods: add_vertices, add_edges, remove_vertices, remove_edges, update_weights, compact, close
+    """
+    def __init__(self, directory: str, generation: int = 0, sync: bool = False):
+        """
+        :param directory: the graph directory
+        :param generation: the generation whose log to append to
+        :param sync: (optional) whether to flush each record to disk (os.fsync) before the graph is changed;
+            otherwise records are written to the operating system, which survives a crash of the process but not of
+            the machine
+        :type directory: str
+        :type generation: int
+        :type sync: bool
+        """
+        self.directory = directory
+        self.generation = generation
+        self.sync = sync
+        self._file = open(log_path(directory, generation), "ab")
+        self._compaction = None
+
+    def append(self, operation: int, items: List[Any]) -> None:
+        """
+        Writes a record to the log.
+
+        :param operation: ADD_VERTICES, ADD_EDGES, REMOVE_VERTICES, REMOVE_EDGES or UPDATE_WEIGHTS
+        :param items: the vertex labels, or edge tuples, the operation applies to
+        """
+        payload = pickle.dumps(items, protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.write(_RECORD.pack(operation, len(payload), zlib.crc32(payload)) + payload)
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+
+    def add_vertices(self, vertices: Iterable[Hashable]) -> None:
+        """
+        Records the addition of vertices.
+        """
+        self.append(ADD_VERTICES, [_name(vertex) for vertex in vertices])
+
+    def add_edges(self, edges: Iterable[Any]) -> None:
+        """
+        Records the addition of edges.
+        """
+        self.append(ADD_EDGES, [_edge_record(edge) for edge in edges])
+
+    def remove_vertices(self, vertices: Iterable[Hashable]) -> None:
+        """
+        Records the removal of vertices.
+        """
+        self.append(REMOVE_VERTICES, [_name(vertex) for vertex in vertices])
+
+    def remove_edges(self, edges: Iterable[Any]) -> None:
+        """
+        Records the removal of edges.
+        """
+        self.append(REMOVE_EDGES, [_edge_record(edge) for edge in edges])
+
+    def update_weights(self, edges: Iterable[Any]) -> None:
+        """
+        Records the change of the weights of edges.
+        """
+        self.append(UPDATE_WEIGHTS, [_edge_record(edge) for edge in edges])
+
+    def compact(self, graph: Digraph, background: bool = True) -> Optional[threading.Thread]:
+        """
+        Begins the next generation: freezes graph, which must be the graph this log is attached to, attaches to it
+        the log of the next generation, and writes the frozen graph as that generation's snapshot, after which the
+        files of older generations are deleted. This log is closed.
+
+        :param graph: The graph this log is attached to
+        :type graph: Digraph
+        :param background: (optional) whether to write the snapshot in a background thread
+        :type background: bool
+        :returns: the background thread, or None if background is False
+        :rtype: threading.Thread
+        """
+        if self._compaction is not None:
+            self._compaction.join()
+        frozen = graph.freeze()
+        log = MutationLog(self.directory, self.generation + 1, self.sync)
+        graph.log = log
+        self.close()
+        compaction = threading.Thread(target=self._write_snapshot, args=(frozen, self.generation + 1))
+        log._compaction = compaction
+        if not background:
+            compaction.run()
+            return None
+        compaction.start()
+        return compaction
+
+    def _write_snapshot(self, frozen, generation: int) -> None:
+        """
+        Writes the snapshot of a generation, then deletes the files of older generations.
+        """
+        binary.save(frozen, snapshot_path(self.directory, generation))
+        _delete_before(self.directory, generation)
+
+    def close(self) -> None:
+        """
+        Closes the log file.
+        """
+        self._file.close()
+
+
+def _generations(directory: str) -> Tuple[List[int], List[int]]:
+    """
+    Returns the sorted generations of the snapshots, and of the logs, in a directory.
+    """
+    snapshots = []
+    logs = []
+    for file_name in os.listdir(directory):
+        match = _FILE_NAME.match(file_name)
+        if match:
+            (snapshots if match.group(1) == "snapshot" else logs).append(int(match.group(2)))
+    return sorted(snapshots), sorted(logs)
+
+
+def _delete_before(directory: str, generation: int) -> None:
+    """
+    Deletes the snapshots and logs of generations older than generation.
+    """
+    snapshots, logs = _generations(directory)
+    for older in snapshots:
+        if older < generation:
+            os.remove(snapshot_path(directory, older))
+    for older in logs:
+        if older < generation:
+            os.remove(log_path(directory, older))
+
+
+def recover(directory: str, graph_class: type = Digraph, backend: str = "set", sync: bool = False) -> Digraph:
+    """
+    Opens the graph held in a directory, creating the directory if need be: loads the newest snapshot, replays the
+    logs after it, and attaches a log to the graph, so that further mutations are recorded.
+
+    :param directory: the graph directory
+    :param graph_class: (optional) the class of graph to begin from when there is no snapshot yet
+    :param backend: (optional) the adjacency index backend of the graph
+    :param sync: (optional) whether to flush each record to disk before the graph is changed
+    :type directory: str
+    :type graph_class: type
+    :type backend: str
+    :type sync: bool
+    :rtype: Digraph
+    """
+    os.makedirs(directory, exist_ok=True)
+    snapshots, logs = _generations(directory)
+    generation = snapshots[-1] if snapshots else 0
+    if snapshots:
+        graph = binary.load(snapshot_path(directory, generation)).to_digraph(backend)
+    else:
+        graph = graph_class(set(), set(), backend=backend)
+    for log_generation in logs:
+        if log_generation >= generation:
+            path = log_path(directory, log_generation)
+            end = replay(graph, path)
+            if end < os.path.getsize(path):
+                with open(path, "r+b") as log_file:
+                    log_file.truncate(end)
+            generation = log_generation
+    _delete_before(directory, snapshots[-1] if snapshots else 0)
+    graph.log = MutationLog(directory, generation, sync)
+    return graph
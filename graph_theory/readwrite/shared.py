@@ -0,0 +1,94 @@
+"""
+Created on Oct 19, 2026
+
+@author: unoriginalbanter
+
+Frozen graphs in shared memory, for process pools. share() writes the binary image of a graph (see
+graph_theory.readwrite.binary) into a new block of multiprocessing.shared_memory and returns a small, picklable
+handle; attach() opens the block in any process and returns a read-only frozen graph whose arrays are views of it.
+However many workers attach, there is one physical copy of the graph.
+
+    handle = share(graph)
+    try:
+        with multiprocessing.Pool(initializer=worker_init, initargs=(handle,)) as pool:
+            ...                      # worker_init calls attach(handle) once per worker
+    finally:
+        unlink(handle)
+
+The block lives until unlink() is called, by whichever process is responsible for it (usually the one that shared it);
+graphs already attached stay usable after that, until they are dropped.
+"""
+import inspect
+from multiprocessing import resource_tracker, shared_memory
+from typing import NamedTuple
+
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.readwrite import binary
+
+
+# Before Python 3.13, every process that opens a block registers it with the resource tracker, whatever created it,
+# and the tracker of a process that did not create the block unlinks it when that process exits.
+_UNTRACKED = {"track": False} if "track" in inspect.signature(shared_memory.SharedMemory).parameters else {}
+
+
+class SharedGraph(NamedTuple):
+    """
+    The handle of a graph in shared memory: the name of the block, and the size of the image in it.
+    """
+    name: str
+    size: int
+
+
+def share(graph) -> SharedGraph:
+    """
+    Copies a graph into a new block of shared memory. Mutable graphs are frozen first.
+
+    :param graph: The graph to share
+    :type graph: Digraph or FrozenDigraph
+    :returns: the handle to attach to, and to unlink when done
+    :rtype: SharedGraph
+    """
+    if not isinstance(graph, FrozenDigraph):
+        graph = graph.freeze()
+    size = binary.image_size(graph)
+    block = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        binary.write_into(graph, block.buf[:size])
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    handle = SharedGraph(block.name, size)
+    block.close()
+    return handle
+
+
+def attach(handle: SharedGraph) -> FrozenDigraph:
+    """
+    Returns the graph in a block of shared memory, without copying it. The graph keeps the block open, so its
+    arrays should not be used after the graph itself is dropped.
+
+    :param handle: the handle returned by share
+    :type handle: SharedGraph
+    :returns: the graph, as a FrozenGraph if a graph was shared, and a FrozenDigraph otherwise
+    :rtype: FrozenDigraph
+    """
+    block = shared_memory.SharedMemory(handle.name, **_UNTRACKED)
+    if not _UNTRACKED:
+        resource_tracker.unregister(block._name, "shared_memory")
+    graph = binary.from_buffer(block.buf[:handle.size].toreadonly(), "shared memory block {n}".format(n=handle.name))
+    # Set last, so that the block is released after the views of it when the graph is dropped.
+    graph._shared_memory = block
+    return graph
+
+
+def unlink(handle: SharedGraph) -> None:
+    """
+    Frees a block of shared memory once every process has dropped the graphs attached to it.
+
+    :param handle: the handle returned by share
+    :type handle: SharedGraph
+    """
+    block = shared_memory.SharedMemory(handle.name, **_UNTRACKED)
+    block.close()
+    block.unlink()
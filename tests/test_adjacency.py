@@ -0,0 +1,163 @@
+import unittest
+
+from graph_theory import graphlike_connectivity
+from graph_theory.exceptions import GraphTheoryException, VertexError
+from graph_theory.objects.adjacency import BitsetAdjacency, SetAdjacency
+from graph_theory.objects.digraph import Digraph
+from graph_theory.objects.graph import Graph
+
+
+class TestAdjacency(unittest.TestCase):
+    """
+    Tests that the set and bitset adjacency indexes answer alike.
+    """
+    def setUp(self):
+        """
+        Builds the same index with each backend.
+        :return:
+        """
+        self.indexes = []
+        for backend in (SetAdjacency, BitsetAdjacency):
+            index = backend("abcde")
+            for v1, v2 in [("a", "b"), ("a", "c"), ("a", "d"), ("b", "c"), ("b", "d"), ("c", "a"), ("e", "a")]:
+                index.add_edge(v1, v2)
+            self.indexes.append(index)
+
+    def test_membership(self):
+        """
+        Tests edge membership and degrees.
+        :return:
+        """
+        for index in self.indexes:
+            self.assertTrue(index.is_edge("a", "b"))
+            self.assertFalse(index.is_edge("b", "a"))
+            self.assertEqual(index.out_degree("a"), 3)
+            self.assertEqual(index.in_degree("a"), 2)
+            self.assertEqual(index.predecessors("c"), {"a", "b"})
+            self.assertRaises(VertexError, index.successors, "z")
+
+    def test_neighbourhood_operations(self):
+        """
+        Tests common neighbour counts and set-style neighbourhood operations.
+        :return:
+        """
+        for index in self.indexes:
+            self.assertEqual(index.common_successors("a", "b"), 2)
+            self.assertEqual(index.intersection("a", "b"), {"c", "d"})
+            self.assertEqual(index.union("b", "c", "e"), {"a", "c", "d"})
+            self.assertEqual(index.difference("a", "b"), {"b"})
+            self.assertFalse(index.is_complete())
+
+    def test_removal(self):
+        """
+        Tests removing edges and vertices, and that the bitset index reclaims the numbers of removed vertices.
+        :return:
+        """
+        for index in self.indexes:
+            index.remove_edge("a", "b")
+            self.assertFalse(index.is_edge("a", "b"))
+            self.assertEqual(index.predecessors("b"), set())
+            index.remove_vertices("c", "z")
+            self.assertNotIn("c", index)
+            self.assertEqual(len(index), 4)
+            self.assertEqual(index.successors("a"), {"d"})
+            self.assertEqual(index.successors("b"), {"d"})
+            self.assertEqual(index.predecessors("a"), {"e"})
+            index.remove_vertices("d", "e")
+            self.assertEqual(index.successors("a"), set())
+            index.add_vertices("f")
+            index.add_edge("f", "a")
+            self.assertEqual(index.predecessors("a"), {"f"})
+            self.assertEqual(index.union("a", "b", "f"), {"a"})
+        bitset = self.indexes[1]
+        self.assertEqual(len(bitset._labels), 3)
+        self.assertEqual(bitset._ids, {"a": 0, "b": 1, "f": 2})
+
+    def test_complete_with_tombstones(self):
+        """
+        Tests that the bitset index answers is_complete with removed vertices not yet reclaimed, without compacting.
+        :return:
+        """
+        index = BitsetAdjacency("abcd")
+        for v1 in "abcd":
+            for v2 in "abcd":
+                if v1 != v2:
+                    index.add_edge(v1, v2)
+        index.remove_vertices("b")
+        ids = dict(index._ids)
+        self.assertTrue(index.is_complete())
+        self.assertEqual(index._ids, ids)
+        self.assertEqual(index._dead, 1)
+        index.remove_edge("a", "c")
+        self.assertFalse(index.is_complete())
+
+    def test_share(self):
+        """
+        Tests that changing a shared copy of an index leaves the index as it was, and that the set index copies only
+        the rows it changes.
+        :return:
+        """
+        for index in self.indexes:
+            shared = index.share()
+            shared.remove_edge("a", "b")
+            shared.add_vertices("f")
+            shared.add_edge("f", "c")
+            shared.remove_vertices("e")
+            self.assertTrue(index.is_edge("a", "b"))
+            self.assertEqual(index.predecessors("c"), {"a", "b"})
+            self.assertEqual(index.predecessors("a"), {"c", "e"})
+            self.assertNotIn("f", index)
+            self.assertFalse(shared.is_edge("a", "b"))
+            self.assertEqual(shared.predecessors("c"), {"a", "b", "f"})
+            self.assertEqual(shared.predecessors("a"), {"c"})
+        index, shared = self.indexes[0], self.indexes[0].share()
+        shared.add_edge("d", "e")
+        self.assertIs(shared._successors["a"], index._successors["a"])
+        self.assertIsNot(shared._successors["d"], index._successors["d"])
+
+
+class TestBackendSelection(unittest.TestCase):
+    """
+    Tests selecting the adjacency backend of Digraph and Graph objects.
+    """
+    def test_digraph(self):
+        """
+        Tests that a Digraph answers alike with either backend, including after add_vertices and add_edges.
+        :return:
+        """
+        for backend in ("set", "bitset"):
+            digraph = Digraph({1, 2, 3}, {Digraph.edge_form(1, 2), Digraph.edge_form(2, 3)}, backend=backend)
+            self.assertEqual(digraph.backend, backend)
+            self.assertTrue(digraph.is_edge(Digraph.edge_form(1, 2)))
+            self.assertFalse(digraph.is_edge(Digraph.edge_form(2, 1)))
+            digraph.add_vertices(4)
+            digraph.add_edges(Digraph.edge_form(4, 1))
+            self.assertEqual(digraph.adjacent(4), {1})
+            self.assertEqual(digraph.in_degree(1), 1)
+            self.assertEqual(digraph.has_an_edge_with(2, 1, 3), (2, 3))
+            self.assertEqual(digraph.sum_of_degrees(), 3)
+
+    def test_graph(self):
+        """
+        Tests a complete Graph with either backend.
+        :return:
+        """
+        for backend in ("set", "bitset"):
+            graph = Graph({0, 1, 2}, {(0, 1), (1, 2)}, backend=backend)
+            self.assertFalse(graphlike_connectivity.is_complete_graph(graph))
+            graph.add_edges((2, 0))
+            self.assertTrue(graph.is_edge(0, 2))
+            self.assertEqual(graph.adjacent(0), {1, 2})
+            self.assertEqual(graph.degree(1), 2)
+            self.assertTrue(graphlike_connectivity.is_complete_graph(graph))
+
+    def test_unknown_backend(self):
+        """
+        Tests that an unknown backend is refused.
+        :return:
+        """
+        self.assertRaises(GraphTheoryException, Digraph, set(), set(), backend="matrix")
+
+
+if __name__ == '__main__':
+    unittest.main()
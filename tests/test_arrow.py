@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+from array import array
+
+from graph_theory.exceptions import GraphTheoryException
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.frozen_graph import FrozenGraph
+from graph_theory.objects.weighted_digraph import WeightedDigraph
+from graph_theory.readwrite import arrow
+
+try:
+    import pyarrow
+    from pyarrow import parquet
+except ImportError:
+    pyarrow = None
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestArrow(unittest.TestCase):
+    """
+    Tests importing and exporting Arrow edge tables and Parquet files.
+    """
+    def test_from_arrow(self):
+        """
+        Tests building a digraph from a chunked table with string labels and weights.
+        :return:
+        """
+        table = pyarrow.Table.from_batches([
+            pyarrow.record_batch({"src": ["a", "b"], "dst": ["b", "c"], "w": [0.5, 1.5]}),
+            pyarrow.record_batch({"src": ["c"], "dst": ["a"], "w": [2.5]}),
+        ])
+        digraph = arrow.from_arrow(table, weight="w")
+        self.assertIsInstance(digraph, FrozenDigraph)
+        self.assertEqual(list(digraph.labels), ["a", "b", "c"])
+        self.assertEqual(digraph.edges, {
+            digraph.edge_form("a", "b", 0.5), digraph.edge_form("b", "c", 1.5), digraph.edge_form("c", "a", 2.5)
+        })
+        graph = arrow.from_arrow(pyarrow.table({"src": [1, 2], "dst": [2, 3]}), directed=False)
+        self.assertIsInstance(graph, FrozenGraph)
+        self.assertTrue(graph.is_edge((3, 2)))
+
+    def test_nulls(self):
+        """
+        Tests that null endpoints are rejected.
+        :return:
+        """
+        with self.assertRaises(GraphTheoryException):
+            arrow.from_arrow(pyarrow.table({"src": ["a", None], "dst": ["b", "c"]}))
+
+    def test_round_trip(self):
+        """
+        Tests writing a graph with edge attributes to Parquet and reading it back.
+        :return:
+        """
+        digraph = WeightedDigraph({"a", "b", "c"}, {
+            WeightedDigraph.edge_form("a", "b", 0.5), WeightedDigraph.edge_form("b", "c", 1.5)
+        }).freeze()
+        digraph.edge_attributes.add("kind", "category", ["x", "y"])
+        table = arrow.to_arrow(digraph)
+        self.assertEqual(table.column("kind").to_pylist(), ["x", "y"])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "edges.parquet")
+            arrow.write_parquet(digraph, path)
+            self.assertEqual(arrow.read_parquet(path, weight="weight").edges, digraph.edges)
+        graph = FrozenGraph.from_edge_arrays([0, 1], [1, 2])
+        graph.edge_attributes.add("capacity", "q", [3, 3, 4, 4])
+        table = arrow.to_arrow(graph)
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.column("capacity").type, pyarrow.int64())
+        self.assertEqual(table.column("capacity").to_pylist(), [3, 4])
+        looped = FrozenGraph(["a", "b"], array("q", [0, 2, 3]), array("q", [0, 1, 0]))
+        self.assertEqual(arrow.to_arrow(looped).column("dst").to_pylist(), ["a", "b"])
+
+
+@unittest.skipIf(pyarrow is not None, "pyarrow is installed")
+class TestArrowMissing(unittest.TestCase):
+    """
+    Tests the error raised without pyarrow.
+    """
+    def test_missing(self):
+        """
+        Tests that exporting without pyarrow raises a GraphTheoryException.
+        :return:
+        """
+        with self.assertRaises(GraphTheoryException):
+            arrow.to_arrow(FrozenDigraph.from_edge_arrays([0], [1]))
@@ -0,0 +1,130 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from graph_theory.exceptions import GraphTheoryException, MatrixError
+from graph_theory.objects.attributes import AttributeStore, CategoryColumn, Column, Mask
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.frozen_graph import FrozenGraph
+from graph_theory.readwrite import binary
+
+
+class TestAttributes(unittest.TestCase):
+    """
+    Tests columnar vertex and edge attributes.
+    """
+    def test_mask(self):
+        """
+        Tests combining masks and listing the rows they select.
+        :return:
+        """
+        a = Mask(b"\x01\x01\x00\x00")
+        b = Mask(b"\x01\x00\x01\x00")
+        self.assertEqual((a & b).flags, b"\x01\x00\x00\x00")
+        self.assertEqual((a | b).flags, b"\x01\x01\x01\x00")
+        self.assertEqual((~a).flags, b"\x00\x00\x01\x01")
+        self.assertEqual(list((a | b).ids()), [0, 1, 2])
+        self.assertEqual((a | b).count(), 3)
+        with self.assertRaises(MatrixError):
+            a & Mask(b"\x01")
+
+    def test_columns(self):
+        """
+        Tests comparing numeric and category columns.
+        :return:
+        """
+        column = Column("q", [5, 1, 7, 3])
+        self.assertEqual(list((column > 2).ids()), [0, 2, 3])
+        self.assertEqual(list(column.isin([1, 7]).ids()), [1, 2])
+        categories = CategoryColumn(["web", "db", "web", "cache"])
+        self.assertEqual(categories.categories, ["web", "db", "cache"])
+        self.assertEqual(list((categories == "web").ids()), [0, 2])
+        self.assertEqual(list((categories != "web").ids()), [1, 3])
+        self.assertEqual((categories == "missing").count(), 0)
+        self.assertEqual(list((categories < "d").ids()), [3])
+        categories[1] = "queue"
+        self.assertEqual(list(categories), ["web", "queue", "web", "cache"])
+
+    def test_store(self):
+        """
+        Tests adding, loading and removing columns of a store.
+        :return:
+        """
+        store = AttributeStore(3, {"lazy": lambda: Column("d", [0.5, 1.5, 2.5])})
+        store.add("count", "q", default=2)
+        store.add("kind", "category", ["a", "b", "a"])
+        self.assertEqual(set(store), {"lazy", "count", "kind"})
+        self.assertEqual(store.row(1), {"lazy": 1.5, "count": 2, "kind": "b"})
+        with self.assertRaises(MatrixError):
+            store["short"] = Column("q", [1])
+        del store["lazy"]
+        self.assertNotIn("lazy", store)
+        with self.assertRaises(GraphTheoryException):
+            store["lazy"]
+
+    def test_where(self):
+        """
+        Tests selecting vertices and edges of frozen digraphs and graphs by their attributes.
+        :return:
+        """
+        digraph = FrozenDigraph.from_edge_arrays([0, 0, 1, 2], [1, 2, 2, 0], [0.25, 0.75, 1.0, 0.5], ["a", "b", "c"])
+        digraph.vertex_attributes.add("kind", "category", ["server", "client", "server"])
+        timestamps = digraph.edge_attributes.add("timestamp", "q", [10, 20, 30, 40])
+        self.assertEqual(digraph.vertices_where(digraph.vertex_attributes["kind"] == "server"), {"a", "c"})
+        selected = digraph.edges_where((digraph.edge_attributes["weight"] > 0.4) & (timestamps >= 25))
+        self.assertEqual(selected, {digraph.edge_form("b", "c", 1.0), digraph.edge_form("c", "a", 0.5)})
+        with self.assertRaises(MatrixError):
+            digraph.edges_where(Mask(b"\x01"))
+        graph = FrozenGraph.from_edge_arrays([0, 1], [1, 2])
+        self.assertEqual(len(graph.edges_where(~Mask(bytes(len(graph.indices))))), 2)
+
+    def test_binary(self):
+        """
+        Tests saving attributes, loading them lazily, and copying loaded columns on write.
+        :return:
+        """
+        digraph = FrozenDigraph.from_edge_arrays([0, 1], [1, 2], [1.5, 2.5], ["a", "b", "c"])
+        digraph.vertex_attributes.add("kind", "category", ["x", "y", "x"])
+        digraph.edge_attributes.add("capacity", "q", [7, 9])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.bin")
+            binary.save(digraph, path)
+            loaded = binary.load(path)
+            self.assertEqual(set(loaded.edge_attributes), {"weight", "capacity"})
+            capacity = loaded.edge_attributes["capacity"]
+            self.assertEqual(list(capacity), [7, 9])
+            self.assertEqual(list(loaded.edge_attributes["weight"]), [1.5, 2.5])
+            self.assertEqual(list(loaded.vertex_attributes["kind"]), ["x", "y", "x"])
+            capacity[0] = 8
+            self.assertEqual(list(capacity), [8, 9])
+            self.assertEqual(list(binary.load(path).edge_attributes["capacity"]), [7, 9])
+            plain = FrozenDigraph.from_edge_arrays([0], [1])
+            binary.save(plain, path)
+            self.assertEqual(len(binary.load(path).edge_attributes), 0)
+
+    def test_pickle(self):
+        """
+        Tests that pickling keeps the attribute columns, with buffers in and out of band, and from a loaded file.
+        :return:
+        """
+        digraph = FrozenDigraph.from_edge_arrays([0, 1], [1, 2], [1.5, 2.5], ["a", "b", "c"])
+        digraph.vertex_attributes.add("kind", "category", ["x", "y", "x"])
+        digraph.edge_attributes.add("capacity", "q", [7, 9])
+        graph = FrozenGraph.from_edge_arrays([0], [1])
+        graph.edge_attributes.add("flag", "b", [1, 1])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.bin")
+            binary.save(digraph, path)
+            loaded = binary.load(path)
+            for original in (digraph, loaded, graph):
+                for protocol in (2, 5):
+                    buffers = []
+                    callback = buffers.append if protocol > 2 else None
+                    copied = pickle.loads(pickle.dumps(original, protocol=protocol, buffer_callback=callback),
+                                          buffers=buffers)
+                    for store, copied_store in ((original.vertex_attributes, copied.vertex_attributes),
+                                                (original.edge_attributes, copied.edge_attributes)):
+                        self.assertEqual(set(copied_store), set(store))
+                        for name in store:
+                            self.assertEqual(list(copied_store[name]), list(store[name]))
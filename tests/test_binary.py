@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+
+from graph_theory import generators
+from graph_theory.exceptions import GraphTheoryException
+from graph_theory.objects.digraph import Digraph
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.frozen_graph import FrozenGraph
+from graph_theory.readwrite import binary
+
+
+class TestBinary(unittest.TestCase):
+    """
+    Tests saving and mapping binary graph files.
+    """
+    def setUp(self):
+        """
+        Makes a scratch directory.
+        :return:
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "graph.bin")
+
+    def tearDown(self):
+        """
+        Removes the scratch directory.
+        :return:
+        """
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """
+        Tests that each kind of label table, weights and direction survive a round trip.
+        :return:
+        """
+        graphs = [
+            generators.gnp(40, 0.2, seed=1),
+            FrozenDigraph.from_edge_arrays([0, 1], [1, 2], [0.5, 1.5], labels=["x", "yy", "é"]),
+            FrozenDigraph.from_edge_arrays([0], [1], labels=[b"a", b"b"]),
+            FrozenDigraph.from_edge_arrays([0], [1], labels=[10, -3]),
+            FrozenDigraph.from_edge_arrays([0], [1], labels=[10, (1, 2)]),
+        ]
+        for graph in graphs:
+            binary.save(graph, self.path)
+            loaded = binary.load(self.path)
+            self.assertIs(type(loaded), type(graph))
+            self.assertEqual(list(loaded.labels), list(graph.labels))
+            self.assertEqual(list(loaded.indptr), list(graph.indptr))
+            self.assertEqual(loaded.edges, graph.edges)
+            if graph.weights is not None:
+                self.assertEqual(list(loaded.weights), list(graph.weights))
+
+    def test_queries_on_mapping(self):
+        """
+        Tests that a loaded graph answers queries straight from the mapping.
+        :return:
+        """
+        binary.save(Digraph({"a", "b", "c"}, {Digraph.edge_form("a", "b"), Digraph.edge_form("c", "b")}), self.path)
+        loaded = binary.load(self.path)
+        self.assertIsInstance(loaded.indices, memoryview)
+        self.assertTrue(loaded.is_edge(("c", "b")))
+        self.assertEqual(loaded.in_degree("b"), 2)
+        self.assertEqual(loaded.adjacent("a"), {"b"})
+        self.assertIsInstance(binary.load(self.path), FrozenDigraph)
+        self.assertNotIsInstance(binary.load(self.path), FrozenGraph)
+
+    def test_not_a_graph_file(self):
+        """
+        Tests that other files are refused.
+        :return:
+        """
+        with open(self.path, "wb") as other_file:
+            other_file.write(b"\x00" * 100)
+        self.assertRaises(GraphTheoryException, binary.load, self.path)
+
+    def test_empty_and_truncated(self):
+        """
+        Tests that empty and truncated files are refused as malformed.
+        :return:
+        """
+        open(self.path, "wb").close()
+        with self.assertRaises(GraphTheoryException) as caught:
+            binary.load(self.path)
+        self.assertEqual(caught.exception.args[0], "FormatError")
+        graph = generators.gnm(50, 100, seed=1)
+        graph.vertex_attributes.add("rank", "q", range(50))
+        binary.save(graph, self.path)
+        with open(self.path, "rb") as graph_file:
+            image = graph_file.read()
+        for length in (40, len(image) // 2, len(image) - 1):
+            with open(self.path, "wb") as graph_file:
+                graph_file.write(image[:length])
+            with self.assertRaises(GraphTheoryException) as caught:
+                binary.load(self.path)
+            self.assertEqual(caught.exception.args[0], "FormatError")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+import bz2
+import gzip
+import io
+import os
+import tempfile
+import unittest
+
+from graph_theory.exceptions import EdgeError
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.frozen_graph import FrozenGraph
+from graph_theory.readwrite import edgelist
+
+
+TEXT = "# a comment\n1 2\n2 3\n\n3 1\n1 2\n"
+
+
+class TestEdgelist(unittest.TestCase):
+    """
+    Tests reading edge lists.
+    """
+    def setUp(self):
+        """
+        Makes a scratch directory.
+        :return:
+        """
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """
+        Removes the scratch directory.
+        :return:
+        """
+        self.directory.cleanup()
+
+    def _write(self, name, data, opener=open):
+        """
+        Writes data to a file in the scratch directory, and returns its path.
+        :return:
+        """
+        path = os.path.join(self.directory.name, name)
+        with opener(path, "wb") as edge_file:
+            edge_file.write(data.encode("utf-8"))
+        return path
+
+    def test_read_edgelist(self):
+        """
+        Tests that plain, gzip and bz2 files read the same, whatever the chunk size.
+        :return:
+        """
+        paths = [
+            self._write("edges.txt", TEXT),
+            self._write("edges.txt.gz", TEXT, gzip.open),
+            self._write("edges.bz2", TEXT, bz2.open),
+        ]
+        for path in paths:
+            for chunk_size in (1, 2, 100):
+                digraph = edgelist.read_edgelist(path, chunk_size=chunk_size, nodetype=int)
+                self.assertIsInstance(digraph, FrozenDigraph)
+                self.assertEqual(digraph.vertices, {1, 2, 3})
+                self.assertEqual(digraph.size, 3)
+                self.assertTrue(digraph.is_edge((3, 1)))
+                self.assertFalse(digraph.is_edge((1, 3)))
+
+    def test_undirected_weighted_csv(self):
+        """
+        Tests reading a weighted CSV file as a graph.
+        :return:
+        """
+        path = self._write("edges.csv", "a,b,1.5\nb,c,2\n")
+        graph = edgelist.read_edgelist(path, directed=False, weighted=True)
+        self.assertIsInstance(graph, FrozenGraph)
+        self.assertEqual(graph.size, 2)
+        self.assertTrue(graph.is_edge(("c", "b")))
+        self.assertEqual(list(graph.weights), [1.5, 1.5, 2.0, 2.0])
+
+    def test_iter_edgelist(self):
+        """
+        Tests that the generator mode yields batches of at most chunk_size lines, from a file object.
+        :return:
+        """
+        batches = list(edgelist.iter_edgelist(io.BytesIO(TEXT.encode("utf-8")), chunk_size=2))
+        self.assertEqual(len(batches), 3)
+        sources = [source for batch in batches for source in batch[0]]
+        self.assertEqual(sources, ["1", "2", "3", "1"])
+        with self.assertRaises(EdgeError):
+            list(edgelist.iter_edgelist(io.StringIO("1 2\n3\n")))
+        with self.assertRaises(EdgeError) as caught:
+            list(edgelist.iter_edgelist(io.StringIO("1 2 0.5\n2 3 heavy\n"), weighted=True))
+        self.assertEqual(caught.exception.args[0], "ParseError")
+
+    def test_file_objects_left_open(self):
+        """
+        Tests that reading from a binary file object, plain or compressed, leaves it open.
+        :return:
+        """
+        compressed = io.BytesIO()
+        with gzip.GzipFile(fileobj=compressed, mode="wb") as gzip_file:
+            gzip_file.write(TEXT.encode("utf-8"))
+        for data in (TEXT.encode("utf-8"), compressed.getvalue(), bz2.compress(TEXT.encode("utf-8"))):
+            edge_file = io.BytesIO(data)
+            self.assertEqual(edgelist.read_edgelist(edge_file).size, 3)
+            self.assertFalse(edge_file.closed)
+            edge_file.seek(0)
+            self.assertEqual(edge_file.read(), data)
+
+    def test_shard_offsets(self):
+        """
+        Tests that shards start at line starts and cover the file.
+        :return:
+        """
+        text = "".join("{i} {j}\n".format(i=i, j=i * 7 % 13) for i in range(1, 200))
+        path = self._write("edges.txt", text)
+        offsets = edgelist.shard_offsets(path, 7)
+        self.assertEqual(offsets[0], 0)
+        self.assertEqual(offsets[-1], len(text))
+        self.assertEqual(offsets, sorted(set(offsets)))
+        for offset in offsets[1:-1]:
+            self.assertEqual(text[offset - 1], "\n")
+
+    def test_read_edgelist_parallel(self):
+        """
+        Tests that parsing in shards gives the same graph, vertex numbering included, as reading in one process.
+        :return:
+        """
+        text = "".join("a{i} b{j} {w}\n".format(i=i % 31, j=i * 7 % 37, w=i / 4) for i in range(1, 500))
+        path = self._write("edges.txt", text)
+        expected = edgelist.read_edgelist(path, weighted=True)
+        for processes in (1, 3):
+            digraph = edgelist.read_edgelist_parallel(path, weighted=True, processes=processes)
+            self.assertEqual(list(digraph.labels), list(expected.labels))
+            self.assertEqual(list(digraph.indptr), list(expected.indptr))
+            self.assertEqual(list(digraph.indices), list(expected.indices))
+            self.assertEqual(list(digraph.weights), list(expected.weights))
+        gzip_path = self._write("edges.gz", TEXT, gzip.open)
+        self.assertEqual(edgelist.read_edgelist_parallel(gzip_path, processes=2).size, 3)
+
+    def test_parse_error_lines(self):
+        """
+        Tests that parse errors name the line of the file they are on, read whole or in shards.
+        :return:
+        """
+        lines = ["{i} {j}\n".format(i=i, j=i + 1) for i in range(1, 300)]
+        lines[240] = "241\n"
+        path = self._write("edges.txt", "".join(lines))
+        for read in (
+            lambda: edgelist.read_edgelist(path, chunk_size=16),
+            lambda: edgelist.read_edgelist_parallel(path, processes=1, chunk_size=16),
+            lambda: edgelist.read_edgelist_parallel(path, processes=4, chunk_size=16),
+        ):
+            with self.assertRaises(EdgeError) as caught:
+                read()
+            self.assertIn("Line 241 ", caught.exception.args[1])
+        # The first line in the file that cannot be parsed is named, whichever shards fail
+        lines[100] = "101\n"
+        path = self._write("edges.txt", "".join(lines))
+        for processes in (1, 4):
+            with self.assertRaises(EdgeError) as caught:
+                edgelist.read_edgelist_parallel(path, processes=processes, chunk_size=16)
+            self.assertIn("Line 101 ", caught.exception.args[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import gzip
+import io
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ElementTree
+
+from graph_theory.exceptions import EdgeError, GraphTheoryException, VertexError
+from graph_theory.objects.digraph import Digraph
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.frozen_graph import FrozenGraph
+from graph_theory.objects.graph import Graph
+from graph_theory.readwrite import edgelist, exporters
+
+
+class TestExporters(unittest.TestCase):
+    """
+    Tests the edge list, DIMACS, METIS and GraphML writers.
+    """
+    def setUp(self):
+        """
+        Makes a scratch directory.
+        :return:
+        """
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """
+        Removes the scratch directory.
+        :return:
+        """
+        self.directory.cleanup()
+
+    def test_write_edgelist(self):
+        """
+        Tests that written edge lists, plain and gzip, read back as the same graph.
+        :return:
+        """
+        digraph = FrozenDigraph.from_edge_arrays([0, 1, 2], [1, 2, 0], [0.5, 2.0, 1e-3], labels=["a", "b", "c"])
+        graph = Graph({1, 2, 3}, {(1, 2), (2, 3)})
+        for name in ("edges.txt", "edges.txt.gz"):
+            path = os.path.join(self.directory.name, name)
+            edgelist.write_edgelist(digraph, path, chunk_size=2)
+            self.assertEqual(edgelist.read_edgelist(path, weighted=True).edges, digraph.edges)
+            edgelist.write_edgelist(graph, path)
+            self.assertEqual(edgelist.read_edgelist(path, directed=False, nodetype=int).edges, graph.freeze().edges)
+        with gzip.open(os.path.join(self.directory.name, "edges.txt.gz"), "rt") as edge_file:
+            self.assertEqual(len(edge_file.readlines()), 2)
+        output = io.StringIO()
+        edgelist.write_edgelist(digraph, output, delimiter=",", weights=False)
+        self.assertEqual(output.getvalue(), "a,b\nb,c\nc,a\n")
+        spaced = FrozenDigraph.from_edge_arrays([0], [1], labels=["a b", "c"])
+        self.assertRaises(VertexError, edgelist.write_edgelist, spaced, io.StringIO())
+
+    def test_write_dimacs(self):
+        """
+        Tests DIMACS output, and that fractional lengths are refused.
+        :return:
+        """
+        digraph = FrozenDigraph.from_edge_arrays([0, 0, 1], [1, 2, 2], [3.0, 4.0, 5.0])
+        output = io.StringIO()
+        exporters.write_dimacs(digraph, output, comment="test")
+        self.assertEqual(output.getvalue(), "c test\np sp 3 3\na 1 2 3\na 1 3 4\na 2 3 5\n")
+        output = io.StringIO()
+        mutable = Digraph({1, 2}, {Digraph.edge_form(1, 2)})
+        exporters.write_dimacs(mutable, output)
+        self.assertEqual(output.getvalue().splitlines()[1][-2:], " 1")
+        # The frozen copy made for the export is not kept by the digraph, but one it has made already is used
+        self.assertNotIn(("freeze", ()), mutable._derived or {})
+        frozen = mutable.freeze()
+        self.assertIs(exporters._frozen(mutable), frozen)
+        fractional = FrozenDigraph.from_edge_arrays([0], [1], [0.5])
+        self.assertRaises(EdgeError, exporters.write_dimacs, fractional, io.StringIO())
+
+    def test_write_metis(self):
+        """
+        Tests METIS output, weighted and not, and that digraphs are refused.
+        :return:
+        """
+        graph = FrozenGraph.from_edge_arrays([0, 1], [1, 2])
+        output = io.StringIO()
+        exporters.write_metis(graph, output)
+        self.assertEqual(output.getvalue(), "3 2\n2\n1 3\n2\n")
+        weighted = FrozenGraph.from_edge_arrays([0], [1], [2.0], order=3)
+        output = io.StringIO()
+        exporters.write_metis(weighted, output)
+        self.assertEqual(output.getvalue(), "3 1 001\n2 2\n1 2\n\n")
+        self.assertRaises(GraphTheoryException, exporters.write_metis, FrozenDigraph.from_edge_arrays([0], [1]),
+                          io.StringIO())
+
+    def test_write_graphml(self):
+        """
+        Tests that GraphML output parses, with labels escaped and edges of graphs written once.
+        :return:
+        """
+        graph = FrozenGraph.from_edge_arrays([0, 1], [1, 2], [0.5, 1.5], labels=["<a>", "b&", "c"])
+        path = os.path.join(self.directory.name, "graph.graphml")
+        exporters.write_graphml(graph, path)
+        namespace = {"g": "http://graphml.graphdrawing.org/xmlns"}
+        root = ElementTree.parse(path).getroot()
+        self.assertEqual(root.find("g:graph", namespace).get("edgedefault"), "undirected")
+        labels = [data.text for data in root.findall("g:graph/g:node/g:data", namespace)]
+        self.assertEqual(labels, ["<a>", "b&", "c"])
+        edges = root.findall("g:graph/g:edge", namespace)
+        self.assertEqual([(edge.get("source"), edge.get("target")) for edge in edges], [("n0", "n1"), ("n1", "n2")])
+        self.assertEqual([edge.find("g:data", namespace).text for edge in edges], ["0.5", "1.5"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+
+from graph_theory import generators
+from graph_theory.exceptions import EdgeError
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.frozen_graph import FrozenGraph
+
+
+class TestGenerators(unittest.TestCase):
+    """
+    Tests the random graph generators.
+    """
+    def assertSimple(self, sources, targets, n, directed):
+        """
+        Asserts that the edges lie on the vertices 0 to n-1, with no loops or repeats.
+        """
+        self.assertEqual(len(sources), len(targets))
+        pairs = list(zip(sources, targets))
+        self.assertTrue(all(0 <= v < n and 0 <= w < n and v != w for v, w in pairs))
+        if not directed:
+            pairs = [frozenset(pair) for pair in pairs]
+        self.assertEqual(len(set(pairs)), len(pairs))
+
+    def test_gnp(self):
+        """
+        Tests G(n, p) edge counts, including the complete and empty extremes.
+        :return:
+        """
+        for directed in (False, True):
+            sources, targets = generators.gnp_edges(200, 0.05, seed=1, directed=directed)
+            self.assertSimple(sources, targets, 200, directed)
+            expected = 0.05 * (200 * 199 if directed else 200 * 199 / 2)
+            self.assertLess(abs(len(sources) - expected), 0.2 * expected)
+            self.assertEqual(generators.gnp_edges(200, 0.05, seed=1, directed=directed), (sources, targets))
+        self.assertEqual(generators.gnp(10, 1.0).size, 45)
+        self.assertEqual(generators.gnp(10, 1.0, directed=True).size, 90)
+        self.assertEqual(generators.gnp(10, 0.0).size, 0)
+
+    def test_gnm(self):
+        """
+        Tests that G(n, m) has exactly m edges.
+        :return:
+        """
+        for directed in (False, True):
+            sources, targets = generators.gnm_edges(50, 300, seed=2, directed=directed)
+            self.assertEqual(len(sources), 300)
+            self.assertSimple(sources, targets, 50, directed)
+        graph = generators.gnm(5, 10, seed=3)
+        self.assertIsInstance(graph, FrozenGraph)
+        self.assertEqual(graph.size, 10)
+        self.assertRaises(EdgeError, generators.gnm_edges, 5, 11)
+
+    def test_barabasi_albert(self):
+        """
+        Tests that each new vertex brings m edges.
+        :return:
+        """
+        sources, targets = generators.barabasi_albert_edges(100, 3, seed=4)
+        self.assertEqual(len(sources), 97 * 3)
+        self.assertSimple(sources, targets, 100, False)
+        self.assertEqual(generators.barabasi_albert(100, 3, seed=4).size, 97 * 3)
+
+    def test_watts_strogatz(self):
+        """
+        Tests that rewiring keeps the number of edges, and that p=0 keeps the ring lattice.
+        :return:
+        """
+        sources, targets = generators.watts_strogatz_edges(60, 4, 0.3, seed=5)
+        self.assertEqual(len(sources), 120)
+        self.assertSimple(sources, targets, 60, False)
+        ring = generators.watts_strogatz(10, 2, 0.0)
+        self.assertEqual(ring.adjacent(0), {1, 9})
+
+    def test_stochastic_block_model(self):
+        """
+        Tests that edges only fall between blocks of nonzero probability.
+        :return:
+        """
+        sources, targets = generators.stochastic_block_model_edges([20, 30], [[1.0, 0.0], [0.0, 0.5]], seed=6)
+        self.assertSimple(sources, targets, 50, False)
+        within_first = sum(1 for v, w in zip(sources, targets) if v < 20 and w < 20)
+        self.assertEqual(within_first, 190)
+        self.assertFalse(any((v < 20) != (w < 20) for v, w in zip(sources, targets)))
+        digraph = generators.stochastic_block_model([3, 3], [[0.0, 1.0], [0.0, 0.0]], directed=True)
+        self.assertEqual(digraph.size, 9)
+
+    def test_rmat(self):
+        """
+        Tests that R-MAT edges lie on 2^scale vertices, with no loops.
+        :return:
+        """
+        sources, targets = generators.rmat_edges(8, edge_factor=4, seed=7)
+        self.assertTrue(all(0 <= v < 256 and 0 <= w < 256 and v != w for v, w in zip(sources, targets)))
+        digraph = generators.rmat(8, edge_factor=4, seed=7)
+        self.assertIsInstance(digraph, FrozenDigraph)
+        self.assertEqual(digraph.order, 256)
+        self.assertEqual(digraph.size, len(set(zip(sources, targets))))
+
+
+if __name__ == '__main__':
+    unittest.main()
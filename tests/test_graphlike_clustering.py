@@ -0,0 +1,70 @@
+import unittest
+
+from graph_theory import graphlike_clustering
+from graph_theory.objects.graph import Graph
+
+
+class TestClustering(unittest.TestCase):
+    """
+    Tests triangle counting and the clustering coefficients derived from it.
+    """
+    def setUp(self):
+        """
+        A 4-clique on 0-3 with a pendant path 3-4-5, and an isolated vertex 6.
+        :return:
+        """
+        self.graph = Graph(
+            {0, 1, 2, 3, 4, 5, 6},
+            {(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3), (3, 4), (4, 5)}
+        )
+
+    def test_triangles(self):
+        """
+        Tests per-vertex triangle counts.
+        :return:
+        """
+        self.assertEqual(
+            graphlike_clustering.triangles(self.graph),
+            {0: 3, 1: 3, 2: 3, 3: 3, 4: 0, 5: 0, 6: 0}
+        )
+
+    def test_edges_in_both_directions(self):
+        """
+        Tests that an edge given as both (v1, v2) and (v2, v1) is counted once.
+        :return:
+        """
+        graph = Graph({0, 1, 2}, {(0, 1), (1, 0), (1, 2), (2, 1), (2, 0), (0, 2), (0, 0)})
+        self.assertEqual(graphlike_clustering.triangles(graph), {0: 1, 1: 1, 2: 1})
+
+    def test_local_clustering(self):
+        """
+        Tests local clustering coefficients.
+        :return:
+        """
+        clustering = graphlike_clustering.local_clustering(self.graph)
+        self.assertEqual(clustering[0], 1.0)
+        self.assertAlmostEqual(clustering[3], 0.5)
+        self.assertEqual(clustering[4], 0.0)
+        self.assertEqual(clustering[6], 0.0)
+
+    def test_transitivity(self):
+        """
+        Tests transitivity: 4 triangles over 3 * 3 + 6 + 1 paths of length 2.
+        :return:
+        """
+        self.assertAlmostEqual(graphlike_clustering.transitivity(self.graph), 12 / 16)
+        self.assertEqual(graphlike_clustering.transitivity(Graph({0, 1}, {(0, 1)})), 0.0)
+
+    def test_processes(self):
+        """
+        Tests that partitioning the work across processes gives the same counts.
+        :return:
+        """
+        self.assertEqual(
+            graphlike_clustering.triangles(self.graph, processes=2),
+            graphlike_clustering.triangles(self.graph)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
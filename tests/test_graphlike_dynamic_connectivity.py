@@ -0,0 +1,104 @@
+import pickle
+import random
+import unittest
+
+from graph_theory.graphlike_dynamic_connectivity import DynamicConnectivity
+from graph_theory.objects.graph import Graph
+
+
+def _components(vertices, edges):
+    """
+    Returns the component of each vertex, by union-find.
+    :return:
+    """
+    parent = {v: v for v in vertices}
+
+    def find(v):
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        return v
+    for u, v in edges:
+        parent[find(u)] = find(v)
+    return {v: find(v) for v in vertices}
+
+
+class TestDynamicConnectivity(unittest.TestCase):
+    """
+    Tests connectivity under edge insertions and deletions.
+    """
+    def test_replacement(self):
+        """
+        Tests that removing a tree edge finds a replacement edge when there is one.
+        :return:
+        """
+        connectivity = DynamicConnectivity()
+        for u, v in [(0, 1), (1, 2), (2, 3), (3, 0), (4, 5)]:
+            connectivity.insert(u, v)
+        self.assertTrue(connectivity.connected(0, 2))
+        self.assertEqual(connectivity.component_count(6), 2)
+        connectivity.delete(1, 2)
+        self.assertTrue(connectivity.connected(1, 2))
+        connectivity.delete(3, 0)
+        self.assertFalse(connectivity.connected(1, 2))
+        self.assertEqual(connectivity.component_size(0), 2)
+        self.assertEqual(connectivity.component_count(6), 3)
+        self.assertTrue(connectivity.connected(7, 7))
+        self.assertFalse(connectivity.connected(0, 7))
+
+    def test_random(self):
+        """
+        Tests random insertions and deletions against union-find from scratch.
+        :return:
+        """
+        generator = random.Random(7)
+        vertices = range(24)
+        edges = set()
+        connectivity = DynamicConnectivity()
+        for step in range(1500):
+            u, v = generator.sample(vertices, 2)
+            edge = (min(u, v), max(u, v))
+            if edge in edges and generator.random() < 0.6:
+                edges.remove(edge)
+                connectivity.delete(u, v)
+            else:
+                edges.add(edge)
+                connectivity.insert(u, v)
+            if step % 25 == 0:
+                components = _components(vertices, edges)
+                for a in vertices:
+                    for b in vertices:
+                        self.assertEqual(connectivity.connected(a, b), components[a] == components[b])
+                self.assertEqual(connectivity.component_count(len(vertices)), len(set(components.values())))
+
+    def test_graph(self):
+        """
+        Tests a graph kept up to date with its connectivity structure.
+        :return:
+        """
+        graph = Graph({1, 2, 3, 4}, {(1, 2), (3, 4)})
+        graph.track_connectivity()
+        self.assertFalse(graph.is_connected())
+        self.assertTrue(graph.same_component(3, 4))
+        graph.add_edges((2, 3))
+        self.assertTrue(graph.is_connected())
+        self.assertTrue(graph.same_component(1, 4))
+        clone = graph.copy()
+        self.assertIsNot(clone.connectivity, graph.connectivity)
+        self.assertTrue(clone.is_connected())
+
+    def test_pickle(self):
+        """
+        Tests that an unpickled graph keeps its own connectivity structure, and that an untracked one does not gain one.
+        :return:
+        """
+        graph = Graph({1, 2, 3, 4}, {(1, 2), (3, 4)})
+        self.assertIsNone(pickle.loads(pickle.dumps(graph)).connectivity)
+        self.assertIsNone(pickle.loads(pickle.dumps(graph.snapshot())).connectivity)
+        graph.track_connectivity()
+        copied = pickle.loads(pickle.dumps(graph))
+        self.assertIsNotNone(copied.connectivity)
+        self.assertFalse(copied.is_connected())
+        copied.add_edges((2, 3))
+        self.assertTrue(copied.connectivity.connected(1, 4))
+        self.assertFalse(graph.connectivity.connected(1, 4))
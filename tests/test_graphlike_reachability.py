@@ -0,0 +1,87 @@
+import os
+import random
+import tempfile
+import unittest
+
+from graph_theory import graphlike_reachability
+from graph_theory.exceptions import VertexError
+from graph_theory.objects.digraph import Digraph
+
+
+def reaches(digraph, vertex):
+    """
+    Returns the set of vertices reachable from vertex, by breadth first search.
+    """
+    found = {vertex}
+    frontier = [vertex]
+    while frontier:
+        frontier = [other for v in frontier for other in digraph.adjacent(v) if other not in found]
+        found.update(frontier)
+    return found
+
+
+class TestReachabilityIndex(unittest.TestCase):
+    """
+    Tests both reachability index methods against breadth first search.
+    """
+    def setUp(self):
+        """
+        A random digraph with cycles, and one with a cycle feeding a tree.
+        :return:
+        """
+        rng = random.Random(7)
+        vertices = set(range(60))
+        edges = set()
+        while len(edges) < 90:
+            v1, v2 = rng.randrange(60), rng.randrange(60)
+            if v1 != v2:
+                edges.add(Digraph.edge_form(v1, v2))
+        self.random_digraph = Digraph(vertices, edges)
+        self.small_digraph = Digraph(
+            "abcdef",
+            {Digraph.edge_form(v1, v2) for v1, v2 in ["ab", "ba", "bc", "cd", "ce", "fa"]}
+        )
+
+    def test_methods_agree_with_search(self):
+        """
+        Tests every pair of vertices with each method.
+        :return:
+        """
+        for digraph in (self.random_digraph, self.small_digraph):
+            expected = {vertex: reaches(digraph, vertex) for vertex in digraph.vertices}
+            for method in ("closure", "interval"):
+                index = graphlike_reachability.reachability_index(digraph, method)
+                for v1 in digraph.vertices:
+                    for v2 in digraph.vertices:
+                        self.assertEqual(index.reachable(v1, v2), v2 in expected[v1], (method, v1, v2))
+
+    def test_plain_labels(self):
+        """
+        Tests queries by plain label, and unknown vertices.
+        :return:
+        """
+        index = graphlike_reachability.reachability_index(self.small_digraph)
+        self.assertEqual(index.method, "closure")
+        self.assertTrue(index.reachable("f", "e"))
+        self.assertFalse(index.reachable("e", "f"))
+        self.assertRaises(VertexError, index.reachable, "a", "z")
+
+    def test_save_and_load(self):
+        """
+        Tests that a saved index answers alike once loaded.
+        :return:
+        """
+        for method in ("closure", "interval"):
+            index = graphlike_reachability.reachability_index(self.random_digraph, method)
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "index")
+                index.save(path)
+                loaded = graphlike_reachability.ReachabilityIndex.load(path)
+            self.assertEqual(loaded.method, method)
+            for v1 in range(0, 60, 7):
+                for v2 in range(60):
+                    self.assertEqual(loaded.reachable(v1, v2), index.reachable(v1, v2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import math
+import random
+import unittest
+
+from graph_theory.exceptions import EdgeError, GraphTheoryException
+from graph_theory.graphlike_shortest_paths import ShortestPathCache, shortest_paths
+from graph_theory.objects.digraph import Digraph
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.weighted_digraph import WeightedDigraph
+
+
+class TestShortestPaths(unittest.TestCase):
+    """
+    Tests single source shortest paths and their cache.
+    """
+    def setUp(self):
+        """
+        SetUp Tests.
+        :return:
+        """
+        edge = WeightedDigraph.edge_form
+        self.digraph = WeightedDigraph({"a", "b", "c", "d"}, {
+            edge("a", "b", 1.0), edge("b", "c", 1.0), edge("a", "c", 5.0)
+        })
+
+    def test_dijkstra(self):
+        """
+        Tests weighted distances, paths and unreachable vertices.
+        :return:
+        """
+        paths = self.digraph.shortest_paths("a")
+        self.assertEqual(paths.distance("c"), 2.0)
+        self.assertEqual(paths.path("c"), ["a", "b", "c"])
+        self.assertEqual(paths.distance("d"), math.inf)
+        self.assertEqual(paths.path("d"), [])
+        distances = self.digraph.dijkstra_distance("a")
+        self.assertEqual(distances["c"], {"path": ["a", "b", "c"], "distance": 2.0})
+        self.assertEqual(self.digraph.shortest_paths("a", "bfs").distance("c"), 1.0)
+        self.assertEqual(Digraph({1, 2}, {Digraph.edge_form(1, 2)}).dijkstra_distance(1)[2]["distance"], 1.0)
+
+    def test_errors(self):
+        """
+        Tests unknown algorithms and negative weights.
+        :return:
+        """
+        with self.assertRaises(GraphTheoryException):
+            shortest_paths(self.digraph, "a", "astar")
+        with self.assertRaises(EdgeError):
+            shortest_paths(FrozenDigraph.from_edge_arrays([0], [1], [-1.0]), 0)
+
+    def test_cache(self):
+        """
+        Tests hits, misses, LRU eviction, byte limits and invalidation by version.
+        :return:
+        """
+        cache = self.digraph.shortest_path_cache = ShortestPathCache(max_entries=2)
+        first = self.digraph.shortest_paths("a")
+        self.assertIs(self.digraph.shortest_paths("a"), first)
+        self.digraph.shortest_paths("b")
+        self.digraph.shortest_paths("a")
+        self.digraph.shortest_paths("c")
+        self.assertEqual(cache.stats()[:4], (2, 3, 1, 2))
+        self.digraph.shortest_paths("a")
+        self.assertEqual(cache.hits, 3)
+        self.digraph.add_edges(WeightedDigraph.edge_form("c", "d", 1.0))
+        self.assertEqual(self.digraph.shortest_paths("a").distance("d"), 3.0)
+        self.assertEqual(len(cache), 1)
+        small = ShortestPathCache(max_bytes=first.nbytes)
+        for source in "abc":
+            small.get(source, self.digraph.freeze(), "dijkstra", lambda: shortest_paths(self.digraph, source))
+        self.assertEqual(len(small), 1)
+        self.assertLessEqual(small.nbytes, first.nbytes)
+
+    def test_cache_identity(self):
+        """
+        Tests that a cache shared between digraphs at the same version never gives the result of another digraph.
+        :return:
+        """
+        edge = WeightedDigraph.edge_form
+        cache = ShortestPathCache()
+        other = WeightedDigraph({"a", "b", "c", "d"}, {edge("a", "c", 7.0)})
+        self.assertEqual(other.version, self.digraph.version)
+        self.digraph.shortest_path_cache = other.shortest_path_cache = cache
+        self.assertEqual(self.digraph.shortest_paths("a").distance("c"), 2.0)
+        self.assertEqual(other.shortest_paths("a").distance("c"), 7.0)
+        self.assertEqual(self.digraph.shortest_paths("a").distance("c"), 2.0)
+        clone = self.digraph.copy()
+        clone.shortest_path_cache = cache
+        clone.add_edges(edge("a", "d", 1.0))
+        self.digraph.add_edges(edge("c", "d", 1.0))
+        self.assertEqual(clone.version, self.digraph.version)
+        self.assertEqual(clone.shortest_paths("a").distance("d"), 1.0)
+        self.assertEqual(self.digraph.shortest_paths("a").distance("d"), 3.0)
+
+    def test_repair(self):
+        """
+        Tests that repairing results after random weight changes matches searching again.
+        :return:
+        """
+        generator = random.Random(3)
+        edge = WeightedDigraph.edge_form
+        pairs = {(u, v) for u in range(30) for v in range(30) if u != v and generator.random() < 0.1}
+        digraph = WeightedDigraph(set(range(30)), {edge(u, v, float(generator.randint(1, 9))) for u, v in pairs})
+        cache = digraph.shortest_path_cache = ShortestPathCache()
+        for source in range(5):
+            digraph.shortest_paths(source)
+        pairs = sorted(pairs)
+        for _ in range(40):
+            changes = {pair: float(generator.randint(1, 9)) for pair in generator.sample(pairs, 3)}
+            digraph.update_weights(*(edge(u, v, weight) for (u, v), weight in changes.items()))
+            self.assertEqual(len(cache), 5)
+            for source in range(5):
+                repaired = digraph.shortest_paths(source)
+                expected = shortest_paths(digraph.freeze(), source)
+                self.assertEqual(list(repaired.distances), list(expected.distances))
+                weights = {(e[0], e[1]): e.weight for e in digraph.edges}
+                for target in range(30):
+                    path = repaired.path(target)
+                    if path:
+                        length = sum(weights[pair] for pair in zip(path, path[1:]))
+                        self.assertEqual(length, repaired.distance(target))
+        self.assertEqual(cache.misses, 5)
@@ -0,0 +1,131 @@
+import os
+import tempfile
+import unittest
+
+from graph_theory.exceptions import EdgeError, VertexError
+from graph_theory.objects.graph import Graph
+from graph_theory.objects.weighted_digraph import WeightedDigraph
+from graph_theory.readwrite import mutation_log
+
+
+class TestMutationLog(unittest.TestCase):
+    """
+    Tests logging mutations, recovery and compaction.
+    """
+    def setUp(self):
+        """
+        Makes a scratch directory.
+        :return:
+        """
+        self.scratch = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.scratch.name, "graph")
+
+    def tearDown(self):
+        """
+        Removes the scratch directory.
+        :return:
+        """
+        self.scratch.cleanup()
+
+    def test_recover(self):
+        """
+        Tests that mutations are replayed on recovery, and that a record cut short is dropped.
+        :return:
+        """
+        digraph = mutation_log.recover(self.directory)
+        digraph.add_vertices(1, 2, 3)
+        digraph.add_edges(digraph.edge_form(1, 2), digraph.edge_form(2, 3))
+        digraph.log.close()
+        path = mutation_log.log_path(self.directory, 0)
+        whole = os.path.getsize(path)
+        with open(path, "ab") as log_file:
+            log_file.write(b"\x02\x40\x00")
+        recovered = mutation_log.recover(self.directory)
+        self.assertEqual(recovered.vertices, {1, 2, 3})
+        self.assertEqual(recovered.edges, {(1, 2), (2, 3)})
+        self.assertEqual(os.path.getsize(path), whole)
+        recovered.log.close()
+
+    def test_refused(self):
+        """
+        Tests that a refused mutation is not logged, so that the graph can still be recovered after it.
+        :return:
+        """
+        digraph = mutation_log.recover(self.directory)
+        digraph.add_vertices(1, 2)
+        self.assertRaises(VertexError, digraph.add_edges, digraph.edge_form(1, 2), digraph.edge_form(1, 99))
+        self.assertRaises(VertexError, digraph.remove_vertices, 99)
+        self.assertRaises(EdgeError, digraph.remove_edges, digraph.edge_form(2, 1))
+        digraph.add_edges(digraph.edge_form(1, 2))
+        digraph.log.close()
+        recovered = mutation_log.recover(self.directory)
+        self.assertEqual(recovered.vertices, {1, 2})
+        self.assertEqual(recovered.edges, {(1, 2)})
+        recovered.log.close()
+
+    def test_batch(self):
+        """
+        Tests that a batch is logged when it is applied, and not at all when it fails.
+        :return:
+        """
+        digraph = mutation_log.recover(self.directory)
+        with digraph.batch():
+            digraph.add_vertices(1, 2, 3)
+            digraph.add_edges(digraph.edge_form(1, 2), digraph.edge_form(2, 3))
+        try:
+            with digraph.batch():
+                digraph.remove_vertices(3)
+                digraph.add_edges(digraph.edge_form(1, 1))
+        except Exception:
+            pass
+        digraph.log.close()
+        recovered = mutation_log.recover(self.directory)
+        self.assertEqual(recovered.vertices, {1, 2, 3})
+        self.assertEqual(recovered.edges, {(1, 2), (2, 3)})
+        recovered.log.close()
+
+    def test_compact(self):
+        """
+        Tests that compaction writes a snapshot, deletes the older generation, and keeps later mutations.
+        :return:
+        """
+        graph = mutation_log.recover(self.directory, Graph)
+        graph.add_vertices("a", "b", "c")
+        graph.add_edges(graph.edge_form("a", "b"))
+        graph.log.compact(graph).join()
+        graph.add_vertices("d")
+        graph.add_edges(graph.edge_form("b", "c"), graph.edge_form("c", "d"))
+        graph.remove_vertices("d")
+        graph.log.close()
+        self.assertEqual(sorted(os.listdir(self.directory)), ["log-1.bin", "snapshot-1.bin"])
+        recovered = mutation_log.recover(self.directory)
+        self.assertIsInstance(recovered, Graph)
+        self.assertTrue(recovered.is_edge("c", "b"))
+        self.assertEqual(recovered.degree("b"), 2)
+        self.assertEqual(recovered.vertices, {"a", "b", "c"})
+        recovered.log.close()
+
+    def test_weighted(self):
+        """
+        Tests that edge weights are logged and survive compaction.
+        :return:
+        """
+        digraph = mutation_log.recover(self.directory, WeightedDigraph)
+        digraph.add_vertices(1, 2, 3)
+        digraph.add_edges(digraph.edge_form(1, 2, 0.5))
+        digraph.log.compact(digraph, background=False)
+        digraph.add_edges(digraph.edge_form(2, 3, 1.5), digraph.edge_form(3, 1, 2.5))
+        digraph.remove_edges(digraph.edge_form(3, 1, 2.5))
+        digraph.update_weights(digraph.edge_form(2, 3, 1.0))
+        digraph.log.close()
+        operations = [record[0] for record in mutation_log.read_records(mutation_log.log_path(self.directory, 1))]
+        self.assertEqual(operations[-1], mutation_log.UPDATE_WEIGHTS)
+        self.assertEqual(operations.count(mutation_log.UPDATE_WEIGHTS), 1)
+        recovered = mutation_log.recover(self.directory)
+        self.assertIsInstance(recovered, WeightedDigraph)
+        self.assertEqual(sorted((tuple(edge), edge.weight) for edge in recovered.edges), [((1, 2), 0.5), ((2, 3), 1.0)])
+        recovered.log.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,71 @@
+import copy
+import pickle
 import unittest
+from fractions import Fraction
+
+from graph_theory.exceptions import EdgeError, VertexError
+from graph_theory.exceptions import GraphTheoryException
+from graph_theory.graphlike_shortest_paths import ShortestPathCache
+from graph_theory.objects.digraph import Digraph
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.frozen_graph import FrozenGraph
+from graph_theory.objects.graph import Graph
+from graph_theory.objects.graphlike import Vertex, VertexTable
+from graph_theory.objects.tree import Tree
+from graph_theory.objects.weighted_digraph import WeightedDigraph
+from graph_theory.objects.weighted_graph import WeightedGraph
+
+
+class TestVertex(unittest.TestCase):
+    """
+    Tests Vertex objects and their interning.
+    """
+    def test_vertex(self):
+        """
+        Tests that vertices mix with their plain labels, and are pickled by name.
+        :return:
+        """
+        vertex = Vertex("a")
+        self.assertEqual(vertex, "a")
+        self.assertEqual(vertex, Vertex(vertex))
+        self.assertEqual(hash(vertex), hash("a"))
+        self.assertIn("a", {vertex})
+        self.assertIn(vertex, {"a": 1})
+        self.assertIsNone(vertex.id)
+        self.assertRaises(AttributeError, setattr, vertex, "colour", "red")
+        self.assertEqual(pickle.loads(pickle.dumps(vertex)), "a")
+
+    def test_vertex_table(self):
+        """
+        Tests that a table keeps one vertex per name, with dense ids, and that its vertices still compare by name
+        with others.
+        :return:
+        """
+        table = VertexTable()
+        a, b = table.intern("a"), table.intern(Vertex("b"))
+        self.assertEqual((a.id, b.id), (0, 1))
+        self.assertIs(table.intern("a"), a)
+        self.assertIs(table.intern(a), a)
+        self.assertIs(table[1], b)
+        self.assertNotEqual(a, b)
+        self.assertEqual(a, Vertex("a"))
+        self.assertEqual(a, VertexTable().intern("a"))
+        self.assertIn("b", table)
+        self.assertEqual(len(table), 2)
+        c, d = table.intern("c"), table.intern("d")
+        table.release("a", Vertex("nothing"))
+        self.assertIsNone(table[0])
+        self.assertIsNone(a.id)
+        self.assertEqual(a, Vertex("a"))
+        self.assertEqual((b.id, len(table)), (1, 3))
+        table.release(b, "c")
+        self.assertEqual((d.id, len(table)), (0, 1))
+        self.assertIs(table[0], d)
+        self.assertEqual(table.intern("a").id, 1)
+        self.assertNotEqual(table.intern("a"), d)
+        copied = pickle.loads(pickle.dumps(a))
+        self.assertEqual(copied, a)
+        self.assertIsNone(copied.id)
 
 
 class TestDigraph(unittest.TestCase):
@@ -26,6 +93,313 @@ class TestDigraph(unittest.TestCase):
         """
         pass
 
+    def test_is_edge_many(self):
+        """
+        Tests batched edge membership with either backend.
+        :return:
+        """
+        for backend in ("set", "bitset"):
+            digraph = Digraph({1, 2, 3}, {Digraph.edge_form(1, 2), Digraph.edge_form(2, 3)}, backend=backend)
+            self.assertEqual(list(digraph.is_edge_many([1, 2, 2, 3], [2, 1, 3, 4])), [1, 0, 1, 0])
+            self.assertEqual(len(digraph.is_edge_many([], [])), 0)
+            self.assertRaises(VertexError, digraph.is_edge_many, [4], [1])
+            self.assertRaises(EdgeError, digraph.is_edge_many, [1, 2], [2])
+
+    def test_neighbors_many(self):
+        """
+        Tests batched adjacency with either backend.
+        :return:
+        """
+        for backend in ("set", "bitset"):
+            digraph = Digraph({1, 2, 3}, {Digraph.edge_form(1, 2), Digraph.edge_form(1, 3)}, backend=backend)
+            indptr, neighbours = digraph.neighbors_many([1, 3, 1])
+            self.assertEqual(list(indptr), [0, 2, 2, 4])
+            self.assertEqual(set(neighbours[0:2]), {2, 3})
+            self.assertEqual(set(neighbours[2:4]), {2, 3})
+
+    def test_pickle(self):
+        """
+        Tests that digraphs, weighted digraphs and graphs survive pickling, with buffers in and out of band.
+        :return:
+        """
+        digraph = Digraph({1, 2, 3}, {Digraph.edge_form(1, 2), Digraph.edge_form(2, 3)}, backend="bitset")
+        digraph.add_vertices(4)
+        weighted = WeightedDigraph({"a", "b"}, {WeightedDigraph.edge_form("a", "b", 0.5)})
+        graph = Graph({1, 2, 3}, {(1, 2), (2, 3)})
+        for original in (digraph, weighted, graph):
+            for protocol in (2, 5):
+                buffers = []
+                callback = buffers.append if protocol > 2 else None
+                data = pickle.dumps(original, protocol=protocol, buffer_callback=callback)
+                copied = pickle.loads(data, buffers=buffers)
+                self.assertIs(type(copied), type(original))
+                self.assertEqual(copied.vertices, original.vertices)
+                self.assertEqual(copied.edges, original.edges)
+                self.assertEqual(copied.backend, original.backend)
+        copied = pickle.loads(pickle.dumps(weighted))
+        self.assertEqual(copied.has_an_edge_with("a", "b").weight, 0.5)
+        self.assertTrue(pickle.loads(pickle.dumps(graph)).is_edge(2, 1))
+        matrix = {Digraph.edge_form(v1, v2): int((v1, v2) == (1, 2)) for v1 in (1, 2) for v2 in (1, 2)}
+        digraph = Digraph({1, 2}, {Digraph.edge_form(1, 2)}, adjacency_matrix=matrix)
+        self.assertEqual(pickle.loads(pickle.dumps(digraph)).adjacency_matrix, matrix)
+        # A matrix with zero entries for some pairs only keeps exactly those, and the types of its values
+        for values in ((0, 1), (0.0, 2.5), (0, 2.5), (0, 2 ** 70)):
+            matrix = {Digraph.edge_form(1, 1): values[0], Digraph.edge_form(1, 2): values[1]}
+            digraph = Digraph({1, 2}, {Digraph.edge_form(1, 2)}, adjacency_matrix=matrix)
+            for protocol in (2, 5):
+                copied = pickle.loads(pickle.dumps(digraph, protocol=protocol)).adjacency_matrix
+                self.assertEqual(copied, matrix)
+                self.assertEqual([type(value) for value in copied.values()], [type(value) for value in values])
+
+    def test_copy(self):
+        """
+        Tests that a copy is independent of the original, index included.
+        :return:
+        """
+        for backend in ("set", "bitset"):
+            digraph = Digraph({1, 2, 3}, {Digraph.edge_form(1, 2)}, backend=backend)
+            self.assertTrue(digraph.is_edge((1, 2)))
+            for clone in (digraph.copy(), copy.copy(digraph), copy.deepcopy(digraph)):
+                clone.add_edges(Digraph.edge_form(2, 3))
+                self.assertTrue(clone.is_edge((2, 3)))
+                self.assertFalse(digraph.is_edge((2, 3)))
+                self.assertEqual(len(digraph.edges), 1)
+
+    def test_refused_edges(self):
+        """
+        Tests that adding edges with an unknown endpoint changes nothing, with either backend.
+        :return:
+        """
+        for cls in (Digraph, Graph):
+            for backend in ("set", "bitset"):
+                digraph = cls({1, 2}, set(), backend=backend)
+                self.assertRaises(VertexError, digraph.add_edges, Digraph.edge_form(1, 2), Digraph.edge_form(1, 99))
+                self.assertEqual(digraph.edges, set())
+                self.assertFalse(digraph.adjacency.is_edge(1, 2))
+                self.assertEqual(digraph.out_degree(1), 0)
+
+    def test_derived(self):
+        """
+        Tests that derived results are kept between changes and dropped by them.
+        :return:
+        """
+        digraph = Digraph({1, 2, 3}, {Digraph.edge_form(1, 2)})
+        version = digraph.version
+        frozen = digraph.freeze()
+        self.assertIs(digraph.freeze(), frozen)
+        self.assertEqual(digraph.in_degrees()[2], 1)
+        self.assertEqual(digraph.sum_of_degrees(), 1)
+        digraph.add_edges(Digraph.edge_form(2, 3))
+        self.assertGreater(digraph.version, version)
+        self.assertIsNot(digraph.freeze(), frozen)
+        self.assertEqual(digraph.sum_of_degrees(), 2)
+        digraph.add_vertices(4)
+        self.assertEqual(digraph.out_degrees()[4], 0)
+        self.assertEqual(digraph.copy().sum_of_degrees(), 2)
+
+    def test_interned_vertices(self):
+        """
+        Tests that a digraph holds one vertex per name, whatever form the vertices are given in.
+        :return:
+        """
+        digraph = Digraph({1, 2}, set())
+        one = next(vertex for vertex in digraph.vertices if vertex == 1)
+        self.assertIsNotNone(one.id)
+        digraph.add_vertices(Vertex(3), 1)
+        self.assertEqual(digraph.vertices, {1, 2, 3})
+        self.assertTrue(any(vertex is one for vertex in digraph.vertices))
+        digraph.remove_vertices(Vertex(1))
+        self.assertEqual(digraph.vertices, {2, 3})
+        # The name is released: the removed vertex leaves the table, and compares by name
+        self.assertIsNone(one.id)
+        clone = digraph.copy()
+        clone.add_vertices(1)
+        again = next(vertex for vertex in clone.vertices if vertex == 1)
+        self.assertIsNot(again, one)
+        self.assertEqual(again, one)
+        self.assertIsNotNone(again.id)
+
+    def test_released_vertices(self):
+        """
+        Tests that removing vertices, by call or by batch, keeps the vertex table to the size of the digraph.
+        :return:
+        """
+        digraph = Digraph(set(range(100)), {Digraph.edge_form(i, i + 1) for i in range(99)})
+        for i in range(0, 100, 2):
+            digraph.remove_vertices(i)
+        with digraph.batch():
+            digraph.remove_vertices(1, 3)
+            digraph.add_vertices(3)
+        self.assertEqual(len(digraph._vertex_table), len(digraph.vertices))
+        self.assertIn(3, digraph._vertex_table)
+        self.assertNotIn(1, digraph._vertex_table)
+        with self.assertRaises(EdgeError):
+            with digraph.batch():
+                digraph.remove_vertices(5)
+                digraph.add_edges(Digraph.edge_form(7, 7))
+        self.assertIn(5, digraph._vertex_table)
+        digraph.add_edges(Digraph.edge_form(3, 5))
+        self.assertTrue(digraph.is_edge((3, 5)))
+        self.assertEqual(digraph.in_degree(5), 1)
+
+    def test_edge(self):
+        """
+        Tests that edges are looked up by their pairs of vertices, returning the digraph's own edge objects, and that
+        the lookups follow changes to the digraph.
+        :return:
+        """
+        edge = Digraph.edge_form(1, 2)
+        digraph = Digraph({1, 2, 3}, {edge, Digraph.edge_form(2, 3)})
+        self.assertIs(digraph.edge(1, 2), edge)
+        self.assertIs(digraph.has_an_edge_with(1, 3, 2), edge)
+        self.assertRaises(EdgeError, digraph.edge, 2, 1)
+        added = Digraph.edge_form(3, 1)
+        digraph.add_edges(added, Digraph.edge_form(1, 2))
+        self.assertIs(digraph.edge(3, 1), added)
+        self.assertIs(digraph.edge(1, 2), edge)
+        digraph.remove_edges(Digraph.edge_form(1, 2))
+        self.assertRaises(EdgeError, digraph.edge, 1, 2)
+        digraph.remove_vertices(3)
+        self.assertFalse(digraph.has_an_edge_with(2, 3))
+        self.assertRaises(EdgeError, digraph.edge, 3, 1)
+        clone = digraph.copy()
+        clone.add_edges(Digraph.edge_form(2, 1))
+        self.assertRaises(EdgeError, digraph.edge, 2, 1)
+        digraph.edges = {Digraph.edge_form(2, 1)}
+        self.assertEqual(digraph.edge(2, 1), (2, 1))
+
+    def test_remove(self):
+        """
+        Tests removing edges and vertices, with either backend, and that missing ones are refused.
+        :return:
+        """
+        for backend in ("set", "bitset"):
+            digraph = Digraph(
+                {1, 2, 3, 4},
+                {Digraph.edge_form(1, 2), Digraph.edge_form(2, 3), Digraph.edge_form(3, 1), Digraph.edge_form(4, 3)},
+                backend=backend
+            )
+            digraph.adjacency_matrix = {Digraph.edge_form(v1, v2): 0 for v1 in range(1, 5) for v2 in range(1, 5)}
+            for edge in digraph.edges:
+                digraph.adjacency_matrix[edge] = 1
+            version = digraph.version
+            digraph.remove_edges(Digraph.edge_form(1, 2))
+            self.assertGreater(digraph.version, version)
+            self.assertEqual(digraph.adjacent(1), set())
+            self.assertEqual(digraph.adjacency_matrix[(1, 2)], 0)
+            self.assertRaises(EdgeError, digraph.remove_edges, Digraph.edge_form(1, 2))
+            digraph.remove_vertices(3)
+            self.assertEqual(digraph.vertices, {1, 2, 4})
+            self.assertEqual(digraph.edges, set())
+            self.assertEqual(digraph.out_degree(4), 0)
+            self.assertNotIn((3, 1), digraph.adjacency_matrix)
+            self.assertEqual(len(digraph.adjacency_matrix), 9)
+            self.assertEqual(digraph.freeze().order, 3)
+            self.assertRaises(VertexError, digraph.remove_vertices, 3)
+
+    def test_batch(self):
+        """
+        Tests that a batch is applied when it ends, and that a failing batch leaves the digraph as it was.
+        :return:
+        """
+        for backend in ("set", "bitset"):
+            digraph = Digraph({1, 2}, {Digraph.edge_form(1, 2)}, backend=backend)
+            digraph.adjacency_matrix = {Digraph.edge_form(1, 2): 1}
+            with digraph.batch():
+                digraph.add_vertices(3, 4)
+                digraph.add_edges(Digraph.edge_form(2, 3), Digraph.edge_form(3, 4))
+                with digraph.batch():
+                    digraph.remove_edges(Digraph.edge_form(1, 2))
+                self.assertEqual(digraph.vertices, {1, 2})
+                self.assertEqual(digraph.adjacent(1), {2})
+            self.assertEqual(digraph.vertices, {1, 2, 3, 4})
+            self.assertEqual(digraph.edges, {(2, 3), (3, 4)})
+            self.assertEqual(digraph.adjacent(1), set())
+            self.assertEqual(digraph.adjacency_matrix[(2, 3)], 1)
+            matrix = dict(digraph.adjacency_matrix)
+            version = digraph.version
+            with self.assertRaises(EdgeError):
+                with digraph.batch():
+                    digraph.remove_vertices(4)
+                    digraph.add_edges(Digraph.edge_form(1, 1))
+            with self.assertRaises(VertexError):
+                with digraph.batch():
+                    digraph.remove_vertices(4)
+                    digraph.remove_edges(Digraph.edge_form(3, 4))
+            with self.assertRaises(KeyError):
+                with digraph.batch():
+                    digraph.remove_vertices(4)
+                    raise KeyError("abandoned")
+            self.assertEqual(digraph.vertices, {1, 2, 3, 4})
+            self.assertEqual(digraph.edges, {(2, 3), (3, 4)})
+            self.assertEqual(digraph.adjacent(3), {4})
+            self.assertEqual(digraph.adjacency_matrix, matrix)
+            self.assertGreaterEqual(digraph.version, version)
+
+
+class TestFrozenDigraph(unittest.TestCase):
+    """
+    Tests FrozenDigraph construction and methods.
+    """
+    def test_from_edge_arrays(self):
+        """
+        Tests that edges are sorted into rows, with repeats kept once.
+        :return:
+        """
+        digraph = FrozenDigraph.from_edge_arrays([2, 0, 0, 2], [1, 2, 1, 1], labels="abc")
+        self.assertEqual(list(digraph.indptr), [0, 2, 2, 3])
+        self.assertEqual(list(digraph.indices), [1, 2, 1])
+        self.assertEqual(digraph.size, 3)
+        self.assertTrue(digraph.is_edge(("a", "c")))
+        self.assertFalse(digraph.is_edge(("c", "a")))
+        self.assertEqual(digraph.in_degree("b"), 2)
+        self.assertEqual(digraph.adjacent("a"), {"b", "c"})
+        self.assertRaises(EdgeError, FrozenDigraph.from_edge_arrays, [0], [0])
+
+    def test_freeze(self):
+        """
+        Tests freezing mutable digraphs, weighted digraphs and graphs, and thawing them again.
+        :return:
+        """
+        digraph = Digraph({1, 2, 3}, {Digraph.edge_form(1, 2), Digraph.edge_form(2, 3)})
+        frozen = digraph.freeze()
+        self.assertEqual(frozen.edges, digraph.edges)
+        self.assertRaises(GraphTheoryException, frozen.add_vertices, 4)
+        self.assertEqual(frozen.to_digraph().edges, digraph.edges)
+        weighted = WeightedDigraph({1, 2}, {WeightedDigraph.edge_form(1, 2, 0.5)}).freeze()
+        self.assertEqual(list(weighted.weights), [0.5])
+        self.assertEqual(weighted.has_an_edge_with(1, 2).weight, 0.5)
+        graph = Graph({1, 2, 3}, {(1, 2), (2, 3)}).freeze()
+        self.assertEqual(graph.size, 2)
+        self.assertTrue(graph.is_edge((2, 1)))
+        self.assertEqual(graph.degree(2), 2)
+        self.assertIs(FrozenGraph.from_digraph(graph), graph)
+        symmetrised = FrozenGraph.from_digraph(frozen)
+        self.assertIsInstance(symmetrised, FrozenGraph)
+        self.assertTrue(symmetrised.is_edge((2, 1)))
+        self.assertEqual(symmetrised.size, 2)
+        mixed = Digraph({1, 2, 3}, {WeightedDigraph.edge_form(1, 2, 0.5), Digraph.edge_form(2, 3)})
+        self.assertRaises(EdgeError, mixed.freeze)
+        self.assertRaises(EdgeError, pickle.dumps, mixed)
+
+    def test_pickle(self):
+        """
+        Tests that frozen digraphs pickle as their arrays, and are their own copies.
+        :return:
+        """
+        frozen = FrozenDigraph.from_edge_arrays([0, 1], [1, 2], [0.5, 1.5], labels="abc")
+        for protocol in (2, 5):
+            buffers = []
+            data = pickle.dumps(frozen, protocol=protocol, buffer_callback=buffers.append if protocol > 2 else None)
+            copied = pickle.loads(data, buffers=buffers)
+            self.assertEqual(copied.edges, frozen.edges)
+            self.assertEqual(list(copied.weights), [0.5, 1.5])
+        self.assertEqual(len(buffers), 3)
+        self.assertIs(copy.deepcopy(frozen), frozen)
+        graph = pickle.loads(pickle.dumps(Graph({1, 2}, {(1, 2)}).freeze()))
+        self.assertTrue(graph.is_edge((2, 1)))
+        self.assertEqual(graph.size, 1)
+
 
 class TestWeightedDigraph(unittest.TestCase):
     """
@@ -38,6 +412,103 @@ class TestWeightedDigraph(unittest.TestCase):
         """
         pass
 
+    def test_interned_vertices(self):
+        """
+        Tests that a weighted digraph interns its vertices, as Digraph does.
+        :return:
+        """
+        digraph = WeightedDigraph({1, 2}, {WeightedDigraph.edge_form(1, 2, 2.5)})
+        self.assertTrue(all(isinstance(vertex, Vertex) and vertex.id is not None for vertex in digraph.vertices))
+        digraph.vertices = {Vertex(3), 4}
+        self.assertEqual(digraph.vertices, {3, 4})
+        self.assertTrue(all(vertex.id is not None for vertex in digraph.vertices))
+
+    def test_is_edge(self):
+        """
+        Tests edge membership, singly and batched.
+        :return:
+        """
+        digraph = WeightedDigraph(
+            {1, 2, 3},
+            {WeightedDigraph.edge_form(1, 2, 2.5), WeightedDigraph.edge_form(2, 3, 1)}
+        )
+        self.assertTrue(digraph.is_edge(1, 2))
+        self.assertFalse(digraph.is_edge(2, 1))
+        self.assertEqual(digraph.has_an_edge_with(1, 3, 2).weight, 2.5)
+        self.assertTrue(digraph.is_edge(1, 2, 2.5))
+        self.assertFalse(digraph.is_edge(1, 2, 1))
+        digraph.update_weights(WeightedDigraph.edge_form(1, 2, 1))
+        self.assertTrue(digraph.is_edge(1, 2, 1))
+        self.assertEqual(digraph.edge(1, 2).weight, 1)
+        self.assertEqual(list(digraph.is_edge_many([1, 2, 3], [2, 3, 1])), [1, 1, 0])
+
+    def test_remove(self):
+        """
+        Tests removing weighted edges, by their endpoints alone, along with their adjacency matrix entries.
+        :return:
+        """
+        edges = {WeightedDigraph.edge_form(1, 2, 2.5), WeightedDigraph.edge_form(2, 3, 1)}
+        digraph = WeightedDigraph({1, 2, 3}, edges, {edge: edge.weight for edge in edges})
+        digraph.remove_edges(WeightedDigraph.edge_form(1, 2, 0))
+        self.assertEqual(digraph.edges, {(2, 3)})
+        self.assertEqual(list(digraph.adjacency_matrix), [(2, 3)])
+        self.assertFalse(digraph.has_an_edge_with(1, 2, 3))
+
+    def test_pickle(self):
+        """
+        Tests that pickling keeps the type of each weight: ints, floats, big ints and fractions.
+        :return:
+        """
+        for weights in ((2, 3), (2.5, 3.0), (2 ** 70, 3), (Fraction(1, 3), 2)):
+            edges = {WeightedDigraph.edge_form(1, 2, weights[0]), WeightedDigraph.edge_form(2, 3, weights[1])}
+            digraph = WeightedDigraph({1, 2, 3}, edges, {edge: edge.weight for edge in edges})
+            for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+                clone = pickle.loads(pickle.dumps(digraph, protocol=protocol))
+                for v1, v2 in ((1, 2), (2, 3)):
+                    weight = digraph.edge(v1, v2).weight
+                    self.assertEqual(clone.edge(v1, v2).weight, weight)
+                    self.assertIs(type(clone.edge(v1, v2).weight), type(weight))
+                    self.assertIs(type(clone.adjacency_matrix[v1, v2]), type(weight))
+                clone._validate()
+
+    def test_matrix_add_vertices(self):
+        """
+        Tests adding vertices, then weighted edges to them, to a weighted digraph that keeps an adjacency matrix.
+        :return:
+        """
+        for cls in (WeightedDigraph, WeightedGraph):
+            edge = cls.edge_form(1, 2, 3.0)
+            matrix = {edge: 3.0, cls.edge_form(2, 1, 3.0): 3.0} if cls is WeightedGraph else {edge: 3.0}
+            digraph = cls({1, 2}, {edge}, matrix)
+            digraph.add_vertices(3)
+            self.assertEqual(digraph.adjacency_matrix[3, 1], 0)
+            digraph.add_edges(cls.edge_form(3, 1, 2.0))
+            self.assertEqual(digraph.adjacency_matrix[3, 1], 2.0)
+            digraph.is_legal_weighted_digraph(digraph.vertices, digraph.edges, digraph.adjacency_matrix)
+            self.assertEqual(pickle.loads(pickle.dumps(digraph)).adjacency_matrix, digraph.adjacency_matrix)
+
+    def test_batch(self):
+        """
+        Tests that a batch checks the weights of its edges once, when it ends.
+        :return:
+        """
+        digraph = WeightedDigraph({1, 2}, {WeightedDigraph.edge_form(1, 2, 2.5)})
+        with self.assertRaises(EdgeError):
+            with digraph.batch():
+                digraph.add_vertices(3)
+                digraph.add_edges(WeightedDigraph.edge_form(2, 3, 1.0), Digraph.edge_form(3, 1))
+        self.assertEqual(digraph.vertices, {1, 2})
+        with self.assertRaises(EdgeError):
+            with digraph.batch():
+                digraph.update_weights(WeightedDigraph.edge_form(1, 2, 1.0))
+                digraph.add_edges(Digraph.edge_form(2, 1))
+        self.assertEqual(digraph.edge(1, 2).weight, 2.5)
+        self.assertEqual(digraph.edges, {(1, 2)})
+        with digraph.batch():
+            digraph.add_vertices(3)
+            digraph.add_edges(WeightedDigraph.edge_form(2, 3, 1.0))
+        self.assertEqual(digraph.has_an_edge_with(2, 3).weight, 1.0)
+
 
 class TestGraph(unittest.TestCase):
     """
@@ -50,6 +521,94 @@ class TestGraph(unittest.TestCase):
         """
         pass
 
+    def test_interned_vertices(self):
+        """
+        Tests that a graph interns its vertices, as Digraph does.
+        :return:
+        """
+        graph = Graph({1, 2, 3}, {(1, 2)})
+        self.assertTrue(all(isinstance(vertex, Vertex) and vertex.id is not None for vertex in graph.vertices))
+        graph.vertices = {Vertex(3), 4}
+        self.assertEqual(graph.vertices, {3, 4})
+        self.assertTrue(all(vertex.id is not None for vertex in graph.vertices))
+
+    def test_components(self):
+        """
+        Tests connected components, and that they are found again after a change.
+        :return:
+        """
+        graph = Graph({1, 2, 3, 4}, {(1, 2), (3, 4)})
+        self.assertEqual(set(graph.components()), {frozenset({1, 2}), frozenset({3, 4})})
+        self.assertFalse(graph.is_connected())
+        self.assertEqual(graph.degrees()[1], 1)
+        graph.add_edges((2, 3))
+        self.assertTrue(graph.is_connected())
+        self.assertEqual(graph.sum_of_degrees(), 6)
+
+    def test_refused_loops(self):
+        """
+        Tests that a loop is refused outside a batch, leaving the graph as it was.
+        :return:
+        """
+        graph = Graph({1, 2}, {(1, 2)})
+        self.assertRaises(EdgeError, graph.add_edges, Graph.edge_form(1, 1))
+        self.assertRaises(EdgeError, graph.add_edges, Graph.edge_form(2, 1), Graph.edge_form(2, 2))
+        self.assertEqual(graph.edges, {(1, 2)})
+        self.assertEqual(graph.adjacent(1), {2})
+        self.assertFalse(graph.is_edge(2, 2))
+
+    def test_remove(self):
+        """
+        Tests removing edges given either way round, and vertices, with and without a connectivity structure.
+        :return:
+        """
+        for track in (False, True):
+            graph = Graph({1, 2, 3, 4}, {(1, 2), (2, 3), (3, 4), (4, 1)})
+            if track:
+                graph.track_connectivity()
+            graph.remove_edges((2, 1))
+            self.assertEqual(graph.adjacent(1), {4})
+            self.assertNotIn((1, 2), graph.edges)
+            self.assertTrue(graph.is_connected())
+            graph.remove_vertices(4)
+            self.assertEqual(graph.edges, {(2, 3)})
+            self.assertFalse(graph.same_component(1, 2))
+            self.assertEqual(len(graph.components()), 2)
+            self.assertRaises(EdgeError, graph.remove_edges, (1, 3))
+
+    def test_edge(self):
+        """
+        Tests looking up edges either way round, and that an edge is turned only once.
+        :return:
+        """
+        graph = Graph({1, 2, 3}, {Graph.edge_form(1, 2)})
+        self.assertEqual(graph.edge(1, 2), (1, 2))
+        turned = graph.has_an_edge_with(2, 1)
+        self.assertEqual(turned, (2, 1))
+        self.assertIs(graph.edge(2, 1), turned)
+        self.assertRaises(EdgeError, graph.edge, 1, 3)
+        graph.remove_edges((1, 2))
+        self.assertRaises(EdgeError, graph.edge, 2, 1)
+
+    def test_batch(self):
+        """
+        Tests batches of graph mutations, and that a failing batch puts back the connectivity structure.
+        :return:
+        """
+        graph = Graph({1, 2, 3}, {(1, 2)})
+        graph.track_connectivity()
+        with graph.batch():
+            graph.add_edges((2, 3))
+            graph.remove_edges((2, 1))
+        self.assertEqual(graph.edges, {(2, 3)})
+        self.assertFalse(graph.same_component(1, 2))
+        with self.assertRaises(EdgeError):
+            with graph.batch():
+                graph.add_edges((1, 2), (3, 3))
+        self.assertFalse(graph.same_component(1, 2))
+        self.assertTrue(graph.same_component(2, 3))
+        self.assertEqual(graph.adjacent(1), set())
+
 
 class TestWeightedGraph(unittest.TestCase):
     """
@@ -60,7 +619,58 @@ class TestWeightedGraph(unittest.TestCase):
         Tests WeightedGraph object instatiation.
         :return:
         """
-        pass
+        edge = WeightedGraph.edge_form
+        for backend in ("set", "bitset"):
+            graph = WeightedGraph({1, 2, 3}, {edge(1, 2, 0.5), edge(2, 3, 1.5)}, backend=backend)
+            self.assertTrue(graph.is_edge(2, 1))
+            self.assertTrue(graph.is_edge(2, 1, 0.5))
+            self.assertFalse(graph.is_edge(2, 1, 1.5))
+            self.assertEqual(graph.edge(3, 2).weight, 1.5)
+            self.assertEqual(graph.adjacent(2), {1, 3})
+            self.assertEqual(graph.sum_of_degrees(), 4)
+            self.assertEqual(graph.shortest_paths(3).distance(1), 2.0)
+        self.assertIs(type(graph.freeze().to_graph()), WeightedGraph)
+
+    def test_remove(self):
+        """
+        Tests removing weighted edges given either way round, and vertices, with an adjacency matrix kept both ways.
+        :return:
+        """
+        edge = WeightedGraph.edge_form
+        matrix = {edge(1, 2, 0.5): 0.5, edge(2, 1, 0.5): 0.5}
+        graph = WeightedGraph({1, 2, 3, 4}, {edge(1, 2, 0.5)}, adjacency_matrix=matrix)
+        graph.track_connectivity()
+        graph.add_edges(edge(2, 3, 1.5), edge(3, 4, 2.5))
+        self.assertEqual(graph.adjacency_matrix[3, 2], 1.5)
+        graph.remove_edges(edge(3, 2, 1.5))
+        self.assertNotIn((2, 3), graph.adjacency_matrix)
+        self.assertNotIn((3, 2), graph.adjacency_matrix)
+        self.assertFalse(graph.is_edge(3, 2))
+        self.assertFalse(graph.same_component(1, 4))
+        graph.remove_vertices(4)
+        self.assertEqual(graph.edges, {(1, 2)})
+        self.assertEqual(graph.adjacent(3), set())
+        graph._validate()
+
+    def test_update_weights(self):
+        """
+        Tests changing the weights of edges given either way round, in both directions.
+        :return:
+        """
+        edge = WeightedGraph.edge_form
+        for v1, v2 in ((1, 2), (2, 1)):
+            matrix = {edge(1, 2, 5.0): 5.0, edge(2, 1, 5.0): 5.0}
+            graph = WeightedGraph({1, 2}, {edge(1, 2, 5.0)}, adjacency_matrix=matrix)
+            graph.shortest_path_cache = ShortestPathCache()
+            self.assertEqual(graph.shortest_paths(2).distance(1), 5.0)
+            graph.update_weights(edge(v1, v2, 1.0))
+            self.assertEqual(len(graph.edges), 1)
+            self.assertEqual(graph.edge(1, 2).weight, 1.0)
+            self.assertEqual(graph.adjacency_matrix[1, 2], 1.0)
+            self.assertEqual(graph.adjacency_matrix[2, 1], 1.0)
+            self.assertEqual(graph.shortest_paths(1).distance(2), 1.0)
+            self.assertEqual(graph.shortest_paths(2).distance(1), 1.0)
+            graph._validate()
 
 
 class TestTree(unittest.TestCase):
@@ -72,7 +682,69 @@ class TestTree(unittest.TestCase):
         Tests Tree init.
         :return:
         """
-        pass
+        tree = Tree({1, 2, 3}, {(1, 2), (2, 3)})
+        self.assertTrue(tree.is_edge(2, 1))
+        self.assertEqual(tree.adjacent(2), {1, 3})
+        self.assertTrue(tree.is_connected())
+        self.assertEqual(len(Tree().vertices), 0)
+        self.assertRaises(EdgeError, Tree, {1, 2, 3}, {(1, 2)})
+        self.assertRaises(EdgeError, Tree, {1, 2, 3, 4}, {(1, 2), (2, 1), (3, 4)})
+
+    def test_remove(self):
+        """
+        Tests removing a leaf of a tree, with its edge.
+        :return:
+        """
+        for backend in ("set", "bitset"):
+            tree = Tree({1, 2, 3}, {(1, 2), (2, 3)}, backend=backend)
+            tree.remove_vertices(3)
+            self.assertEqual(tree.edges, {(1, 2)})
+            self.assertEqual(tree.adjacent(2), {1})
+            tree.is_legal_tree(tree.vertices, tree.edges, tree.adjacency_matrix)
+
+    def test_batch(self):
+        """
+        Tests that a tree grows and is rearranged in batches, and that a change that leaves no tree is refused whole,
+        inside a batch or out of one.
+        :return:
+        """
+        for backend in ("set", "bitset"):
+            tree = Tree({1, 2}, {(1, 2)}, backend=backend)
+            tree.track_connectivity()
+            self.assertRaises(EdgeError, tree.add_vertices, 3)
+            self.assertRaises(EdgeError, tree.remove_edges, (1, 2))
+            self.assertEqual(tree.vertices, {1, 2})
+            self.assertTrue(tree.is_edge(1, 2))
+            with tree.batch():
+                tree.add_vertices(3, 4)
+                tree.add_edges((2, 3), (3, 4))
+            self.assertEqual(tree.adjacent(3), {2, 4})
+            self.assertTrue(tree.same_component(1, 4))
+            with tree.batch():
+                tree.remove_edges((2, 3))
+                tree.add_edges((1, 3))
+            self.assertEqual(tree.adjacent(1), {2, 3})
+            self.assertTrue(tree.same_component(2, 4))
+            with self.assertRaises(EdgeError):
+                with tree.batch():
+                    tree.add_vertices(5)
+                    tree.add_edges((2, 4))
+            self.assertEqual(tree.vertices, {1, 2, 3, 4})
+            self.assertFalse(tree.is_edge(2, 4))
+            tree.remove_vertices(4)
+            self.assertEqual(tree.edges, {(1, 2), (1, 3)})
+            self.assertRaises(EdgeError, tree.remove_vertices, 1)
+            self.assertEqual(len(tree.vertices), 3)
+
+    def test_is_legal_tree(self):
+        """
+        Tests the tree legality check, which batches of tree mutations end with.
+        :return:
+        """
+        tree = Tree()
+        tree.is_legal_tree({1, 2, 3}, {(1, 2), (2, 3)}, None)
+        self.assertRaises(EdgeError, tree.is_legal_tree, {1, 2, 3, 4}, {(1, 2), (2, 3)}, None)
+        self.assertRaises(EdgeError, tree.is_legal_tree, {1, 2, 3, 4}, {(1, 2), (2, 1), (3, 4)}, None)
 
 
 class TestNetwork(unittest.TestCase):
@@ -0,0 +1,81 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+import unittest
+
+from graph_theory import generators
+from graph_theory.objects.frozen_graph import FrozenGraph
+from graph_theory.objects.weighted_digraph import WeightedDigraph
+from graph_theory.readwrite import shared
+
+
+def _degree_sum(handle):
+    """
+    Attaches to a shared graph in a worker, and returns the sum of its degrees.
+    :return:
+    """
+    return shared.attach(handle).sum_of_degrees()
+
+
+class TestShared(unittest.TestCase):
+    """
+    Tests sharing frozen graphs between processes.
+    """
+    def test_attach(self):
+        """
+        Tests that an attached graph equals the shared one, is read-only, and outlives the unlinked block.
+        :return:
+        """
+        digraph = WeightedDigraph({"a", "b", "c"}, {WeightedDigraph.edge_form("a", "b", 0.5)})
+        handle = shared.share(digraph)
+        try:
+            attached = shared.attach(handle)
+        finally:
+            shared.unlink(handle)
+        self.assertEqual(attached.edges, digraph.freeze().edges)
+        self.assertEqual(list(attached.weights), [0.5])
+        self.assertTrue(attached.indices.readonly)
+        self.assertTrue(attached.is_edge(("a", "b")))
+
+    def test_pool(self):
+        """
+        Tests attaching from worker processes.
+        :return:
+        """
+        graph = generators.gnp(200, 0.05, seed=3)
+        handle = shared.share(graph)
+        try:
+            with multiprocessing.Pool(2) as pool:
+                sums = pool.map(_degree_sum, [handle] * 4)
+        finally:
+            shared.unlink(handle)
+        self.assertEqual(sums, [graph.sum_of_degrees()] * 4)
+        self.assertIsInstance(graph, FrozenGraph)
+
+    def test_attach_from_interpreter(self):
+        """
+        Tests that a separate interpreter attaching and exiting leaves the block in place, and warns of no leak.
+        :return:
+        """
+        graph = generators.gnp(50, 0.1, seed=5)
+        handle = shared.share(graph)
+        try:
+            code = (
+                "from graph_theory.readwrite import shared\n"
+                "print(shared.attach(shared.SharedGraph({n!r}, {s})).sum_of_degrees())\n"
+            ).format(n=handle.name, s=handle.size)
+            root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            result = subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, timeout=60, cwd=root
+            )
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertEqual(int(result.stdout), graph.sum_of_degrees())
+            self.assertNotIn("leaked", result.stderr)
+            self.assertEqual(shared.attach(handle).sum_of_degrees(), graph.sum_of_degrees())
+        finally:
+            shared.unlink(handle)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import copy
+import pickle
+import unittest
+
+from graph_theory.exceptions import GraphTheoryException
+from graph_theory.objects.digraph import Digraph
+from graph_theory.objects.graph import Graph
+from graph_theory.objects.snapshot import Snapshot
+from graph_theory.objects.weighted_digraph import WeightedDigraph
+
+
+class TestSnapshot(unittest.TestCase):
+    """
+    Tests snapshots of mutable digraphs and graphs.
+    """
+    def setUp(self):
+        """
+        A path 1 -> 2 -> 3, with a vertex 4 on its own.
+        :return:
+        """
+        self.digraph = Digraph({1, 2, 3, 4}, {Digraph.edge_form(1, 2), Digraph.edge_form(2, 3)})
+
+    def test_consistent(self):
+        """
+        Tests that a snapshot keeps the version it was taken at while the digraph changes, with either backend.
+        :return:
+        """
+        for backend in ("set", "bitset"):
+            digraph = Digraph({1, 2, 3, 4}, {Digraph.edge_form(1, 2), Digraph.edge_form(2, 3)}, backend=backend)
+            digraph.adjacency_matrix = {Digraph.edge_form(1, 2): 1, Digraph.edge_form(2, 3): 1}
+            version = digraph.version
+            snapshot = digraph.snapshot()
+            self.assertIsInstance(snapshot, Digraph)
+            self.assertIsInstance(snapshot, Snapshot)
+            self.assertIs(snapshot.edges, digraph.edges)
+            digraph.add_edges(Digraph.edge_form(3, 4))
+            digraph.remove_vertices(1)
+            digraph.add_vertices(5)
+            self.assertEqual(snapshot.vertices, {1, 2, 3, 4})
+            self.assertEqual(snapshot.edges, {(1, 2), (2, 3)})
+            self.assertEqual(snapshot.adjacency_matrix, {(1, 2): 1, (2, 3): 1})
+            self.assertEqual(snapshot.adjacent(3), set())
+            self.assertEqual(snapshot.in_degree(2), 1)
+            self.assertIs(snapshot.edge(1, 2), snapshot.has_an_edge_with(1, 2))
+            self.assertEqual(snapshot.version, version)
+            self.assertEqual(snapshot.freeze().edges, {(1, 2), (2, 3)})
+            self.assertEqual(digraph.edges, {(2, 3), (3, 4)})
+            self.assertEqual(digraph.adjacent(3), {4})
+            self.assertEqual(digraph.freeze().order, 4)
+
+    def test_immutable(self):
+        """
+        Tests that a snapshot cannot be changed, and is its own copy.
+        :return:
+        """
+        snapshot = self.digraph.snapshot()
+        with self.assertRaises(GraphTheoryException):
+            snapshot.add_vertices(5)
+        with self.assertRaises(GraphTheoryException):
+            snapshot.remove_edges(Digraph.edge_form(1, 2))
+        with self.assertRaises(GraphTheoryException):
+            snapshot.edges = set()
+        with self.assertRaises(GraphTheoryException):
+            with snapshot.batch():
+                pass
+        self.assertIs(snapshot.snapshot(), snapshot)
+        self.assertIs(copy.copy(snapshot), snapshot)
+        self.assertEqual(snapshot.edges, {(1, 2), (2, 3)})
+
+    def test_to_digraph(self):
+        """
+        Tests mutable copies of a snapshot, made by to_digraph() and by pickling.
+        :return:
+        """
+        snapshot = self.digraph.snapshot()
+        for digraph in (snapshot.to_digraph(), pickle.loads(pickle.dumps(snapshot))):
+            self.assertIs(type(digraph), Digraph)
+            digraph.add_edges(Digraph.edge_form(3, 1))
+            self.assertEqual(snapshot.edges, {(1, 2), (2, 3)})
+            self.assertEqual(digraph.adjacent(3), {1})
+
+    def test_batch(self):
+        """
+        Tests snapshots taken before, and during, a batch, and that a failing batch leaves the snapshot alone.
+        :return:
+        """
+        snapshot = self.digraph.snapshot()
+        with self.assertRaises(GraphTheoryException):
+            with self.digraph.batch():
+                self.digraph.add_edges(Digraph.edge_form(3, 4), Digraph.edge_form(4, 4))
+        with self.digraph.batch():
+            self.digraph.remove_edges(Digraph.edge_form(1, 2))
+            during = self.digraph.snapshot()
+        self.assertEqual(snapshot.edges, {(1, 2), (2, 3)})
+        self.assertEqual(during.edges, {(1, 2), (2, 3)})
+        self.assertEqual(self.digraph.edges, {(2, 3)})
+
+    def test_weighted(self):
+        """
+        Tests that changing weights leaves a snapshot of a weighted digraph alone.
+        :return:
+        """
+        digraph = WeightedDigraph({1, 2}, {WeightedDigraph.edge_form(1, 2, 2.5)})
+        snapshot = digraph.snapshot()
+        digraph.update_weights(WeightedDigraph.edge_form(1, 2, 1.0))
+        self.assertEqual(snapshot.edge(1, 2).weight, 2.5)
+        self.assertTrue(snapshot.is_edge(1, 2, 2.5))
+        self.assertEqual(digraph.edge(1, 2).weight, 1.0)
+        with self.assertRaises(GraphTheoryException):
+            snapshot.update_weights(WeightedDigraph.edge_form(1, 2, 3.0))
+
+    def test_graph(self):
+        """
+        Tests that a snapshot of a graph answers connectivity queries as of when it was taken.
+        :return:
+        """
+        graph = Graph({1, 2, 3}, {(1, 2)})
+        graph.track_connectivity()
+        snapshot = graph.snapshot()
+        graph.add_edges((2, 3))
+        self.assertTrue(graph.is_connected())
+        self.assertFalse(snapshot.is_connected())
+        self.assertIsNone(snapshot.connectivity)
+        self.assertEqual(snapshot.adjacent(2), {1})
+
+
+if __name__ == "__main__":
+    unittest.main()
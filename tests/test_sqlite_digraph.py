@@ -0,0 +1,121 @@
+import os
+import tempfile
+import unittest
+
+from graph_theory.exceptions import EdgeError, VertexError
+from graph_theory.objects.digraph import Digraph
+from graph_theory.objects.sqlite_digraph import SqliteDigraph
+
+
+class TestSqliteDigraph(unittest.TestCase):
+    """
+    Tests SqliteDigraph storage, queries and caching.
+    """
+    def setUp(self):
+        """
+        Makes a scratch directory.
+        :return:
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "graph.db")
+
+    def tearDown(self):
+        """
+        Removes the scratch directory.
+        :return:
+        """
+        self.directory.cleanup()
+
+    def test_queries(self):
+        """
+        Tests that queries answer as they do for a Digraph, with a cache too small to hold the digraph.
+        :return:
+        """
+        edges = [(i, (i * 7 + 3) % 50) for i in range(50) if i != (i * 7 + 3) % 50]
+        edges += [(i, (i + 1) % 50) for i in range(50)]
+        digraph = Digraph(set(range(50)), {Digraph.edge_form(v1, v2) for v1, v2 in edges})
+        stored = SqliteDigraph(cache_size=8)
+        stored.bulk_load(edges, batch_size=16)
+        self.assertEqual(stored.vertices, digraph.vertices)
+        self.assertEqual(stored.edges, digraph.edges)
+        for vertex in range(50):
+            self.assertEqual(stored.adjacent(vertex), digraph.adjacent(vertex))
+            self.assertEqual(stored.in_degree(vertex), digraph.in_degree(vertex))
+            self.assertEqual(stored.out_degree(vertex), digraph.out_degree(vertex))
+        self.assertTrue(stored.is_edge((0, 1)))
+        self.assertFalse(stored.is_edge((1, 0)))
+        indptr, neighbours = stored.neighbors_many(list(range(20)))
+        for i in range(20):
+            self.assertEqual(set(neighbours[indptr[i]:indptr[i + 1]]), digraph.adjacent(i))
+        self.assertLessEqual(len(stored._pages), 8)
+        self.assertEqual(stored.freeze().edges, digraph.edges)
+        self.assertRaises(VertexError, stored.adjacent, 50)
+        self.assertRaises(EdgeError, stored.add_edges, Digraph.edge_form(1, 1))
+
+    def test_remove(self):
+        """
+        Tests that removals drop the cached pages they change.
+        :return:
+        """
+        stored = SqliteDigraph()
+        stored.bulk_load([(1, 2), (2, 3), (3, 1), (4, 3)])
+        self.assertEqual(stored.adjacent(4), {3})
+        stored.remove_edges(Digraph.edge_form(1, 2))
+        self.assertEqual(stored.adjacent(1), set())
+        stored.remove_vertices(3)
+        self.assertEqual(stored.vertices, {1, 2, 4})
+        self.assertEqual(stored.adjacent(4), set())
+        self.assertEqual(stored.adjacent(2), set())
+        self.assertEqual(stored.size, 0)
+        self.assertRaises(VertexError, stored.adjacent, 3)
+
+    def test_persistence(self):
+        """
+        Tests that writes persist, that a failed transaction is rolled back, and weights.
+        :return:
+        """
+        stored = SqliteDigraph(self.path, weighted=True)
+        stored.add_vertices("a", "b", "c")
+        stored.add_edges(stored.edge_form("a", "b", 0.5))
+        self.assertEqual(stored.adjacent("a"), {"b"})
+        with self.assertRaises(EdgeError):
+            with stored.transaction():
+                stored.add_edges(stored.edge_form("b", "c", 1.5))
+                stored.add_edges(stored.edge_form("c", "c", 1.0))
+        stored.close()
+        stored = SqliteDigraph(self.path, weighted=True)
+        self.assertEqual(stored.size, 1)
+        self.assertEqual(stored.has_an_edge_with("a", "c", "b").weight, 0.5)
+        self.assertEqual(stored.adjacent("b"), set())
+        stored.close()
+
+    def test_nested_transaction(self):
+        """
+        Tests that a nested block that raises is rolled back on its own, and the rest only with the outermost block.
+        :return:
+        """
+        stored = SqliteDigraph(self.path)
+        with stored.transaction():
+            with stored.transaction():
+                stored.add_vertices("a", "b", "c")
+            with self.assertRaises(EdgeError):
+                with stored.transaction():
+                    stored.add_edges(stored.edge_form("a", "b"))
+                    stored.add_edges(stored.edge_form("c", "c"))
+            self.assertEqual(stored.adjacent("a"), set())
+            stored.add_edges(stored.edge_form("b", "c"))
+        self.assertEqual(stored.adjacent("b"), {"c"})
+        with self.assertRaises(EdgeError):
+            with stored.transaction():
+                with stored.transaction():
+                    stored.add_vertices("d")
+                stored.add_edges(stored.edge_form("d", "d"))
+        stored.close()
+        stored = SqliteDigraph(self.path)
+        self.assertEqual(stored.vertices, {"a", "b", "c"})
+        self.assertEqual(stored.size, 1)
+        stored.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+
+from graph_theory.exceptions import GraphTheoryException, MatrixError, VertexError
+from graph_theory.graphlike_reachability import reachability_index
+from graph_theory.graphlike_shortest_paths import shortest_paths
+from graph_theory.objects.attributes import Mask
+from graph_theory.objects.digraph import Digraph
+from graph_theory.objects.frozen_digraph import FrozenDigraph
+from graph_theory.objects.frozen_graph import FrozenGraph
+from graph_theory.objects.views import DigraphView
+
+
+class TestViews(unittest.TestCase):
+    """
+    Tests subgraph, reverse and filtered views.
+    """
+    def setUp(self):
+        """
+        A weighted path a -> b -> c -> d, with a shortcut a -> c.
+        :return:
+        """
+        self.digraph = FrozenDigraph.from_edge_arrays(
+            [0, 1, 2, 0], [1, 2, 3, 2], [1.0, 2.0, 3.0, 5.0], ["a", "b", "c", "d"]
+        )
+
+    def test_subgraph(self):
+        """
+        Tests the subgraph induced by some vertices, and that it shares the storage of its parent.
+        :return:
+        """
+        view = self.digraph.subgraph([0, 1, 2])
+        self.assertIs(view.parent, self.digraph)
+        self.assertEqual(view.vertices, {"a", "b", "c"})
+        self.assertEqual(view.edges, {("a", "b"), ("b", "c"), ("a", "c")})
+        self.assertEqual((view.order, view.size), (3, 3))
+        self.assertEqual(view.adjacent("c"), set())
+        self.assertEqual(view.in_degree("c"), 2)
+        self.assertFalse(view.has_an_edge_with("b", "a"))
+        self.assertEqual(view.has_an_edge_with("a", "c").weight, 5.0)
+        with self.assertRaises(VertexError):
+            view.adjacent("d")
+        with self.assertRaises(VertexError):
+            self.digraph.subgraph([4])
+        self.assertEqual(view.subgraph([1, 2, 3]).vertices, {"b", "c"})
+
+    def test_reverse(self):
+        """
+        Tests reversed views, and that reversing twice gives back the parent's edges.
+        :return:
+        """
+        view = self.digraph.reverse()
+        self.assertEqual(view.adjacent("c"), {"a", "b"})
+        self.assertEqual(view.in_degree("c"), 1)
+        self.assertEqual(view.out_degree("c"), 2)
+        self.assertTrue(view.is_edge(("c", "a")))
+        self.assertFalse(view.is_edge(("a", "c")))
+        self.assertEqual(view.edges, {("b", "a"), ("c", "b"), ("d", "c"), ("c", "a")})
+        self.assertEqual(view.reverse().edges, self.digraph.edges)
+        graph = FrozenGraph.from_edge_arrays([0, 1], [1, 2])
+        self.assertEqual(graph.reverse().edges, graph.edges)
+
+    def test_edge_subgraph_and_filter(self):
+        """
+        Tests selecting edges by a mask and by predicates.
+        :return:
+        """
+        view = self.digraph.edge_subgraph(self.digraph.edge_attributes["weight"] < 4)
+        self.assertEqual(view.edges, {("a", "b"), ("b", "c"), ("c", "d")})
+        self.assertEqual(view.vertices, self.digraph.vertices)
+        with self.assertRaises(MatrixError):
+            self.digraph.edge_subgraph(Mask(b"\x01"))
+        view = self.digraph.filter(vertex_pred=lambda label: label != "b", edge_pred=lambda edge: edge.weight > 4)
+        self.assertEqual(view.edges, {("a", "c")})
+        self.assertEqual(view.reverse().filter(edge_pred=lambda edge: edge[0] == "c").edges, {("c", "a")})
+        graph = FrozenGraph.from_edge_arrays([0, 1, 0], [1, 2, 2])
+        flags = bytearray(graph.sum_of_degrees())
+        flags[graph.edge_id(0, 1)] = flags[graph.edge_id(1, 2)] = 1
+        view = graph.edge_subgraph(Mask(bytes(flags)))
+        self.assertEqual(view.adjacent(1), {0, 2})
+        self.assertEqual(view.adjacent(2), {1})
+        self.assertEqual(view.size, 2)
+        self.assertEqual(graph.filter(edge_pred=lambda edge: set(edge) == {0, 2}).adjacent(2), {0})
+
+    def test_algorithms(self):
+        """
+        Tests that views can be handed to algorithms, and are copied into frozen digraphs only for those that need
+        the arrays.
+        :return:
+        """
+        view = self.digraph.filter(edge_pred=lambda edge: edge.weight < 4).reverse()
+        self.assertEqual(shortest_paths(view, "d").distance("a"), 6.0)
+        self.assertEqual(shortest_paths(view, "d").path("a"), ["d", "c", "b", "a"])
+        self.assertTrue(reachability_index(view).reachable("d", "a"))
+        self.assertFalse(reachability_index(view).reachable("a", "d"))
+        frozen = view.freeze()
+        self.assertIs(view.freeze(), frozen)
+        self.assertIsInstance(frozen, FrozenDigraph)
+        self.assertEqual(frozen.edges, view.edges)
+        subgraph = FrozenGraph.from_edge_arrays([0, 1], [1, 2]).subgraph([1, 2]).freeze()
+        self.assertIsInstance(subgraph, FrozenGraph)
+        self.assertEqual(subgraph.edges, {(1, 2)})
+
+    def test_mutable(self):
+        """
+        Tests views of a mutable digraph, and that views cannot be changed.
+        :return:
+        """
+        digraph = Digraph({1, 2, 3}, {Digraph.edge_form(1, 2), Digraph.edge_form(2, 3)})
+        view = digraph.subgraph([1, 2])
+        self.assertIsInstance(view, DigraphView)
+        self.assertEqual(view.edges, {(1, 2)})
+        self.assertEqual(digraph.reverse().adjacent(3), {2})
+        with self.assertRaises(GraphTheoryException):
+            view.add_edges(Digraph.edge_form(2, 1))
+        with self.assertRaises(GraphTheoryException):
+            view.vertices = {1}
+        self.assertEqual(view.to_digraph().edges, {(1, 2)})
+
+
+if __name__ == "__main__":
+    unittest.main()